@@ -0,0 +1,70 @@
+"""Materialize current high bid state on auction items.
+
+Revision ID: auction_002_high_bid_state
+Revises: 051_silent_auction_ext
+Create Date: 2026-10-16 09:00:00.000000
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "auction_002_high_bid_state"
+down_revision = "051_silent_auction_ext"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "auction_items",
+        sa.Column("current_high_bid_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+
+    # Backfill from bid history. The latest record of each bid chain is the one
+    # no other bid points at through source_bid_id.
+    op.execute(
+        """
+        WITH latest AS (
+            SELECT b.id, b.auction_item_id, b.bid_amount, b.bid_status, b.placed_at
+            FROM auction_bids b
+            WHERE NOT EXISTS (
+                SELECT 1 FROM auction_bids c WHERE c.source_bid_id = b.id
+            )
+        ),
+        high AS (
+            SELECT DISTINCT ON (auction_item_id) auction_item_id, id, bid_amount
+            FROM latest
+            WHERE bid_status IN ('active', 'winning')
+            ORDER BY auction_item_id, bid_amount DESC, placed_at DESC
+        ),
+        counts AS (
+            SELECT auction_item_id, COUNT(*) AS bid_count
+            FROM latest
+            WHERE bid_status NOT IN ('cancelled', 'withdrawn')
+            GROUP BY auction_item_id
+        )
+        UPDATE auction_items ai
+        SET current_high_bid_id = high.id,
+            current_bid_amount = high.bid_amount,
+            min_next_bid_amount = COALESCE(high.bid_amount + ai.bid_increment, ai.starting_bid),
+            bid_count = COALESCE(counts.bid_count, 0)
+        FROM (SELECT DISTINCT auction_item_id FROM auction_bids) touched
+        LEFT JOIN high ON high.auction_item_id = touched.auction_item_id
+        LEFT JOIN counts ON counts.auction_item_id = touched.auction_item_id
+        WHERE ai.id = touched.auction_item_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE auction_items
+        SET min_next_bid_amount = COALESCE(current_bid_amount + bid_increment, starting_bid)
+        WHERE min_next_bid_amount IS NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("auction_items", "current_high_bid_id")
@@ -0,0 +1,27 @@
+"""Add a bid state version to auction items.
+
+Revision ID: auction_003_bid_state_version
+Revises: import_002_job_heartbeat
+Create Date: 2026-10-17 09:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "auction_003_bid_state_version"
+down_revision = "import_002_job_heartbeat"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "auction_items",
+        sa.Column("bid_state_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("auction_items", "bid_state_version")
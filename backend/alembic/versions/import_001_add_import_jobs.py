@@ -0,0 +1,97 @@
+"""Add background import job tables.
+
+Revision ID: import_001_import_jobs
+Revises: auction_002_high_bid_state
+Create Date: 2026-10-16 12:00:00.000000
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "import_001_import_jobs"
+down_revision = "auction_002_high_bid_state"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "import_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column("kind", sa.String(length=20), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="queued"),
+        sa.Column(
+            "event_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("events.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+        sa.Column(
+            "npo_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("npos.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+        sa.Column(
+            "initiated_by_user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id"),
+            nullable=False,
+        ),
+        sa.Column("file_name", sa.String(length=255), nullable=False),
+        sa.Column("storage_key", sa.String(length=512), nullable=True),
+        sa.Column(
+            "params",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+        sa.Column("total_rows", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("processed_rows", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "status_counts",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+        sa.Column("result", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_import_jobs_status", "import_jobs", ["status"])
+    op.create_index("ix_import_jobs_event_id", "import_jobs", ["event_id"])
+    op.create_index("ix_import_jobs_initiated_by_user_id", "import_jobs", ["initiated_by_user_id"])
+
+    op.create_table(
+        "import_job_rows",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column(
+            "job_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("import_jobs.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("row_number", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=30), nullable=False),
+        sa.Column("message", sa.Text(), nullable=True),
+    )
+    op.create_index("ix_import_job_rows_job_id", "import_job_rows", ["job_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_import_job_rows_job_id", table_name="import_job_rows")
+    op.drop_table("import_job_rows")
+    op.drop_index("ix_import_jobs_initiated_by_user_id", table_name="import_jobs")
+    op.drop_index("ix_import_jobs_event_id", table_name="import_jobs")
+    op.drop_index("ix_import_jobs_status", table_name="import_jobs")
+    op.drop_table("import_jobs")
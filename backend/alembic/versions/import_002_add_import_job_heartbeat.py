@@ -0,0 +1,32 @@
+"""Add heartbeat and attempt count to import jobs.
+
+Revision ID: import_002_job_heartbeat
+Revises: import_001_import_jobs
+Create Date: 2026-10-16 18:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "import_002_job_heartbeat"
+down_revision = "import_001_import_jobs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "import_jobs",
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "import_jobs",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("import_jobs", "attempts")
+    op.drop_column("import_jobs", "heartbeat_at")
@@ -7,6 +7,8 @@ metrics from `app.core.metrics` and increment counters as appropriate.
 from fastapi import APIRouter, Response
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
+from app.core.queue_metrics import refresh_celery_queue_metrics
+
 router = APIRouter()
 
 
@@ -15,7 +17,9 @@ async def metrics_endpoint() -> Response:
     """Return Prometheus-formatted metrics for scraping.
 
     Returns the default registry's metrics in text format with the
-    appropriate content type.
+    appropriate content type. Celery queue gauges are sampled from the
+    broker first.
     """
+    await refresh_celery_queue_metrics()
     body = generate_latest()
     return Response(content=body, media_type=CONTENT_TYPE_LATEST)
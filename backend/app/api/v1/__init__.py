@@ -18,6 +18,7 @@ from app.api.v1 import (
     admin_event_dashboard,
     admin_event_nudges,
     admin_event_survey,
+    admin_import_jobs,
     admin_notifications,
     admin_npo_credentials,
     admin_payments,
@@ -133,6 +134,7 @@ api_router.include_router(admin_silent_auction_extension.router)
 api_router.include_router(admin_registration_import.router)
 api_router.include_router(admin_ticket_sales_import.router)
 api_router.include_router(admin_user_import.router)
+api_router.include_router(admin_import_jobs.router)
 api_router.include_router(admin_event_dashboard.router)
 api_router.include_router(admin_donor_dashboard.router)
 api_router.include_router(admin_auction_dashboard.router)
@@ -12,17 +12,19 @@ from app.core.database import get_db
 from app.core.logging import get_logger
 from app.middleware.auth import get_current_user
 from app.models.event import Event
+from app.models.import_job import ImportJobKind
 from app.models.user import User
 from app.schemas.auction_bid_import import (
     AuctionBidDashboardResponse,
-    AuctionBidImportSummary,
     AuctionBidPreflightResult,
 )
+from app.schemas.import_job import ImportJobResponse
 from app.services.auction_bid_import_service import (
     AuctionBidImportError,
     AuctionBidImportService,
 )
 from app.services.audit_service import AuditService
+from app.services.import_job_service import ImportJobError, ImportJobService
 from app.services.permission_service import PermissionService
 
 router = APIRouter(prefix="/admin/events", tags=["admin-auction-bids-import"])
@@ -129,8 +131,8 @@ async def preflight_auction_bid_import(
 
 @router.post(
     "/{event_id}/auction-bids/import/confirm",
-    response_model=AuctionBidImportSummary,
-    status_code=status.HTTP_200_OK,
+    response_model=ImportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
 )
 async def confirm_auction_bid_import(
     event_id: UUID,
@@ -138,7 +140,7 @@ async def confirm_auction_bid_import(
     file: Annotated[UploadFile, File(...)],
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> AuctionBidImportSummary:
+) -> ImportJobResponse:
     event_result = await db.execute(select(Event).where(Event.id == event_id))
     event = event_result.scalar_one_or_none()
     if not event:
@@ -147,47 +149,20 @@ async def confirm_auction_bid_import(
     await _require_event_admin(db, current_user, event)
 
     try:
-        file_bytes = await file.read()
-        service = AuctionBidImportService(db)
-        result = await service.confirm_import(
-            event_id=event_id,
-            import_batch_id=import_batch_id,
-            file_bytes=file_bytes,
-            user_id=current_user.id,
-        )
-
-        await AuditService.log_auction_bid_import(
-            db=db,
-            event_id=event_id,
+        job = await ImportJobService(db).enqueue(
+            kind=ImportJobKind.AUCTION_BIDS,
+            file_name=file.filename or "auction-bids",
+            content=await file.read(),
             initiated_by_user_id=current_user.id,
-            stage="confirm",
-            total_rows=result.created_bids,
-            error_count=0,
-            commit=False,
-        )
-        await db.commit()
-        logger.info(
-            "Auction bid confirm response ready",
-            extra={"event_id": str(event_id), "import_batch_id": result.import_batch_id},
-        )
-
-        return result
-    except asyncio.CancelledError:
-        logger.warning(
-            "Auction bid confirm cancelled",
-            extra={"event_id": str(event_id), "import_batch_id": str(import_batch_id)},
-        )
-        raise
-    except AuctionBidImportError as exc:
-        await db.rollback()
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-    except Exception as exc:
-        await db.rollback()
-        logger.exception(
-            "Auction bid import confirm failed",
-            extra={"event_id": str(event_id)},
+            event_id=event_id,
+            params={"import_batch_id": str(import_batch_id)},
         )
+    except ImportJobError as exc:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error during import: {str(exc)}",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
         ) from exc
+    logger.info(
+        "Auction bid import queued",
+        extra={"event_id": str(event_id), "import_job_id": str(job.id)},
+    )
+    return ImportJobResponse.model_validate(job)
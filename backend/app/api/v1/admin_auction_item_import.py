@@ -11,11 +11,14 @@ from app.core.config import get_settings
 from app.core.database import get_db
 from app.middleware.auth import get_current_user
 from app.models.event import Event
+from app.models.import_job import ImportJobKind
 from app.models.user import User
 from app.schemas.auction_item_import import ImportReport
+from app.schemas.import_job import ImportJobResponse
 from app.services.auction_item_import_service import AuctionItemImportService
 from app.services.auction_item_import_zip import ImportZipValidationError
 from app.services.audit_service import AuditService
+from app.services.import_job_service import ImportJobError, ImportJobService
 from app.services.permission_service import PermissionService
 
 router = APIRouter(prefix="/admin/events", tags=["admin-auction-items-import"])
@@ -87,15 +90,15 @@ async def preflight_import(
 
 @router.post(
     "/{event_id}/auction-items/import/commit",
-    response_model=ImportReport,
-    status_code=status.HTTP_200_OK,
+    response_model=ImportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
 )
 async def commit_import(
     event_id: UUID,
     zip_file: Annotated[UploadFile, File(...)],
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> ImportReport:
+) -> ImportJobResponse:
     _require_import_allowed()
 
     event_result = await db.execute(select(Event).where(Event.id == event_id))
@@ -106,19 +109,15 @@ async def commit_import(
     await _require_event_admin(db, current_user, event)
 
     try:
-        zip_bytes = await zip_file.read()
-        service = AuctionItemImportService(db)
-        report = await service.commit(event_id, zip_bytes, current_user.id)
-        await AuditService.log_auction_item_import(
-            db=db,
-            event_id=event_id,
+        job = await ImportJobService(db).enqueue(
+            kind=ImportJobKind.AUCTION_ITEMS,
+            file_name=zip_file.filename or "auction-items.zip",
+            content=await zip_file.read(),
             initiated_by_user_id=current_user.id,
-            stage="commit",
-            total_rows=report.total_rows,
-            created_count=report.created_count,
-            updated_count=report.updated_count,
-            error_count=report.error_count,
+            event_id=event_id,
         )
-        return report
-    except ImportZipValidationError as exc:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except ImportJobError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+        ) from exc
+    return ImportJobResponse.model_validate(job)
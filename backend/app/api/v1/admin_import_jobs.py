@@ -0,0 +1,64 @@
+"""Admin endpoints for following background import jobs."""
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.middleware.auth import get_current_user
+from app.models.import_job import ImportJob
+from app.models.user import User
+from app.schemas.import_job import ImportJobResponse, ImportJobRowResponse, ImportJobRowsResponse
+from app.services.import_job_service import ImportJobService
+
+router = APIRouter(prefix="/admin/import-jobs", tags=["admin-import-jobs"])
+
+
+async def _get_visible_job(db: AsyncSession, current_user: User, job_id: UUID) -> ImportJob:
+    """Load a job the current user started (any job for super admins)."""
+    job = await ImportJobService(db).get_job(job_id)
+    if job is None or (
+        current_user.role_name != "super_admin"  # type: ignore[attr-defined]
+        and job.initiated_by_user_id != current_user.id
+    ):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Import job not found")
+    return job
+
+
+@router.get("/{job_id}", response_model=ImportJobResponse, status_code=status.HTTP_200_OK)
+async def get_import_job(
+    job_id: UUID,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> ImportJobResponse:
+    """Get an import job's status and progress.
+
+    ``result`` holds the importer's report once ``status`` is ``completed``;
+    ``error`` explains a ``failed`` job.
+    """
+    job = await _get_visible_job(db, current_user, job_id)
+    return ImportJobResponse.model_validate(job)
+
+
+@router.get("/{job_id}/rows", response_model=ImportJobRowsResponse, status_code=status.HTTP_200_OK)
+async def list_import_job_rows(
+    job_id: UUID,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    row_status: str | None = Query(default=None, alias="status"),
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=1000),
+) -> ImportJobRowsResponse:
+    """List the row outcomes saved so far, optionally filtered by row status."""
+    await _get_visible_job(db, current_user, job_id)
+    rows, total = await ImportJobService(db).list_rows(
+        job_id, offset=offset, limit=limit, status=row_status
+    )
+    return ImportJobRowsResponse(
+        rows=[ImportJobRowResponse.model_validate(row) for row in rows],
+        total=total,
+        offset=offset,
+        limit=limit,
+    )
@@ -44,7 +44,7 @@ from app.schemas.quick_entry.schemas import (
     QuickEntrySilentItemResponse,
     QuickEntryWinnerAssignmentResponse,
 )
-from app.services.auction_bid_service import AuctionBidService
+from app.services.auction_bid_service import AuctionBidService, BidConflictError
 from app.services.auction_item_media_service import AuctionItemMediaService
 from app.services.permission_service import PermissionService
 from app.services.quick_entry.buy_now_service import BuyNowService
@@ -684,7 +684,7 @@ async def create_silent_auction_bid(
             bid_type=BidType.REGULAR,
             max_bid=None,
         )
-    except ValueError as exc:
+    except (BidConflictError, ValueError) as exc:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(exc),
@@ -10,13 +10,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.middleware.auth import get_current_user
 from app.models.event import Event
+from app.models.import_job import ImportJobKind
 from app.models.user import User
+from app.schemas.import_job import ImportJobResponse
 from app.schemas.registration_import import (
     ImportErrorReportRequest,
     ImportErrorReportResponse,
     ImportReport,
 )
 from app.services.audit_service import AuditService
+from app.services.import_job_service import ImportJobError, ImportJobService
 from app.services.permission_service import PermissionService
 from app.services.registration_import_service import (
     RegistrationImportError,
@@ -116,19 +119,18 @@ async def preflight_import(
 
 @router.post(
     "/{event_id}/registrations/import/commit",
-    response_model=ImportReport,
-    status_code=status.HTTP_200_OK,
+    response_model=ImportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
 )
 async def commit_import(
     event_id: UUID,
     file: Annotated[UploadFile, File(...)],
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> ImportReport:
-    """Execute registration import and create records.
+) -> ImportJobResponse:
+    """Queue registration import and return the import job.
 
-    This endpoint performs the actual import after successful preflight.
-    It creates:
+    The import runs on a background worker after preflight. It creates:
     - Event registration records
     - Registration guest records
     - Links to ticket packages
@@ -136,7 +138,8 @@ async def commit_import(
     Rows with errors are skipped. Rows with existing external_registration_id
     are also skipped with warnings.
 
-    The response includes counts of created, skipped, and failed records.
+    Follow progress at GET /admin/import-jobs/{job_id}; the job's result holds
+    the counts of created, skipped, and failed records once it completes.
     """
     event_result = await db.execute(select(Event).where(Event.id == event_id))
     event = event_result.scalar_one_or_none()
@@ -149,24 +152,18 @@ async def commit_import(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Filename is required")
 
     try:
-        file_bytes = await file.read()
-        service = RegistrationImportService(db)
-        current_user_id = _get_user_id(current_user)
-        report = await service.commit(event_id, file_bytes, file.filename, current_user_id)
-
-        await AuditService.log_registration_import(
-            db=db,
+        job = await ImportJobService(db).enqueue(
+            kind=ImportJobKind.REGISTRATIONS,
+            file_name=file.filename,
+            content=await file.read(),
+            initiated_by_user_id=_get_user_id(current_user),
             event_id=event_id,
-            initiated_by_user_id=current_user_id,
-            stage="commit",
-            total_rows=report.total_rows,
-            created_count=report.created_count,
-            error_count=report.error_rows,
         )
-
-        return report
-    except RegistrationImportError as exc:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except ImportJobError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+        ) from exc
+    return ImportJobResponse.model_validate(job)
 
 
 @router.post(
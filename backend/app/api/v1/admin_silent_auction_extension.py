@@ -16,6 +16,7 @@ from app.schemas.silent_auction_extension_policy import (
     SilentAuctionExtensionPolicyResponse,
     SilentAuctionExtensionPolicyUpdate,
 )
+from app.services.event_snapshot_cache import EventSnapshotCache
 from app.services.permission_service import PermissionService
 from app.services.silent_auction_extension_service import SilentAuctionExtensionService
 
@@ -84,5 +85,6 @@ async def update_extension_policy(
         ) from exc
 
     await db.commit()
+    await EventSnapshotCache.bump_version(event_id)
     await db.refresh(policy)
     return SilentAuctionExtensionPolicyResponse.model_validate(policy)
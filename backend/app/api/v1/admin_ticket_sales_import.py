@@ -12,9 +12,12 @@ from app.core.database import get_db
 from app.core.logging import get_logger
 from app.middleware.auth import get_current_user
 from app.models.event import Event
+from app.models.import_job import ImportJobKind
 from app.models.user import User
-from app.schemas.ticket_sales_import import ImportResult, PreflightResult
+from app.schemas.import_job import ImportJobResponse
+from app.schemas.ticket_sales_import import PreflightResult
 from app.services.audit_service import AuditService
+from app.services.import_job_service import ImportJobError, ImportJobService
 from app.services.permission_service import PermissionService
 from app.services.ticket_sales_import_service import (
     TicketSalesImportError,
@@ -123,8 +126,8 @@ async def preflight_import(
 
 @router.post(
     "/{event_id}/ticket-sales/import",
-    response_model=ImportResult,
-    status_code=status.HTTP_200_OK,
+    response_model=ImportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
 )
 async def commit_import(
     event_id: UUID,
@@ -133,10 +136,11 @@ async def commit_import(
     file: Annotated[UploadFile, File(...)],
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> ImportResult:
-    """Import ticket sales from a preflighted file.
+) -> ImportJobResponse:
+    """Queue ticket sales import from a preflighted file.
 
-    Executes the import using a preflight identifier.
+    Returns the import job; the import itself runs on a background worker.
+    Follow progress at GET /admin/import-jobs/{job_id}.
     """
     # Fetch event
     event_result = await db.execute(select(Event).where(Event.id == event_id))
@@ -155,37 +159,23 @@ async def commit_import(
         )
 
     try:
-        # Read file
-        file_bytes = await file.read()
-
-        # Run import
-        service = TicketSalesImportService(db)
-        result = await service.commit_import(
-            event_id=event_id,
-            preflight_id=UUID(preflight_id),
-            file_bytes=file_bytes,
-            user_id=current_user.id,
-        )
-
-        await db.commit()
+        preflight_uuid = UUID(preflight_id)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid preflight_id"
+        ) from exc
 
-        # Log audit
-        await AuditService.log_ticket_sales_import(
-            db=db,
-            event_id=event_id,
+    try:
+        job = await ImportJobService(db).enqueue(
+            kind=ImportJobKind.TICKET_SALES,
+            file_name=file.filename or "ticket-sales",
+            content=await file.read(),
             initiated_by_user_id=current_user.id,
-            stage="commit",
-            total_rows=result.created_rows + result.skipped_rows + result.failed_rows,
-            error_count=result.failed_rows,
+            event_id=event_id,
+            params={"preflight_id": str(preflight_uuid)},
         )
-
-        return result
-    except TicketSalesImportError as exc:
-        await db.rollback()
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-    except Exception as exc:
-        await db.rollback()
+    except ImportJobError as exc:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error during import: {str(exc)}",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
         ) from exc
+    return ImportJobResponse.model_validate(job)
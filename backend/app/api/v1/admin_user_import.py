@@ -9,15 +9,17 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.middleware.auth import get_current_user, require_role
+from app.models.import_job import ImportJobKind
 from app.models.npo_member import MemberStatus, NPOMember
 from app.models.user import User
+from app.schemas.import_job import ImportJobResponse
 from app.schemas.user_import import (
     ErrorReportRequest,
     ErrorReportResponse,
-    ImportResult,
     PreflightResult,
 )
 from app.services.audit_service import AuditService
+from app.services.import_job_service import ImportJobError, ImportJobService
 from app.services.npo_permission_service import NPOPermissionService
 from app.services.user_import_service import UserImportError, UserImportService
 
@@ -119,7 +121,7 @@ async def preflight_user_import(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
 
-@router.post("/commit", response_model=ImportResult, status_code=status.HTTP_200_OK)
+@router.post("/commit", response_model=ImportJobResponse, status_code=status.HTTP_202_ACCEPTED)
 @require_role("super_admin", "npo_admin", "event_coordinator")
 async def commit_user_import(
     file: Annotated[UploadFile, File(...)],
@@ -128,12 +130,13 @@ async def commit_user_import(
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
     npo_id: UUID | None = Query(default=None),
-) -> ImportResult:
-    """Commit user import after successful preflight.
+) -> ImportJobResponse:
+    """Queue user import after successful preflight and return the import job.
 
     Requires the same file checksum and a preflight with zero errors.
     Creates new users, adds memberships for existing users in other NPOs,
-    and skips users already in the selected NPO.
+    and skips users already in the selected NPO. Follow progress at
+    GET /admin/import-jobs/{job_id}.
     """
     if not confirm:
         raise HTTPException(
@@ -147,31 +150,19 @@ async def commit_user_import(
     target_npo_id = await _resolve_npo_id(db, current_user, npo_id)
 
     try:
-        file_bytes = await file.read()
-        service = UserImportService(db)
-        report = await service.commit(
-            npo_id=target_npo_id,
-            preflight_id=preflight_id,
-            file_bytes=file_bytes,
+        job = await ImportJobService(db).enqueue(
+            kind=ImportJobKind.USERS,
+            file_name=file.filename,
+            content=await file.read(),
             initiated_by_user_id=_get_user_id(current_user),
-        )
-        await AuditService.log_user_import(
-            db=db,
             npo_id=target_npo_id,
-            initiated_by_user_id=_get_user_id(current_user),
-            stage="commit",
-            total_rows=report.created_rows
-            + report.skipped_rows
-            + report.membership_added_rows
-            + report.failed_rows,
-            created_count=report.created_rows,
-            skipped_count=report.skipped_rows,
-            membership_added_count=report.membership_added_rows,
-            error_count=report.failed_rows,
+            params={"preflight_id": preflight_id},
         )
-        return report
-    except UserImportError as exc:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except ImportJobError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+        ) from exc
+    return ImportJobResponse.model_validate(job)
 
 
 @router.post("/error-report", response_model=ErrorReportResponse, status_code=status.HTTP_200_OK)
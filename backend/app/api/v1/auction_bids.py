@@ -38,7 +38,7 @@ from app.schemas.auction_bid import (
     WinningBidReportItem,
     WinningBidsReportResponse,
 )
-from app.services.auction_bid_service import AuctionBidService
+from app.services.auction_bid_service import AuctionBidService, BidConflictError
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +68,12 @@ async def place_bid(
             max_bid=bid_data.max_bid,
         )
         return BidResponse.model_validate(bid)
+    except BidConflictError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(exc),
+            headers={"Retry-After": "1"},
+        ) from exc
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
@@ -134,6 +140,8 @@ async def mark_winning_bid(
         service = AuctionBidService(db)
         bid = await service.mark_winning(bid_id, current_user.id, payload.reason)
         return BidResponse.model_validate(bid)
+    except BidConflictError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
@@ -159,6 +167,8 @@ async def adjust_bid_amount(
             reason=payload.reason,
         )
         return BidResponse.model_validate(bid)
+    except BidConflictError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
@@ -179,6 +189,8 @@ async def cancel_bid(
         service = AuctionBidService(db)
         bid = await service.cancel_bid(bid_id, current_user.id, payload.reason)
         return BidResponse.model_validate(bid)
+    except BidConflictError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
@@ -204,6 +216,8 @@ async def override_transaction_status(
             reason=payload.reason,
         )
         return BidResponse.model_validate(bid)
+    except BidConflictError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
@@ -272,11 +286,12 @@ async def unprocessed_transactions_report(
 async def bidder_analytics_report(
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    event_id: UUID = Query(...),
     bidder_number: int | None = Query(default=None),
     auction_type: AuctionType | None = Query(default=None),
 ) -> BidderAnalyticsReportResponse:
     service = AuctionBidService(db)
-    rows = await service.report_bidder_analytics(bidder_number, auction_type)
+    rows = await service.report_bidder_analytics(event_id, bidder_number, auction_type)
     items = [BidderAnalyticsReportItem(**row) for row in rows]
     return BidderAnalyticsReportResponse(generated_at=datetime.now(UTC), items=items)
 
@@ -290,9 +305,10 @@ async def bidder_analytics_report(
 async def item_performance_report(
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    event_id: UUID = Query(...),
 ) -> ItemPerformanceReportResponse:
     service = AuctionBidService(db)
-    rows = await service.report_item_performance()
+    rows = await service.report_item_performance(event_id)
     items = [ItemPerformanceReportItem(**row) for row in rows]
     return ItemPerformanceReportResponse(generated_at=datetime.now(UTC), items=items)
 
@@ -306,9 +322,10 @@ async def item_performance_report(
 async def bidding_wars_report(
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    event_id: UUID = Query(...),
 ) -> BiddingWarsReportResponse:
     service = AuctionBidService(db)
-    rows = await service.report_bidding_wars()
+    rows = await service.report_bidding_wars(event_id)
     items = [BiddingWarReportItem(**row) for row in rows]
     return BiddingWarsReportResponse(generated_at=datetime.now(UTC), items=items)
 
@@ -322,8 +339,9 @@ async def bidding_wars_report(
 async def high_value_donors_report(
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    event_id: UUID = Query(...),
 ) -> HighValueDonorReportResponse:
     service = AuctionBidService(db)
-    rows = await service.report_high_value_donors()
+    rows = await service.report_high_value_donors(event_id)
     items = [HighValueDonorReportItem(**row) for row in rows]
     return HighValueDonorReportResponse(generated_at=datetime.now(UTC), items=items)
@@ -1,11 +1,10 @@
 """API routes for auction item management."""
 
 import logging
-from decimal import Decimal
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -28,6 +27,7 @@ from app.schemas.auction_item_media import MediaResponse
 from app.schemas.item_view import ItemViewCreate, ItemViewResponse
 from app.services.auction_item_media_service import AuctionItemMediaService
 from app.services.auction_item_service import AuctionItemService
+from app.services.event_snapshot_cache import EventSnapshotCache
 from app.services.item_view_service import ItemViewService
 from app.services.permission_service import PermissionService
 
@@ -107,6 +107,7 @@ async def create_auction_item(
 )
 async def list_auction_items(
     event_id: UUID,
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
     auction_type: Annotated[
         str | None,
@@ -127,7 +128,8 @@ async def list_auction_items(
     page: Annotated[int, Query(description="Page number (1-indexed)", ge=1)] = 1,
     limit: Annotated[int, Query(description="Items per page", ge=1, le=100)] = 50,
     current_user: Annotated[User | None, Depends(get_current_user_optional)] = None,
-) -> AuctionItemListResponse:
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> AuctionItemListResponse | Response:
     """List auction items for an event.
 
     **Permissions**:
@@ -143,6 +145,10 @@ async def list_auction_items(
     - highest_bid (default): Items with highest current bid first
     - newest: Most recently created items first
 
+    **Caching**:
+    - Responses carry an ETag tied to the event version; send it back in
+      If-None-Match to get 304 Not Modified while nothing has changed
+
     Args:
         event_id: UUID of the event
         auction_type: Filter by auction type (or 'all')
@@ -152,10 +158,12 @@ async def list_auction_items(
         page: Page number
         limit: Items per page
         current_user: Optional authenticated user
+        if_none_match: ETag from a previous response
+        response: Response used to set caching headers
         db: Database session
 
     Returns:
-        Paginated list of auction items
+        Paginated list of auction items, or 304 Not Modified
     """
     service = AuctionItemService(db)
 
@@ -198,10 +206,92 @@ async def list_auction_items(
             detail=f"Invalid sort_by: {sort_by}. Must be 'newest' or 'highest_bid'.",
         )
 
-    # List items
+    # The page is identical for every viewer with the same filters and draft
+    # visibility, so it is cached per event version; only the viewer's own
+    # buy-now count is layered on per request.
+    variant = (
+        f"items|{actual_auction_type}|{item_status}|{search}|{sort_by}|{page}|{limit}"
+        f"|{include_drafts}"
+    )
+    viewer = str(current_user.id) if current_user else "anonymous"
+    version = await EventSnapshotCache.get_version(event_id)
+    if version is not None:
+        etag = EventSnapshotCache.etag(event_id, version, f"{variant}|{viewer}")
+        cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if EventSnapshotCache.matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+        response.headers.update(cache_headers)
+
+    cached = (
+        await EventSnapshotCache.get_snapshot(event_id, version, variant)
+        if version is not None
+        else None
+    )
+    if cached:
+        item_page = AuctionItemListResponse.model_validate_json(cached)
+    else:
+        item_page = await _build_auction_item_page(
+            db,
+            service,
+            event_id=event_id,
+            auction_type=actual_auction_type,
+            item_status=item_status,
+            search=search,
+            sort_by=sort_by,
+            page=page,
+            limit=limit,
+            include_drafts=include_drafts,
+        )
+        if version is not None:
+            await EventSnapshotCache.set_snapshot(
+                event_id, version, variant, item_page.model_dump_json()
+            )
+
+    if current_user and item_page.items:
+        buy_now_counts_stmt = (
+            select(
+                AuctionBid.auction_item_id,
+                func.count(AuctionBid.id),
+            )
+            .where(
+                AuctionBid.auction_item_id.in_([item.id for item in item_page.items]),
+                AuctionBid.user_id == current_user.id,
+                AuctionBid.bid_type == "buy_now",
+                AuctionBid.bid_status.notin_(
+                    [BidStatus.CANCELLED.value, BidStatus.WITHDRAWN.value]
+                ),
+            )
+            .group_by(AuctionBid.auction_item_id)
+        )
+        buy_now_purchased_counts = {
+            auction_item_id: int(purchased_count or 0)
+            for auction_item_id, purchased_count in (await db.execute(buy_now_counts_stmt)).all()
+        }
+        for item_response in item_page.items:
+            item_response.buy_now_purchased_count = buy_now_purchased_counts.get(
+                item_response.id, 0
+            )
+
+    return item_page
+
+
+async def _build_auction_item_page(
+    db: AsyncSession,
+    service: AuctionItemService,
+    *,
+    event_id: UUID,
+    auction_type: AuctionType | None,
+    item_status: ItemStatus | None,
+    search: str | None,
+    sort_by: str,
+    page: int,
+    limit: int,
+    include_drafts: bool,
+) -> AuctionItemListResponse:
+    """Build one page of the auction item gallery (viewer-independent fields only)."""
     items, total = await service.list_auction_items(
         event_id=event_id,
-        auction_type=actual_auction_type,
+        auction_type=auction_type,
         status=item_status,
         search=search,
         sort_by=sort_by,
@@ -213,65 +303,24 @@ async def list_auction_items(
     # Calculate pagination
     total_pages = (total + limit - 1) // limit if total > 0 else 0
 
-    # Enrich items with primary image URLs and bid aggregates
+    # Enrich items with primary image URLs and close times
 
     settings = get_settings()
     media_service = AuctionItemMediaService(settings, db)
 
     item_ids = [item.id for item in items]
-    bid_aggregates: dict[UUID, tuple[Decimal | None, int]] = {}
-    buy_now_purchased_counts: dict[UUID, int] = {}
+    primary_image_paths = await media_service.get_primary_image_paths(item_ids)
     extension_state_map, event_close_datetime = await service.get_effective_close_times(
         event_id=event_id,
         item_ids=item_ids,
     )
-    if item_ids:
-        bid_aggregate_stmt = (
-            select(
-                AuctionBid.auction_item_id,
-                func.max(AuctionBid.bid_amount),
-                func.count(AuctionBid.id),
-            )
-            .where(
-                AuctionBid.auction_item_id.in_(item_ids),
-                AuctionBid.bid_status.notin_(
-                    [BidStatus.CANCELLED.value, BidStatus.WITHDRAWN.value]
-                ),
-            )
-            .group_by(AuctionBid.auction_item_id)
-        )
-        bid_aggregate_result = await db.execute(bid_aggregate_stmt)
-        for auction_item_id, max_bid, bid_count in bid_aggregate_result.all():
-            bid_aggregates[auction_item_id] = (max_bid, int(bid_count or 0))
-
-        if current_user:
-            buy_now_counts_stmt = (
-                select(
-                    AuctionBid.auction_item_id,
-                    func.count(AuctionBid.id),
-                )
-                .where(
-                    AuctionBid.auction_item_id.in_(item_ids),
-                    AuctionBid.user_id == current_user.id,
-                    AuctionBid.bid_type == "buy_now",
-                    AuctionBid.bid_status.notin_(
-                        [BidStatus.CANCELLED.value, BidStatus.WITHDRAWN.value]
-                    ),
-                )
-                .group_by(AuctionBid.auction_item_id)
-            )
-            buy_now_counts_result = await db.execute(buy_now_counts_stmt)
-            for auction_item_id, purchased_count in buy_now_counts_result.all():
-                buy_now_purchased_counts[auction_item_id] = int(purchased_count or 0)
 
     enriched_items = []
     for item in items:
         item_dict = AuctionItemResponse.model_validate(item).model_dump()
 
-        current_bid_amount, bid_count = bid_aggregates.get(item.id, (None, 0))
-        item_dict["current_bid_amount"] = current_bid_amount
-        item_dict["bid_count"] = bid_count
-        item_dict["buy_now_purchased_count"] = buy_now_purchased_counts.get(item.id, 0)
+        # Bid state is materialized on the item by AuctionBidService
+        current_bid_amount = item.current_bid_amount
         extension_state = extension_state_map.get(item.id)
         if extension_state:
             item_dict["original_close_at"] = extension_state.original_close_at
@@ -288,38 +337,10 @@ async def list_auction_items(
         else:
             item_dict["min_next_bid_amount"] = item.starting_bid + item.bid_increment
 
-        # Fetch primary image (first image by display_order)
-        media_stmt = (
-            select(AuctionItemMedia)
-            .where(
-                AuctionItemMedia.auction_item_id == item.id,
-                AuctionItemMedia.media_type == "image",
-            )
-            .order_by(AuctionItemMedia.display_order)
-            .limit(1)
+        # Primary image is the first image by display_order
+        item_dict["primary_image_url"] = media_service.get_read_url(
+            primary_image_paths.get(item.id)
         )
-        media_result = await db.execute(media_stmt)
-        primary_media = media_result.scalar_one_or_none()
-
-        if primary_media and primary_media.file_path:
-            image_blob_url = primary_media.file_path
-            if image_blob_url.startswith("https://"):
-                try:
-                    container_path = f"{settings.azure_storage_container_name}/"
-                    if container_path in image_blob_url:
-                        blob_path = image_blob_url.split(container_path, 1)[1]
-                        blob_path = blob_path.split("?", 1)[0]
-                        item_dict["primary_image_url"] = media_service._generate_blob_sas_url(
-                            blob_path, expiry_hours=24
-                        )
-                    else:
-                        item_dict["primary_image_url"] = image_blob_url
-                except (ValueError, IndexError):
-                    item_dict["primary_image_url"] = image_blob_url
-            else:
-                item_dict["primary_image_url"] = image_blob_url
-        else:
-            item_dict["primary_image_url"] = None
 
         enriched_items.append(AuctionItemResponse(**item_dict))
 
@@ -395,52 +416,20 @@ async def get_auction_item(
     media_result = await db.execute(media_stmt)
     media_items = media_result.scalars().all()
 
-    bid_aggregate_stmt = select(
-        func.max(AuctionBid.bid_amount),
-        func.count(AuctionBid.id),
-    ).where(
-        AuctionBid.auction_item_id == item_id,
-        AuctionBid.bid_status.notin_([BidStatus.CANCELLED.value, BidStatus.WITHDRAWN.value]),
-    )
-    bid_aggregate_result = await db.execute(bid_aggregate_stmt)
-    current_bid_amount, bid_count = bid_aggregate_result.one()
+    current_bid_amount = item.current_bid_amount
 
     # Convert media URLs to SAS URLs
     media_responses = []
     for media in media_items:
         media_dict = MediaResponse.model_validate(media).model_dump()
-        container_path = f"{settings.azure_storage_container_name}/"
-
         # Generate SAS URLs for file_path and thumbnail_path if using Azure Blob Storage
-        if media.file_path and media.file_path.startswith("https://"):
-            if container_path in media.file_path:
-                try:
-                    blob_path = media.file_path.split(container_path, 1)[1]
-                    blob_path = blob_path.split("?", 1)[0]
-                    media_dict["file_path"] = media_service._generate_blob_sas_url(
-                        blob_path, expiry_hours=24
-                    )
-                except (ValueError, IndexError):
-                    pass
-
-        if media.thumbnail_path and media.thumbnail_path.startswith("https://"):
-            if container_path in media.thumbnail_path:
-                try:
-                    thumb_blob_path = media.thumbnail_path.split(container_path, 1)[1]
-                    thumb_blob_path = thumb_blob_path.split("?", 1)[0]
-                    media_dict["thumbnail_path"] = media_service._generate_blob_sas_url(
-                        thumb_blob_path, expiry_hours=24
-                    )
-                except (ValueError, IndexError):
-                    pass
-
+        media_dict["file_path"] = media_service.get_read_url(media.file_path)
+        media_dict["thumbnail_path"] = media_service.get_read_url(media.thumbnail_path)
         media_responses.append(media_dict)
 
     # Build response dictionary with all fields
     response_dict = {
         **AuctionItemResponse.model_validate(item).model_dump(),
-        "current_bid_amount": current_bid_amount,
-        "bid_count": int(bid_count or 0),
         "min_next_bid_amount": (
             current_bid_amount + item.bid_increment
             if current_bid_amount is not None
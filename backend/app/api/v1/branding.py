@@ -22,6 +22,7 @@ from app.schemas.npo_branding import (
     LogoUploadResponse,
 )
 from app.services.branding_service import BrandingService
+from app.services.event_service import EventService
 from app.services.file_upload_service import FileUploadService
 from app.services.npo_permission_service import NPOPermissionService
 
@@ -316,6 +317,7 @@ async def upload_logo_local(
         current_branding.logo_url = logo_url
         await db.commit()
         await db.refresh(current_branding)
+        await EventService.bump_npo_event_versions(db, npo_id)
 
         # Convert to response
         branding_response = BrandingResponse.model_validate(current_branding)
@@ -396,6 +398,7 @@ async def upload_icon_local(
         current_branding.icon_url = icon_url
         await db.commit()
         await db.refresh(current_branding)
+        await EventService.bump_npo_event_versions(db, npo_id)
 
         branding_response = BrandingResponse.model_validate(current_branding)
 
@@ -14,6 +14,7 @@ from app.models.event import FoodOption
 from app.models.user import User
 from app.schemas.event import FoodOptionCreateRequest, FoodOptionResponse, FoodOptionUpdateRequest
 from app.services.event_service import EventService
+from app.services.event_snapshot_cache import EventSnapshotCache
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +57,7 @@ async def create_food_option(
     await db.flush()  # Flush to get the ID without committing
     await db.refresh(food_option)
     await db.commit()  # Commit the transaction
+    await EventSnapshotCache.bump_version(event.id)
 
     logger.info(
         f"Created food option {food_option.id} for event {event.id} by user {current_user.id}"
@@ -118,6 +120,7 @@ async def update_food_option(
     await db.flush()
     await db.refresh(food_option)
     await db.commit()  # Commit the transaction
+    await EventSnapshotCache.bump_version(event.id)
 
     logger.info(f"Updated food option {option_id} for event {event.id} by user {current_user.id}")
 
@@ -169,5 +172,6 @@ async def delete_food_option(
     # Delete the food option
     await db.delete(food_option)
     await db.commit()  # Commit the transaction
+    await EventSnapshotCache.bump_version(event.id)
 
     logger.info(f"Deleted food option {option_id} from event {event.id} by user {current_user.id}")
@@ -14,6 +14,7 @@ from app.models.event import EventLink
 from app.models.user import User
 from app.schemas.event import EventLinkCreateRequest, EventLinkResponse, EventLinkUpdateRequest
 from app.services.event_service import EventService
+from app.services.event_snapshot_cache import EventSnapshotCache
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +56,7 @@ async def create_event_link(
     await db.flush()  # Flush to get the ID without committing
     await db.refresh(link)
     await db.commit()  # Commit the transaction
+    await EventSnapshotCache.bump_version(event_id)
 
     logger.info(f"Created link {link.id} for event {event_id} by user {current_user.id}")
 
@@ -111,6 +113,7 @@ async def update_event_link(
     await db.flush()
     await db.refresh(link)
     await db.commit()  # Commit the transaction
+    await EventSnapshotCache.bump_version(event_id)
 
     logger.info(f"Updated link {link_id} for event {event_id} by user {current_user.id}")
 
@@ -160,5 +163,6 @@ async def delete_event_link(
     # Delete the link
     await db.delete(link)
     await db.commit()  # Commit the transaction
+    await EventSnapshotCache.bump_version(event_id)
 
     logger.info(f"Deleted link {link_id} from event {event_id} by user {current_user.id}")
@@ -21,6 +21,7 @@ from app.schemas.event import (
     MediaUploadUrlResponse,
 )
 from app.services.event_service import EventService
+from app.services.event_snapshot_cache import EventSnapshotCache
 from app.services.media_service import MediaService
 
 logger = logging.getLogger(__name__)
@@ -230,6 +231,7 @@ async def update_media(
         media.usage_tag = request.usage_tag
 
     await db.commit()
+    await EventSnapshotCache.bump_version(event_id)
     await db.refresh(media)
 
     file_url = media.file_url
@@ -5,7 +5,7 @@ import uuid
 from decimal import Decimal
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -16,6 +16,7 @@ from app.models.event import EventStatus
 from app.models.ticket_management import TicketPackage
 from app.schemas.event import EventDetailResponse, EventListResponse, EventSummaryResponse
 from app.services.event_service import EventService
+from app.services.event_snapshot_cache import EventSnapshotCache
 
 logger = logging.getLogger(__name__)
 
@@ -84,14 +85,33 @@ async def list_public_events(
 @router.get("/{slug}", response_model=EventDetailResponse)
 async def get_public_event_by_slug(
     slug: str,
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> EventDetailResponse:
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> EventDetailResponse | Response:
     """
     Get event details by slug for public viewing.
 
     Only active events can be viewed.
     No authentication required.
+    Responses carry an ETag tied to the event version; send it back in
+    If-None-Match to get 304 Not Modified while nothing has changed.
     """
+    event_id = await EventSnapshotCache.get_event_id_for_slug(slug)
+    version = await EventSnapshotCache.get_version(event_id) if event_id else None
+    if event_id and version is not None:
+        etag = EventSnapshotCache.etag(event_id, version, "public")
+        if EventSnapshotCache.matches(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": "public, no-cache"},
+            )
+        cached = await EventSnapshotCache.get_snapshot(event_id, version, "public")
+        if cached:
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = "public, no-cache"
+            return EventDetailResponse.model_validate_json(cached)
+
     event = await EventService.get_event_by_slug(db, slug)
 
     if not event:
@@ -106,6 +126,9 @@ async def get_public_event_by_slug(
             detail=f"Event with slug '{slug}' is not available for registration",
         )
 
+    # Read the version before building so a concurrent change is never cached as current
+    version = await EventSnapshotCache.get_version(event.id)
+
     response_dict = EventDetailResponse.model_validate(event, from_attributes=True).model_dump()
     response_dict["npo_name"] = event.npo.name if event.npo else None
     response_dict["npo_slug"] = event.npo.slug if event.npo else None
@@ -113,7 +136,16 @@ async def get_public_event_by_slug(
         event.npo.external_donate_now_url if event.npo else None
     )
     add_sas_urls_to_event_media(response_dict, list(event.media or []))
-    return EventDetailResponse(**response_dict)
+    event_response = EventDetailResponse(**response_dict)
+
+    if version is not None:
+        await EventSnapshotCache.set_snapshot(
+            event.id, version, "public", event_response.model_dump_json()
+        )
+        await EventSnapshotCache.set_event_id_for_slug(slug, event.id)
+        response.headers["ETag"] = EventSnapshotCache.etag(event.id, version, "public")
+        response.headers["Cache-Control"] = "public, no-cache"
+    return event_response
 
 
 # ── Ticket Packages (public) ──────────────────────────────────────────────────
@@ -1,5 +1,7 @@
 """Push subscription API endpoints for Web Push notifications."""
 
+import asyncio
+
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -169,12 +171,11 @@ async def send_test_raw_push(
         raise HTTPException(status_code=403, detail="Super admin access required")
     import json
 
-    from pywebpush import WebPushException, webpush
-
-    from app.services.push_notification_service import _get_vapid_private_key_raw
+    from app.services.push_notification_service import _get_vapid_header_cache
+    from app.services.web_push_sender import WebPushSender
 
-    vapid_key = _get_vapid_private_key_raw()
-    if not vapid_key:
+    vapid = _get_vapid_header_cache()
+    if vapid is None:
         return {"error": "VAPID key not configured"}
 
     subs_result = await db.execute(
@@ -192,8 +193,16 @@ async def send_test_raw_push(
         }
     )
 
+    async with WebPushSender(vapid) as sender:
+        push_results = await asyncio.gather(
+            *(
+                sender.send(sub.endpoint, sub.p256dh_key, sub.auth_key, payload)
+                for sub in subscriptions
+            )
+        )
+
     results = []
-    for sub in subscriptions:
+    for sub, push_result in zip(subscriptions, push_results, strict=True):
         endpoint_domain = "unknown"
         try:
             endpoint_domain = sub.endpoint.split("/")[2]
@@ -204,29 +213,11 @@ async def send_test_raw_push(
             "endpoint_domain": endpoint_domain,
             "platform": sub.platform,
             "user_agent_short": (sub.user_agent or "")[:40],
+            "status": push_result.status,
+            "success": push_result.ok,
         }
-        try:
-            resp = webpush(
-                subscription_info={
-                    "endpoint": sub.endpoint,
-                    "keys": {"p256dh": sub.p256dh_key, "auth": sub.auth_key},
-                },
-                data=payload,
-                vapid_private_key=vapid_key,
-                vapid_claims={"sub": settings.vapid_claims_email},
-                headers={"TTL": "86400", "Urgency": "high"},
-            )
-            entry["status"] = resp.status_code if resp else "no-response"
-            entry["success"] = True
-        except WebPushException as e:
-            resp_obj = getattr(e, "response", None)
-            entry["status"] = resp_obj.status_code if resp_obj else None
-            entry["error"] = str(e)[:200]
-            entry["success"] = False
-        except Exception as e:
-            entry["status"] = None
-            entry["error"] = str(e)[:200]
-            entry["success"] = False
+        if push_result.error:
+            entry["error"] = push_result.error[:200]
         results.append(entry)
 
     return {"subscriptions_count": len(subscriptions), "results": results}
@@ -26,6 +26,7 @@ from app.schemas.users import (
     UserUpdateRequest,
 )
 from app.services.audit_service import AuditService
+from app.services.identity_cache import publish_identity_invalidation
 from app.services.user_service import UserService
 
 router = APIRouter()
@@ -888,6 +889,8 @@ async def verify_user_email(
         result = await db.execute(update_stmt)
         updated_user = result.scalar_one()
         await db.commit()
+        # Core UPDATEs bypass the flush hook that evicts cached identities
+        await publish_identity_invalidation(user_id)
 
         return await build_user_response(updated_user, db)
     except ValueError as e:
@@ -983,6 +986,8 @@ async def upload_profile_picture(
     )
     await db.execute(update_stmt)
     await db.commit()
+    # Core UPDATEs bypass the flush hook that evicts cached identities
+    await publish_identity_invalidation(user_id)
 
     # Audit log
     await AuditService.log_user_updated(
@@ -1,22 +1,63 @@
-"""Celery application configuration for background task processing."""
+"""Celery application configuration for background task processing.
+
+Tasks are routed to queues by urgency so bulk work cannot delay alerts that
+matter within seconds (outbid, bid confirmation, run-of-show cues):
+
+  - realtime:    single-notification push/email/SMS delivery, coalesced bid notifications,
+                 transactional email retries, run-of-show, checkout opening, timer dispatch
+  - bulk:        campaigns, auction opened/closing/closed fan-outs, batched delivery, nudges,
+                 bulk import jobs
+  - reports:     PDF receipt rendering and emailing
+  - maintenance: periodic purges, expiries, event auto-close, recurring donations, nudge fan-out,
+                 stale import job sweep
+
+Run one worker per queue (or group of queues); when a worker is started with
+-Q and without --concurrency, its concurrency comes from the matching
+celery_<queue>_concurrency settings:
+
+    celery -A app.celery_app worker -Q realtime
+    celery -A app.celery_app worker -Q bulk,reports,maintenance,default
+    celery -A app.celery_app beat
+"""
+
+import time
+from typing import Any
 
 from celery import Celery
+from celery.signals import before_task_publish, celeryd_init
+from kombu import Queue
 
 from app.core.config import get_settings
+from app.core.worker_runtime import install_worker_signals
 
 settings = get_settings()
 
+REALTIME_QUEUE = "realtime"
+BULK_QUEUE = "bulk"
+REPORTS_QUEUE = "reports"
+MAINTENANCE_QUEUE = "maintenance"
+DEFAULT_QUEUE = "default"
+
+QUEUE_NAMES = (REALTIME_QUEUE, BULK_QUEUE, REPORTS_QUEUE, MAINTENANCE_QUEUE, DEFAULT_QUEUE)
+
+# Message header carrying the publish time, used for queue latency metrics
+PUBLISHED_AT_HEADER = "fundrbolt_published_at"
+
 celery_app = Celery(
     "fundrbolt",
     broker=settings.celery_broker_url,
     backend=settings.celery_result_backend,
     include=[
         "app.tasks.notification_tasks",
+        "app.tasks.email_tasks",
+        "app.tasks.import_tasks",
         "app.tasks.run_of_show_tasks",
         "app.tasks.recurring_donation_tasks",
         "app.tasks.checkout_tasks",
         "app.tasks.payment_tasks",
         "app.tasks.nudge_tasks",
+        "app.tasks.event_tasks",
+        "app.tasks.timer_tasks",
     ],
 )
 
@@ -34,12 +75,47 @@ celery_app.conf.update(
     task_always_eager=False,
     task_eager_propagates=False,
     worker_prefetch_multiplier=1,
+    task_queues=[Queue(name) for name in QUEUE_NAMES],
+    task_default_queue=DEFAULT_QUEUE,
+    # A worker consuming several queues drains them in the order given to -Q
+    broker_transport_options={"queue_order_strategy": "priority"},
     task_routes={
-        "app.tasks.notification_tasks.*": {"queue": "notifications"},
-        "app.tasks.run_of_show_tasks.*": {"queue": "notifications"},
-        "app.tasks.nudge_tasks.*": {"queue": "notifications"},
+        # Realtime: one notification at a time, donors are waiting on it
+        "app.tasks.notification_tasks.send_push_notification_task": {"queue": REALTIME_QUEUE},
+        "app.tasks.notification_tasks.send_email_notification_task": {"queue": REALTIME_QUEUE},
+        "app.tasks.notification_tasks.send_sms_notification_task": {"queue": REALTIME_QUEUE},
+        "app.tasks.notification_tasks.send_bid_digest_task": {"queue": REALTIME_QUEUE},
+        "app.tasks.email_tasks.send_email_task": {"queue": REALTIME_QUEUE},
+        "app.tasks.run_of_show_tasks.*": {"queue": REALTIME_QUEUE},
+        "app.tasks.checkout_tasks.*": {"queue": REALTIME_QUEUE},
+        "app.tasks.timer_tasks.dispatch_due_timers_task": {"queue": REALTIME_QUEUE},
+        # Bulk: fan-outs to every registrant and batched channel delivery
+        "app.tasks.notification_tasks.send_push_notification_batch_task": {"queue": BULK_QUEUE},
+        "app.tasks.notification_tasks.send_email_notification_batch_task": {"queue": BULK_QUEUE},
+        "app.tasks.notification_tasks.send_sms_notification_batch_task": {"queue": BULK_QUEUE},
+        "app.tasks.notification_tasks.deliver_campaign_task": {"queue": BULK_QUEUE},
+        "app.tasks.notification_tasks.send_auction_opened_task": {"queue": BULK_QUEUE},
+        "app.tasks.notification_tasks.send_auction_closing_soon_task": {"queue": BULK_QUEUE},
+        "app.tasks.notification_tasks.send_auction_closed_task": {"queue": BULK_QUEUE},
+        "app.tasks.notification_tasks.send_checkout_reminders_task": {"queue": BULK_QUEUE},
+        "app.tasks.nudge_tasks.nudge_scan_task": {"queue": BULK_QUEUE},
+        "app.tasks.import_tasks.run_import_job_task": {"queue": BULK_QUEUE},
+        # Reports: PDF rendering
+        "app.tasks.payment_tasks.generate_and_send_receipt": {"queue": REPORTS_QUEUE},
+        "app.tasks.payment_tasks.retry_failed_receipts": {"queue": REPORTS_QUEUE},
+        # Maintenance: periodic housekeeping
+        "app.tasks.notification_tasks.purge_expired_notifications": {"queue": MAINTENANCE_QUEUE},
+        "app.tasks.nudge_tasks.fan_out_nudge_scans_task": {"queue": MAINTENANCE_QUEUE},
+        "app.tasks.payment_tasks.expire_pending_transactions": {"queue": MAINTENANCE_QUEUE},
+        "app.tasks.event_tasks.close_expired_events": {"queue": MAINTENANCE_QUEUE},
+        "app.tasks.recurring_donation_tasks.*": {"queue": MAINTENANCE_QUEUE},
+        "app.tasks.import_tasks.reap_stale_import_jobs_task": {"queue": MAINTENANCE_QUEUE},
     },
     beat_schedule={
+        "dispatch-due-timers": {
+            "task": "app.tasks.timer_tasks.dispatch_due_timers_task",
+            "schedule": settings.timer_dispatch_interval_seconds,
+        },
         "purge-expired-notifications": {
             "task": "app.tasks.notification_tasks.purge_expired_notifications",
             "schedule": 86400.0,  # daily
@@ -52,7 +128,55 @@ celery_app.conf.update(
             "task": "app.tasks.nudge_tasks.fan_out_nudge_scans_task",
             "schedule": 300.0,  # every 5 minutes
         },
+        "expire-pending-transactions": {
+            "task": "app.tasks.payment_tasks.expire_pending_transactions",
+            "schedule": 300.0,  # every 5 minutes
+        },
+        "retry-failed-receipts": {
+            "task": "app.tasks.payment_tasks.retry_failed_receipts",
+            "schedule": 600.0,  # every 10 minutes
+        },
+        "reap-stale-import-jobs": {
+            "task": "app.tasks.import_tasks.reap_stale_import_jobs_task",
+            "schedule": 300.0,  # every 5 minutes
+        },
     },
 )
 
 celery_app.autodiscover_tasks(["app.tasks"])
+
+install_worker_signals()
+
+
+def queue_concurrency(queues: list[str]) -> int | None:
+    """Worker concurrency for a set of consumed queues, from settings.
+
+    Returns None if none of the queues has a configured concurrency.
+    """
+    configured = {
+        REALTIME_QUEUE: settings.celery_realtime_concurrency,
+        BULK_QUEUE: settings.celery_bulk_concurrency,
+        REPORTS_QUEUE: settings.celery_reports_concurrency,
+        MAINTENANCE_QUEUE: settings.celery_maintenance_concurrency,
+    }
+    matched = [configured[queue] for queue in queues if queue in configured]
+    return sum(matched) if matched else None
+
+
+@celeryd_init.connect  # type: ignore[misc]
+def _apply_queue_concurrency(conf: Any = None, options: Any = None, **kwargs: Any) -> None:
+    options = options or {}
+    if options.get("concurrency"):
+        return
+    queues = options.get("queues") or []
+    if isinstance(queues, str):
+        queues = queues.split(",")
+    concurrency = queue_concurrency([queue.strip() for queue in queues])
+    if concurrency is not None and conf is not None:
+        conf.worker_concurrency = concurrency
+
+
+@before_task_publish.connect  # type: ignore[misc]
+def _stamp_publish_time(headers: dict[str, Any] | None = None, **kwargs: Any) -> None:
+    if headers is not None:
+        headers[PUBLISHED_AT_HEADER] = time.time()
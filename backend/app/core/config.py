@@ -35,6 +35,8 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 15
     refresh_token_expire_days: int = 7
+    # bcrypt worker processes per API/worker process; 0 uses one per CPU core
+    password_hash_workers: int = 0
 
     # Azure Communication Services (Email) - Optional for local dev
     azure_communication_connection_string: str | None = None
@@ -43,6 +45,14 @@ class Settings(BaseSettings):
     mailpit_smtp_port: int = 1025
     email_from_address: EmailStr = "noreply@fundrbolt.com"
     email_from_name: str = "FundrBolt"
+    # Email transport: concurrent sends per batch, open SMTP connections per process
+    email_send_concurrency: int = 10
+    email_smtp_pool_size: int = 4
+    # Sends per second across all processes, kept under the provider quota; 0 disables
+    email_max_sends_per_second: int = 20
+    # Transient send failures are requeued (not slept on) with exponential backoff
+    email_max_retries: int = 5
+    email_retry_base_delay_seconds: int = 10
 
     # Azure Blob Storage (for NPO logo uploads) - Optional for local dev
     azure_storage_connection_string: str | None = None
@@ -96,16 +106,91 @@ class Settings(BaseSettings):
     vapid_private_key: str | None = None
     vapid_public_key: str | None = None
     vapid_claims_email: str = "mailto:admin@fundrbolt.com"
+    # In-flight push service requests per sender, and pooled connections per push origin
+    push_max_concurrency: int = 50
+    push_connections_per_origin: int = 20
+    push_request_timeout_seconds: float = 10.0
 
     # Twilio SMS
     twilio_account_sid: str | None = None
     twilio_auth_token: str | None = None
     twilio_from_number: str | None = None
 
+    # Auction Bidding
+    # How long place_bid waits for the per-item row lock before asking the bidder to retry
+    bid_lock_timeout_ms: int = 2000
+    # Window for folding bursts of bid updates on one item into a single broadcast
+    auction_update_coalesce_ms: int = 250
+
+    # Event page caching
+    # Upper bound on snapshot lifetime; snapshots are normally replaced by a version bump
+    event_snapshot_ttl_seconds: int = 300
+
+    # Consent check caching
+    # Lifetime of cached legal document versions; publish/accept/withdraw invalidate sooner
+    consent_cache_ttl_seconds: int = 300
+
+    # Authenticated user caching
+    # How long a process reuses a loaded user+role; User changes are evicted via Redis pub/sub
+    identity_cache_ttl_seconds: float = 30.0
+
     # Celery
     celery_broker_url: str = "redis://localhost:6379/2"
     celery_result_backend: str = "redis://localhost:6379/3"
     celery_task_always_eager: bool = False  # Set True only for local dev / tests
+    # DB connections per Celery worker process (each process runs one event loop)
+    celery_worker_db_pool_size: int = 2
+    celery_worker_db_max_overflow: int = 3
+    # Worker processes per queue, applied to workers started with -Q and no --concurrency
+    celery_realtime_concurrency: int = 4
+    celery_bulk_concurrency: int = 2
+    celery_reports_concurrency: int = 1
+    celery_maintenance_concurrency: int = 1
+    # Timer wheel dispatcher (event timers: closing warnings, reminders, auto-open/close)
+    timer_dispatch_interval_seconds: float = 10.0
+    timer_dispatch_batch_size: int = 100
+    timer_retry_delay_seconds: int = 30
+    # Outbid/bid confirmation push+email coalescing per (user, item): the first update is
+    # sent at once, later ones within this window are folded into one; 0 sends every update
+    bid_notification_coalesce_seconds: int = 15
+    # Coalesced bid notifications a donor can receive per event per hour; 0 disables the cap
+    bid_notification_max_per_user_per_hour: int = 20
+
+    # Background import jobs
+    # Uploaded files wait here for the bulk worker; import_upload_dir is used without Azure
+    # and must be shared by the API and workers
+    import_upload_container: str = "import-uploads"
+    import_upload_dir: str = "uploads/imports"
+    # Row results are saved and a progress event emitted every N rows or seconds
+    import_job_progress_rows: int = 100
+    import_job_progress_interval_seconds: float = 1.0
+    # Running jobs refresh a heartbeat; one silent for longer (worker killed) is re-run,
+    # up to the attempt limit, then failed and its upload removed
+    import_job_heartbeat_seconds: float = 30.0
+    import_job_stale_after_seconds: int = 300
+    import_job_max_attempts: int = 2
+    # Registration imports write this many rows per transaction; off commits row by row
+    registration_import_bulk_commit: bool = True
+    registration_import_commit_chunk_size: int = 500
+    # Auction item ZIP imports upsert this many items per transaction and process this many
+    # images at once; off upserts item by item
+    auction_item_import_bulk_commit: bool = True
+    auction_item_import_chunk_size: int = 100
+    auction_item_import_image_concurrency: int = 8
+    # Rows parsed at preflight are kept this long for the commit of the same file;
+    # larger parses are not cached
+    import_row_cache_ttl_seconds: int = 3600
+    import_row_cache_max_bytes: int = 32 * 1024 * 1024
+
+    # Missed-notification replay on Socket.IO (re)connect
+    notification_replay_page_size: int = 50
+    # Oldest notification replayed; older ones are left to the notification list API
+    notification_replay_max_age_seconds: int = 21600
+    # Minimum gap between reconnect replays per user and event
+    notification_replay_min_interval_seconds: int = 5
+    # Route event-room emits over per-event Redis channels (ShardedRedisManager).
+    # Every API replica and Celery worker must use the same value.
+    socketio_sharded_channels: bool = False
 
     # CORS
     cors_origins: str = (
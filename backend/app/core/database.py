@@ -7,6 +7,7 @@ from typing import Any
 from fastapi import HTTPException
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -46,6 +47,20 @@ else:
 # Create async engine
 async_engine = create_async_engine(database_url, **engine_kwargs)
 
+
+def create_worker_engine() -> AsyncEngine:
+    """Create the engine for one Celery worker process.
+
+    A worker runs one task at a time on one event loop, so it needs far fewer
+    connections than an API process.
+    """
+    worker_kwargs = dict(engine_kwargs)
+    if settings.environment != "test":
+        worker_kwargs["pool_size"] = settings.celery_worker_db_pool_size
+        worker_kwargs["max_overflow"] = settings.celery_worker_db_max_overflow
+    return create_async_engine(database_url, **worker_kwargs)
+
+
 # Create session factory
 AsyncSessionLocal = async_sessionmaker(
     async_engine,
@@ -5,15 +5,50 @@ increment. The /metrics endpoint will use the default registry to expose
 metrics in Prometheus text format.
 """
 
-from prometheus_client import Counter, Gauge
+from prometheus_client import Counter, Gauge, Histogram
 
-# HTTP request counter (labels added later when middleware is added)
+# HTTP request metrics, labelled by route template (e.g. /api/v1/events/{event_id})
 HTTP_REQUESTS_TOTAL = Counter(
     "fundrbolt_http_requests_total",
     "Total number of HTTP requests processed",
     ["method", "path", "status"],
 )
 
+HTTP_REQUEST_DURATION_SECONDS = Histogram(
+    "fundrbolt_http_request_duration_seconds",
+    "HTTP request latency in seconds",
+    ["method", "path"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "fundrbolt_http_requests_in_progress",
+    "HTTP requests currently being processed",
+    ["method"],
+)
+
+HTTP_RESPONSE_SIZE_BYTES = Histogram(
+    "fundrbolt_http_response_size_bytes",
+    "HTTP response body size in bytes",
+    ["method", "path"],
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000),
+)
+
+# Database work per HTTP request (fed by SQLAlchemy engine events)
+HTTP_REQUEST_DB_SECONDS = Histogram(
+    "fundrbolt_http_request_db_seconds",
+    "Time spent executing SQL per HTTP request",
+    ["method", "path"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+HTTP_REQUEST_DB_QUERIES = Histogram(
+    "fundrbolt_http_request_db_queries",
+    "Number of SQL statements executed per HTTP request",
+    ["method", "path"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144),
+)
+
 # Failure counters for key subsystems
 DB_FAILURES_TOTAL = Counter("fundrbolt_db_failures_total", "Total DB failure events")
 REDIS_FAILURES_TOTAL = Counter("fundrbolt_redis_failures_total", "Total Redis failure events")
@@ -75,6 +110,19 @@ SOCIAL_AUTH_FAILURES_TOTAL = Counter(
     ["provider", "failure_code"],
 )
 
+# Celery queue metrics, sampled from the broker when /metrics is scraped
+CELERY_QUEUE_DEPTH = Gauge(
+    "fundrbolt_celery_queue_depth",
+    "Messages waiting in a Celery queue",
+    ["queue"],
+)
+
+CELERY_QUEUE_OLDEST_MESSAGE_AGE_SECONDS = Gauge(
+    "fundrbolt_celery_queue_oldest_message_age_seconds",
+    "Time the oldest waiting message has spent in a Celery queue",
+    ["queue"],
+)
+
 # Simple gauges for introspection
 UP = Gauge("fundrbolt_up", "Application up (1 = up, 0 = down)")
 
@@ -87,6 +135,11 @@ def set_up(value: int = 1) -> None:
 
 __all__ = [
     "HTTP_REQUESTS_TOTAL",
+    "HTTP_REQUEST_DURATION_SECONDS",
+    "HTTP_REQUESTS_IN_PROGRESS",
+    "HTTP_RESPONSE_SIZE_BYTES",
+    "HTTP_REQUEST_DB_SECONDS",
+    "HTTP_REQUEST_DB_QUERIES",
     "DB_FAILURES_TOTAL",
     "REDIS_FAILURES_TOTAL",
     "EMAIL_FAILURES_TOTAL",
@@ -99,6 +152,8 @@ __all__ = [
     "SOCIAL_AUTH_STARTS_TOTAL",
     "SOCIAL_AUTH_SUCCESS_TOTAL",
     "SOCIAL_AUTH_FAILURES_TOTAL",
+    "CELERY_QUEUE_DEPTH",
+    "CELERY_QUEUE_OLDEST_MESSAGE_AGE_SECONDS",
     "UP",
     "set_up",
 ]
@@ -0,0 +1,77 @@
+"""Celery queue depth and latency, sampled from the Redis broker.
+
+Workers do not expose a metrics endpoint, so queue health is read straight
+from the broker whenever the API's /metrics endpoint is scraped: the length
+of each queue's list and the age of the oldest waiting message, taken from
+the publish time stamped on every message by ``app.celery_app``.
+"""
+
+import json
+import time
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.metrics import CELERY_QUEUE_DEPTH, CELERY_QUEUE_OLDEST_MESSAGE_AGE_SECONDS
+
+logger = get_logger(__name__)
+
+_broker_client: "redis.Redis[str] | None" = None
+
+
+def _get_broker_client() -> "redis.Redis[str] | None":
+    global _broker_client
+
+    broker_url = get_settings().celery_broker_url
+    if not broker_url.startswith(("redis://", "rediss://")):
+        return None
+    if _broker_client is None:
+        _broker_client = redis.from_url(
+            broker_url,
+            decode_responses=True,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+        )
+    return _broker_client
+
+
+def message_age_seconds(raw_message: str | None, now: float) -> float:
+    """Age of a raw Redis-transport message, or 0 if it has no publish stamp."""
+    from app.celery_app import PUBLISHED_AT_HEADER
+
+    if not raw_message:
+        return 0.0
+    try:
+        published_at = json.loads(raw_message)["headers"][PUBLISHED_AT_HEADER]
+    except (ValueError, KeyError, TypeError):
+        return 0.0
+    return max(0.0, now - float(published_at))
+
+
+async def refresh_celery_queue_metrics() -> None:
+    """Update the queue depth and oldest-message age gauges for every queue."""
+    from app.celery_app import QUEUE_NAMES
+
+    client = _get_broker_client()
+    if client is None:
+        return
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            for queue in QUEUE_NAMES:
+                # Kombu pushes on the left and workers pop from the right
+                pipe.llen(queue)
+                pipe.lindex(queue, -1)
+            results = await pipe.execute()
+    except (RedisError, OSError):
+        logger.warning("Celery queue metrics sampling failed")
+        return
+
+    now = time.time()
+    for index, queue in enumerate(QUEUE_NAMES):
+        depth, oldest = results[2 * index], results[2 * index + 1]
+        CELERY_QUEUE_DEPTH.labels(queue=queue).set(depth)
+        CELERY_QUEUE_OLDEST_MESSAGE_AGE_SECONDS.labels(queue=queue).set(
+            message_age_seconds(oldest, now)
+        )
@@ -1,6 +1,19 @@
-"""Security utilities for JWT, password hashing, and token generation."""
-
+"""Security utilities for JWT, password hashing, and token generation.
+
+bcrypt at 12 rounds costs a few hundred milliseconds of CPU. Code running on
+the event loop must use ``hash_password_async`` / ``verify_password_async``,
+which run the work in a process pool sized to the CPU count, so a login or a
+bulk import never stalls every other request on the worker. Accounts that
+will set their own password through an account-setup link need no hash at
+all: give them ``unusable_password_hash()``.
+"""
+
+import asyncio
+import multiprocessing
+import os
 import secrets
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -8,8 +21,15 @@ import bcrypt
 import jwt
 
 from app.core.config import get_settings
+from app.core.logging import get_logger
 
 settings = get_settings()
+logger = get_logger(__name__)
+
+# Prefix of password hashes that never match any password (not a bcrypt hash)
+UNUSABLE_PASSWORD_PREFIX = "!"
+
+_password_executor: ProcessPoolExecutor | None = None
 
 
 def hash_password(password: str) -> str:
@@ -46,11 +66,89 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Example:
         is_valid = verify_password("SecurePassword123", hashed)
     """
+    if hashed_password.startswith(UNUSABLE_PASSWORD_PREFIX):
+        return False
     password_bytes = plain_password.encode("utf-8")[:72]  # Truncate to 72 bytes
     hashed_bytes = hashed_password.encode("utf-8")
     return bcrypt.checkpw(password_bytes, hashed_bytes)
 
 
+def unusable_password_hash() -> str:
+    """Placeholder hash for accounts whose owner sets a password via a setup link.
+
+    Costs nothing to create and never verifies, unlike hashing a random
+    temporary password that nobody will ever type.
+
+    Returns:
+        str: Value for ``User.password_hash``
+    """
+    return f"{UNUSABLE_PASSWORD_PREFIX}{secrets.token_urlsafe(16)}"
+
+
+def _get_password_executor() -> ProcessPoolExecutor:
+    global _password_executor
+    if _password_executor is None:
+        workers = settings.password_hash_workers or os.cpu_count() or 1
+        # Spawned workers: forking a process that runs an event loop and
+        # holds open sockets is not safe
+        _password_executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _password_executor
+
+
+def shutdown_password_executor() -> None:
+    """Stop the hashing worker processes (application shutdown)."""
+    global _password_executor
+    executor, _password_executor = _password_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run_in_password_executor(func: Any, *args: Any) -> Any:
+    global _password_executor
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(_get_password_executor(), func, *args)
+    except BrokenProcessPool:
+        # A worker died (OOM kill, crash); start a fresh pool next time and
+        # finish this call on a thread so the caller still gets an answer
+        logger.warning("Password hashing pool broke, recreating it")
+        _password_executor = None
+        return await asyncio.to_thread(func, *args)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password in the hashing process pool, off the event loop.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        str: Hashed password
+    """
+    hashed: str = await _run_in_password_executor(hash_password, password)
+    return hashed
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in the hashing process pool, off the event loop.
+
+    Args:
+        plain_password: Plain text password
+        hashed_password: Bcrypt hash
+
+    Returns:
+        bool: True if password matches
+    """
+    if hashed_password.startswith(UNUSABLE_PASSWORD_PREFIX):
+        return False
+    matches: bool = await _run_in_password_executor(
+        verify_password, plain_password, hashed_password
+    )
+    return matches
+
+
 def create_access_token(
     data: dict[str, Any],
     expires_delta: timedelta | None = None,
@@ -0,0 +1,114 @@
+"""Persistent asyncio runtime for Celery worker processes.
+
+Celery tasks are synchronous but most of the work they do is async. Running
+each task under a fresh ``asyncio.run`` loop leaves pooled asyncpg connections
+bound to loops that no longer exist, so every task paid for a new connection.
+Instead, each worker process gets one long-lived event loop and its own
+small engine when it starts, and every task runs its coroutine on that loop.
+
+Usage:
+    from app.core.worker_runtime import run_async
+
+    @celery_app.task
+    def my_task(event_id: str) -> int:
+        return run_async(_my_task_async(event_id))
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread_id: int | None = None
+_engine: AsyncEngine | None = None
+
+
+def init_worker_runtime() -> None:
+    """Create this process's event loop and database engine.
+
+    Connected to Celery's ``worker_process_init`` signal, so it runs once in
+    every pool process right after fork.
+    """
+    global _loop, _loop_thread_id, _engine
+
+    from app.core.database import AsyncSessionLocal, async_engine, create_worker_engine
+
+    # Connections inherited from the parent process must not be shared with it
+    async_engine.sync_engine.dispose(close=False)
+
+    _loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_loop)
+    _loop_thread_id = threading.get_ident()
+    _engine = create_worker_engine()
+    AsyncSessionLocal.configure(bind=_engine)
+    logger.info("Celery worker runtime initialized")
+
+
+def shutdown_worker_runtime() -> None:
+    """Close this process's push and database connections and its event loop."""
+    global _loop, _loop_thread_id, _engine
+
+    from app.services.push_notification_service import close_push_sender
+
+    loop, engine = _loop, _engine
+    _loop, _loop_thread_id, _engine = None, None, None
+    if loop is None:
+        return
+    try:
+        loop.run_until_complete(close_push_sender())
+        if engine is not None:
+            loop.run_until_complete(engine.dispose())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+
+
+def _on_worker_process_init(**kwargs: Any) -> None:
+    init_worker_runtime()
+
+
+def _on_worker_process_shutdown(**kwargs: Any) -> None:
+    shutdown_worker_runtime()
+
+
+def install_worker_signals() -> None:
+    """Hook the runtime into Celery's worker process lifecycle (idempotent)."""
+    from celery.signals import worker_process_init, worker_process_shutdown
+
+    worker_process_init.connect(
+        _on_worker_process_init, weak=False, dispatch_uid="worker_runtime.init"
+    )
+    worker_process_shutdown.connect(
+        _on_worker_process_shutdown, weak=False, dispatch_uid="worker_runtime.shutdown"
+    )
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from a synchronous Celery task.
+
+    Inside an initialized worker process this reuses the process's event loop
+    and connection pool. Elsewhere (eager mode, scripts, thread pools) it
+    falls back to a private loop, in a helper thread if this thread already
+    has a running loop.
+    """
+    loop = _loop
+    if loop is not None and threading.get_ident() == _loop_thread_id and not loop.is_running():
+        return loop.run_until_complete(coro)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
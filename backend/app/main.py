@@ -1,7 +1,8 @@
 """FastAPI application entry point."""
 
+import asyncio
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
 import sentry_sdk
@@ -32,11 +33,14 @@ from app.core.errors import (
 from app.core.logging import get_logger, setup_logging
 from app.core.metrics import set_up
 from app.core.redis import get_redis
+from app.core.security import shutdown_password_executor
 from app.middleware.consent_check import ConsentCheckMiddleware
-from app.middleware.metrics import MetricsMiddleware
+from app.middleware.metrics import MetricsMiddleware, instrument_engine
 from app.middleware.powered_by import PoweredByMiddleware
 from app.middleware.request_id import RequestIDMiddleware
 from app.middleware.slug_validator import SlugValidationMiddleware
+from app.services.identity_cache import listen_for_identity_invalidations
+from app.services.push_notification_service import close_push_sender
 from app.websocket.notification_ws import sio
 
 # Setup logging
@@ -70,11 +74,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     Startup:
     - Initialize Redis connection
+    - Start the identity cache invalidation listener
     - Log application start
 
     Shutdown:
     - Close database connections
     - Close Redis connection
+    - Stop password hashing workers
     """
     # Startup
     logger.info(
@@ -90,11 +96,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     redis_client = await get_redis()
     logger.info("Redis connection established")
 
+    # Evict cached identities changed by other processes
+    identity_listener = asyncio.create_task(listen_for_identity_invalidations())
+
     # Mark service as up for metrics
     set_up(1)
 
     yield
 
+    identity_listener.cancel()
+    with suppress(asyncio.CancelledError):
+        await identity_listener
+
     # Shutdown
     logger.info("Shutting down FundrBolt Platform API")
 
@@ -102,10 +115,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await async_engine.dispose()
     logger.info("Database connections closed")
 
+    # Close pooled push service connections
+    await close_push_sender()
+
     # Close Redis connection
     await redis_client.aclose()  # type: ignore[attr-defined]
     logger.info("Redis connection closed")
 
+    # Stop password hashing worker processes
+    shutdown_password_executor()
+
     # Mark service as down
     set_up(0)
 
@@ -171,7 +190,8 @@ app.add_middleware(
 # Request ID middleware
 app.add_middleware(RequestIDMiddleware)
 
-# Metrics middleware
+# Metrics middleware (per-request SQL time/count comes from engine events)
+instrument_engine(async_engine.sync_engine)
 app.add_middleware(MetricsMiddleware)
 
 # Powered-By header middleware
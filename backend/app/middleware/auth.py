@@ -7,7 +7,7 @@ import inspect
 import uuid
 from collections.abc import Callable
 from functools import wraps
-from typing import Annotated, Any
+from typing import Annotated, Any, cast
 from uuid import UUID
 
 import jwt
@@ -18,6 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.core.security import decode_token
 from app.models.user import User
+from app.services.identity_cache import identity_cache
 from app.services.redis_service import RedisService
 
 _FORWARD_REF_UUID = UUID
@@ -57,7 +58,7 @@ async def get_current_user(
     2. Decode JWT and validate signature
     3. Check if token is blacklisted in Redis
     4. Verify token hasn't expired
-    5. Fetch user from database
+    5. Fetch user (request state, then the in-process identity cache, then the database)
     6. Verify user is active
 
     Args:
@@ -80,6 +81,11 @@ async def get_current_user(
     """
     token = credentials.credentials
 
+    # Reuse the identity already resolved for this token earlier in the request
+    resolved = getattr(request.state, "authenticated_user", None)
+    if resolved is not None and resolved[0] == token:
+        return cast(User, resolved[1])
+
     try:
         # Decode and validate JWT
         payload = decode_token(token)
@@ -147,6 +153,7 @@ async def get_current_user(
             )
 
         user = await _apply_user_spoofing_if_requested(request, db, user)
+        request.state.authenticated_user = (token, user)
 
         return user
 
@@ -205,6 +212,10 @@ async def get_current_user_optional(
 
     token = auth_header.replace("Bearer ", "")
 
+    resolved = getattr(request.state, "authenticated_user", None)
+    if resolved is not None and resolved[0] == token:
+        return cast(User, resolved[1])
+
     try:
         # Decode and validate JWT
         payload = decode_token(token)
@@ -227,7 +238,9 @@ async def get_current_user_optional(
         if not user or not user.is_active:
             return None
 
-        return await _apply_user_spoofing_if_requested(request, db, user)
+        user = await _apply_user_spoofing_if_requested(request, db, user)
+        request.state.authenticated_user = (token, user)
+        return user
 
     except Exception:
         # Any error in token validation - return None (anonymous)
@@ -235,8 +248,23 @@ async def get_current_user_optional(
 
 
 async def _get_user_with_role(db: AsyncSession, user_id: UUID) -> User | None:
-    """Fetch a user and attach role_name for downstream authorization checks."""
+    """Fetch a user and attach role_name for downstream authorization checks.
+
+    Served from the in-process identity cache when possible; the cached
+    snapshot is attached to ``db`` without a query so endpoints can still
+    modify and commit the returned user.
+    """
     from sqlalchemy import select, text
+    from sqlalchemy.orm import make_transient_to_detached
+
+    snapshot = identity_cache.get(user_id)
+    if snapshot is not None:
+        values, role_name = snapshot
+        detached = User(**values)
+        make_transient_to_detached(detached)
+        merged = await db.merge(detached, load=False)
+        merged.role_name = role_name  # type: ignore[attr-defined]
+        return merged
 
     stmt = select(User).where(User.id == user_id)
     result = await db.execute(stmt)
@@ -248,6 +276,7 @@ async def _get_user_with_role(db: AsyncSession, user_id: UUID) -> User | None:
     role_result = await db.execute(role_stmt, {"role_id": user.role_id})
     role_name_str = role_result.scalar_one_or_none()
     user.role_name = role_name_str if role_name_str else "unknown"  # type: ignore[attr-defined]
+    identity_cache.put(user, user.role_name)  # type: ignore[attr-defined]
     return user
 
 
@@ -6,12 +6,12 @@ legal documents before accessing protected endpoints.
 
 import logging
 from collections.abc import Awaitable, Callable
+from uuid import UUID
 
 from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from app.core.database import AsyncSessionLocal
 from app.services.consent_service import ConsentService
 
 logger = logging.getLogger(__name__)
@@ -25,6 +25,8 @@ class ConsentCheckMiddleware(BaseHTTPMiddleware):
     - Exempt paths: /auth/*, /legal/*, /consent/*, /health, /metrics, /docs
     - If user has outdated consent, returns 409 Conflict
     - Does NOT block anonymous/public endpoints
+    - Latest document versions and each user's accepted versions are cached
+      in Redis, so the check normally costs no database round-trips
 
     Response on outdated consent:
     - Status: 409 Conflict
@@ -81,64 +83,53 @@ class ConsentCheckMiddleware(BaseHTTPMiddleware):
                 # Invalid token - let auth middleware handle it
                 return await call_next(request)
 
-            # Check consent status
-            async with AsyncSessionLocal() as db:
-                # Get user
-                from sqlalchemy import select
-
-                from app.models.user import User
-
-                stmt = select(User).where(User.id == user_id_str)
-                result = await db.execute(stmt)
-                user = result.scalar_one_or_none()
-
-                if not user:
-                    # User not found - let auth middleware handle it
-                    return await call_next(request)
-
-                # Check consent status
-                service = ConsentService()
-                consent_status = await service.get_consent_status(db=db, user=user)
-
-                # If consent required, block request with 409
-                if consent_status.consent_required:
-                    logger.warning(
-                        f"User {user.email} has outdated consent - blocking request to {path}"
-                    )
-                    return JSONResponse(
-                        status_code=status.HTTP_409_CONFLICT,
-                        content={
-                            "error": {
-                                "code": "CONSENT_REQUIRED",
-                                "message": "You must accept the updated legal documents to continue",
-                                "details": {
-                                    "current_tos_version": consent_status.current_tos_version,
-                                    "current_privacy_version": consent_status.current_privacy_version,
-                                    "latest_tos_version": consent_status.latest_tos_version,
-                                    "latest_privacy_version": consent_status.latest_privacy_version,
-                                },
-                            }
-                        },
-                    )
-
-                # If no active consent at all, also block (except for initial consent)
-                if not consent_status.has_active_consent:
-                    logger.warning(
-                        f"User {user.email} has no active consent - blocking request to {path}"
-                    )
-                    return JSONResponse(
-                        status_code=status.HTTP_409_CONFLICT,
-                        content={
-                            "error": {
-                                "code": "CONSENT_REQUIRED",
-                                "message": "You must accept the legal documents to continue",
-                                "details": {
-                                    "latest_tos_version": consent_status.latest_tos_version,
-                                    "latest_privacy_version": consent_status.latest_privacy_version,
-                                },
-                            }
-                        },
-                    )
+            # Check consent status (served from cache; no DB session on the common path)
+            service = ConsentService()
+            consent_status = await service.get_cached_consent_status(UUID(user_id_str))
+
+            if consent_status is None:
+                # User not found - let auth middleware handle it
+                return await call_next(request)
+
+            # If consent required, block request with 409
+            if consent_status.consent_required:
+                logger.warning(
+                    f"User {user_id_str} has outdated consent - blocking request to {path}"
+                )
+                return JSONResponse(
+                    status_code=status.HTTP_409_CONFLICT,
+                    content={
+                        "error": {
+                            "code": "CONSENT_REQUIRED",
+                            "message": "You must accept the updated legal documents to continue",
+                            "details": {
+                                "current_tos_version": consent_status.current_tos_version,
+                                "current_privacy_version": consent_status.current_privacy_version,
+                                "latest_tos_version": consent_status.latest_tos_version,
+                                "latest_privacy_version": consent_status.latest_privacy_version,
+                            },
+                        }
+                    },
+                )
+
+            # If no active consent at all, also block (except for initial consent)
+            if not consent_status.has_active_consent:
+                logger.warning(
+                    f"User {user_id_str} has no active consent - blocking request to {path}"
+                )
+                return JSONResponse(
+                    status_code=status.HTTP_409_CONFLICT,
+                    content={
+                        "error": {
+                            "code": "CONSENT_REQUIRED",
+                            "message": "You must accept the legal documents to continue",
+                            "details": {
+                                "latest_tos_version": consent_status.latest_tos_version,
+                                "latest_privacy_version": consent_status.latest_privacy_version,
+                            },
+                        }
+                    },
+                )
 
         except Exception as e:
             # Any error in consent check - log and allow request
@@ -1,54 +1,128 @@
 """Middleware for collecting HTTP request metrics.
 
-Tracks request count, latency, and status codes for Prometheus monitoring.
+Tracks request count, latency, in-flight requests, response size, and the SQL
+time and statement count spent on each request for Prometheus monitoring.
+Requests are labelled by route template rather than raw path so path
+parameters such as UUIDs do not create new series.
+
+Implemented as plain ASGI middleware so it does not add a task hop or
+response re-wrapping to every request.
 """
 
 import time
-from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.core.metrics import HTTP_REQUESTS_TOTAL
+from app.core.metrics import (
+    HTTP_REQUEST_DB_QUERIES,
+    HTTP_REQUEST_DB_SECONDS,
+    HTTP_REQUEST_DURATION_SECONDS,
+    HTTP_REQUESTS_IN_PROGRESS,
+    HTTP_REQUESTS_TOTAL,
+    HTTP_RESPONSE_SIZE_BYTES,
+)
 
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+@dataclass
+class RequestDbStats:
+    """SQL work accumulated while serving one request."""
+
+    queries: int = 0
+    seconds: float = 0.0
+
+
+_request_db_stats: ContextVar[RequestDbStats | None] = ContextVar("request_db_stats", default=None)
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    """Middleware to collect HTTP request metrics for Prometheus."""
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        """Process request and collect metrics.
+def instrument_engine(engine: Engine) -> None:
+    """Attribute SQL statement count and time on ``engine`` to the current request.
 
-        Args:
-            request: The incoming request
-            call_next: The next middleware or route handler
+    Args:
+        engine: Sync engine (``async_engine.sync_engine`` for async engines)
+    """
 
-        Returns:
-            The response from downstream handlers
-        """
-        # Start timing
-        start_time = time.time()
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        started = conn.info["query_start_time"].pop()
+        stats = _request_db_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.seconds += time.perf_counter() - started
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context: Any) -> None:
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start_time"):
+            conn.info["query_start_time"].pop()
+
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if not path:
+        return UNMATCHED_ROUTE
+    if len(path) > 100:
+        path = path[:97] + "..."
+    return str(path)
+
+
+class MetricsMiddleware:
+    """Middleware to collect HTTP request metrics for Prometheus."""
 
-        # Process request
-        response = await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        # Calculate duration
-        duration = time.time() - start_time
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request and collect metrics."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Extract path without query params and truncate long paths
-        path = request.url.path
-        if len(path) > 100:
-            path = path[:97] + "..."
+        method = scope["method"]
+        start_time = time.perf_counter()
+        status_code = 500
+        response_size = 0
+        db_stats = RequestDbStats()
+        stats_token = _request_db_stats.set(db_stats)
 
-        # Increment request counter
-        HTTP_REQUESTS_TOTAL.labels(
-            method=request.method,
-            path=path,
-            status=response.status_code,
-        ).inc()
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add duration header for debugging (optional)
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Process-Time", f"{time.perf_counter() - start_time:.4f}")
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
 
-        # Add duration header for debugging (optional)
-        response.headers["X-Process-Time"] = f"{duration:.4f}"
+        HTTP_REQUESTS_IN_PROGRESS.labels(method=method).inc()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            duration = time.perf_counter() - start_time
+            HTTP_REQUESTS_IN_PROGRESS.labels(method=method).dec()
+            _request_db_stats.reset(stats_token)
 
-        return response
+            path = _route_template(scope)
+            HTTP_REQUESTS_TOTAL.labels(method=method, path=path, status=status_code).inc()
+            HTTP_REQUEST_DURATION_SECONDS.labels(method=method, path=path).observe(duration)
+            HTTP_RESPONSE_SIZE_BYTES.labels(method=method, path=path).observe(response_size)
+            HTTP_REQUEST_DB_SECONDS.labels(method=method, path=path).observe(db_stats.seconds)
+            HTTP_REQUEST_DB_QUERIES.labels(method=method, path=path).observe(db_stats.queries)
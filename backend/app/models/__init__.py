@@ -55,6 +55,7 @@ from app.models.event_nudge_notification_log import EventNudgeNotificationLog
 from app.models.event_registration import EventRegistration, RegistrationStatus
 from app.models.event_survey_config import EventSurveyConfig
 from app.models.event_table import EventTable
+from app.models.import_job import ImportJob, ImportJobKind, ImportJobRow, ImportJobStatus
 from app.models.invitation import Invitation
 from app.models.item_promotion import ItemPromotion
 from app.models.item_view import ItemView
@@ -216,6 +217,10 @@ __all__ = [
     "EventTable",
     "FoodOption",
     "ImportFormat",
+    "ImportJob",
+    "ImportJobKind",
+    "ImportJobRow",
+    "ImportJobStatus",
     "ImportStatus",
     "Invitation",
     "ItemPromotion",
@@ -22,6 +22,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base, TimestampMixin, UUIDMixin
 
 if TYPE_CHECKING:
+    from app.models.auction_bid import AuctionBid
     from app.models.event import Event
     from app.models.sponsor import Sponsor
     from app.models.user import User
@@ -139,6 +140,19 @@ class AuctionItem(Base, UUIDMixin, TimestampMixin):
         server_default="0",
         nullable=False,
     )
+    # Incremented on every bid state change, so real-time deltas can be ordered
+    bid_state_version: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+    # Latest record of the current high bid (not a foreign key, to avoid a
+    # circular dependency with auction_bids)
+    current_high_bid_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=True,
+    )
     bidding_open: Mapped[bool] = mapped_column(
         default=False,
         server_default="false",
@@ -195,6 +209,22 @@ class AuctionItem(Base, UUIDMixin, TimestampMixin):
     )
     creator: Mapped["User"] = relationship("User", foreign_keys=[created_by])
 
+    def set_high_bid_state(self, high_bid: "AuctionBid | None", placed: int = 0) -> None:
+        """Update the materialized bidding state after bids are written.
+
+        Args:
+            high_bid: Latest record of the current high bid, or None if no bid is active
+            placed: Number of newly placed bids to add to bid_count
+        """
+        self.current_high_bid_id = high_bid.id if high_bid else None
+        self.current_bid_amount = high_bid.bid_amount if high_bid else None
+        self.min_next_bid_amount = (
+            high_bid.bid_amount + self.bid_increment if high_bid else self.starting_bid
+        )
+        if placed:
+            self.bid_count = (self.bid_count or 0) + placed
+        self.bid_state_version = (self.bid_state_version or 0) + 1
+
     # Constraints (documented in migration)
     __table_args__ = (
         UniqueConstraint("event_id", "external_id", name="uq_auction_items_event_external_id"),
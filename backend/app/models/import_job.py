@@ -0,0 +1,133 @@
+"""Models for background bulk import jobs."""
+
+import enum
+import uuid
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+
+from app.models.base import Base, UUIDMixin
+
+if TYPE_CHECKING:
+    from app.models.user import User
+
+
+class ImportJobKind(str, enum.Enum):
+    """Which importer a job runs."""
+
+    REGISTRATIONS = "registrations"
+    USERS = "users"
+    TICKET_SALES = "ticket_sales"
+    AUCTION_BIDS = "auction_bids"
+    AUCTION_ITEMS = "auction_items"
+
+
+class ImportJobStatus(str, enum.Enum):
+    """Lifecycle of an import job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ImportJob(Base, UUIDMixin):
+    """A committed import running on the bulk Celery queue.
+
+    The uploaded file is kept in import upload storage under ``storage_key``
+    until the job finishes. ``result`` holds the importer's full report once
+    the job completes. A running job refreshes ``heartbeat_at``; a job whose
+    heartbeat stops (worker killed mid-import) is run again or failed by the
+    stale job sweep.
+    """
+
+    __tablename__ = "import_jobs"
+
+    kind: Mapped[ImportJobKind] = mapped_column(
+        SQLEnum(
+            ImportJobKind,
+            name="import_job_kind",
+            native_enum=False,
+            values_callable=lambda obj: [e.value for e in obj],
+        ),
+        nullable=False,
+    )
+    status: Mapped[ImportJobStatus] = mapped_column(
+        SQLEnum(
+            ImportJobStatus,
+            name="import_job_status",
+            native_enum=False,
+            values_callable=lambda obj: [e.value for e in obj],
+        ),
+        nullable=False,
+        default=ImportJobStatus.QUEUED,
+        index=True,
+    )
+    event_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("events.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
+    npo_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("npos.id", ondelete="CASCADE"),
+        nullable=True,
+    )
+    initiated_by_user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id"),
+        nullable=False,
+        index=True,
+    )
+    file_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    storage_key: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    # Importer arguments that are not columns, e.g. the preflight batch id
+    params: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
+    total_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    processed_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Processed rows per row status, e.g. {"created": 120, "skipped": 3}
+    status_counts: Mapped[dict[str, int]] = mapped_column(JSONB, nullable=False, default=dict)
+    result: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Times the job has been claimed by a worker
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    initiated_by: Mapped["User"] = relationship("User")
+    rows: Mapped[list["ImportJobRow"]] = relationship(
+        "ImportJobRow",
+        back_populates="job",
+        cascade="all, delete-orphan",
+        order_by="ImportJobRow.row_number",
+    )
+
+
+class ImportJobRow(Base, UUIDMixin):
+    """Outcome of one source row, written in batches while the job runs."""
+
+    __tablename__ = "import_job_rows"
+
+    job_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("import_jobs.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    row_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[str] = mapped_column(String(30), nullable=False)
+    message: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    job: Mapped["ImportJob"] = relationship("ImportJob", back_populates="rows")
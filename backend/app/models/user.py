@@ -249,6 +249,17 @@ class User(Base, UUIDMixin, TimestampMixin):
         self.password_hash = hash_password(plain_password)
         self.has_local_password = True
 
+    async def set_password_async(self, plain_password: str) -> None:
+        """Hash and set the user's password without blocking the event loop.
+
+        Args:
+            plain_password: The plain text password to hash
+        """
+        from app.core.security import hash_password_async
+
+        self.password_hash = await hash_password_async(plain_password)
+        self.has_local_password = True
+
     def verify_password(self, plain_password: str) -> bool:
         """Verify a plain text password against the stored hash.
 
@@ -262,6 +273,19 @@ class User(Base, UUIDMixin, TimestampMixin):
 
         return verify_password(plain_password, self.password_hash)
 
+    async def verify_password_async(self, plain_password: str) -> bool:
+        """Verify a password against the stored hash without blocking the event loop.
+
+        Args:
+            plain_password: The plain text password to verify
+
+        Returns:
+            True if password matches, False otherwise
+        """
+        from app.core.security import verify_password_async
+
+        return await verify_password_async(plain_password, self.password_hash)
+
     @property
     def full_name(self) -> str:
         """Get the user's full name.
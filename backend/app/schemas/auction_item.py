@@ -140,6 +140,7 @@ class AuctionItemResponse(AuctionItemBase):
     current_bid_amount: Decimal | None = None
     min_next_bid_amount: Decimal | None = None
     bid_count: int = 0
+    bid_state_version: int = 0
     bidding_open: bool = False
     original_close_at: datetime | None = None
     effective_close_at: datetime | None = None
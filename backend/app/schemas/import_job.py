@@ -0,0 +1,55 @@
+"""Schemas for background import jobs."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.models.import_job import ImportJobKind, ImportJobStatus
+
+
+class ImportJobResponse(BaseModel):
+    """State of an import job.
+
+    ``result`` is the importer's report (the same body the commit endpoint
+    used to return) and is only set once ``status`` is ``completed``.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    kind: ImportJobKind
+    status: ImportJobStatus
+    event_id: UUID | None = None
+    npo_id: UUID | None = None
+    file_name: str
+    total_rows: int
+    processed_rows: int
+    status_counts: dict[str, int] = Field(default_factory=dict)
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+
+class ImportJobRowResponse(BaseModel):
+    """Outcome of one source row."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    row_number: int
+    status: str
+    message: str | None = None
+
+
+class ImportJobRowsResponse(BaseModel):
+    """A page of row outcomes, in row order."""
+
+    rows: list[ImportJobRowResponse]
+    total: int
+    offset: int
+    limit: int
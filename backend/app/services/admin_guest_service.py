@@ -3,7 +3,6 @@
 import csv
 import io
 import logging
-import secrets
 import uuid as _uuid_module
 from datetime import datetime
 from decimal import Decimal
@@ -18,7 +17,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.config import get_settings
-from app.core.security import hash_password
+from app.core.security import unusable_password_hash
 from app.models.donor_label import DonorLabel
 from app.models.donor_label_assignment import DonorLabelAssignment
 from app.models.event import Event, FoodOption
@@ -92,7 +91,7 @@ class AdminGuestService:
                     email=guest_email.lower(),
                     first_name=pre_first,
                     last_name=pre_last,
-                    password_hash=hash_password(f"Tmp{secrets.token_urlsafe(10)}1"),
+                    password_hash=unusable_password_hash(),
                     role_id=donor_role.id,
                     must_change_password=True,
                     email_verified=False,
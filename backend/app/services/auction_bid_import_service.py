@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import csv
 import hashlib
-import io
 import json
 import time
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from decimal import Decimal, InvalidOperation
@@ -15,7 +14,6 @@ from typing import Any
 from uuid import UUID
 
 import magic
-from openpyxl import load_workbook
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.selectable import Subquery
@@ -46,18 +44,21 @@ from app.schemas.auction_bid_import import (
 from app.schemas.auction_bid_import import (
     AuctionBidImportIssueSeverity as SchemaIssueSeverity,
 )
+from app.services.import_progress import ImportProgress
+from app.services.import_reader import (
+    JSONArrayExpectedError,
+    ParsedRow,
+    iter_json_array,
+    iter_xlsx_records,
+    open_text,
+)
+from app.services.import_row_cache import ImportRowCache
 
 MAX_IMPORT_ROWS = 10000
 REQUIRED_HEADERS = ["donor_email", "auction_item_code", "bid_amount", "bid_time"]
 logger = get_logger(__name__)
 
 
-@dataclass
-class ParsedRow:
-    row_number: int
-    data: dict[str, Any]
-
-
 @dataclass
 class DonorLookup:
     users_by_email: dict[str, User]
@@ -68,6 +69,10 @@ class AuctionBidImportError(Exception):
     """Base exception for auction bid import errors."""
 
 
+class _RowLimitError(AuctionBidImportError):
+    """File has more rows than MAX_IMPORT_ROWS."""
+
+
 class AuctionBidImportService:
     """Bulk import service for auction bids."""
 
@@ -93,7 +98,7 @@ class AuctionBidImportService:
 
         detect_start = time.monotonic()
         detected_format = self._detect_format(file_bytes, filename)
-        parsed_rows = self._parse_file(file_bytes, detected_format)
+        parsed_rows = await self._load_rows(file_bytes, detected_format)
         logger.info(
             "Auction bid preflight parsed",
             extra={
@@ -257,7 +262,9 @@ class AuctionBidImportService:
         import_batch_id: UUID,
         file_bytes: bytes,
         user_id: UUID,
+        progress: ImportProgress | None = None,
     ) -> AuctionBidImportSummary:
+        progress = progress or ImportProgress()
         result = await self.db.execute(
             select(AuctionBidImportBatch).where(
                 AuctionBidImportBatch.id == import_batch_id,
@@ -279,7 +286,8 @@ class AuctionBidImportService:
                 "Cannot import file with errors. Please fix errors and re-run preflight."
             )
 
-        parsed_rows = self._parse_file(file_bytes, batch.source_format)
+        parsed_rows = await self._load_rows(file_bytes, batch.source_format)
+        await progress.start(len(parsed_rows))
 
         donor_emails: set[str] = {
             email
@@ -305,6 +313,7 @@ class AuctionBidImportService:
         skipped_count = 0
         started_at = datetime.now(UTC)
         updated_high_bids = dict(current_high_bids)
+        placed_per_item: dict[UUID, int] = {}
 
         for parsed_row in parsed_rows:
             row_issues = self._validate_row(
@@ -328,6 +337,7 @@ class AuctionBidImportService:
                     for issue in row_issues
                 ):
                     skipped_count += 1
+                    await progress.row(parsed_row.row_number, "skipped", "Bid already exists")
                     continue
 
             donor_email = self._normalize_email(parsed_row.data.get("donor_email"))
@@ -382,7 +392,14 @@ class AuctionBidImportService:
                 self.db.add(outbid)
 
             updated_high_bids[item.id] = new_bid
+            placed_per_item[item.id] = placed_per_item.get(item.id, 0) + 1
             created_count += 1
+            await progress.row(parsed_row.row_number, "created")
+
+        for item in item_lookup.values():
+            placed = placed_per_item.get(item.id, 0)
+            if placed:
+                item.set_high_bid_state(updated_high_bids.get(item.id), placed=placed)
 
         batch.status = AuctionBidImportStatus.IMPORTED
         batch.created_by = user_id
@@ -486,6 +503,16 @@ class AuctionBidImportService:
             "Unsupported file format. Please upload a CSV, JSON, or Excel file."
         )
 
+    async def _load_rows(
+        self, file_bytes: bytes, file_format: AuctionBidImportFormat
+    ) -> list[ParsedRow]:
+        """Parse a file, reusing the rows parsed at preflight when unchanged."""
+        return await ImportRowCache.get_or_parse(
+            f"auction_bids:{file_format.value}",
+            file_bytes,
+            lambda content: self._parse_file(content, file_format),
+        )
+
     def _parse_file(
         self, file_bytes: bytes, file_format: AuctionBidImportFormat
     ) -> list[ParsedRow]:
@@ -499,15 +526,16 @@ class AuctionBidImportService:
 
     def _parse_csv(self, file_bytes: bytes) -> list[ParsedRow]:
         try:
-            text = file_bytes.decode("utf-8")
-            reader = csv.DictReader(io.StringIO(text))
-            self._validate_required_headers(reader.fieldnames or [])
-            rows: list[ParsedRow] = []
-            for idx, row in enumerate(reader, start=2):
-                if self._is_empty_row(row):
-                    continue
-                rows.append(ParsedRow(row_number=idx, data=dict(row)))
-            return rows
+            with open_text(file_bytes, "utf-8") as text:
+                reader = csv.DictReader(text)
+                self._validate_required_headers(reader.fieldnames or [])
+                return self._collect_rows(
+                    ParsedRow(row_number=idx, data=dict(row))
+                    for idx, row in enumerate(reader, start=2)
+                    if not self._is_empty_row(row)
+                )
+        except _RowLimitError:
+            raise
         except UnicodeDecodeError as exc:
             raise AuctionBidImportError("CSV must be UTF-8 encoded") from exc
         except Exception as exc:
@@ -515,41 +543,58 @@ class AuctionBidImportService:
 
     def _parse_json(self, file_bytes: bytes) -> list[ParsedRow]:
         try:
-            text = file_bytes.decode("utf-8")
-            data = json.loads(text)
-            if not isinstance(data, list):
+            try:
+                items = iter_json_array(file_bytes, "utf-8")
+            except JSONArrayExpectedError:
                 raise AuctionBidImportError("JSON must contain an array of bids")
-            rows = []
-            for idx, item in enumerate(data, start=1):
-                if not isinstance(item, dict):
-                    raise AuctionBidImportError("JSON rows must be objects")
-                rows.append(ParsedRow(row_number=idx, data=item))
-            return rows
+            return self._collect_rows(
+                self._json_row(idx, item) for idx, item in enumerate(items, start=1)
+            )
+        except _RowLimitError:
+            raise
         except json.JSONDecodeError as exc:
             raise AuctionBidImportError(f"Invalid JSON: {exc}") from exc
         except Exception as exc:
             raise AuctionBidImportError(f"Failed to parse JSON: {exc}") from exc
 
+    def _json_row(self, idx: int, item: Any) -> ParsedRow:
+        if not isinstance(item, dict):
+            raise AuctionBidImportError("JSON rows must be objects")
+        return ParsedRow(row_number=idx, data=item)
+
     def _parse_xlsx(self, file_bytes: bytes) -> list[ParsedRow]:
         try:
-            workbook = load_workbook(io.BytesIO(file_bytes))
-            sheet = workbook.active
-            if sheet is None:
-                raise AuctionBidImportError("Excel file has no active sheet")
-            header_row = [cell.value for cell in sheet[1]]
+            records = iter_xlsx_records(file_bytes)
+            header_row = next(records, None) or ()
             headers = [self._normalize_header(value) for value in header_row]
             self._validate_required_headers(headers)
 
-            rows: list[ParsedRow] = []
-            for idx, row in enumerate(sheet.iter_rows(min_row=2, values_only=True), start=2):
-                if self._is_empty_row(row):
-                    continue
-                data = {headers[i]: row[i] for i in range(len(headers)) if i < len(row)}
-                rows.append(ParsedRow(row_number=idx, data=data))
-            return rows
+            return self._collect_rows(
+                ParsedRow(
+                    row_number=idx,
+                    data={headers[i]: row[i] for i in range(len(headers)) if i < len(row)},
+                )
+                for idx, row in enumerate(records, start=2)
+                if not self._is_empty_row(row)
+            )
+        except _RowLimitError:
+            raise
         except Exception as exc:
             raise AuctionBidImportError(f"Failed to parse Excel: {exc}") from exc
 
+    def _collect_rows(self, rows: Iterator[ParsedRow]) -> list[ParsedRow]:
+        """Keep up to MAX_IMPORT_ROWS rows; past that, only count them for the error."""
+        collected: list[ParsedRow] = []
+        total = 0
+        for total, row in enumerate(rows, start=1):
+            if total <= MAX_IMPORT_ROWS:
+                collected.append(row)
+        if total > MAX_IMPORT_ROWS:
+            raise _RowLimitError(
+                f"File contains {total} rows. Maximum allowed is {MAX_IMPORT_ROWS}."
+            )
+        return collected
+
     def _validate_required_headers(self, headers: Sequence[Any]) -> None:
         normalized = {self._normalize_header(header) for header in headers if header}
         missing = [field for field in REQUIRED_HEADERS if field not in normalized]
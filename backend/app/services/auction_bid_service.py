@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
-from datetime import UTC, datetime
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, not_, select
+from sqlalchemy import Numeric, cast, exists, func, not_, select, text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 from sqlalchemy.sql.selectable import Subquery
 
+from app.core.config import get_settings
 from app.models.auction_bid import (
     AuctionBid,
     BidActionAudit,
@@ -22,18 +26,48 @@ from app.models.auction_bid import (
     PaddleRaiseContribution,
     TransactionStatus,
 )
-from app.models.auction_item import AuctionItem, AuctionItemMedia, AuctionType
+from app.models.auction_item import AuctionItem, AuctionType
 from app.models.event import Event
 from app.models.event_registration import EventRegistration
-from app.models.notification import NotificationPriorityEnum, NotificationTypeEnum
+from app.models.notification import (
+    Notification,
+    NotificationPriorityEnum,
+    NotificationTypeEnum,
+)
 from app.models.registration_guest import RegistrationGuest
 from app.models.user import User
+from app.services.bid_notification_coalescer import BidNotificationCoalescer
+from app.services.event_snapshot_cache import EventSnapshotCache
 from app.services.notification_service import NotificationService
 from app.services.silent_auction_extension_service import SilentAuctionExtensionService
+from app.websocket.auction_updates import auction_update_publisher, build_item_delta
 from app.websocket.notification_ws import sio
 
 logger = logging.getLogger(__name__)
 
+# PostgreSQL SQLSTATE raised when lock_timeout expires
+_LOCK_NOT_AVAILABLE = "55P03"
+
+
+class BidConflictError(Exception):
+    """Raised when a concurrent bid holds the item lock past the lock timeout."""
+
+    def __init__(
+        self,
+        message: str = "Another bid was just placed on this item. Please review the new price and retry.",
+    ) -> None:
+        super().__init__(message)
+
+
+@dataclass
+class _ContestOutcome:
+    """Result of resolving a bid against the current high bid."""
+
+    high_bid: AuctionBid
+    placed: int
+    outbid: list[tuple[AuctionBid, Decimal]] = field(default_factory=list)
+    proxy_bids: list[AuctionBid] = field(default_factory=list)
+
 
 class AuctionBidService:
     """Service for auction bid operations."""
@@ -41,19 +75,24 @@ class AuctionBidService:
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
-    async def _publish_bid_update(self, bid: AuctionBid) -> None:
-        """Publish bid update for real-time clients (placeholder hook)."""
-        logger.info(
-            "Bid update published",
-            extra={
-                "event_id": str(bid.event_id),
-                "auction_item_id": str(bid.auction_item_id),
-                "bid_id": str(bid.id),
-                "bid_status": bid.bid_status,
-            },
-        )
-
-    async def _get_auction_item(self, item_id: UUID) -> AuctionItem:
+    async def _publish_bid_state(
+        self,
+        item: AuctionItem,
+        *,
+        bid_placed: bool,
+        effective_close_at: datetime | None = None,
+    ) -> None:
+        """Broadcast the item's committed bid state to everyone viewing the event."""
+        await EventSnapshotCache.bump_version(item.event_id)
+        delta = build_item_delta(item, effective_close_at)
+        if bid_placed:
+            await auction_update_publisher.publish_bid_placed(item, delta)
+        else:
+            await auction_update_publisher.publish_item_changed(item, delta)
+
+    async def _get_auction_item(self, item_id: UUID, *, for_update: bool = False) -> AuctionItem:
+        if for_update:
+            return await self._lock_auction_item(item_id)
         stmt = select(AuctionItem).where(AuctionItem.id == item_id)
         result = await self.db.execute(stmt)
         item = result.scalar_one_or_none()
@@ -61,6 +100,33 @@ class AuctionBidService:
             raise ValueError("Auction item not found")
         return item
 
+    async def _lock_auction_item(self, item_id: UUID) -> AuctionItem:
+        """Lock the item row so bids on the same item are serialized.
+
+        The item row carries the materialized high-bid state, so holding its
+        lock for the rest of the transaction makes the read-check-insert in
+        place_bid atomic per item without blocking bids on other items. A short
+        lock_timeout turns a pile-up behind a hot item into a retryable error.
+        """
+        timeout_ms = int(get_settings().bid_lock_timeout_ms)
+        try:
+            await self.db.execute(text(f"SET LOCAL lock_timeout = '{timeout_ms}ms'"))
+            result = await self.db.execute(
+                select(AuctionItem)
+                .where(AuctionItem.id == item_id)
+                .with_for_update()
+                .execution_options(populate_existing=True)
+            )
+        except DBAPIError as exc:
+            if getattr(exc.orig, "sqlstate", None) != _LOCK_NOT_AVAILABLE:
+                raise
+            await self.db.rollback()
+            raise BidConflictError() from exc
+        item = result.scalar_one_or_none()
+        if not item:
+            raise ValueError("Auction item not found")
+        return item
+
     async def _get_user_display_name(self, user_id: UUID) -> str:
         """Get a display name for a user (first+last or email)."""
         stmt = select(User.first_name, User.last_name, User.email).where(User.id == user_id)
@@ -81,13 +147,17 @@ class AuctionBidService:
         return slug or str(event_id)
 
     async def _send_bid_confirmation(self, bid: AuctionBid, item: AuctionItem) -> None:
-        """T075: Send bid confirmation notification to the bidder."""
+        """T075: Send bid confirmation notification to the bidder.
+
+        The in-app notification is emitted immediately; push/email delivery is
+        coalesced with the bidder's other notifications for the item.
+        """
         bid_id = str(bid.id)
         bid_user_id = str(bid.user_id)
         try:
             event_slug = await self._get_event_slug(bid.event_id)
             async with self.db.begin_nested():
-                await NotificationService.create_notification(
+                notification = await NotificationService.create_notification(
                     db=self.db,
                     event_id=bid.event_id,
                     user_id=bid.user_id,
@@ -105,6 +175,7 @@ class AuctionBidService:
                     dispatch_tasks=False,
                 )
             await self.db.commit()
+            await BidNotificationCoalescer.hold(notification, item.id)
         except Exception:
             logger.warning(
                 "Failed to send bid confirmation notification",
@@ -158,6 +229,17 @@ class AuctionBidService:
         return list(result.scalars().all())
 
     async def _current_high_bid(self, item_id: UUID) -> AuctionBid | None:
+        """Load the current high bid from the item's materialized bid state."""
+        stmt = (
+            select(AuctionBid)
+            .join(AuctionItem, AuctionItem.current_high_bid_id == AuctionBid.id)
+            .where(AuctionItem.id == item_id)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def _scan_current_high_bid(self, item_id: UUID) -> AuctionBid | None:
+        """Find the current high bid by scanning the item's full bid history."""
         latest = await self._latest_bid_records_for_item(item_id)
         active = [
             bid
@@ -168,18 +250,58 @@ class AuctionBidService:
             return None
         return sorted(active, key=lambda bid: (bid.bid_amount, bid.placed_at), reverse=True)[0]
 
+    async def _recompute_bid_state(self, item_id: UUID) -> AuctionItem:
+        """Rebuild the item's materialized bid state from history.
+
+        Only used by admin corrections (cancel, adjust, mark winning), where the
+        high bid can move backwards; the bid placement path updates the state
+        incrementally instead.
+        """
+        await self.db.flush()
+        item = await self._get_auction_item(item_id, for_update=True)
+        latest = await self._latest_bid_records_for_item(item_id)
+        active = [
+            bid
+            for bid in latest
+            if bid.bid_status in {BidStatus.ACTIVE.value, BidStatus.WINNING.value}
+        ]
+        high_bid = max(active, key=lambda bid: (bid.bid_amount, bid.placed_at)) if active else None
+        item.set_high_bid_state(high_bid)
+        item.bid_count = len(
+            [
+                bid
+                for bid in latest
+                if bid.bid_status not in {BidStatus.CANCELLED.value, BidStatus.WITHDRAWN.value}
+            ]
+        )
+        return item
+
     async def _create_status_copy(
         self,
         bid: AuctionBid,
         new_status: BidStatus | None = None,
         new_transaction_status: TransactionStatus | None = None,
         actor_user_id: UUID | None = None,
+    ) -> AuctionBid:
+        copy_bid = self._build_status_copy(
+            bid, new_status, new_transaction_status, actor_user_id=actor_user_id
+        )
+        self.db.add(copy_bid)
+        await self.db.flush()
+        return copy_bid
+
+    def _build_status_copy(
+        self,
+        bid: AuctionBid,
+        new_status: BidStatus | None = None,
+        new_transaction_status: TransactionStatus | None = None,
+        actor_user_id: UUID | None = None,
     ) -> AuctionBid:
         status = new_status.value if new_status else bid.bid_status
         transaction_status = (
             new_transaction_status.value if new_transaction_status else bid.transaction_status
         )
-        copy_bid = AuctionBid(
+        return AuctionBid(
             event_id=bid.event_id,
             auction_item_id=bid.auction_item_id,
             user_id=bid.user_id,
@@ -193,9 +315,6 @@ class AuctionBidService:
             source_bid_id=bid.id,
             created_by=actor_user_id or bid.user_id,
         )
-        self.db.add(copy_bid)
-        await self.db.flush()
-        return copy_bid
 
     async def _log_admin_action(
         self,
@@ -220,14 +339,20 @@ class AuctionBidService:
         actor_user_id: UUID,
         new_bid_amount: Decimal | None = None,
         item: AuctionItem | None = None,
-    ) -> None:
+    ) -> Notification | None:
+        """Mark a bid outbid and notify its bidder.
+
+        Returns:
+            The outbid notification, for BidNotificationCoalescer.hold once the
+            caller has committed, or None if it could not be created.
+        """
         await self._create_status_copy(
             previous_bid, new_status=BidStatus.OUTBID, actor_user_id=actor_user_id
         )
 
         # Send outbid notification to the previous high bidder
         try:
-            await self._send_outbid_notification(
+            return await self._send_outbid_notification(
                 previous_bid=previous_bid,
                 new_bid_amount=new_bid_amount,
                 item=item,
@@ -240,17 +365,20 @@ class AuctionBidService:
                     "item_id": str(previous_bid.auction_item_id),
                 },
             )
+            return None
 
     async def _send_outbid_notification(
         self,
         previous_bid: AuctionBid,
         new_bid_amount: Decimal | None = None,
         item: AuctionItem | None = None,
-    ) -> None:
+    ) -> Notification | None:
         """Create an outbid notification for the outbid user.
 
         Uses a savepoint so that a DB failure (e.g. missing notifications
-        table) does not corrupt the parent bid transaction.
+        table) does not corrupt the parent bid transaction. Push/email
+        delivery is not dispatched here: the caller commits and hands the
+        returned notification to BidNotificationCoalescer.hold.
         """
         if item is None:
             item = await self._get_auction_item(previous_bid.auction_item_id)
@@ -265,42 +393,19 @@ class AuctionBidService:
         old_amount_str = f"${previous_bid.bid_amount:,.2f}"
 
         # Fetch primary image for thumbnail
-        media_result = await self.db.execute(
-            select(AuctionItemMedia.file_path)
-            .where(
-                AuctionItemMedia.auction_item_id == item.id,
-                AuctionItemMedia.media_type == "image",
-            )
-            .order_by(AuctionItemMedia.display_order)
-            .limit(1)
-        )
-        image_url: str | None = None
-        raw_image_url = media_result.scalar_one_or_none()
-        if raw_image_url:
-            if raw_image_url.startswith("https://"):
-                try:
-                    from app.core.config import get_settings
-                    from app.services.auction_item_media_service import (
-                        AuctionItemMediaService,
-                    )
+        from app.services.auction_item_media_service import AuctionItemMediaService
 
-                    _settings = get_settings()
-                    _media_svc = AuctionItemMediaService(_settings, self.db)
-                    container_path = f"{_settings.azure_storage_container_name}/"
-                    if container_path in raw_image_url:
-                        blob_path = raw_image_url.split(container_path, 1)[1]
-                        blob_path = blob_path.split("?", 1)[0]
-                        image_url = _media_svc._generate_blob_sas_url(blob_path, expiry_hours=24)
-                    else:
-                        image_url = raw_image_url
-                except Exception:
-                    image_url = raw_image_url
-            else:
-                image_url = raw_image_url
+        media_service = AuctionItemMediaService(get_settings(), self.db)
+        image_paths = await media_service.get_primary_image_paths([item.id])
+        image_url = image_paths.get(item.id)
+        try:
+            image_url = media_service.get_read_url(image_url)
+        except Exception:
+            pass
 
         try:
             async with self.db.begin_nested():
-                await NotificationService.create_notification(
+                return await NotificationService.create_notification(
                     db=self.db,
                     event_id=previous_bid.event_id,
                     user_id=previous_bid.user_id,
@@ -332,6 +437,7 @@ class AuctionBidService:
                 },
                 exc_info=True,
             )
+            return None
 
     async def place_bid(
         self,
@@ -342,7 +448,7 @@ class AuctionBidService:
         bid_type: BidType,
         max_bid: Decimal | None = None,
     ) -> AuctionBid:
-        item = await self._get_auction_item(auction_item_id)
+        item = await self._get_auction_item(auction_item_id, for_update=True)
         if item.event_id != event_id:
             raise ValueError("Auction item does not belong to the event")
 
@@ -400,7 +506,21 @@ class AuctionBidService:
                 created_by=user_id,
             )
             self.db.add(new_bid)
+
+            outcome = _ContestOutcome(high_bid=new_bid, placed=1)
+            if current_high and current_high.user_id != user_id:
+                self.db.add(
+                    self._build_status_copy(
+                        current_high, new_status=BidStatus.OUTBID, actor_user_id=user_id
+                    )
+                )
+                outcome.outbid.append((current_high, bid_amount))
+            elif current_high:
+                outcome.high_bid = max(
+                    (current_high, new_bid), key=lambda bid: (bid.bid_amount, bid.placed_at)
+                )
             await self.db.flush()
+            item.set_high_bid_state(outcome.high_bid, placed=outcome.placed)
 
             # Buy-now bids do not participate in anti-sniping extension updates.
             bid_response_meta: Any = new_bid
@@ -408,16 +528,9 @@ class AuctionBidService:
             bid_response_meta.item_effective_close_at = None
             bid_response_meta.max_extension_reached = False
 
-            if current_high and current_high.user_id != user_id:
-                await self._outbid_previous(
-                    current_high,
-                    actor_user_id=user_id,
-                    new_bid_amount=bid_amount,
-                    item=item,
-                )
-
             await self.db.commit()
-            await self._publish_bid_update(new_bid)
+            await self._publish_bid_state(item, bid_placed=True)
+            await self._send_contest_notifications(item, outcome)
             await self._send_bid_confirmation(new_bid, item)
 
             return new_bid
@@ -448,21 +561,15 @@ class AuctionBidService:
             created_by=user_id,
         )
         self.db.add(new_bid)
-        await self.db.flush()
 
-        if (
-            current_high
-            and current_high.user_id != user_id
-            and bid_amount > current_high.bid_amount
-        ):
-            await self._outbid_previous(
-                current_high,
-                actor_user_id=user_id,
-                new_bid_amount=bid_amount,
-                item=item,
-            )
+        if current_high and current_high.user_id != user_id:
+            outcome = self._resolve_bid_contest(item, current_high, new_bid)
+        else:
+            outcome = _ContestOutcome(high_bid=new_bid, placed=1)
 
-        await self._apply_proxy_bidding(item, starting_high_bid=new_bid)
+        # Every row produced by the contest is written in a single flush.
+        await self.db.flush()
+        item.set_high_bid_state(outcome.high_bid, placed=outcome.placed)
 
         extension_service = SilentAuctionExtensionService(self.db)
         extension_result = await extension_service.evaluate_and_apply_extension(
@@ -480,92 +587,152 @@ class AuctionBidService:
         bid_response_meta_after_eval.max_extension_reached = extension_result.max_extension_reached
 
         await self.db.commit()
-        await self._publish_bid_update(new_bid)
+        await self._publish_bid_state(
+            item,
+            bid_placed=True,
+            effective_close_at=extension_result.item_effective_close_at,
+        )
+        await self._send_contest_notifications(item, outcome)
 
         # T075: Send bid confirmation for direct bids
-        await self._send_bid_confirmation(new_bid, item)
+        if outcome.high_bid is new_bid:
+            await self._send_bid_confirmation(new_bid, item)
 
         return new_bid
 
-    async def _apply_proxy_bidding(self, item: AuctionItem, starting_high_bid: AuctionBid) -> None:
-        if item.auction_type != AuctionType.SILENT.value:
-            return
+    def _resolve_bid_contest(
+        self, item: AuctionItem, current_high: AuctionBid, challenger: AuctionBid
+    ) -> _ContestOutcome:
+        """Resolve a challenge against another bidder's high bid in one pass.
 
-        current_high = starting_high_bid
-        iterations = 0
-        while iterations < 20:
-            iterations += 1
-            latest = await self._latest_bid_records_for_item(item.id)
-            active_latest = [
-                bid
-                for bid in latest
-                if bid.bid_status == BidStatus.ACTIVE.value and bid.max_bid is not None
-            ]
-            candidates = [bid for bid in active_latest if bid.user_id != current_high.user_id]
-            if not candidates:
-                break
-
-            candidates.sort(key=lambda bid: (-Decimal(bid.max_bid or 0), bid.placed_at))
-            best = candidates[0]
-            next_amount = current_high.bid_amount + item.bid_increment
-            if best.max_bid is None or best.max_bid < next_amount:
-                break
-
-            auto_bid = AuctionBid(
-                event_id=item.event_id,
-                auction_item_id=item.id,
-                user_id=best.user_id,
-                bidder_number=best.bidder_number,
-                bid_amount=next_amount,
-                max_bid=best.max_bid,
-                bid_type=BidType.PROXY_AUTO.value,
-                bid_status=BidStatus.ACTIVE.value,
-                transaction_status=TransactionStatus.PENDING.value,
-                placed_at=datetime.now(UTC),
-                source_bid_id=None,
-                created_by=best.user_id,
+        Proxy bids are settled the way eBay does it: the higher maximum wins at
+        one increment above the losing maximum (capped at the winner's own
+        maximum), and an equal maximum goes to the bidder who got there first.
+        Because every earlier proxy loser was beaten at its maximum, only the
+        current leader and the challenger can still take part.
+
+        Rows are only added to the session; the caller flushes them together.
+        """
+        proxies_apply = item.auction_type == AuctionType.SILENT.value
+        leader_max = (proxies_apply and current_high.max_bid) or current_high.bid_amount
+        challenger_max = (proxies_apply and challenger.max_bid) or challenger.bid_amount
+        opening_amount = challenger.bid_amount
+        outcome = _ContestOutcome(high_bid=challenger, placed=1)
+
+        self.db.add(
+            self._build_status_copy(
+                current_high, new_status=BidStatus.OUTBID, actor_user_id=challenger.user_id
             )
-            self.db.add(auto_bid)
-            await self.db.flush()
+        )
 
-            await self._outbid_previous(
-                current_high,
-                actor_user_id=best.user_id,
-                new_bid_amount=next_amount,
-                item=item,
+        if challenger_max > leader_max:
+            # The challenger wins, paying just enough to beat the leader's maximum.
+            challenger.bid_amount = max(
+                challenger.bid_amount, min(challenger_max, leader_max + item.bid_increment)
             )
+            if leader_max >= opening_amount and leader_max > current_high.bid_amount:
+                # Record the leader's proxy reaching its maximum before losing.
+                self.db.add(
+                    self._build_proxy_bid(
+                        current_high, leader_max, BidStatus.OUTBID, challenger.placed_at
+                    )
+                )
+                outcome.placed += 1
+            outcome.outbid.append((current_high, challenger.bid_amount))
+            return outcome
+
+        # The leader's proxy defends, one increment above the challenger's maximum.
+        challenger.bid_amount = challenger_max
+        challenger.bid_status = BidStatus.OUTBID.value
+        defending_bid = self._build_proxy_bid(
+            current_high,
+            min(leader_max, challenger_max + item.bid_increment),
+            BidStatus.ACTIVE,
+            challenger.placed_at,
+        )
+        self.db.add(defending_bid)
+        outcome.high_bid = defending_bid
+        outcome.placed += 1
+        outcome.outbid.append((challenger, defending_bid.bid_amount))
+        outcome.proxy_bids.append(defending_bid)
+        return outcome
+
+    def _build_proxy_bid(
+        self, proxy_bid: AuctionBid, amount: Decimal, status: BidStatus, after: datetime
+    ) -> AuctionBid:
+        return AuctionBid(
+            event_id=proxy_bid.event_id,
+            auction_item_id=proxy_bid.auction_item_id,
+            user_id=proxy_bid.user_id,
+            bidder_number=proxy_bid.bidder_number,
+            bid_amount=amount,
+            max_bid=proxy_bid.max_bid,
+            bid_type=BidType.PROXY_AUTO.value,
+            bid_status=status.value,
+            transaction_status=TransactionStatus.PENDING.value,
+            # Keep history ordered after the bid that triggered the proxy.
+            placed_at=max(datetime.now(UTC), after + timedelta(microseconds=1)),
+            source_bid_id=None,
+            created_by=proxy_bid.user_id,
+        )
+
+    async def _send_contest_notifications(
+        self, item: AuctionItem, outcome: _ContestOutcome
+    ) -> None:
+        """Send the notifications produced by a bid contest once the bids are committed."""
+        if not outcome.outbid and not outcome.proxy_bids:
+            return
 
+        held: list[Notification] = []
+        for outbid_bid, new_amount in outcome.outbid:
+            try:
+                notification = await self._send_outbid_notification(
+                    previous_bid=outbid_bid, new_bid_amount=new_amount, item=item
+                )
+                if notification is not None:
+                    held.append(notification)
+            except Exception:
+                logger.warning(
+                    "Failed to send outbid notification",
+                    extra={"user_id": str(outbid_bid.user_id), "item_id": str(item.id)},
+                )
+
+        if outcome.proxy_bids:
+            event_slug = await self._get_event_slug(item.event_id)
+        for proxy_bid in outcome.proxy_bids:
             # T076: Notify user their proxy bid auto-executed
             try:
-                event_slug = await self._get_event_slug(item.event_id)
                 async with self.db.begin_nested():
-                    await NotificationService.create_notification(
+                    notification = await NotificationService.create_notification(
                         db=self.db,
                         event_id=item.event_id,
-                        user_id=best.user_id,
+                        user_id=proxy_bid.user_id,
                         notification_type=NotificationTypeEnum.PROXY_BID_TRIGGERED,
                         priority=NotificationPriorityEnum.NORMAL,
                         title="Proxy bid placed automatically",
                         body=(
-                            f"Your proxy bid of ${next_amount:,.2f} was automatically "
+                            f"Your proxy bid of ${proxy_bid.bid_amount:,.2f} was automatically "
                             f"placed on {item.title}."
                         ),
                         data={
                             "item_id": str(item.id),
-                            "bid_amount": str(next_amount),
-                            "max_bid": str(best.max_bid),
+                            "bid_amount": str(proxy_bid.bid_amount),
+                            "max_bid": str(proxy_bid.max_bid),
                             "deep_link": f"/events/{event_slug}?item={item.id}",
                         },
                         sio=sio,
                         dispatch_tasks=False,
                     )
+                held.append(notification)
             except Exception:
                 logger.warning(
                     "Failed to send proxy bid triggered notification",
-                    extra={"user_id": str(best.user_id), "item_id": str(item.id)},
+                    extra={"user_id": str(proxy_bid.user_id), "item_id": str(item.id)},
                 )
 
-            current_high = auto_bid
+        await self.db.commit()
+        for notification in held:
+            await BidNotificationCoalescer.hold(notification, item.id)
 
     async def list_item_bids(
         self, auction_item_id: UUID, page: int, per_page: int
@@ -602,7 +769,7 @@ class AuctionBidService:
         return list(result.scalars().all()), total
 
     async def mark_winning(self, bid_id: UUID, actor_user_id: UUID, reason: str) -> AuctionBid:
-        bid = await self._get_bid_by_id(bid_id)
+        bid = await self._lock_item_for_bid(bid_id)
         winning_bid = await self._create_status_copy(
             bid, new_status=BidStatus.WINNING, actor_user_id=actor_user_id
         )
@@ -614,16 +781,21 @@ class AuctionBidService:
             metadata={"previous_bid_id": str(bid.id)},
         )
 
-        current_high = await self._current_high_bid(bid.auction_item_id)
+        current_high = await self._scan_current_high_bid(bid.auction_item_id)
+        outbid_notification = None
         if current_high and current_high.id != winning_bid.id:
-            await self._outbid_previous(current_high, actor_user_id=actor_user_id)
+            outbid_notification = await self._outbid_previous(
+                current_high, actor_user_id=actor_user_id
+            )
+        item = await self._recompute_bid_state(bid.auction_item_id)
 
         await self.db.commit()
-        await self._publish_bid_update(winning_bid)
+        await self._publish_bid_state(item, bid_placed=False)
+        if outbid_notification is not None:
+            await BidNotificationCoalescer.hold(outbid_notification, item.id)
 
         # T048: Notify donor that an admin placed a bid on their behalf
         try:
-            item = await self._get_auction_item(winning_bid.auction_item_id)
             admin_name = await self._get_user_display_name(actor_user_id)
             event_slug = await self._get_event_slug(winning_bid.event_id)
             await NotificationService.create_notification(
@@ -661,7 +833,7 @@ class AuctionBidService:
         new_amount: Decimal,
         reason: str,
     ) -> AuctionBid:
-        bid = await self._get_bid_by_id(bid_id)
+        bid = await self._lock_item_for_bid(bid_id)
         adjusted_bid = AuctionBid(
             event_id=bid.event_id,
             auction_item_id=bid.auction_item_id,
@@ -685,12 +857,13 @@ class AuctionBidService:
             reason=reason,
             metadata={"previous_bid_id": str(bid.id), "new_amount": str(new_amount)},
         )
+        item = await self._recompute_bid_state(bid.auction_item_id)
         await self.db.commit()
-        await self._publish_bid_update(adjusted_bid)
+        await self._publish_bid_state(item, bid_placed=False)
         return adjusted_bid
 
     async def cancel_bid(self, bid_id: UUID, actor_user_id: UUID, reason: str) -> AuctionBid:
-        bid = await self._get_bid_by_id(bid_id)
+        bid = await self._lock_item_for_bid(bid_id)
         cancelled_bid = await self._create_status_copy(
             bid, new_status=BidStatus.CANCELLED, actor_user_id=actor_user_id
         )
@@ -701,8 +874,9 @@ class AuctionBidService:
             reason=reason,
             metadata={"previous_bid_id": str(bid.id)},
         )
+        item = await self._recompute_bid_state(bid.auction_item_id)
         await self.db.commit()
-        await self._publish_bid_update(cancelled_bid)
+        await self._publish_bid_state(item, bid_placed=False)
         return cancelled_bid
 
     async def override_transaction_status(
@@ -712,7 +886,7 @@ class AuctionBidService:
         new_status: TransactionStatus,
         reason: str,
     ) -> AuctionBid:
-        bid = await self._get_bid_by_id(bid_id)
+        bid = await self._lock_item_for_bid(bid_id)
         updated_bid = await self._create_status_copy(
             bid,
             new_transaction_status=new_status,
@@ -725,8 +899,9 @@ class AuctionBidService:
             reason=reason,
             metadata={"previous_bid_id": str(bid.id), "transaction_status": new_status.value},
         )
+        item = await self._recompute_bid_state(bid.auction_item_id)
         await self.db.commit()
-        await self._publish_bid_update(updated_bid)
+        await self._publish_bid_state(item, bid_placed=False)
         return updated_bid
 
     async def record_paddle_raise(
@@ -776,6 +951,23 @@ class AuctionBidService:
 
         return contribution
 
+    async def _lock_item_for_bid(self, bid_id: UUID) -> AuctionBid:
+        """Lock a bid's auction item, then load the bid.
+
+        A bid record never moves to another item, so its item can be looked up
+        before the lock. Everything an admin correction decides on (the bid,
+        the current high bid, who gets outbid) is read only once the lock is
+        held, so a concurrent place_bid cannot change it in between.
+        """
+        result = await self.db.execute(
+            select(AuctionBid.auction_item_id).where(AuctionBid.id == bid_id)
+        )
+        item_id = result.scalar_one_or_none()
+        if item_id is None:
+            raise ValueError("Bid not found")
+        await self._lock_auction_item(item_id)
+        return await self._get_bid_by_id(bid_id)
+
     async def _get_bid_by_id(self, bid_id: UUID) -> AuctionBid:
         stmt = select(AuctionBid).where(AuctionBid.id == bid_id)
         result = await self.db.execute(stmt)
@@ -841,170 +1033,220 @@ class AuctionBidService:
             for bid in bids
         ]
 
+    def _latest_event_bids_subquery(self, event_id: UUID) -> Subquery:
+        """Latest record of every bid chain in one event."""
+        successor = aliased(AuctionBid)
+        return (
+            select(AuctionBid)
+            .where(
+                AuctionBid.event_id == event_id,
+                ~exists().where(successor.source_bid_id == AuctionBid.id),
+            )
+            .subquery()
+        )
+
     async def report_bidder_analytics(
         self,
+        event_id: UUID,
         bidder_number: int | None = None,
         auction_type: AuctionType | None = None,
     ) -> list[dict[str, Any]]:
-        latest = await self._latest_bid_records_for_item_subquery()
+        latest = self._latest_event_bids_subquery(event_id)
+        zero = Decimal("0.00")
+        is_proxy = (latest.c.bid_type == BidType.PROXY_AUTO.value) | latest.c.max_bid.isnot(None)
+        is_winning = latest.c.bid_status == BidStatus.WINNING.value
+        is_live = AuctionItem.auction_type == AuctionType.LIVE.value
         stmt = (
-            select(AuctionBid, AuctionItem)
-            .join(AuctionItem)
-            .where(AuctionBid.id.in_(select(latest.c.id)))
+            select(
+                latest.c.bidder_number,
+                func.coalesce(func.sum(latest.c.bid_amount).filter(is_winning), zero),
+                func.coalesce(
+                    func.sum(latest.c.bid_amount).filter(
+                        latest.c.bid_status == BidStatus.OUTBID.value
+                    ),
+                    zero,
+                ),
+                func.coalesce(
+                    func.sum(latest.c.bid_amount).filter(
+                        is_winning,
+                        latest.c.transaction_status.in_(
+                            [TransactionStatus.PENDING.value, TransactionStatus.PROCESSING.value]
+                        ),
+                    ),
+                    zero,
+                ),
+                func.coalesce(func.sum(latest.c.max_bid), zero),
+                func.coalesce(func.sum(latest.c.bid_amount).filter(is_live), zero),
+                func.coalesce(func.sum(latest.c.bid_amount).filter(~is_live), zero),
+                func.count(),
+                func.count().filter(is_proxy),
+            )
+            .join(AuctionItem, AuctionItem.id == latest.c.auction_item_id)
+            .group_by(latest.c.bidder_number)
         )
         if bidder_number:
-            stmt = stmt.where(AuctionBid.bidder_number == bidder_number)
+            stmt = stmt.where(latest.c.bidder_number == bidder_number)
         if auction_type:
             stmt = stmt.where(AuctionItem.auction_type == auction_type.value)
         result = await self.db.execute(stmt)
-        rows = result.all()
-
-        by_bidder: dict[int, dict[str, Any]] = defaultdict(
-            lambda: {
-                "bidder_number": 0,
-                "total_won": Decimal("0.00"),
-                "total_lost": Decimal("0.00"),
-                "total_unprocessed": Decimal("0.00"),
-                "total_max_potential": Decimal("0.00"),
-                "live_total": Decimal("0.00"),
-                "silent_total": Decimal("0.00"),
-                "paddle_raise_total": Decimal("0.00"),
+        # Too many columns for typed rows; each row is unpacked by position below
+        bidder_rows: Sequence[Any] = result.all()
+
+        by_bidder: dict[int, dict[str, Any]] = {}
+        for (
+            bidder_num,
+            total_won,
+            total_lost,
+            total_unprocessed,
+            total_max_potential,
+            live_total,
+            silent_total,
+            total_bids,
+            proxy_bids,
+        ) in bidder_rows:
+            by_bidder[bidder_num] = {
+                "bidder_number": bidder_num,
+                "total_won": total_won,
+                "total_lost": total_lost,
+                "total_unprocessed": total_unprocessed,
+                "total_max_potential": total_max_potential,
+                "live_total": live_total,
+                "silent_total": silent_total,
+                "paddle_raise_total": zero,
                 "bidding_war_count": 0,
-                "proxy_usage_rate": Decimal("0.00"),
-                "_total_bids": 0,
-                "_proxy_bids": 0,
+                "proxy_usage_rate": Decimal(proxy_bids) / Decimal(total_bids),
             }
-        )
 
-        for bid, item in rows:
-            entry = by_bidder[bid.bidder_number]
-            entry["bidder_number"] = bid.bidder_number
-            entry["_total_bids"] += 1
-            if bid.bid_type == BidType.PROXY_AUTO.value or bid.max_bid is not None:
-                entry["_proxy_bids"] += 1
-
-            if bid.bid_status == BidStatus.WINNING.value:
-                entry["total_won"] += bid.bid_amount
-                if bid.transaction_status in {
-                    TransactionStatus.PENDING.value,
-                    TransactionStatus.PROCESSING.value,
-                }:
-                    entry["total_unprocessed"] += bid.bid_amount
-            elif bid.bid_status == BidStatus.OUTBID.value:
-                entry["total_lost"] += bid.bid_amount
-
-            if bid.max_bid is not None:
-                entry["total_max_potential"] += bid.max_bid
-
-            if item.auction_type == AuctionType.LIVE.value:
-                entry["live_total"] += bid.bid_amount
-            else:
-                entry["silent_total"] += bid.bid_amount
-
-        paddle_stmt = select(
-            PaddleRaiseContribution.bidder_number,
-            func.sum(PaddleRaiseContribution.amount),
-        ).group_by(PaddleRaiseContribution.bidder_number)
+        paddle_stmt = (
+            select(
+                PaddleRaiseContribution.bidder_number,
+                func.sum(PaddleRaiseContribution.amount),
+            )
+            .where(PaddleRaiseContribution.event_id == event_id)
+            .group_by(PaddleRaiseContribution.bidder_number)
+        )
         if bidder_number:
             paddle_stmt = paddle_stmt.where(PaddleRaiseContribution.bidder_number == bidder_number)
         paddle_results = await self.db.execute(paddle_stmt)
         for bidder_num, total in paddle_results.all():
-            by_bidder[bidder_num]["paddle_raise_total"] = total or Decimal("0.00")
-
-        for entry in by_bidder.values():
-            if entry["_total_bids"] > 0:
-                entry["proxy_usage_rate"] = Decimal(entry["_proxy_bids"]) / Decimal(
-                    entry["_total_bids"]
-                )
-            entry.pop("_total_bids")
-            entry.pop("_proxy_bids")
+            entry = by_bidder.setdefault(
+                bidder_num,
+                {
+                    "bidder_number": bidder_num,
+                    "total_won": zero,
+                    "total_lost": zero,
+                    "total_unprocessed": zero,
+                    "total_max_potential": zero,
+                    "live_total": zero,
+                    "silent_total": zero,
+                    "bidding_war_count": 0,
+                    "proxy_usage_rate": zero,
+                },
+            )
+            entry["paddle_raise_total"] = total or zero
 
         return list(by_bidder.values())
 
-    async def report_item_performance(self) -> list[dict[str, Any]]:
-        stmt = select(AuctionItem, AuctionBid).join(
-            AuctionBid, AuctionBid.auction_item_id == AuctionItem.id, isouter=True
+    async def report_item_performance(self, event_id: UUID) -> list[dict[str, Any]]:
+        # Status copies repeat the bid they supersede, so only placed bids are counted.
+        is_placed = AuctionBid.source_bid_id.is_(None)
+        bid_stats = (
+            select(
+                AuctionBid.auction_item_id,
+                func.count().filter(is_placed).label("total_bids"),
+                func.count(AuctionBid.bidder_number.distinct()).label("unique_bidders"),
+                func.max(AuctionBid.bid_amount).label("final_price"),
+                func.bool_or(
+                    AuctionBid.max_bid.isnot(None)
+                    | (AuctionBid.bid_type == BidType.PROXY_AUTO.value)
+                ).label("proxy_used"),
+            )
+            .where(AuctionBid.event_id == event_id)
+            .group_by(AuctionBid.auction_item_id)
+            .subquery()
         )
-        result = await self.db.execute(stmt)
-        rows = result.all()
-
-        by_item: dict[UUID, dict[str, Any]] = {}
-        for item, bid in rows:
-            entry = by_item.setdefault(
-                item.id,
-                {
-                    "auction_item_id": item.id,
-                    "total_bids": 0,
-                    "unique_bidders": set(),
-                    "starting_bid": item.starting_bid,
-                    "final_price": Decimal("0.00"),
-                    "revenue_total": Decimal("0.00"),
-                    "proxy_used": False,
-                },
+        stmt = (
+            select(
+                AuctionItem.id,
+                AuctionItem.starting_bid,
+                func.coalesce(bid_stats.c.total_bids, 0),
+                func.coalesce(bid_stats.c.unique_bidders, 0),
+                func.coalesce(bid_stats.c.final_price, Decimal("0.00")),
+                func.coalesce(bid_stats.c.proxy_used, False),
             )
-            if bid:
-                entry["total_bids"] += 1
-                entry["unique_bidders"].add(bid.bidder_number)
-                entry["final_price"] = max(entry["final_price"], bid.bid_amount)
-                entry["revenue_total"] = max(entry["revenue_total"], bid.bid_amount)
-                if bid.max_bid is not None or bid.bid_type == BidType.PROXY_AUTO.value:
-                    entry["proxy_used"] = True
-
+            .outerjoin(bid_stats, bid_stats.c.auction_item_id == AuctionItem.id)
+            .where(AuctionItem.event_id == event_id)
+        )
+        result = await self.db.execute(stmt)
         return [
             {
-                "auction_item_id": entry["auction_item_id"],
-                "total_bids": entry["total_bids"],
-                "unique_bidders": len(entry["unique_bidders"]),
-                "starting_bid": entry["starting_bid"],
-                "final_price": entry["final_price"],
-                "revenue_total": entry["revenue_total"],
-                "proxy_used": entry["proxy_used"],
+                "auction_item_id": item_id,
+                "total_bids": total_bids,
+                "unique_bidders": unique_bidders,
+                "starting_bid": starting_bid,
+                "final_price": final_price,
+                "revenue_total": final_price,
+                "proxy_used": proxy_used,
             }
-            for entry in by_item.values()
+            for (
+                item_id,
+                starting_bid,
+                total_bids,
+                unique_bidders,
+                final_price,
+                proxy_used,
+            ) in result.all()
         ]
 
-    async def report_bidding_wars(self) -> list[dict[str, Any]]:
-        stmt = select(AuctionBid).order_by(AuctionBid.placed_at.asc())
+    async def report_bidding_wars(self, event_id: UUID) -> list[dict[str, Any]]:
+        is_proxy = AuctionBid.bid_type == BidType.PROXY_AUTO.value
+        bid_count = func.count()
+        duration_minutes = func.greatest(
+            cast(
+                func.extract(
+                    "epoch", func.max(AuctionBid.placed_at) - func.min(AuctionBid.placed_at)
+                ),
+                Numeric,
+            )
+            / 60,
+            1,
+        )
+        stmt = (
+            select(
+                AuctionBid.auction_item_id,
+                func.count(AuctionBid.bidder_number.distinct()),
+                cast(bid_count, Numeric) / duration_minutes,
+                func.max(AuctionBid.bid_amount) - func.min(AuctionBid.bid_amount),
+                func.count().filter(~is_proxy),
+                func.count().filter(is_proxy),
+            )
+            # Status copies repeat the bid they supersede, so only placed bids are counted.
+            .where(AuctionBid.event_id == event_id, AuctionBid.source_bid_id.is_(None))
+            .group_by(AuctionBid.auction_item_id)
+            .having(bid_count >= 2)
+        )
         result = await self.db.execute(stmt)
-        bids = result.scalars().all()
-
-        by_item: dict[UUID, list[AuctionBid]] = defaultdict(list)
-        for bid in bids:
-            by_item[bid.auction_item_id].append(bid)
 
         reports: list[dict[str, Any]] = []
-        for item_id, item_bids in by_item.items():
-            if len(item_bids) < 2:
-                continue
-            participant_count = len({bid.bidder_number for bid in item_bids})
-            duration_minutes = max(
-                Decimal("1"),
-                Decimal((item_bids[-1].placed_at - item_bids[0].placed_at).total_seconds())
-                / Decimal(60),
-            )
-            bid_frequency = Decimal(len(item_bids)) / duration_minutes
-            escalation_amount = max(bid.bid_amount for bid in item_bids) - min(
-                bid.bid_amount for bid in item_bids
-            )
-            intensity_score = (
+        for (
+            item_id,
+            participant_count,
+            bid_frequency,
+            escalation_amount,
+            manual_count,
+            proxy_count,
+        ) in result.all():
+            intensity_score = min(
+                Decimal("100"),
                 Decimal("0.5") * bid_frequency
                 + Decimal("0.3") * Decimal(participant_count)
-                + Decimal("0.2") * escalation_amount
-            )
-            intensity_score = min(Decimal("100"), intensity_score)
-
-            manual_count = len(
-                [bid for bid in item_bids if bid.bid_type != BidType.PROXY_AUTO.value]
-            )
-            proxy_count = len(
-                [bid for bid in item_bids if bid.bid_type == BidType.PROXY_AUTO.value]
+                + Decimal("0.2") * escalation_amount,
             )
             manual_vs_proxy_ratio = (
                 Decimal(manual_count) / Decimal(proxy_count)
                 if proxy_count > 0
                 else Decimal(manual_count)
             )
-
             reports.append(
                 {
                     "auction_item_id": item_id,
@@ -1018,8 +1260,8 @@ class AuctionBidService:
 
         return reports
 
-    async def report_high_value_donors(self) -> list[dict[str, Any]]:
-        analytics = await self.report_bidder_analytics()
+    async def report_high_value_donors(self, event_id: UUID) -> list[dict[str, Any]]:
+        analytics = await self.report_bidder_analytics(event_id)
         reports: list[dict[str, Any]] = []
         for entry in analytics:
             winning_total = entry["total_won"]
@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import csv
 import io
 from collections import Counter
-from dataclasses import dataclass
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Any
-from uuid import UUID
+from typing import TYPE_CHECKING, Any
+from uuid import UUID, uuid4
 
 import magic
-from openpyxl import load_workbook
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auction_item_import import ALLOWED_CATEGORIES, MAX_IMPORT_ROWS
@@ -34,12 +36,47 @@ from app.schemas.auction_item_import import (
 )
 from app.services.auction_item_import_zip import ImportZipValidationError, validate_zip_bytes
 from app.services.auction_item_service import AuctionItemService, calculate_bid_increment
+from app.services.event_snapshot_cache import EventSnapshotCache
+from app.services.import_progress import ImportProgress
+from app.services.import_reader import (
+    ParsedRow,
+    iter_batches,
+    iter_csv_records,
+    iter_xlsx_records,
+)
+from app.services.import_row_cache import ImportRowCache
+
+if TYPE_CHECKING:
+    from azure.storage.blob import BlobServiceClient
+
+    from app.services.auction_item_media_service import AuctionItemMediaService
+
+# Columns an import overwrites on an existing item (see _apply_row_to_item)
+UPSERT_COLUMNS = (
+    "title",
+    "description",
+    "auction_type",
+    "category",
+    "starting_bid",
+    "donor_value",
+    "buy_now_price",
+    "buy_now_enabled",
+    "quantity_available",
+    "donated_by",
+    "display_priority",
+)
+MAX_MEDIA_ROWS_PER_INSERT = 1000
 
 
 @dataclass
-class ParsedRow:
-    row_number: int
-    data: dict[str, Any]
+class _PlannedItem:
+    """A valid row on its way through the bulk commit path."""
+
+    result: ImportRowResult
+    row: AuctionItemImportRow
+    item_id: UUID
+    bid_number: int | None = None
+    media: list[dict[str, Any]] = field(default_factory=list)
 
 
 class AuctionItemImportService:
@@ -51,7 +88,7 @@ class AuctionItemImportService:
 
     async def preflight(self, event_id: UUID, zip_bytes: bytes) -> ImportReport:
         contents = validate_zip_bytes(zip_bytes)
-        parsed_rows = self._parse_workbook(contents.workbook_bytes, contents.workbook_filename)
+        parsed_rows = await self._load_rows(contents.workbook_bytes, contents.workbook_filename)
 
         external_ids = [
             str(value).strip()
@@ -63,20 +100,73 @@ class AuctionItemImportService:
         results = self._validate_rows(parsed_rows, contents.image_files, existing_ids)
         return self._build_report(results)
 
-    async def commit(self, event_id: UUID, zip_bytes: bytes, user_id: UUID) -> ImportReport:
+    async def commit(
+        self,
+        event_id: UUID,
+        zip_bytes: bytes,
+        user_id: UUID,
+        progress: ImportProgress | None = None,
+    ) -> ImportReport:
+        progress = progress or ImportProgress()
         contents = validate_zip_bytes(zip_bytes)
-        parsed_rows = self._parse_workbook(contents.workbook_bytes, contents.workbook_filename)
+        parsed_rows = await self._load_rows(contents.workbook_bytes, contents.workbook_filename)
         row_lookup = {row.row_number: row for row in parsed_rows}
+        await progress.start(len(parsed_rows))
 
         external_ids = [
             str(value).strip()
             for row in parsed_rows
             if (value := row.data.get("external_id")) not in (None, "")
         ]
-        existing_ids = await self._fetch_existing_external_ids(event_id, external_ids)
 
-        results = []
-        for result in self._validate_rows(parsed_rows, contents.image_files, existing_ids):
+        try:
+            if self.settings.auction_item_import_bulk_commit:
+                existing_items = await self._fetch_existing_items(event_id, external_ids)
+                validation_results = self._validate_rows(
+                    parsed_rows, contents.image_files, set(existing_items)
+                )
+                results = await self._commit_bulk(
+                    event_id,
+                    user_id,
+                    validation_results,
+                    row_lookup,
+                    contents.image_files,
+                    existing_items,
+                    progress,
+                )
+            else:
+                existing_ids = await self._fetch_existing_external_ids(event_id, external_ids)
+                validation_results = self._validate_rows(
+                    parsed_rows, contents.image_files, existing_ids
+                )
+                results = await self._commit_per_row(
+                    event_id,
+                    user_id,
+                    validation_results,
+                    row_lookup,
+                    contents.image_files,
+                    progress,
+                )
+        finally:
+            # Both paths commit as they go, so bump even if a later row failed.
+            await EventSnapshotCache.bump_version(event_id)
+
+        await progress.report(results)
+        return self._build_report(results)
+
+    async def _commit_per_row(
+        self,
+        event_id: UUID,
+        user_id: UUID,
+        validation_results: list[ImportRowResult],
+        row_lookup: dict[int, ParsedRow],
+        image_files: dict[str, bytes],
+        progress: ImportProgress,
+    ) -> list[ImportRowResult]:
+        """Upsert items one at a time, committing after each."""
+        results: list[ImportRowResult] = []
+        for result in validation_results:
+            await progress.report(results)
             if result.status == ImportRowStatus.ERROR:
                 results.append(result)
                 continue
@@ -87,7 +177,7 @@ class AuctionItemImportService:
                     row_number=result.row_number,
                     external_id=result.external_id or "",
                     row=row_lookup[result.row_number].data,
-                    image_files=contents.image_files,
+                    image_files=image_files,
                     user_id=user_id,
                 )
                 results.append(result)
@@ -105,55 +195,295 @@ class AuctionItemImportService:
                     )
                 )
 
-        return self._build_report(results)
+        return results
 
-    def _parse_workbook(self, workbook_bytes: bytes, workbook_filename: str) -> list[ParsedRow]:
-        if workbook_filename.lower().endswith(".csv"):
-            return self._parse_csv(workbook_bytes)
+    async def _commit_bulk(
+        self,
+        event_id: UUID,
+        user_id: UUID,
+        validation_results: list[ImportRowResult],
+        row_lookup: dict[int, ParsedRow],
+        image_files: dict[str, bytes],
+        existing_items: dict[str, tuple[UUID, int]],
+        progress: ImportProgress,
+    ) -> list[ImportRowResult]:
+        """Upsert items a chunk at a time.
 
-        workbook = load_workbook(io.BytesIO(workbook_bytes), read_only=True, data_only=True)
-        sheet = workbook.active
-        row_iter = sheet.iter_rows(values_only=True)
-        header_row = next(row_iter, None)
-        if not header_row:
-            raise ImportZipValidationError("Workbook is empty")
+        Each chunk's images are stored and thumbnailed in a bounded pool of
+        worker threads, bid numbers for its new items are allocated in one
+        query, and its items and media are written with multi-row INSERTs in
+        one transaction.
+        """
+        from app.services.auction_item_media_service import AuctionItemMediaService
 
-        headers = [self._normalize_header(value) for value in header_row]
-        self._validate_required_headers(headers)
+        media_service = AuctionItemMediaService(self.settings, self.db)
+        results: list[ImportRowResult] = []
+        for chunk in iter_batches(validation_results, self.settings.auction_item_import_chunk_size):
+            outcomes = await self._commit_chunk(
+                event_id, user_id, chunk, row_lookup, image_files, existing_items, media_service
+            )
+            results.extend(outcomes.get(result.row_number, result) for result in chunk)
+            await progress.report(results)
+        return results
 
-        parsed_rows: list[ParsedRow] = []
-        for index, values in enumerate(row_iter, start=2):
-            if self._is_empty_row(values):
+    async def _commit_chunk(
+        self,
+        event_id: UUID,
+        user_id: UUID,
+        chunk: list[ImportRowResult],
+        row_lookup: dict[int, ParsedRow],
+        image_files: dict[str, bytes],
+        existing_items: dict[str, tuple[UUID, int]],
+        media_service: AuctionItemMediaService,
+    ) -> dict[int, ImportRowResult]:
+        """Write one chunk of valid rows.
+
+        A chunk that fails to write is rolled back and retried item by item
+        in savepoints, so a bad row only fails itself.
+
+        Returns:
+            Error results for the rows that could not be imported.
+        """
+        outcomes: dict[int, ImportRowResult] = {}
+        plans: list[_PlannedItem] = []
+        for result in chunk:
+            if result.status == ImportRowStatus.ERROR:
                 continue
-            if len(parsed_rows) >= MAX_IMPORT_ROWS:
-                raise ImportZipValidationError("Workbook exceeds maximum row limit")
+            row = AuctionItemImportRow(**self._coerce_row(row_lookup[result.row_number].data))
+            existing = existing_items.get(row.external_id)
+            plans.append(
+                _PlannedItem(
+                    result=result,
+                    row=row,
+                    item_id=existing[0] if existing else uuid4(),
+                    bid_number=existing[1] if existing else None,
+                )
+            )
 
-            row_data = {
-                headers[i]: values[i] if i < len(values) else None for i in range(len(headers))
-            }
-            parsed_rows.append(ParsedRow(row_number=index, data=row_data))
+        image_errors = await self._store_images(plans, image_files, media_service)
+        for row_number, message in image_errors.items():
+            outcomes[row_number] = self._error_result(
+                next(plan.result for plan in plans if plan.result.row_number == row_number),
+                message,
+            )
+        plans = [plan for plan in plans if plan.result.row_number not in outcomes]
 
-        if not parsed_rows:
-            raise ImportZipValidationError("Workbook contains no data rows")
+        new_plans = [plan for plan in plans if plan.bid_number is None]
+        if new_plans:
+            shortage_message = "Event has reached maximum auction items (900 items limit)"
+            try:
+                bid_numbers = await AuctionItemService(self.db)._get_next_bid_numbers(
+                    event_id, len(new_plans)
+                )
+                # Commit the sequence (it may have just been created) so a chunk
+                # rolled back below cannot hand the same numbers out again.
+                await self.db.commit()
+            except ValueError as exc:
+                await self.db.rollback()
+                bid_numbers, shortage_message = [], str(exc)
+            for plan, bid_number in zip(new_plans, bid_numbers, strict=False):
+                plan.bid_number = bid_number
+            for plan in new_plans[len(bid_numbers) :]:
+                outcomes[plan.result.row_number] = self._error_result(plan.result, shortage_message)
+            plans = [plan for plan in plans if plan.result.row_number not in outcomes]
 
-        return parsed_rows
+        if not plans:
+            return outcomes
+
+        try:
+            await self._write_items(event_id, user_id, plans)
+            await self.db.commit()
+            return outcomes
+        except Exception:
+            await self.db.rollback()
+
+        for plan in plans:
+            try:
+                async with self.db.begin_nested():
+                    await self._write_items(event_id, user_id, [plan])
+            except Exception as exc:
+                outcomes[plan.result.row_number] = self._error_result(plan.result, str(exc))
+        await self.db.commit()
+        return outcomes
+
+    async def _write_items(self, event_id: UUID, user_id: UUID, plans: list[_PlannedItem]) -> None:
+        """Upsert planned items on (event_id, external_id) and insert their media."""
+        rows = pg_insert(AuctionItem).values(
+            [self._item_values(event_id, user_id, plan) for plan in plans]
+        )
+        upsert = rows.on_conflict_do_update(
+            index_elements=[AuctionItem.event_id, AuctionItem.external_id],
+            set_={
+                **{column: rows.excluded[column] for column in UPSERT_COLUMNS},
+                "updated_at": func.now(),
+            },
+        ).returning(AuctionItem.external_id, AuctionItem.id)
+        result = await self.db.execute(upsert)
+        item_ids = dict(result.tuples().all())
+
+        media = [
+            {**values, "auction_item_id": item_ids[plan.row.external_id]}
+            for plan in plans
+            for values in plan.media
+        ]
+        for start in range(0, len(media), MAX_MEDIA_ROWS_PER_INSERT):
+            await self.db.execute(
+                insert(AuctionItemMedia).values(media[start : start + MAX_MEDIA_ROWS_PER_INSERT])
+            )
+
+    def _item_values(self, event_id: UUID, user_id: UUID, plan: _PlannedItem) -> dict[str, Any]:
+        row = plan.row
+        return {
+            "id": plan.item_id,
+            "event_id": event_id,
+            "external_id": row.external_id,
+            "bid_number": plan.bid_number,
+            "title": row.title,
+            "description": row.description,
+            "auction_type": AuctionType(row.auction_type).value,
+            "category": row.category,
+            "starting_bid": row.starting_bid,
+            "bid_increment": calculate_bid_increment(row.starting_bid),
+            "donor_value": row.fair_market_value,
+            "buy_now_price": row.buy_it_now,
+            "buy_now_enabled": row.buy_it_now is not None,
+            "quantity_available": row.quantity or 1,
+            "donated_by": row.donor_name,
+            "display_priority": row.sort_order,
+            "status": ItemStatus.DRAFT.value,
+            "created_by": user_id,
+        }
+
+    async def _store_images(
+        self,
+        plans: list[_PlannedItem],
+        image_files: dict[str, bytes],
+        media_service: AuctionItemMediaService,
+    ) -> dict[int, str]:
+        """Store and thumbnail the images of ``plans`` in a bounded thread pool.
+
+        Fills in each plan's media rows.
+
+        Returns:
+            An error message for each row number with an image that failed.
+        """
+        semaphore = asyncio.Semaphore(max(self.settings.auction_item_import_image_concurrency, 1))
+
+        async def _one(item_id: UUID, filename: str, display_order: int) -> dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._process_image,
+                    item_id,
+                    filename,
+                    image_files[filename],
+                    display_order,
+                    media_service,
+                )
+
+        jobs = [
+            (plan, filename, display_order)
+            for plan in plans
+            for display_order, filename in enumerate(
+                name for name in self._get_image_filenames(plan.row) if name in image_files
+            )
+        ]
+        stored = await asyncio.gather(
+            *(_one(plan.item_id, filename, order) for plan, filename, order in jobs),
+            return_exceptions=True,
+        )
+
+        errors: dict[int, str] = {}
+        for (plan, filename, _), outcome in zip(jobs, stored, strict=True):
+            if isinstance(outcome, BaseException):
+                errors.setdefault(
+                    plan.result.row_number, f"Failed to store image {filename}: {outcome}"
+                )
+            else:
+                plan.media.append(outcome)
+        return errors
+
+    def _process_image(
+        self,
+        item_id: UUID,
+        filename: str,
+        image_bytes: bytes,
+        display_order: int,
+        media_service: AuctionItemMediaService,
+    ) -> dict[str, Any]:
+        """Detect, store and thumbnail one image; runs in a worker thread."""
+        mime_type = magic.from_buffer(image_bytes, mime=True)
+        file_path = self._store_image(
+            item_id, filename, image_bytes, mime_type, media_service.blob_service_client
+        )
+
+        # Non-fatal, as in _attach_images: fall back to the full-resolution image.
+        thumbnail_path: str | None = None
+        if mime_type.startswith("image/") and media_service.blob_service_client:
+            blob_name = f"auction-items/{item_id}/{filename}"
+            try:
+                thumbnails = media_service._generate_thumbnails_sync(image_bytes, blob_name)
+                thumbnail_path = thumbnails.get("small")
+            except Exception:
+                pass
+
+        return {
+            "id": uuid4(),
+            "media_type": MediaType.IMAGE.value,
+            "file_path": file_path,
+            "file_name": filename,
+            "file_size": len(image_bytes),
+            "mime_type": mime_type,
+            "display_order": display_order,
+            "thumbnail_path": thumbnail_path,
+        }
+
+    @staticmethod
+    def _error_result(result: ImportRowResult, message: str) -> ImportRowResult:
+        return ImportRowResult(
+            row_number=result.row_number,
+            external_id=result.external_id,
+            title=result.title,
+            status=ImportRowStatus.ERROR,
+            message=message,
+            image_status=result.image_status,
+            image_count=result.image_count,
+        )
+
+    async def _load_rows(self, workbook_bytes: bytes, workbook_filename: str) -> list[ParsedRow]:
+        """Parse the workbook, reusing the rows parsed at preflight when unchanged."""
+        kind = "csv" if workbook_filename.lower().endswith(".csv") else "xlsx"
+        return await ImportRowCache.get_or_parse(
+            f"auction_items:{kind}",
+            workbook_bytes,
+            lambda content: self._parse_workbook(content, workbook_filename),
+        )
+
+    def _parse_workbook(self, workbook_bytes: bytes, workbook_filename: str) -> list[ParsedRow]:
+        if workbook_filename.lower().endswith(".csv"):
+            return self._parse_csv(workbook_bytes)
+        return self._parse_records(iter_xlsx_records(workbook_bytes), "Workbook is empty")
 
     def _parse_csv(self, workbook_bytes: bytes) -> list[ParsedRow]:
         try:
-            content = workbook_bytes.decode("utf-8-sig")
+            return self._parse_records(
+                iter_csv_records(workbook_bytes, "utf-8-sig"), "CSV is empty"
+            )
         except UnicodeDecodeError as exc:
             raise ImportZipValidationError("CSV must be UTF-8 encoded") from exc
 
-        reader = csv.reader(io.StringIO(content))
-        header_row = next(reader, None)
+    def _parse_records(
+        self, records: Iterator[Sequence[Any]], empty_message: str
+    ) -> list[ParsedRow]:
+        """Build rows from a header record followed by data records."""
+        header_row = next(records, None)
         if not header_row:
-            raise ImportZipValidationError("CSV is empty")
+            raise ImportZipValidationError(empty_message)
 
         headers = [self._normalize_header(value) for value in header_row]
         self._validate_required_headers(headers)
 
         parsed_rows: list[ParsedRow] = []
-        for index, values in enumerate(reader, start=2):
+        for index, values in enumerate(records, start=2):
             if self._is_empty_row(values):
                 continue
             if len(parsed_rows) >= MAX_IMPORT_ROWS:
@@ -291,6 +621,22 @@ class AuctionItemImportService:
         result = await self.db.execute(query)
         return {row[0] for row in result.fetchall()}
 
+    async def _fetch_existing_items(
+        self, event_id: UUID, external_ids: list[str]
+    ) -> dict[str, tuple[UUID, int]]:
+        """Map external IDs already in the event to their item ID and bid number."""
+        if not external_ids:
+            return {}
+
+        query = select(AuctionItem.external_id, AuctionItem.id, AuctionItem.bid_number).where(
+            AuctionItem.event_id == event_id,
+            AuctionItem.external_id.in_(external_ids),
+        )
+        result = await self.db.execute(query)
+        return {
+            external_id: (item_id, bid_number) for external_id, item_id, bid_number in result.all()
+        }
+
     async def _upsert_auction_item(
         self,
         event_id: UUID,
@@ -403,14 +749,21 @@ class AuctionItemImportService:
             display_order += 1
         await self.db.commit()
 
-    def _store_image(self, item_id: UUID, filename: str, content: bytes, mime_type: str) -> str:
+    def _store_image(
+        self,
+        item_id: UUID,
+        filename: str,
+        content: bytes,
+        mime_type: str,
+        blob_service: BlobServiceClient | None = None,
+    ) -> str:
         if (
             self.settings.azure_storage_connection_string
             and self.settings.azure_storage_account_name
         ):
             from azure.storage.blob import BlobServiceClient, ContentSettings
 
-            blob_service = BlobServiceClient.from_connection_string(
+            blob_service = blob_service or BlobServiceClient.from_connection_string(
                 self.settings.azure_storage_connection_string
             )
             blob_name = f"auction-items/{item_id}/{filename}"
@@ -551,5 +904,5 @@ class AuctionItemImportService:
         return str(value).strip().lower().replace(" ", "_")
 
     @staticmethod
-    def _is_empty_row(values: list[Any] | tuple[Any, ...]) -> bool:
+    def _is_empty_row(values: Sequence[Any]) -> bool:
         return all(value is None or str(value).strip() == "" for value in values)
@@ -28,6 +28,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Settings
 from app.models.auction_item import AuctionItemMedia
+from app.services.blob_sas_cache import blob_sas_url_cache
+from app.services.event_snapshot_cache import EventSnapshotCache
 
 
 class AuctionItemMediaService:
@@ -124,21 +126,90 @@ class AuctionItemMediaService:
         except (IndexError, AttributeError) as e:
             raise ValueError("Invalid Azure storage connection string format") from e
 
-        # Generate SAS token
-        sas_token = generate_blob_sas(
-            account_name=self.settings.azure_storage_account_name,
-            container_name=self.container_name,
-            blob_name=blob_name,
-            account_key=account_key,
-            permission=BlobSasPermissions(read=True),
-            expiry=datetime.utcnow() + timedelta(hours=expiry_hours),
+        blob_service_client = self.blob_service_client
+        account_name = self.settings.azure_storage_account_name
+
+        def sign(expires_at: datetime) -> str:
+            sas_token = generate_blob_sas(
+                account_name=account_name,
+                container_name=self.container_name,
+                blob_name=blob_name,
+                account_key=account_key,
+                permission=BlobSasPermissions(read=True),
+                expiry=expires_at,
+            )
+            blob_client = blob_service_client.get_blob_client(
+                container=self.container_name, blob=blob_name
+            )
+            return f"{blob_client.url}?{sas_token}"
+
+        # Signed URLs are reused across requests until they near expiry
+        return blob_sas_url_cache.get_or_sign(self.container_name, blob_name, expiry_hours, sign)
+
+    def get_read_url(self, url: str | None, expiry_hours: float = 24.0) -> str | None:
+        """Return a browser-readable URL for stored media.
+
+        Azure Blob Storage URLs in the media container are SAS-signed; any other
+        URL (local storage, external hosts) is returned unchanged.
+
+        Args:
+            url: Stored media URL
+            expiry_hours: Hours until the SAS URL expires
+
+        Returns:
+            Signed URL, the original URL, or None when no URL is given
+        """
+        if not url or not url.startswith("https://"):
+            return url
+        container_path = f"{self.container_name}/"
+        if container_path not in url:
+            return url
+        blob_path = url.split(container_path, 1)[1].split("?", 1)[0]
+        try:
+            return self._generate_blob_sas_url(blob_path, expiry_hours=expiry_hours)
+        except (ValueError, IndexError):
+            return url
+
+    async def _bump_event_version(self, auction_item_id: uuid.UUID) -> None:
+        """Invalidate cached event pages after an item's media changed."""
+        from sqlalchemy import select
+
+        from app.models.auction_item import AuctionItem
+
+        event_id = await self.db.scalar(
+            select(AuctionItem.event_id).where(AuctionItem.id == auction_item_id)
         )
+        if event_id:
+            await EventSnapshotCache.bump_version(event_id)
 
-        # Get blob URL and append SAS token
-        blob_client = self.blob_service_client.get_blob_client(
-            container=self.container_name, blob=blob_name
+    async def get_primary_image_paths(self, item_ids: list[uuid.UUID]) -> dict[uuid.UUID, str]:
+        """Get the stored path of each item's first image in a single query.
+
+        Args:
+            item_ids: Auction item IDs
+
+        Returns:
+            Mapping of item ID to image file path (items without images are omitted)
+        """
+        from sqlalchemy import select
+
+        if not item_ids:
+            return {}
+        stmt = (
+            select(AuctionItemMedia.auction_item_id, AuctionItemMedia.file_path)
+            .where(
+                AuctionItemMedia.auction_item_id.in_(item_ids),
+                AuctionItemMedia.media_type == "image",
+            )
+            .distinct(AuctionItemMedia.auction_item_id)
+            .order_by(
+                AuctionItemMedia.auction_item_id,
+                AuctionItemMedia.display_order,
+                AuctionItemMedia.created_at,
+            )
         )
-        return f"{blob_client.url}?{sas_token}"
+        result = await self.db.execute(stmt)
+        return {item_id: file_path for item_id, file_path in result.all() if file_path}
 
     def _validate_file_type(
         self, content_type: str, file_name: str, media_type: str
@@ -338,6 +409,17 @@ class AuctionItemMediaService:
     ) -> dict[str, str]:
         """Generate thumbnails for an image.
 
+        See ``_generate_thumbnails_sync``, which does the work.
+        """
+        return self._generate_thumbnails_sync(file_content, original_blob_name)
+
+    def _generate_thumbnails_sync(
+        self, file_content: bytes, original_blob_name: str
+    ) -> dict[str, str]:
+        """Resize an image and upload its thumbnails, blocking the calling thread.
+
+        Safe to call from a worker thread; bulk imports run it in a pool.
+
         Args:
             file_content: Original image content as bytes
             original_blob_name: Original blob name
@@ -621,6 +703,7 @@ class AuctionItemMediaService:
         self.db.add(media)
         await self.db.commit()
         await self.db.refresh(media)
+        await self._bump_event_version(auction_item_id)
 
         return media
 
@@ -657,6 +740,7 @@ class AuctionItemMediaService:
             media_by_id[media_id].display_order = index
 
         await self.db.commit()
+        await self._bump_event_version(auction_item_id)
 
         # Refresh all media items to get updated_at timestamps
         for media_id in media_order:
@@ -735,5 +819,6 @@ class AuctionItemMediaService:
         # Delete from database
         await self.db.delete(media)
         await self.db.commit()
+        await self._bump_event_version(auction_item_id)
 
         return True
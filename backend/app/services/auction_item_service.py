@@ -16,6 +16,7 @@ from app.models.event import Event
 from app.models.silent_auction_extension_policy import SilentAuctionItemExtensionState
 from app.schemas.auction_item import AuctionItemCreate, AuctionItemUpdate
 from app.services.audit_service import AuditService
+from app.services.event_snapshot_cache import EventSnapshotCache
 
 logger = logging.getLogger(__name__)
 
@@ -139,6 +140,43 @@ class AuctionItemService:
             logger.error(f"Failed to get next bid number: {e}")
             raise ValueError(f"Failed to assign bid number: {e}") from e
 
+    async def _get_next_bid_numbers(self, event_id: UUID, count: int) -> list[int]:
+        """Get up to ``count`` bid numbers for an event in one round trip.
+
+        Bulk counterpart of ``_get_next_bid_number`` for imports. Stops at the
+        sequence's maximum instead of failing, so fewer numbers than asked
+        for are returned once the event runs out.
+
+        Args:
+            event_id: UUID of the event
+            count: Number of bid numbers wanted
+
+        Returns:
+            Allocated bid numbers in ascending order
+
+        Raises:
+            ValueError: If the sequence cannot be read
+        """
+        if count <= 0:
+            return []
+
+        await self._ensure_bid_number_sequence(event_id)
+
+        sequence_name = f"event_{str(event_id).replace('-', '_')}_bid_number_seq"
+
+        try:
+            query = text(
+                f"SELECT nextval('{sequence_name}') FROM generate_series(1, LEAST(:count, "
+                "(SELECT max_value - COALESCE(last_value, start_value - 1) "
+                "FROM pg_sequences WHERE schemaname = 'public' AND sequencename = :seq_name)))"
+            )
+            result = await self.db.execute(query, {"count": count, "seq_name": sequence_name})
+            return sorted(int(row[0]) for row in result.all())
+
+        except Exception as e:
+            logger.error(f"Failed to get next bid numbers: {e}")
+            raise ValueError(f"Failed to assign bid numbers: {e}") from e
+
     async def create_auction_item(
         self,
         event_id: UUID,
@@ -217,6 +255,7 @@ class AuctionItemService:
             category=item_data.category,
             starting_bid=effective_starting_bid,
             bid_increment=bid_increment,
+            min_next_bid_amount=effective_starting_bid,
             donor_value=item_data.donor_value,
             cost=item_data.cost,
             buy_now_price=item_data.buy_now_price,
@@ -239,6 +278,7 @@ class AuctionItemService:
         try:
             await self.db.commit()
             await self.db.refresh(auction_item)
+            await EventSnapshotCache.bump_version(event_id)
 
             # Audit logging (T025)
             await AuditService.log_auction_item_created(
@@ -462,6 +502,14 @@ class AuctionItemService:
                     setattr(item, field, value)
                     changes[field] = {"old": old_value, "new": value}
 
+        # Keep the materialized minimum next bid in step with pricing changes
+        if "starting_bid" in changes or "bid_increment" in changes:
+            item.min_next_bid_amount = (
+                item.current_bid_amount + item.bid_increment
+                if item.current_bid_amount is not None
+                else item.starting_bid
+            )
+
         # Cross-field validation
         if item.buy_now_price is not None and item.buy_now_price < item.starting_bid:
             raise ValueError(f"Buy now price must be >= starting bid (${item.starting_bid})")
@@ -488,6 +536,7 @@ class AuctionItemService:
         try:
             await self.db.commit()
             await self.db.refresh(item)
+            await EventSnapshotCache.bump_version(item.event_id)
 
             # Audit logging (T025) - only if changes were made
             if changes:
@@ -567,6 +616,7 @@ class AuctionItemService:
                 item.deleted_at = datetime.now(UTC)
                 item.status = ItemStatus.WITHDRAWN
                 await self.db.commit()
+                await EventSnapshotCache.bump_version(item.event_id)
 
                 # Audit logging (T025)
                 await AuditService.log_auction_item_deleted(
@@ -595,8 +645,10 @@ class AuctionItemService:
                     is_soft_delete=False,
                 )
 
+                event_id = item.event_id
                 await self.db.delete(item)
                 await self.db.commit()
+                await EventSnapshotCache.bump_version(event_id)
                 logger.info(f"Hard deleted auction item {item_id}")
 
             return True
@@ -19,6 +19,7 @@ from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.config import get_settings
 from app.models.auction_bid import AuctionBid, BidStatus, PaddleRaiseContribution
 from app.models.auction_item import AuctionItem, AuctionItemMedia
 from app.models.auctioneer import AuctioneerEventSettings, AuctioneerItemCommission
@@ -56,6 +57,7 @@ from app.schemas.auctioneer import (
     SilentAuctionStatus,
     TimerData,
 )
+from app.services.auction_item_media_service import AuctionItemMediaService
 
 logger = logging.getLogger(__name__)
 
@@ -85,22 +87,12 @@ class AuctioneerService:
         return normalized.strip()
 
     async def _get_primary_image_map(self, item_ids: list[UUID]) -> dict[UUID, str | None]:
-        if not item_ids:
-            return {}
-
-        stmt = (
-            select(AuctionItemMedia.auction_item_id, AuctionItemMedia.file_path)
-            .where(
-                AuctionItemMedia.auction_item_id.in_(item_ids),
-                AuctionItemMedia.display_order == 0,
-            )
-            .order_by(AuctionItemMedia.display_order.asc(), AuctionItemMedia.created_at.asc())
-        )
-        rows = (await self.db.execute(stmt)).all()
-        image_map: dict[UUID, str | None] = {}
-        for item_id, file_path in rows:
-            image_map.setdefault(item_id, file_path)
-        return image_map
+        media_service = AuctionItemMediaService(get_settings(), self.db)
+        image_paths = await media_service.get_primary_image_paths(item_ids)
+        return {
+            item_id: media_service.get_read_url(file_path)
+            for item_id, file_path in image_paths.items()
+        }
 
     async def _get_commission_map(
         self, event_id: UUID, auctioneer_user_id: UUID
@@ -908,14 +900,14 @@ class AuctioneerService:
         items = list((await self.db.execute(item_stmt)).scalars().all())
         item_ids = [item.id for item in items]
 
-        bid_stats = {
-            item_id: (Decimal(max_bid or 0), int(bid_count or 0), int(bidder_count or 0))
-            for item_id, max_bid, bid_count, bidder_count in (
+        # High bid and bid count are materialized on the item; only the distinct
+        # bidder count still needs an aggregate.
+        bidder_counts = {
+            item_id: int(bidder_count or 0)
+            for item_id, bidder_count in (
                 await self.db.execute(
                     select(
                         AuctionBid.auction_item_id,
-                        func.max(AuctionBid.bid_amount),
-                        func.count(AuctionBid.id),
                         func.count(func.distinct(AuctionBid.bidder_number)),
                     )
                     .where(
@@ -936,9 +928,9 @@ class AuctioneerService:
         total_bids = 0
 
         for item in items:
-            current_bid_amount, bid_count, bidder_count = bid_stats.get(
-                item.id, (Decimal("0"), 0, 0)
-            )
+            current_bid_amount = item.current_bid_amount or Decimal("0")
+            bid_count = item.bid_count or 0
+            bidder_count = bidder_counts.get(item.id, 0)
             total_raised += current_bid_amount
             total_bids += bid_count
             commission_data = commission_map.get(item.id)
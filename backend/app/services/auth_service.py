@@ -113,7 +113,7 @@ class AuthService:
         )
 
         # Set password (hashes internally)
-        user.set_password(user_data.password)
+        await user.set_password_async(user_data.password)
 
         db.add(user)
         await db.commit()
@@ -163,7 +163,7 @@ class AuthService:
         user = result.scalar_one_or_none()
 
         # Check credentials
-        if not user or not user.verify_password(password):
+        if not user or not await user.verify_password_async(password):
             raise ValueError("Invalid email or password")
 
         # Allow unverified users to sign in so they can complete email verification,
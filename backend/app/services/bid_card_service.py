@@ -7,7 +7,7 @@ import base64
 import io
 import logging
 import pathlib
-from datetime import datetime, timedelta
+from datetime import datetime
 from uuid import UUID
 
 import aiohttp
@@ -20,6 +20,7 @@ from sqlalchemy.orm import selectinload
 from app.core.config import Settings, get_settings
 from app.models.auction_item import AuctionItem, AuctionItemMedia
 from app.schemas.reports import BidCardRequest, LabelSize
+from app.services.blob_sas_cache import blob_sas_url_cache
 from app.services.report_utils import fetch_image_as_base64, get_fundrbolt_logo_b64
 
 logger = logging.getLogger(__name__)
@@ -37,14 +38,12 @@ def _ensure_sas_url(url: str | None, settings: Settings) -> str | None:
     """
     if not url:
         return None
-    if (
-        not settings.azure_storage_connection_string
-        or not settings.azure_storage_account_name
-        or not settings.azure_storage_container_name
-    ):
+    account_name = settings.azure_storage_account_name
+    conn_str = settings.azure_storage_connection_string
+    if not conn_str or not account_name or not settings.azure_storage_container_name:
         return url
 
-    account_host = f"{settings.azure_storage_account_name}.blob.core.windows.net"
+    account_host = f"{account_name}.blob.core.windows.net"
     if account_host not in url:
         return url  # Different storage account — leave unchanged
 
@@ -58,20 +57,21 @@ def _ensure_sas_url(url: str | None, settings: Settings) -> str | None:
 
     blob_name = url.split(container_prefix, 1)[1].split("?", 1)[0]
     try:
-        conn_str = settings.azure_storage_connection_string
         account_key = conn_str.split("AccountKey=")[1].split(";")[0]
-        sas_token = generate_blob_sas(
-            account_name=settings.azure_storage_account_name,
-            container_name=settings.azure_storage_container_name,
-            blob_name=blob_name,
-            account_key=account_key,
-            permission=BlobSasPermissions(read=True),
-            expiry=datetime.utcnow() + timedelta(hours=1),
-        )
-        return (
-            f"https://{account_host}/{settings.azure_storage_container_name}"
-            f"/{blob_name}?{sas_token}"
-        )
+        container_name = settings.azure_storage_container_name
+
+        def sign(expires_at: datetime) -> str:
+            sas_token = generate_blob_sas(
+                account_name=account_name,
+                container_name=container_name,
+                blob_name=blob_name,
+                account_key=account_key,
+                permission=BlobSasPermissions(read=True),
+                expiry=expires_at,
+            )
+            return f"https://{account_host}/{container_name}/{blob_name}?{sas_token}"
+
+        return blob_sas_url_cache.get_or_sign(container_name, blob_name, 1, sign)
     except Exception:
         logger.debug("Failed to generate SAS URL for %s", url, exc_info=True)
         return url
@@ -0,0 +1,218 @@
+"""Coalesce push/email/SMS delivery of bid notifications per (user, item).
+
+During a bidding war every bid creates an OUTBID, BID_CONFIRMATION or
+PROXY_BID_TRIGGERED notification. The in-app row and Socket.IO emit are still
+created immediately. External delivery of the first notification for a user
+and item also goes out immediately and opens a window of
+``bid_notification_coalesce_seconds``; notifications that follow within the
+window are held on the timer wheel and replace one another without moving the
+deadline, so when the window closes the donor receives one push/email carrying
+the latest state, and the superseded notifications' external deliveries are
+marked skipped. An isolated outbid is therefore never delayed.
+
+On top of that, each donor receives at most
+``bid_notification_max_per_user_per_hour`` coalesced deliveries per event.
+
+Keys:
+    bid_notify:rate:<event_id>:<user_id>              deliveries sent in the current hour
+    bid_notify:window:<event_id>:<user_id>:<item_id>  open window, value = its deadline epoch
+"""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from redis.exceptions import RedisError
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.redis import get_redis
+from app.models.notification import (
+    DeliveryChannelEnum,
+    DeliveryStatusEnum,
+    Notification,
+    NotificationTypeEnum,
+)
+from app.models.notification_delivery_status import NotificationDeliveryStatus
+from app.services.notification_service import NotificationService
+from app.services.timer_wheel import BID_DIGEST, TimerWheel
+
+logger = get_logger(__name__)
+
+COALESCED_TYPES = frozenset(
+    {
+        NotificationTypeEnum.OUTBID,
+        NotificationTypeEnum.BID_CONFIRMATION,
+        NotificationTypeEnum.PROXY_BID_TRIGGERED,
+    }
+)
+
+RATE_WINDOW_SECONDS = 3600
+
+
+class BidNotificationCoalescer:
+    """Hold and release external delivery of bid notifications."""
+
+    RATE_PREFIX = "bid_notify:rate:"
+    WINDOW_PREFIX = "bid_notify:window:"
+
+    @staticmethod
+    def timer_kind(user_id: UUID, item_id: UUID) -> str:
+        """Timer kind holding one user's deliveries for one item."""
+        return f"{BID_DIGEST}:{user_id}:{item_id}"
+
+    @staticmethod
+    def parse_timer_kind(kind: str) -> tuple[UUID, UUID]:
+        """Return ``(user_id, item_id)`` from a bid digest timer kind."""
+        _, user_id, item_id = kind.split(":", 2)
+        return UUID(user_id), UUID(item_id)
+
+    @staticmethod
+    async def _open_window(
+        event_id: UUID, user_id: UUID, item_id: UUID, window: int
+    ) -> datetime | None:
+        """Open a coalescing window unless one is already open.
+
+        Returns:
+            None if this call opened the window, else the open window's deadline
+        """
+        key = f"{BidNotificationCoalescer.WINDOW_PREFIX}{event_id}:{user_id}:{item_id}"
+        deadline = datetime.now(UTC) + timedelta(seconds=window)
+        redis = await get_redis()
+        if await redis.set(key, str(deadline.timestamp()), nx=True, ex=window):
+            return None
+        existing = await redis.get(key)
+        if existing is None:
+            # Expired between the two calls; the caller is first in a new window
+            await redis.set(key, str(deadline.timestamp()), ex=window)
+            return None
+        return datetime.fromtimestamp(float(existing), UTC)
+
+    @staticmethod
+    async def hold(notification: Notification, item_id: UUID) -> None:
+        """Deliver or hold a bid notification's push/email/SMS delivery.
+
+        The first notification in a window is dispatched immediately; later
+        ones are held until the window closes. Call after committing the
+        notification. Falls back to dispatching immediately when coalescing
+        is disabled or Redis is unavailable.
+        """
+        channels = [
+            channel
+            for channel in getattr(notification, "_resolved_channels", [])
+            if channel != DeliveryChannelEnum.INAPP
+        ]
+        if not channels:
+            return
+
+        window = get_settings().bid_notification_coalesce_seconds
+        if window > 0:
+            try:
+                deadline = await BidNotificationCoalescer._open_window(
+                    notification.event_id, notification.user_id, item_id, window
+                )
+                if deadline is None and await BidNotificationCoalescer._consume_quota(
+                    notification.event_id, notification.user_id
+                ):
+                    NotificationService.dispatch_delivery_tasks(str(notification.id), channels)
+                    return
+                # Held until the window closes; over the hourly cap, the release
+                # marks the delivery rate limited
+                await TimerWheel.upsert(
+                    notification.event_id,
+                    BidNotificationCoalescer.timer_kind(notification.user_id, item_id),
+                    deadline or datetime.now(UTC) + timedelta(seconds=window),
+                    {
+                        "notification_id": str(notification.id),
+                        "channels": [channel.value for channel in channels],
+                    },
+                    keep_due=True,
+                )
+                return
+            except (RedisError, OSError):
+                logger.warning(
+                    "Bid notification coalescing unavailable, dispatching immediately",
+                    extra={"notification_id": str(notification.id)},
+                )
+
+        NotificationService.dispatch_delivery_tasks(str(notification.id), channels)
+
+    @staticmethod
+    async def _consume_quota(event_id: UUID, user_id: UUID) -> bool:
+        """Count one delivery against the donor's hourly cap; True if within it."""
+        limit = get_settings().bid_notification_max_per_user_per_hour
+        if limit <= 0:
+            return True
+        key = f"{BidNotificationCoalescer.RATE_PREFIX}{event_id}:{user_id}"
+        try:
+            redis = await get_redis()
+            async with redis.pipeline(transaction=True) as pipe:
+                pipe.incr(key)
+                pipe.expire(key, RATE_WINDOW_SECONDS, nx=True)
+                count, _ = await pipe.execute()
+        except (RedisError, OSError):
+            logger.warning(
+                "Bid notification rate check failed",
+                extra={"event_id": str(event_id), "user_id": str(user_id)},
+            )
+            return True
+        return int(count) <= limit
+
+    @staticmethod
+    async def _skip_pending(db: AsyncSession, notification_ids: Any, reason: str) -> None:
+        """Mark pending push/email/SMS deliveries of the given notifications skipped."""
+        await db.execute(
+            update(NotificationDeliveryStatus)
+            .where(
+                NotificationDeliveryStatus.notification_id.in_(notification_ids),
+                NotificationDeliveryStatus.channel != DeliveryChannelEnum.INAPP,
+                NotificationDeliveryStatus.status == DeliveryStatusEnum.PENDING,
+            )
+            .values(status=DeliveryStatusEnum.SKIPPED, failure_reason=reason)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    async def release(
+        db: AsyncSession,
+        event_id: UUID,
+        user_id: UUID,
+        item_id: UUID,
+        notification_id: UUID,
+    ) -> bool:
+        """Close a coalescing window (caller commits, then dispatches on True).
+
+        Marks the external deliveries of every earlier bid notification for
+        the same user and item as skipped, and applies the hourly cap to the
+        latest one.
+
+        Returns:
+            True if the latest notification should be delivered.
+        """
+        created_at = await db.scalar(
+            select(Notification.created_at).where(Notification.id == notification_id)
+        )
+        if created_at is None:
+            # The notification was rolled back or purged
+            return False
+
+        superseded = select(Notification.id).where(
+            Notification.user_id == user_id,
+            Notification.event_id == event_id,
+            Notification.notification_type.in_(COALESCED_TYPES),
+            Notification.data["item_id"].astext == str(item_id),
+            Notification.created_at <= created_at,
+            Notification.id != notification_id,
+        )
+        await BidNotificationCoalescer._skip_pending(db, superseded, "coalesced")
+
+        if not await BidNotificationCoalescer._consume_quota(event_id, user_id):
+            await BidNotificationCoalescer._skip_pending(db, [notification_id], "rate_limited")
+            logger.info(
+                "Bid notification rate limited",
+                extra={"event_id": str(event_id), "user_id": str(user_id)},
+            )
+            return False
+        return True
@@ -0,0 +1,61 @@
+"""Process-level cache of signed Azure Blob Storage read URLs.
+
+Signing a SAS token is an HMAC over the blob path and expiry, so galleries that
+list many images re-sign the same blobs on every refresh. Caching the signed URL
+per blob also keeps image URLs stable between refreshes, which lets browsers
+and CDNs reuse the downloaded image.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+
+class BlobSasUrlCache:
+    """Bounded LRU cache of read SAS URLs keyed by container, blob and lifetime.
+
+    A cached URL is reused while at least half of its requested lifetime is
+    left, so callers always receive a URL that stays valid for a useful time.
+    """
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str, float], tuple[str, datetime]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_sign(
+        self,
+        container_name: str,
+        blob_name: str,
+        expiry_hours: float,
+        sign: Callable[[datetime], str],
+    ) -> str:
+        """Return a cached signed URL, or call ``sign(expires_at)`` to create one."""
+        key = (container_name, blob_name, expiry_hours)
+        now = datetime.now(UTC)
+        lifetime = timedelta(hours=expiry_hours)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached and cached[1] - now >= lifetime / 2:
+                self._entries.move_to_end(key)
+                return cached[0]
+
+        expires_at = now + lifetime
+        url = sign(expires_at)
+
+        with self._lock:
+            self._entries[key] = (url, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return url
+
+    def clear(self) -> None:
+        """Drop every cached URL."""
+        with self._lock:
+            self._entries.clear()
+
+
+blob_sas_url_cache = BlobSasUrlCache()
@@ -16,6 +16,7 @@ from app.core.logging import get_logger
 from app.models.npo import NPO
 from app.models.npo_branding import NPOBranding
 from app.schemas.npo_branding import BrandingCreateRequest, BrandingUpdateRequest
+from app.services.event_service import EventService
 
 logger = get_logger(__name__)
 
@@ -442,6 +443,7 @@ class BrandingService:
 
         await db.commit()
         await db.refresh(branding)
+        await EventService.bump_npo_event_versions(db, npo_id)
 
         logger.info(f"Updated branding for NPO {npo_id}")
         return branding
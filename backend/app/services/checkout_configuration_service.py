@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.logging import get_logger
 from app.models.checkout_configuration import CheckoutConfiguration
 from app.models.processing_fee_config import ProcessingFeeConfig
+from app.services.timer_wheel import CHECKOUT_AUTO_OPEN, TimerWheel
 
 logger = get_logger(__name__)
 
@@ -47,6 +48,10 @@ class CheckoutConfigurationService:
             current_rate = await self._get_current_fee_rate()
             config.processing_fee_rate = current_rate
 
+        # Opened by hand before the scheduled time: drop the pending auto-open
+        if config.scheduled_open_at is not None:
+            await TimerWheel.cancel(event_id, CHECKOUT_AUTO_OPEN)
+
         config.is_open = True
         config.donor_visible = True
         config.opened_at = datetime.now(UTC)
@@ -64,32 +69,21 @@ class CheckoutConfigurationService:
     async def schedule_open(self, event_id: uuid.UUID, open_at: datetime) -> CheckoutConfiguration:
         """Schedule checkout to auto-open at a specific datetime.
 
-        Cancels any existing scheduled task before scheduling the new one.
+        Replaces any existing schedule; the auto-open is a timer on the timer wheel.
         """
-        from app.tasks.checkout_tasks import auto_open_checkout_task
-
         config = await self.get_or_create(event_id)
 
-        # Cancel existing task if any
-        if config.celery_task_id:
-            await self._revoke_task(config.celery_task_id)
-
-        result = auto_open_checkout_task.apply_async(
-            args=[str(event_id)],
-            eta=open_at,
-        )
-        config.celery_task_id = result.id
+        await TimerWheel.upsert(event_id, CHECKOUT_AUTO_OPEN, open_at)
+        config.celery_task_id = None
         config.scheduled_open_at = open_at
 
         return config
 
     async def cancel_schedule(self, event_id: uuid.UUID) -> CheckoutConfiguration:
-        """Cancel a scheduled auto-open task."""
+        """Cancel a scheduled auto-open."""
         config = await self.get_or_create(event_id)
 
-        if config.celery_task_id:
-            await self._revoke_task(config.celery_task_id)
-
+        await TimerWheel.cancel(event_id, CHECKOUT_AUTO_OPEN)
         config.celery_task_id = None
         config.scheduled_open_at = None
 
@@ -123,12 +117,3 @@ class CheckoutConfigurationService:
             # Fallback to default if no config exists
             return Decimal("0.0290")
         return config.rate
-
-    async def _revoke_task(self, task_id: str) -> None:
-        """Revoke a Celery task by ID."""
-        try:
-            from app.celery_app import celery_app
-
-            celery_app.control.revoke(task_id, terminate=False)
-        except Exception:
-            logger.warning(f"Failed to revoke Celery task {task_id}", exc_info=True)
@@ -0,0 +1,84 @@
+"""Redis cache of legal document versions used by the consent check.
+
+Two things decide whether a user must re-consent: the latest published Terms
+of Service / Privacy Policy versions (global, changes only on publish) and the
+versions the user last accepted (changes only on accept/withdraw). Both are
+cached here so the per-request consent check is a single Redis round-trip.
+"""
+
+import json
+import logging
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# (tos_version, privacy_version); None entries mean no active consent
+ConsentVersions = tuple[str | None, str | None]
+
+
+class ConsentCache:
+    """Cached latest published versions and per-user accepted versions."""
+
+    LATEST_KEY = "consent:latest_versions"
+    USER_PREFIX = "consent:user:"
+
+    @staticmethod
+    async def get(user_id: UUID) -> tuple[tuple[str, str] | None, ConsentVersions | None]:
+        """Get the latest published versions and a user's accepted versions.
+
+        Returns:
+            (latest, accepted); either is None on a cache miss or Redis failure
+        """
+        try:
+            redis = await get_redis()
+            latest_raw, user_raw = await redis.mget(
+                ConsentCache.LATEST_KEY, f"{ConsentCache.USER_PREFIX}{user_id}"
+            )
+        except (RedisError, OSError):
+            logger.warning("Consent cache lookup failed", extra={"user_id": str(user_id)})
+            return None, None
+
+        latest = tuple(json.loads(latest_raw)) if latest_raw else None
+        accepted = tuple(json.loads(user_raw)) if user_raw else None
+        return latest, accepted
+
+    @staticmethod
+    async def set_latest(tos_version: str, privacy_version: str) -> None:
+        """Cache the latest published (tos, privacy) versions."""
+        await ConsentCache._set(ConsentCache.LATEST_KEY, [tos_version, privacy_version])
+
+    @staticmethod
+    async def set_accepted(user_id: UUID, versions: ConsentVersions) -> None:
+        """Cache the (tos, privacy) versions a user has actively accepted."""
+        await ConsentCache._set(f"{ConsentCache.USER_PREFIX}{user_id}", list(versions))
+
+    @staticmethod
+    async def invalidate_latest() -> None:
+        """Forget the latest published versions (call after publishing a document)."""
+        await ConsentCache._delete(ConsentCache.LATEST_KEY)
+
+    @staticmethod
+    async def invalidate_user(user_id: UUID) -> None:
+        """Forget a user's accepted versions (call after accepting or withdrawing consent)."""
+        await ConsentCache._delete(f"{ConsentCache.USER_PREFIX}{user_id}")
+
+    @staticmethod
+    async def _set(key: str, value: list[str | None]) -> None:
+        try:
+            redis = await get_redis()
+            await redis.setex(key, get_settings().consent_cache_ttl_seconds, json.dumps(value))
+        except (RedisError, OSError):
+            logger.warning("Consent cache store failed", extra={"key": key})
+
+    @staticmethod
+    async def _delete(key: str) -> None:
+        try:
+            redis = await get_redis()
+            await redis.delete(key)
+        except (RedisError, OSError):
+            logger.warning("Consent cache invalidation failed", extra={"key": key})
@@ -10,6 +10,7 @@ from datetime import UTC, datetime, timedelta
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.models.consent import (
     ConsentAction,
@@ -25,6 +26,7 @@ from app.schemas.consent import (
     ConsentResponse,
     ConsentStatusResponse,
 )
+from app.services.consent_cache import ConsentCache
 
 logger = logging.getLogger(__name__)
 
@@ -117,6 +119,7 @@ class ConsentService:
         db.add(audit_log)
 
         await db.commit()
+        await ConsentCache.invalidate_user(user.id)
         await db.refresh(consent)
 
         return ConsentResponse.model_validate(consent)
@@ -175,6 +178,7 @@ class ConsentService:
         user.updated_at = datetime.now(UTC)
 
         await db.commit()
+        await ConsentCache.invalidate_user(user.id)
         await db.refresh(consent)
 
         return ConsentResponse.model_validate(consent)
@@ -193,63 +197,39 @@ class ConsentService:
         Returns:
             Consent status with version information
         """
-        # Get user's active consent
-        stmt = select(UserConsent).where(
-            UserConsent.user_id == user.id,
-            UserConsent.status == ConsentStatus.ACTIVE,
-        )
-        result = await db.execute(stmt)
-        consent = result.scalar_one_or_none()
-
-        # Get latest published versions
-        latest_tos = await self._get_latest_published(
-            db=db,
-            document_type=LegalDocumentType.TERMS_OF_SERVICE,
-        )
-        latest_privacy = await self._get_latest_published(
-            db=db,
-            document_type=LegalDocumentType.PRIVACY_POLICY,
-        )
-
-        if not latest_tos or not latest_privacy:
-            raise ValueError("Latest legal documents not found")
-
-        # If no active consent, user needs to consent
-        if not consent:
-            return ConsentStatusResponse(
-                has_active_consent=False,
-                current_tos_version=None,
-                current_privacy_version=None,
-                latest_tos_version=latest_tos.version,
-                latest_privacy_version=latest_privacy.version,
-                consent_required=True,
-            )
+        latest, accepted = await ConsentCache.get(user.id)
+        if latest is None:
+            latest = await self._load_latest_versions(db)
+        if accepted is None:
+            accepted = await self._load_accepted_versions(db, user.id)
+            if accepted is None:
+                raise ValueError(f"User {user.id} not found")
+        return self._build_status(latest, accepted)
 
-        # Get versions from consent
-        tos_doc_stmt = select(LegalDocument).where(LegalDocument.id == consent.tos_document_id)
-        privacy_doc_stmt = select(LegalDocument).where(
-            LegalDocument.id == consent.privacy_document_id
-        )
+    async def get_cached_consent_status(self, user_id: uuid.UUID) -> ConsentStatusResponse | None:
+        """Get a user's consent status, touching the database only on a cache miss.
 
-        tos_result = await db.execute(tos_doc_stmt)
-        privacy_result = await db.execute(privacy_doc_stmt)
+        Used by the per-request consent check, which runs before the route has
+        a session of its own.
 
-        tos_doc = tos_result.scalar_one()
-        privacy_doc = privacy_result.scalar_one()
-
-        # Check if user's consent is outdated
-        consent_required = (
-            tos_doc.version != latest_tos.version or privacy_doc.version != latest_privacy.version
-        )
+        Args:
+            user_id: User to check consent for
 
-        return ConsentStatusResponse(
-            has_active_consent=True,
-            current_tos_version=tos_doc.version,
-            current_privacy_version=privacy_doc.version,
-            latest_tos_version=latest_tos.version,
-            latest_privacy_version=latest_privacy.version,
-            consent_required=consent_required,
-        )
+        Returns:
+            Consent status, or None if the user does not exist
+        """
+        latest, accepted = await ConsentCache.get(user_id)
+        if latest is None or accepted is None:
+            from app.core.database import AsyncSessionLocal
+
+            async with AsyncSessionLocal() as db:
+                if latest is None:
+                    latest = await self._load_latest_versions(db)
+                if accepted is None:
+                    accepted = await self._load_accepted_versions(db, user_id)
+            if accepted is None:
+                return None
+        return self._build_status(latest, accepted)
 
     async def get_consent_history(
         self,
@@ -396,6 +376,86 @@ class ConsentService:
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def _load_latest_versions(self, db: AsyncSession) -> tuple[str, str]:
+        """Load and cache the latest published (tos, privacy) versions."""
+        latest_tos = await self._get_latest_published(
+            db=db,
+            document_type=LegalDocumentType.TERMS_OF_SERVICE,
+        )
+        latest_privacy = await self._get_latest_published(
+            db=db,
+            document_type=LegalDocumentType.PRIVACY_POLICY,
+        )
+
+        if not latest_tos or not latest_privacy:
+            raise ValueError("Latest legal documents not found")
+
+        await ConsentCache.set_latest(latest_tos.version, latest_privacy.version)
+        return latest_tos.version, latest_privacy.version
+
+    async def _load_accepted_versions(
+        self,
+        db: AsyncSession,
+        user_id: uuid.UUID,
+    ) -> tuple[str | None, str | None] | None:
+        """Load and cache the (tos, privacy) versions of a user's active consent.
+
+        Returns:
+            (None, None) if the user has no active consent, None if the user does not exist
+        """
+        tos_doc = aliased(LegalDocument)
+        privacy_doc = aliased(LegalDocument)
+        stmt = (
+            select(User.id, tos_doc.version, privacy_doc.version)
+            .outerjoin(
+                UserConsent,
+                (UserConsent.user_id == User.id) & (UserConsent.status == ConsentStatus.ACTIVE),
+            )
+            .outerjoin(tos_doc, tos_doc.id == UserConsent.tos_document_id)
+            .outerjoin(privacy_doc, privacy_doc.id == UserConsent.privacy_document_id)
+            .where(User.id == user_id)
+        )
+        row = (await db.execute(stmt)).first()
+        if row is None:
+            return None
+
+        accepted = (row[1], row[2])
+        await ConsentCache.set_accepted(user_id, accepted)
+        return accepted
+
+    @staticmethod
+    def _build_status(
+        latest: tuple[str, str],
+        accepted: tuple[str | None, str | None],
+    ) -> ConsentStatusResponse:
+        latest_tos_version, latest_privacy_version = latest
+        tos_version, privacy_version = accepted
+
+        # If no active consent, user needs to consent
+        if tos_version is None or privacy_version is None:
+            return ConsentStatusResponse(
+                has_active_consent=False,
+                current_tos_version=None,
+                current_privacy_version=None,
+                latest_tos_version=latest_tos_version,
+                latest_privacy_version=latest_privacy_version,
+                consent_required=True,
+            )
+
+        # Check if user's consent is outdated
+        consent_required = (
+            tos_version != latest_tos_version or privacy_version != latest_privacy_version
+        )
+
+        return ConsentStatusResponse(
+            has_active_consent=True,
+            current_tos_version=tos_version,
+            current_privacy_version=privacy_version,
+            latest_tos_version=latest_tos_version,
+            latest_privacy_version=latest_privacy_version,
+            consent_required=consent_required,
+        )
+
     async def _get_latest_published(
         self,
         db: AsyncSession,
@@ -4,16 +4,31 @@ T057: Azure Communication Services email client for sending password reset email
 T159: Error handling and retry logic for email service failures
 """
 
-import asyncio
-import os
-import smtplib
-from email.message import EmailMessage
+from collections.abc import Sequence
 from typing import Any
 from urllib.parse import urlencode
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.core.metrics import EMAIL_FAILURES_TOTAL
+from app.services.email_transport import (
+    EmailAttachment,
+    EmailSendError,
+    EmailServiceError,
+    OutboundEmail,
+    SendResult,
+    TransientEmailError,
+    get_email_transport,
+    retry_delay_seconds,
+)
+
+__all__ = [
+    "EmailSendError",
+    "EmailService",
+    "EmailServiceError",
+    "TransientEmailError",
+    "get_email_service",
+]
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -201,18 +216,6 @@ def _create_email_html_template(
     """
 
 
-class EmailServiceError(Exception):
-    """Base exception for email service errors."""
-
-    pass
-
-
-class EmailSendError(EmailServiceError):
-    """Exception raised when email sending fails."""
-
-    pass
-
-
 class EmailService:
     """Email service for sending transactional emails via Azure Communication Services."""
 
@@ -999,7 +1002,7 @@ The FundrBolt Team
         from_name: str | None = None,
     ) -> bool:
         """
-        Send email with retry logic and error handling.
+        Send email, requeueing it for a later retry if the provider fails transiently.
 
         Args:
             to_email: Recipient email address
@@ -1011,79 +1014,114 @@ The FundrBolt Team
             from_name: Optional sender display name override (defaults to settings.email_from_name)
 
         Returns:
-            True if email sent successfully
+            True if email was sent or queued for retry
 
         Raises:
-            EmailSendError: If email fails after all retries
+            EmailSendError: If the provider rejected the email or no backend is configured
         """
-        max_retries = 3
-        retry_delay = 1.0
-        can_send_real_email = settings.email_backend == "mailpit" or (
-            settings.email_backend == "azure_acs" and self.enabled
+        return await self.deliver(
+            OutboundEmail(
+                to_email=to_email,
+                subject=subject,
+                body=body,
+                html_body=html_body,
+                from_address=from_address,
+                from_name=from_name,
+                email_type=email_type,
+            )
         )
 
-        if not can_send_real_email and settings.environment not in {"development", "test"}:
-            raise EmailSendError(
-                f"Email backend '{settings.email_backend}' is not configured for real delivery"
+    async def deliver(self, message: OutboundEmail) -> bool:
+        """
+        Send one rendered email over the pooled transport.
+
+        Transient failures (throttling, provider outages, dropped connections)
+        are handed to send_email_task with a backoff countdown instead of being
+        retried inline, so the caller returns immediately.
+
+        Args:
+            message: Rendered email
+
+        Returns:
+            True if email was sent or queued for retry
+
+        Raises:
+            EmailSendError: If the provider rejected the email or no backend is configured
+        """
+        try:
+            await get_email_transport().send(message)
+            return True
+        except TransientEmailError as e:
+            EMAIL_FAILURES_TOTAL.inc()
+            self.requeue(message, attempt=1, retry_after=e.retry_after)
+            return True
+        except Exception as e:
+            EMAIL_FAILURES_TOTAL.inc()
+            logger.error(
+                "Email sending failed",
+                extra={
+                    "email_type": message.email_type,
+                    "to_email": message.to_email,
+                    "error": str(e),
+                },
             )
+            if isinstance(e, EmailSendError):
+                raise
+            raise EmailSendError(f"Failed to send {message.email_type} email") from e
 
-        for attempt in range(max_retries):
-            try:
-                if settings.email_backend == "mailpit":
-                    await self._send_via_mailpit(
-                        to_email, subject, body, html_body, from_address, from_name
-                    )
-                elif settings.email_backend == "azure_acs" and self.enabled:
-                    await self._send_via_azure(
-                        to_email, subject, body, html_body, from_address, from_name
-                    )
-                elif settings.environment in {"development", "test"}:
-                    sender_display = from_address or settings.email_from_address
-                    logger.info(
-                        f"[MOCK EMAIL] {email_type} email\n"
-                        f"From: {sender_display}\n"
-                        f"To: {to_email}\n"
-                        f"Subject: {subject}\n"
-                        f"Body:\n{body}"
-                    )
-                else:
-                    raise EmailSendError(
-                        f"Email backend '{settings.email_backend}' is not configured for real delivery"
-                    )
-                return True
-
-            except Exception as e:
-                # Increment failure counter
-                EMAIL_FAILURES_TOTAL.inc()
-
-                if attempt < max_retries - 1:
-                    logger.warning(
-                        "Email sending failed, retrying",
-                        extra={
-                            "email_type": email_type,
-                            "to_email": to_email,
-                            "error": str(e),
-                            "attempt": attempt + 1,
-                            "max_retries": max_retries,
-                        },
-                    )
-                    await asyncio.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                else:
-                    logger.error(
-                        "Email sending failed after all retries",
-                        extra={
-                            "email_type": email_type,
-                            "to_email": to_email,
-                            "error": str(e),
-                            "max_retries": max_retries,
-                        },
-                    )
-                    raise EmailSendError(
-                        f"Failed to send {email_type} email after {max_retries} attempts"
-                    ) from e
-
-        return False  # Should not reach here
+    @staticmethod
+    def requeue(message: OutboundEmail, attempt: int, retry_after: float | None = None) -> None:
+        """
+        Queue a transiently failed email for another attempt.
+
+        Args:
+            message: Rendered email
+            attempt: Attempt number of the retry (1 for the first retry)
+            retry_after: Provider's Retry-After hint in seconds, if any
+
+        Raises:
+            EmailSendError: If the retry could not be queued
+        """
+        from app.tasks.email_tasks import send_email_task
+
+        countdown = retry_delay_seconds(attempt, retry_after)
+        try:
+            send_email_task.apply_async(
+                args=[message.to_payload()], kwargs={"attempt": attempt}, countdown=countdown
+            )
+        except Exception as e:
+            raise EmailSendError(f"Failed to queue {message.email_type} email for retry") from e
+        logger.warning(
+            "Email sending failed, retry queued",
+            extra={
+                "email_type": message.email_type,
+                "to_email": message.to_email,
+                "attempt": attempt,
+                "countdown": countdown,
+            },
+        )
+
+    async def send_batch(self, messages: Sequence[OutboundEmail]) -> list[SendResult]:
+        """
+        Send many rendered emails with bounded concurrency over the pooled transport.
+
+        Failures are returned per message rather than raised or requeued, so
+        the caller can record them and requeue the transient ones together.
+
+        Args:
+            messages: Rendered emails
+
+        Returns:
+            One SendResult per message, in input order
+
+        Raises:
+            EmailSendError: If no backend is configured
+        """
+        results = await get_email_transport().send_batch(messages)
+        failed = sum(1 for result in results if not result.ok)
+        if failed:
+            EMAIL_FAILURES_TOTAL.inc(failed)
+        return results
 
     async def send_application_submitted_email(
         self, to_email: str, npo_name: str, applicant_name: str | None = None
@@ -1556,135 +1594,6 @@ If you have any questions about this decision, please contact us by replying to
             html_body=html_body,
         )
 
-    async def _send_via_mailpit(
-        self,
-        to_email: str,
-        subject: str,
-        body: str,
-        html_body: str | None = None,
-        from_address: str | None = None,
-        from_name: str | None = None,
-    ) -> None:
-        """Send email through Mailpit SMTP for local/CI integration tests."""
-
-        message = EmailMessage()
-        message["Subject"] = subject
-        message["From"] = (
-            f"{from_name or settings.email_from_name} <{from_address or settings.email_from_address}>"
-        )
-        message["To"] = to_email
-        message.set_content(body)
-        if html_body:
-            message.add_alternative(html_body, subtype="html")
-
-        def _send_sync() -> None:
-            with smtplib.SMTP(
-                settings.mailpit_smtp_host, settings.mailpit_smtp_port, timeout=10
-            ) as smtp:
-                smtp.send_message(message)
-
-        await asyncio.to_thread(_send_sync)
-
-    async def _send_via_azure(
-        self,
-        to_email: str,
-        subject: str,
-        body: str,
-        html_body: str | None = None,
-        from_address: str | None = None,
-        from_name: str | None = None,
-    ) -> None:
-        """
-        Send email via Azure Communication Services.
-
-        Args:
-            to_email: Recipient email address
-            subject: Email subject
-            body: Email body (plain text)
-            html_body: Optional HTML email body
-            from_address: Optional sender address override
-            from_name: Optional sender display name override
-
-        Raises:
-            EmailSendError: If sending fails
-        """
-        import asyncio
-        from concurrent.futures import ThreadPoolExecutor
-        from typing import Any
-
-        if settings.environment == "test" or "PYTEST_CURRENT_TEST" in os.environ:
-            logger.info(
-                "Email send skipped in test environment",
-                extra={
-                    "to": to_email,
-                    "subject": subject,
-                },
-            )
-            return
-
-        def _send_sync() -> Any:
-            """Synchronous send operation to run in thread pool."""
-            try:
-                from azure.communication.email import EmailClient
-
-                if not settings.azure_communication_connection_string:
-                    raise EmailSendError(
-                        "Azure Communication Services connection string not configured"
-                    )
-
-                # Initialize client
-                client = EmailClient.from_connection_string(
-                    settings.azure_communication_connection_string
-                )
-
-                # Prepare message content
-                content = {
-                    "subject": subject,
-                    "plainText": body,
-                }
-                if html_body:
-                    content["html"] = html_body
-
-                # Prepare message
-                message = {
-                    "senderAddress": from_address or settings.email_from_address,
-                    "senderDisplayName": from_name or settings.email_from_name,
-                    "recipients": {"to": [{"address": to_email}]},
-                    "content": content,
-                }
-
-                # Send email (synchronous Azure SDK call)
-                poller = client.begin_send(message)
-                result = poller.result()
-
-                logger.info(
-                    "Email sent via Azure Communication Services",
-                    extra={
-                        "to": to_email,
-                        "subject": subject,
-                        "message_id": result.get("id"),
-                        "status": result.get("status"),
-                    },
-                )
-                return result
-
-            except ImportError as e:
-                raise EmailSendError(
-                    "Azure Communication Email SDK not installed. "
-                    "Install with: poetry add azure-communication-email"
-                ) from e
-            except Exception as e:
-                logger.error(
-                    "Failed to send email via Azure",
-                    extra={"to": to_email, "subject": subject, "error": str(e)},
-                )
-                raise EmailSendError(f"Failed to send email: {str(e)}") from e
-
-        # Run synchronous Azure SDK call in thread pool to avoid blocking event loop
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            await loop.run_in_executor(executor, _send_sync)
-
     async def send_receipt_email(
         self,
         to_email: str,
@@ -1711,10 +1620,10 @@ If you have any questions about this decision, please contact us by replying to
             npo_slug: Optional NPO slug for branded sender address
 
         Returns:
-            True if sent successfully, False on mock mode.
+            True if sent or queued for retry (always True in mock mode).
 
         Raises:
-            EmailSendError: If sending fails after retries.
+            EmailSendError: If the provider rejected the email.
         """
         subject = f"Your receipt for {event_name}"
         greeting = f"Hi {donor_name},"
@@ -1753,7 +1662,7 @@ If you have any questions about this decision, please contact us by replying to
 
         sender_address, sender_name = self._get_event_sender(npo_slug)
 
-        if not self.enabled:
+        if settings.email_backend != "mailpit" and not self.enabled:
             logger.info(
                 "[MOCK EMAIL] receipt email",
                 extra={
@@ -1765,75 +1674,38 @@ If you have any questions about this decision, please contact us by replying to
             )
             return True
 
-        # Send with optional PDF attachment via Azure
-        import asyncio as _asyncio
-        import base64
-        from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
-
-        def _send_sync_with_attachment() -> None:
-            try:
-                from azure.communication.email import EmailClient
-
-                if not settings.azure_communication_connection_string:
-                    raise EmailSendError("Azure connection string not configured")
-
-                client = EmailClient.from_connection_string(
-                    settings.azure_communication_connection_string
-                )
-
-                content: dict[str, str] = {
-                    "subject": subject,
-                    "plainText": plain_body,
-                    "html": html_body,
-                }
-
-                message: dict[str, object] = {
-                    "senderAddress": sender_address,
-                    "senderDisplayName": sender_name,
-                    "recipients": {"to": [{"address": to_email}]},
-                    "content": content,
-                }
-
-                if pdf_bytes:
-                    message["attachments"] = [
-                        {
-                            "name": f"receipt-{transaction_id[:8]}.pdf",
-                            "contentType": "application/pdf",
-                            "contentInBase64": base64.b64encode(pdf_bytes).decode(),
-                        }
-                    ]
-
-                poller = client.begin_send(message)
-                poller.result()
-
-                logger.info(
-                    "Receipt email sent",
-                    extra={
-                        "to": to_email,
-                        "transaction_id": transaction_id,
-                        "has_pdf": pdf_bytes is not None,
-                    },
-                )
-            except Exception as exc:
-                logger.error("Failed to send receipt email", extra={"error": str(exc)})
-                raise EmailSendError(f"Receipt email failed: {exc}") from exc
-
-        # Retry up to 3 times with exponential backoff
-        delay = 1.0
-        last_exc: Exception | None = None
-        for attempt in range(3):
-            try:
-                loop = _asyncio.get_event_loop()
-                with _ThreadPoolExecutor() as executor:
-                    await loop.run_in_executor(executor, _send_sync_with_attachment)
-                return True
-            except EmailSendError as exc:
-                last_exc = exc
-                if attempt < 2:
-                    await _asyncio.sleep(delay)
-                    delay *= 2
-
-        raise EmailSendError("Failed to send receipt email after 3 attempts") from last_exc
+        attachments = (
+            (
+                EmailAttachment(
+                    name=f"receipt-{transaction_id[:8]}.pdf",
+                    content_type="application/pdf",
+                    content=pdf_bytes,
+                ),
+            )
+            if pdf_bytes
+            else ()
+        )
+        await self.deliver(
+            OutboundEmail(
+                to_email=to_email,
+                subject=subject,
+                body=plain_body,
+                html_body=html_body,
+                from_address=sender_address,
+                from_name=sender_name,
+                email_type="receipt",
+                attachments=attachments,
+            )
+        )
+        logger.info(
+            "Receipt email sent",
+            extra={
+                "to": to_email,
+                "transaction_id": transaction_id,
+                "has_pdf": pdf_bytes is not None,
+            },
+        )
+        return True
 
     # ------------------------------------------------------------------
     # T072: Notification email templates
@@ -1924,7 +1796,7 @@ If you have any questions about this decision, please contact us by replying to
 
         return subject, heading, plain_text, cta_text, cta_url
 
-    async def send_notification_email(
+    def build_notification_email(
         self,
         to_email: str,
         notification_type: str,
@@ -1936,8 +1808,8 @@ If you have any questions about this decision, please contact us by replying to
         npo_slug: str | None = None,
         primary_color: str | None = None,
         npo_name: str | None = None,
-    ) -> bool:
-        """Send a branded notification email.
+    ) -> OutboundEmail:
+        """Render a branded notification email.
 
         Args:
             to_email: Recipient email address.
@@ -1950,7 +1822,7 @@ If you have any questions about this decision, please contact us by replying to
             npo_slug: Optional NPO slug for branded sender address.
 
         Returns:
-            True if sent successfully.
+            Rendered email, ready for deliver() or send_batch().
         """
         donor_url = getattr(settings, "frontend_donor_url", "https://app.fundrbolt.com")
         subject, heading, plain_text, cta_text, cta_url = self._notification_email_content(
@@ -1981,14 +1853,49 @@ If you have any questions about this decision, please contact us by replying to
             npo_name=npo_name,
         )
 
-        return await self._send_email_with_retry(
+        return OutboundEmail(
             to_email=to_email,
             subject=subject,
             body=plain_text,
-            email_type=f"notification_{notification_type}",
             html_body=html_body,
             from_address=sender_address,
             from_name=sender_name,
+            email_type=f"notification_{notification_type}",
+        )
+
+    async def send_notification_email(
+        self,
+        to_email: str,
+        notification_type: str,
+        title: str,
+        body: str,
+        donor_name: str | None = None,
+        data: dict[str, Any] | None = None,
+        event_logo_url: str | None = None,
+        npo_slug: str | None = None,
+        primary_color: str | None = None,
+        npo_name: str | None = None,
+    ) -> bool:
+        """Send a branded notification email.
+
+        Args are as for build_notification_email.
+
+        Returns:
+            True if sent successfully or queued for retry.
+        """
+        return await self.deliver(
+            self.build_notification_email(
+                to_email=to_email,
+                notification_type=notification_type,
+                title=title,
+                body=body,
+                donor_name=donor_name,
+                data=data,
+                event_logo_url=event_logo_url,
+                npo_slug=npo_slug,
+                primary_color=primary_color,
+                npo_name=npo_name,
+            )
         )
 
     async def send_account_deletion_confirmation_email(
@@ -0,0 +1,499 @@
+"""Pooled email transports with batch sending and a shared provider rate limit.
+
+One transport per process holds the provider connection for its lifetime: a
+single Azure Communication Services ``EmailClient`` (with a bounded thread
+pool for its synchronous SDK), or a small pool of open SMTP connections to
+Mailpit for local and CI runs. ``send_batch`` sends many messages with bounded
+concurrency, and every send first takes a slot from a Redis-backed per-second
+budget shared by all API and worker processes.
+
+Transports never sleep to retry. A failure the provider may accept later
+(throttling, 5xx, dropped connections) raises ``TransientEmailError`` and the
+caller requeues the message through Celery; anything else raises
+``EmailSendError``.
+"""
+
+import asyncio
+import base64
+import os
+import smtplib
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from email.message import EmailMessage
+from typing import Any
+
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.redis import get_redis
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class EmailServiceError(Exception):
+    """Base exception for email service errors."""
+
+    pass
+
+
+class EmailSendError(EmailServiceError):
+    """Exception raised when email sending fails."""
+
+    pass
+
+
+class TransientEmailError(EmailSendError):
+    """Send failed in a way the provider may accept on a later attempt."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class EmailAttachment:
+    """File attached to an outbound email."""
+
+    name: str
+    content_type: str
+    content: bytes
+
+
+@dataclass(frozen=True)
+class OutboundEmail:
+    """A fully rendered email, independent of the transport that sends it."""
+
+    to_email: str
+    subject: str
+    body: str
+    html_body: str | None = None
+    from_address: str | None = None
+    from_name: str | None = None
+    email_type: str = "generic"
+    attachments: tuple[EmailAttachment, ...] = ()
+
+    @property
+    def sender_address(self) -> str:
+        return self.from_address or str(settings.email_from_address)
+
+    @property
+    def sender_name(self) -> str:
+        return self.from_name or settings.email_from_name
+
+    def to_payload(self) -> dict[str, Any]:
+        """JSON-serialisable form, used to requeue the message through Celery."""
+        return {
+            "to_email": self.to_email,
+            "subject": self.subject,
+            "body": self.body,
+            "html_body": self.html_body,
+            "from_address": self.from_address,
+            "from_name": self.from_name,
+            "email_type": self.email_type,
+            "attachments": [
+                {
+                    "name": attachment.name,
+                    "content_type": attachment.content_type,
+                    "content": base64.b64encode(attachment.content).decode(),
+                }
+                for attachment in self.attachments
+            ],
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "OutboundEmail":
+        attachments = tuple(
+            EmailAttachment(
+                name=attachment["name"],
+                content_type=attachment["content_type"],
+                content=base64.b64decode(attachment["content"]),
+            )
+            for attachment in payload.get("attachments") or []
+        )
+        return cls(
+            to_email=payload["to_email"],
+            subject=payload["subject"],
+            body=payload["body"],
+            html_body=payload.get("html_body"),
+            from_address=payload.get("from_address"),
+            from_name=payload.get("from_name"),
+            email_type=payload.get("email_type") or "generic",
+            attachments=attachments,
+        )
+
+
+@dataclass
+class SendResult:
+    """Outcome of one message in a batch."""
+
+    message: OutboundEmail
+    error: Exception | None = None
+    message_id: str | None = field(default=None)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def transient(self) -> bool:
+        return isinstance(self.error, TransientEmailError)
+
+
+def retry_delay_seconds(attempt: int, retry_after: float | None = None) -> int:
+    """Countdown before requeued attempt ``attempt`` (1-based), honouring Retry-After."""
+    base = settings.email_retry_base_delay_seconds
+    delay: int = base * 2 ** max(0, attempt - 1)
+    if retry_after is not None:
+        delay = max(delay, int(retry_after) + 1)
+    return delay
+
+
+class ProviderRateLimiter:
+    """Sends-per-second budget shared by every process using the same provider."""
+
+    KEY_PREFIX = "email:rate:"
+
+    def __init__(self, provider: str, per_second: int) -> None:
+        self.provider = provider
+        self.per_second = per_second
+
+    async def acquire(self) -> None:
+        """Wait until the current one-second window has room for one more send.
+
+        Fails open when Redis is unavailable; the provider's own throttling
+        responses are still retried as transient failures.
+        """
+        if self.per_second <= 0:
+            return
+        while True:
+            now = time.time()
+            window = int(now)
+            key = f"{self.KEY_PREFIX}{self.provider}:{window}"
+            try:
+                redis = await get_redis()
+                async with redis.pipeline(transaction=True) as pipe:
+                    pipe.incr(key)
+                    pipe.expire(key, 2, nx=True)
+                    count, _ = await pipe.execute()
+            except (RedisError, OSError):
+                logger.warning("Email rate limit check failed", extra={"provider": self.provider})
+                return
+            if int(count) <= self.per_second:
+                return
+            await asyncio.sleep(window + 1 - now)
+
+
+class EmailTransport(ABC):
+    """Sends rendered emails through one provider."""
+
+    name = "base"
+
+    def __init__(self) -> None:
+        self.rate_limiter = ProviderRateLimiter(self.name, settings.email_max_sends_per_second)
+
+    @abstractmethod
+    async def _send(self, message: OutboundEmail) -> str | None:
+        """Hand one message to the provider; returns its message ID if known."""
+
+    async def send(self, message: OutboundEmail) -> str | None:
+        """Send one message within the provider rate limit.
+
+        Raises:
+            TransientEmailError: The provider may accept the message later
+            EmailSendError: The message was rejected
+        """
+        await self.rate_limiter.acquire()
+        return await self._send(message)
+
+    async def send_batch(
+        self, messages: Sequence[OutboundEmail], concurrency: int | None = None
+    ) -> list[SendResult]:
+        """Send many messages concurrently; results are in input order.
+
+        Failures are returned, not raised, so one bad address does not stop
+        the rest of the batch.
+        """
+        semaphore = asyncio.Semaphore(concurrency or settings.email_send_concurrency)
+
+        async def _one(message: OutboundEmail) -> SendResult:
+            async with semaphore:
+                try:
+                    return SendResult(message, message_id=await self.send(message))
+                except Exception as exc:
+                    if not isinstance(exc, EmailSendError):
+                        exc = EmailSendError(f"Failed to send email: {exc}")
+                    return SendResult(message, error=exc)
+
+        return list(await asyncio.gather(*(_one(message) for message in messages)))
+
+    async def close(self) -> None:
+        """Release pooled connections."""
+        return None
+
+
+class ConsoleEmailTransport(EmailTransport):
+    """Logs emails instead of sending them (development and tests)."""
+
+    name = "console"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.rate_limiter = ProviderRateLimiter(self.name, 0)
+
+    async def _send(self, message: OutboundEmail) -> str | None:
+        logger.info(
+            f"[MOCK EMAIL] {message.email_type} email\n"
+            f"From: {message.sender_address}\n"
+            f"To: {message.to_email}\n"
+            f"Subject: {message.subject}\n"
+            f"Attachments: {len(message.attachments)}\n"
+            f"Body:\n{message.body}"
+        )
+        return None
+
+
+class SmtpEmailTransport(EmailTransport):
+    """SMTP transport keeping a small pool of open connections (Mailpit)."""
+
+    name = "smtp"
+
+    def __init__(self, host: str, port: int, pool_size: int) -> None:
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.pool_size = max(1, pool_size)
+        self._idle: list[smtplib.SMTP] = []
+        self._lock = threading.Lock()
+        # Never more connections than the pool holds, however large the batch
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+
+    def _checkout(self) -> smtplib.SMTP:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return smtplib.SMTP(self.host, self.port, timeout=10)
+
+    def _checkin(self, connection: smtplib.SMTP) -> None:
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(connection)
+                return
+        self._quit(connection)
+
+    @staticmethod
+    def _quit(connection: smtplib.SMTP) -> None:
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
+
+    @staticmethod
+    def _build_message(message: OutboundEmail) -> EmailMessage:
+        mime = EmailMessage()
+        mime["Subject"] = message.subject
+        mime["From"] = f"{message.sender_name} <{message.sender_address}>"
+        mime["To"] = message.to_email
+        mime.set_content(message.body)
+        if message.html_body:
+            mime.add_alternative(message.html_body, subtype="html")
+        for attachment in message.attachments:
+            maintype, _, subtype = attachment.content_type.partition("/")
+            mime.add_attachment(
+                attachment.content,
+                maintype=maintype,
+                subtype=subtype or "octet-stream",
+                filename=attachment.name,
+            )
+        return mime
+
+    def _send_sync(self, mime: EmailMessage) -> None:
+        with self._slots:
+            connection = self._checkout()
+            try:
+                try:
+                    connection.send_message(mime)
+                except smtplib.SMTPServerDisconnected:
+                    # Pooled connection timed out server-side; one fresh reconnect
+                    connection.close()
+                    connection = smtplib.SMTP(self.host, self.port, timeout=10)
+                    connection.send_message(mime)
+            except BaseException:
+                connection.close()
+                raise
+            self._checkin(connection)
+
+    async def _send(self, message: OutboundEmail) -> str | None:
+        mime = self._build_message(message)
+        try:
+            await asyncio.to_thread(self._send_sync, mime)
+        except smtplib.SMTPResponseException as exc:
+            if 400 <= exc.smtp_code < 500:
+                raise TransientEmailError(f"SMTP {exc.smtp_code}: {exc.smtp_error!r}") from exc
+            raise EmailSendError(f"SMTP {exc.smtp_code}: {exc.smtp_error!r}") from exc
+        except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, OSError) as exc:
+            raise TransientEmailError(f"SMTP connection failed: {exc}") from exc
+        except smtplib.SMTPException as exc:
+            raise EmailSendError(f"SMTP send failed: {exc}") from exc
+        return None
+
+    async def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            await asyncio.to_thread(self._quit, connection)
+
+
+class AzureEmailTransport(EmailTransport):
+    """Azure Communication Services transport sharing one client per process.
+
+    Sends return once ACS has accepted the message instead of polling the
+    operation to completion, and the SDK's own retry policy is disabled so
+    throttled sends are requeued instead of sleeping in a pool thread.
+    """
+
+    name = "azure_acs"
+
+    def __init__(self, connection_string: str, max_workers: int) -> None:
+        super().__init__()
+        self.connection_string = connection_string
+        self._client: Any = None
+        self._client_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="acs-email"
+        )
+
+    def _get_client(self) -> Any:
+        with self._client_lock:
+            if self._client is None:
+                try:
+                    from azure.communication.email import EmailClient
+                except ImportError as e:
+                    raise EmailSendError(
+                        "Azure Communication Email SDK not installed. "
+                        "Install with: poetry add azure-communication-email"
+                    ) from e
+                self._client = EmailClient.from_connection_string(
+                    self.connection_string, retry_total=0
+                )
+            return self._client
+
+    @staticmethod
+    def _build_message(message: OutboundEmail) -> dict[str, Any]:
+        content = {"subject": message.subject, "plainText": message.body}
+        if message.html_body:
+            content["html"] = message.html_body
+        payload: dict[str, Any] = {
+            "senderAddress": message.sender_address,
+            "senderDisplayName": message.sender_name,
+            "recipients": {"to": [{"address": message.to_email}]},
+            "content": content,
+        }
+        if message.attachments:
+            payload["attachments"] = [
+                {
+                    "name": attachment.name,
+                    "contentType": attachment.content_type,
+                    "contentInBase64": base64.b64encode(attachment.content).decode(),
+                }
+                for attachment in message.attachments
+            ]
+        return payload
+
+    def _send_sync(self, payload: dict[str, Any]) -> Any:
+        poller = self._get_client().begin_send(payload, polling=False)
+        return poller.result()
+
+    async def _send(self, message: OutboundEmail) -> str | None:
+        if settings.environment == "test" or "PYTEST_CURRENT_TEST" in os.environ:
+            logger.info(
+                "Email send skipped in test environment",
+                extra={"to": message.to_email, "subject": message.subject},
+            )
+            return None
+
+        from azure.core.exceptions import (
+            HttpResponseError,
+            ServiceRequestError,
+            ServiceResponseError,
+        )
+
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(
+                self._executor, self._send_sync, self._build_message(message)
+            )
+        except (ServiceRequestError, ServiceResponseError) as exc:
+            raise TransientEmailError(f"Azure email request failed: {exc}") from exc
+        except HttpResponseError as exc:
+            status = exc.status_code or 0
+            if status == 429 or status >= 500:
+                headers = getattr(exc.response, "headers", None) or {}
+                retry_after = headers.get("Retry-After")
+                raise TransientEmailError(
+                    f"Azure email send throttled or unavailable ({status})",
+                    retry_after=float(retry_after) if retry_after else None,
+                ) from exc
+            raise EmailSendError(f"Failed to send email: {exc}") from exc
+
+        message_id = result.get("id") if isinstance(result, dict) else None
+        logger.info(
+            "Email sent via Azure Communication Services",
+            extra={"to": message.to_email, "subject": message.subject, "message_id": message_id},
+        )
+        return message_id
+
+    async def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        if self._client is not None:
+            await asyncio.to_thread(self._client.close)
+
+
+_transport: EmailTransport | None = None
+_transport_key: tuple[str, bool, bool] | None = None
+
+
+def get_email_transport() -> EmailTransport:
+    """Process-wide transport for the configured backend.
+
+    Raises:
+        EmailSendError: No real backend is configured outside development/test
+    """
+    global _transport, _transport_key
+    connection_string = settings.azure_communication_connection_string
+    key = (
+        settings.email_backend,
+        bool(connection_string),
+        settings.environment in {"development", "test"},
+    )
+    if _transport is not None and key == _transport_key:
+        return _transport
+
+    transport: EmailTransport
+    if settings.email_backend == "mailpit":
+        transport = SmtpEmailTransport(
+            settings.mailpit_smtp_host, settings.mailpit_smtp_port, settings.email_smtp_pool_size
+        )
+    elif settings.email_backend == "azure_acs" and connection_string:
+        transport = AzureEmailTransport(connection_string, settings.email_send_concurrency)
+    elif settings.environment in {"development", "test"}:
+        transport = ConsoleEmailTransport()
+    else:
+        raise EmailSendError(
+            f"Email backend '{settings.email_backend}' is not configured for real delivery"
+        )
+    _transport, _transport_key = transport, key
+    return transport
+
+
+async def reset_email_transport() -> None:
+    """Close and forget the current transport (settings changes, tests)."""
+    global _transport, _transport_key
+    transport, _transport, _transport_key = _transport, None, None
+    if transport is not None:
+        await transport.close()
@@ -26,9 +26,13 @@ from app.models.sponsor import Sponsor
 from app.models.ticket_management import CustomTicketOption, TicketPackage
 from app.models.user import User
 from app.schemas.event import DuplicateEventRequest, EventCreateRequest, EventUpdateRequest
+from app.services.event_snapshot_cache import EventSnapshotCache
 
 logger = logging.getLogger(__name__)
 
+# Active events are closed automatically this long after event_datetime
+AUTO_CLOSE_AFTER = timedelta(hours=24)
+
 
 class EventService:
     """Service for event management operations."""
@@ -182,6 +186,7 @@ class EventService:
         # Snapshot event_datetime for checklist recalculation
         old_event_datetime = event.event_datetime
         old_timezone = event.timezone
+        old_auction_close = event.auction_close_datetime
 
         # Update fields
         update_dict = event_data.model_dump(exclude_unset=True, exclude={"version"})
@@ -192,10 +197,14 @@ class EventService:
         event.version += 1
 
         await db.commit()
+        await EventSnapshotCache.bump_version(event_id)
 
         # Recalculate template-derived checklist dates if event_datetime or timezone changed
         datetime_changed = event.event_datetime != old_event_datetime
         timezone_changed = event.timezone != old_timezone
+        auction_close_changed = event.auction_close_datetime != old_auction_close
+        if event.status == EventStatus.ACTIVE and (datetime_changed or auction_close_changed):
+            await EventService._schedule_event_timers(event)
         if datetime_changed or timezone_changed:
             try:
                 from app.services.checklist_service import ChecklistService
@@ -248,6 +257,8 @@ class EventService:
         event.updated_by = current_user.id
 
         await db.commit()
+        await EventSnapshotCache.bump_version(event_id)
+        await EventService._schedule_event_timers(event)
 
         # Re-query to get fresh data with all relationships loaded
         result = await db.execute(
@@ -299,19 +310,24 @@ class EventService:
         event.checkout_open = True  # auto-open checkout when event closes
         event.updated_by = current_user.id
 
+        await db.commit()
+        await EventSnapshotCache.bump_version(event_id)
+
+        from app.services.timer_wheel import AUCTION_CLOSING_SOON, EVENT_AUTO_CLOSE
+
+        await EventService._cancel_event_timers(event_id, AUCTION_CLOSING_SOON, EVENT_AUTO_CLOSE)
+
         # T052: Dispatch checkout reminders when event closes
         try:
             from app.services.notification_scheduler import schedule_checkout_reminders
 
-            schedule_checkout_reminders(str(event_id))
+            await schedule_checkout_reminders(str(event_id))
         except Exception:
             logger.warning(
                 "Failed to schedule checkout reminders on event close",
                 extra={"event_id": str(event_id)},
             )
 
-        await db.commit()
-
         # Re-query to get fresh data with all relationships loaded
         result = await db.execute(
             select(Event)
@@ -704,6 +720,8 @@ class EventService:
         # Delete event (hard delete - cascades to related entities)
         await db.delete(event)
         await db.commit()
+        await EventSnapshotCache.bump_version(event_id)
+        await EventService._cancel_event_timers(event_id)
 
         logger.info(f"Event deleted: {event.name} (ID: {event.id}) by user {current_user.id}")
 
@@ -927,6 +945,53 @@ class EventService:
             "active_guest_count": mapping["active_guest_count"],
         }
 
+    @staticmethod
+    async def bump_npo_event_versions(db: AsyncSession, npo_id: uuid.UUID) -> None:
+        """Invalidate cached snapshots of every event of an NPO.
+
+        Event payloads embed NPO details (name, slug, branding), so call this
+        after committing a change to any of them.
+        """
+        result = await db.execute(select(Event.id).where(Event.npo_id == npo_id))
+        for event_id in result.scalars().all():
+            await EventSnapshotCache.bump_version(event_id)
+
+    @staticmethod
+    async def _schedule_event_timers(event: Event) -> None:
+        """Put an active event's auto-close and closing-warning timers on the timer wheel."""
+        from app.services.notification_scheduler import reschedule_auction_warnings
+        from app.services.timer_wheel import EVENT_AUTO_CLOSE, TimerWheel
+
+        try:
+            await TimerWheel.upsert(
+                event.id, EVENT_AUTO_CLOSE, event.event_datetime + AUTO_CLOSE_AFTER
+            )
+            await reschedule_auction_warnings(str(event.id), event.auction_close_datetime)
+        except Exception:
+            logger.warning(
+                "Failed to schedule event timers",
+                extra={"event_id": str(event.id)},
+                exc_info=True,
+            )
+
+    @staticmethod
+    async def _cancel_event_timers(event_id: uuid.UUID, *families: str) -> None:
+        """Cancel an event's timers (all of them if no families are given)."""
+        from app.services.timer_wheel import TimerWheel
+
+        try:
+            if families:
+                for family in families:
+                    await TimerWheel.cancel_event(event_id, family)
+            else:
+                await TimerWheel.cancel_event(event_id)
+        except Exception:
+            logger.warning(
+                "Failed to cancel event timers",
+                extra={"event_id": str(event_id)},
+                exc_info=True,
+            )
+
     @staticmethod
     async def _generate_unique_slug(
         db: AsyncSession,
@@ -985,12 +1050,15 @@ class EventService:
 
 async def close_expired_events(db: AsyncSession) -> int:
     """
-    Celery task: Close events 24 hours after event_datetime.
+    Close events 24 hours after event_datetime.
+
+    Fired by each event's auto-close timer; closes every overdue event, so
+    events whose timer was never scheduled are caught by the next one.
 
     Returns:
         Number of events closed
     """
-    cutoff_time = datetime.now(pytz.UTC) - timedelta(hours=24)
+    cutoff_time = datetime.now(pytz.UTC) - AUTO_CLOSE_AFTER
 
     query = select(Event).where(
         and_(Event.status == EventStatus.ACTIVE, Event.event_datetime < cutoff_time)
@@ -1006,6 +1074,13 @@ async def close_expired_events(db: AsyncSession) -> int:
 
     if events_to_close:
         await db.commit()
+        from app.services.timer_wheel import AUCTION_CLOSING_SOON, EVENT_AUTO_CLOSE
+
+        for event in events_to_close:
+            await EventSnapshotCache.bump_version(event.id)
+            await EventService._cancel_event_timers(
+                event.id, AUCTION_CLOSING_SOON, EVENT_AUTO_CLOSE
+            )
         # Increment metrics for automatic closure
         EVENTS_CLOSED_TOTAL.labels(closure_type="automatic").inc(len(events_to_close))
         logger.info(f"Auto-closed {len(events_to_close)} expired events")
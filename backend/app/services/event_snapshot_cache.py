@@ -0,0 +1,133 @@
+"""Versioned per-event snapshot cache for public gallery payloads.
+
+Each event has a version counter in Redis. Anything that changes what donors
+see on the event page (bids, item edits, item media, event edits) bumps it.
+Snapshots are stored under the version they were built from, so a bump makes
+every older snapshot unreachable without having to find and delete it, and
+the version doubles as the HTTP ETag for conditional requests.
+"""
+
+import hashlib
+import logging
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class EventSnapshotCache:
+    """Redis-backed snapshots of event gallery payloads keyed by event version."""
+
+    VERSION_PREFIX = "event:version:"
+    SNAPSHOT_PREFIX = "event:snapshot:"
+    SLUG_PREFIX = "event:slug:"
+
+    @staticmethod
+    def _variant_key(variant: str) -> str:
+        return hashlib.sha1(variant.encode(), usedforsecurity=False).hexdigest()[:16]
+
+    @staticmethod
+    def etag(event_id: UUID, version: int, variant: str) -> str:
+        """Build the weak ETag for one variant of an event payload.
+
+        Args:
+            event_id: Event UUID
+            version: Event version the payload was built from
+            variant: Everything besides the event that shapes the payload
+                (query parameters, viewer)
+
+        Returns:
+            Quoted weak ETag header value
+        """
+        return f'W/"{event_id}-{version}-{EventSnapshotCache._variant_key(variant)}"'
+
+    @staticmethod
+    def matches(if_none_match: str | None, etag: str) -> bool:
+        """Check whether an If-None-Match header matches an ETag."""
+        if not if_none_match:
+            return False
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        return "*" in candidates or etag in candidates
+
+    @staticmethod
+    async def get_version(event_id: UUID) -> int | None:
+        """Get the current version of an event.
+
+        Returns:
+            Version number (0 before the first change), or None if Redis is unavailable
+        """
+        try:
+            redis = await get_redis()
+            value = await redis.get(f"{EventSnapshotCache.VERSION_PREFIX}{event_id}")
+        except (RedisError, OSError):
+            logger.warning("Event version lookup failed", extra={"event_id": str(event_id)})
+            return None
+        return int(value) if value else 0
+
+    @staticmethod
+    async def bump_version(event_id: UUID) -> None:
+        """Invalidate every cached snapshot of an event.
+
+        Call after committing any change that is visible on the event page.
+        """
+        try:
+            redis = await get_redis()
+            await redis.incr(f"{EventSnapshotCache.VERSION_PREFIX}{event_id}")
+        except (RedisError, OSError):
+            logger.warning("Event version bump failed", extra={"event_id": str(event_id)})
+
+    @staticmethod
+    async def get_snapshot(event_id: UUID, version: int, variant: str) -> str | None:
+        """Get a cached JSON payload for an event version, if present."""
+        key = (
+            f"{EventSnapshotCache.SNAPSHOT_PREFIX}{event_id}:{version}:"
+            f"{EventSnapshotCache._variant_key(variant)}"
+        )
+        try:
+            redis = await get_redis()
+            cached: str | None = await redis.get(key)
+        except (RedisError, OSError):
+            logger.warning("Event snapshot lookup failed", extra={"event_id": str(event_id)})
+            return None
+        return cached
+
+    @staticmethod
+    async def set_snapshot(event_id: UUID, version: int, variant: str, payload: str) -> None:
+        """Store a JSON payload built from the given event version."""
+        key = (
+            f"{EventSnapshotCache.SNAPSHOT_PREFIX}{event_id}:{version}:"
+            f"{EventSnapshotCache._variant_key(variant)}"
+        )
+        try:
+            redis = await get_redis()
+            await redis.setex(key, get_settings().event_snapshot_ttl_seconds, payload)
+        except (RedisError, OSError):
+            logger.warning("Event snapshot store failed", extra={"event_id": str(event_id)})
+
+    @staticmethod
+    async def get_event_id_for_slug(slug: str) -> UUID | None:
+        """Resolve a public event slug to its event ID without touching the database."""
+        try:
+            redis = await get_redis()
+            value = await redis.get(f"{EventSnapshotCache.SLUG_PREFIX}{slug}")
+        except (RedisError, OSError):
+            logger.warning("Event slug lookup failed", extra={"slug": slug})
+            return None
+        return UUID(value) if value else None
+
+    @staticmethod
+    async def set_event_id_for_slug(slug: str, event_id: UUID) -> None:
+        """Remember which event a public slug belongs to."""
+        try:
+            redis = await get_redis()
+            await redis.setex(
+                f"{EventSnapshotCache.SLUG_PREFIX}{slug}",
+                get_settings().event_snapshot_ttl_seconds,
+                str(event_id),
+            )
+        except (RedisError, OSError):
+            logger.warning("Event slug store failed", extra={"slug": slug})
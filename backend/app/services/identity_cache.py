@@ -0,0 +1,157 @@
+"""Short-lived in-process cache of authenticated user snapshots.
+
+Every authenticated request resolves its bearer token to a User plus role
+name. Donor pages poll several endpoints per second per user, so the user and
+role lookups are cached per process for a few seconds. Any flushed change to a
+User row evicts the entry locally and is broadcast over Redis pub/sub so other
+API processes evict it too; the TTL bounds staleness for changes made outside
+the ORM.
+"""
+
+import asyncio
+import copy
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any
+
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.redis import get_redis
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "identity:invalidate"
+
+# Column values of a User row plus its role name
+UserSnapshot = tuple[dict[str, Any], str]
+
+
+class IdentityCache:
+    """Bounded LRU of user snapshots with a per-entry TTL."""
+
+    def __init__(self, max_entries: int = 10_000, ttl_seconds: float = 30.0) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[uuid.UUID, tuple[UserSnapshot, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: uuid.UUID) -> UserSnapshot | None:
+        """Get a fresh snapshot for a user, if cached."""
+        with self._lock:
+            cached = self._entries.get(user_id)
+            if cached is None:
+                return None
+            snapshot, expires_at = cached
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+        values, role_name = snapshot
+        return copy.deepcopy(values), role_name
+
+    def put(self, user: User, role_name: str) -> None:
+        """Snapshot a user's loaded column values."""
+        values = {
+            attr.key: copy.deepcopy(getattr(user, attr.key))
+            for attr in sa_inspect(User).column_attrs
+        }
+        with self._lock:
+            self._entries[user.id] = ((values, role_name), time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        """Drop one user's snapshot from this process."""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop every snapshot from this process."""
+        with self._lock:
+            self._entries.clear()
+
+
+identity_cache = IdentityCache(ttl_seconds=get_settings().identity_cache_ttl_seconds)
+
+# Strong references to in-flight publish tasks so they are not garbage collected
+_pending_publishes: set[asyncio.Task[None]] = set()
+
+
+async def publish_identity_invalidation(user_id: uuid.UUID) -> None:
+    """Evict a user's snapshot here and in every other API process."""
+    identity_cache.invalidate(user_id)
+    try:
+        redis = await get_redis()
+        await redis.publish(INVALIDATION_CHANNEL, str(user_id))
+    except (RedisError, OSError):
+        logger.warning("Identity invalidation publish failed", extra={"user_id": str(user_id)})
+
+
+async def listen_for_identity_invalidations() -> None:
+    """Apply invalidations published by other processes until cancelled."""
+    while True:
+        try:
+            redis = await get_redis()
+            pubsub = redis.pubsub()
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            try:
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        identity_cache.invalidate(uuid.UUID(message["data"]))
+                    except ValueError:
+                        continue
+            finally:
+                await pubsub.aclose()  # type: ignore[attr-defined]
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("Identity invalidation listener lost connection", exc_info=True)
+            # Messages may have been missed while disconnected
+            identity_cache.clear()
+            await asyncio.sleep(1.0)
+
+
+@event.listens_for(Session, "after_flush")
+def _evict_flushed_users(session: Session, flush_context: Any) -> None:
+    changed = {
+        obj.id
+        for obj in (*session.dirty, *session.deleted)
+        if isinstance(obj, User) and obj.id is not None
+    }
+    if not changed:
+        return
+    for user_id in changed:
+        identity_cache.invalidate(user_id)
+    session.info.setdefault("identity_changed", set()).update(changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _broadcast_committed_users(session: Session) -> None:
+    changed = session.info.pop("identity_changed", None)
+    if not changed:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No event loop (sync scripts); other processes fall back to the TTL
+        return
+    for user_id in changed:
+        task = loop.create_task(publish_identity_invalidation(user_id))
+        _pending_publishes.add(task)
+        task.add_done_callback(_pending_publishes.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_users(session: Session) -> None:
+    session.info.pop("identity_changed", None)
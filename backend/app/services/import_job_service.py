@@ -0,0 +1,565 @@
+"""Background jobs for bulk imports.
+
+Commit endpoints hand the uploaded file to ``ImportJobService.enqueue``, which
+stores it, records an ``ImportJob`` and queues ``run_import_job_task`` on the
+bulk queue, so the request returns a job id instead of holding a connection
+for the whole import. ``run_import_job`` then runs the importer in the worker
+with an ``ImportJobProgress`` that saves row results in batches and emits
+``import:progress`` to the job's Socket.IO room. Clients poll
+``GET /admin/import-jobs/{job_id}`` or join the room with ``import:join_job``.
+
+A running job refreshes ``heartbeat_at`` every ``import_job_heartbeat_seconds``.
+If its worker dies mid-import, ``reap_stale_import_jobs`` (on beat) queues it
+again once the heartbeat is ``import_job_stale_after_seconds`` old, or fails it
+and removes the upload after ``import_job_max_attempts`` claims. A redelivered
+task message may also reclaim such a job.
+
+Rows reported before a job failed may have been rolled back with it; the
+job's ``status`` is authoritative.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, suppress
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, and_, delete, func, insert, or_, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal
+from app.core.logging import get_logger
+from app.models.import_job import ImportJob, ImportJobKind, ImportJobRow, ImportJobStatus
+from app.services.auction_bid_import_service import AuctionBidImportError, AuctionBidImportService
+from app.services.auction_item_import_service import AuctionItemImportService
+from app.services.auction_item_import_zip import ImportZipValidationError
+from app.services.audit_service import AuditService
+from app.services.event_snapshot_cache import EventSnapshotCache
+from app.services.import_progress import ImportProgress
+from app.services.import_upload_storage import ImportUploadStorage, ImportUploadStorageError
+from app.services.registration_import_service import (
+    RegistrationImportError,
+    RegistrationImportService,
+)
+from app.services.ticket_sales_import_service import (
+    TicketSalesImportError,
+    TicketSalesImportService,
+)
+from app.services.user_import_service import UserImportError, UserImportService
+from app.websocket.notification_ws import emit_import_job_progress
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+Importer = Callable[[AsyncSession, ImportJob, bytes, ImportProgress], Awaitable[BaseModel]]
+
+# Errors an importer raises for a bad file or stale preflight; shown to the user as-is
+IMPORT_ERRORS: tuple[type[Exception], ...] = (
+    RegistrationImportError,
+    UserImportError,
+    TicketSalesImportError,
+    AuctionBidImportError,
+    ImportZipValidationError,
+    ImportUploadStorageError,
+)
+
+
+STALE_JOB_ERROR = "The import stopped responding and was not finished. Please run it again."
+
+
+class ImportJobError(Exception):
+    """Raised when an import job cannot be queued."""
+
+
+def _stale_running_job() -> ColumnElement[bool]:
+    """Running jobs whose worker has stopped refreshing the heartbeat."""
+    cutoff = datetime.now(UTC) - timedelta(seconds=settings.import_job_stale_after_seconds)
+    return and_(
+        ImportJob.status == ImportJobStatus.RUNNING,
+        func.coalesce(ImportJob.heartbeat_at, ImportJob.started_at) < cutoff,
+    )
+
+
+def import_job_progress_payload(job: ImportJob) -> dict[str, Any]:
+    """Build the ``import:progress`` payload for a job."""
+    return {
+        "job_id": str(job.id),
+        "kind": job.kind.value,
+        "status": job.status.value,
+        "total_rows": job.total_rows,
+        "processed_rows": job.processed_rows,
+        "status_counts": dict(job.status_counts or {}),
+        "error": job.error,
+    }
+
+
+class ImportJobProgress(ImportProgress):
+    """Saves row outcomes to ``import_job_rows`` and emits progress.
+
+    Rows are buffered and written in their own session every
+    ``import_job_progress_rows`` rows or ``import_job_progress_interval_seconds``,
+    whichever comes first, so the importer's transaction is not touched and
+    the worker does one write per batch rather than per row.
+    """
+
+    def __init__(self, job: ImportJob, session_factory: SessionFactory) -> None:
+        super().__init__()
+        self.job = job
+        self.session_factory = session_factory
+        self.total_rows = 0
+        self.processed_rows = 0
+        self.status_counts: Counter[str] = Counter()
+        self._pending: list[dict[str, Any]] = []
+        self._last_flush = time.monotonic()
+
+    async def start(self, total_rows: int) -> None:
+        self.total_rows = total_rows
+        await self.flush()
+
+    async def row(self, row_number: int, status: str, message: str | None = None) -> None:
+        self._pending.append(
+            {"job_id": self.job.id, "row_number": row_number, "status": status, "message": message}
+        )
+        self.processed_rows += 1
+        self.status_counts[status] += 1
+        if (
+            len(self._pending) >= settings.import_job_progress_rows
+            or time.monotonic() - self._last_flush >= settings.import_job_progress_interval_seconds
+        ):
+            await self.flush()
+
+    async def flush(self, **job_values: Any) -> None:
+        """Write buffered rows and counters, then emit progress.
+
+        Args:
+            job_values: Extra ImportJob columns to set in the same update,
+                used to record the final status.
+        """
+        rows, self._pending = self._pending, []
+        self._last_flush = time.monotonic()
+        values = {
+            "total_rows": self.total_rows,
+            "processed_rows": self.processed_rows,
+            "status_counts": dict(self.status_counts),
+            **job_values,
+        }
+        try:
+            async with self.session_factory() as db:
+                if rows:
+                    await db.execute(insert(ImportJobRow), rows)
+                await db.execute(
+                    update(ImportJob).where(ImportJob.id == self.job.id).values(values)
+                )
+                await db.commit()
+        except SQLAlchemyError:
+            # Progress is best effort while rows are flowing; keep the rows for the next flush
+            if job_values:
+                raise
+            self._pending = rows + self._pending
+            logger.warning("Failed to save import progress", extra={"job_id": str(self.job.id)})
+            return
+
+        for key, value in values.items():
+            setattr(self.job, key, value)
+        await emit_import_job_progress(str(self.job.id), import_job_progress_payload(self.job))
+
+
+class ImportJobService:
+    """Queue import jobs and read their progress."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.storage = ImportUploadStorage()
+
+    async def enqueue(
+        self,
+        kind: ImportJobKind,
+        file_name: str,
+        content: bytes,
+        initiated_by_user_id: uuid.UUID,
+        event_id: uuid.UUID | None = None,
+        npo_id: uuid.UUID | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> ImportJob:
+        """Store the file, record a queued job and dispatch it to the bulk queue.
+
+        The job row is committed before dispatch so the worker can always
+        load it.
+
+        Raises:
+            ImportJobError: If the file cannot be stored or the job cannot be queued
+        """
+        from app.tasks.import_tasks import run_import_job_task
+
+        job = ImportJob(
+            id=uuid.uuid4(),
+            kind=kind,
+            status=ImportJobStatus.QUEUED,
+            event_id=event_id,
+            npo_id=npo_id,
+            initiated_by_user_id=initiated_by_user_id,
+            file_name=file_name,
+            params=params or {},
+            total_rows=0,
+            processed_rows=0,
+            status_counts={},
+        )
+        try:
+            job.storage_key = await self.storage.save(job.id, file_name, content)
+        except ImportUploadStorageError as exc:
+            raise ImportJobError(str(exc)) from exc
+
+        self.db.add(job)
+        await self.db.commit()
+
+        try:
+            run_import_job_task.apply_async(args=[str(job.id)])
+        except Exception as exc:
+            logger.exception("Failed to queue import job", extra={"job_id": str(job.id)})
+            job.status = ImportJobStatus.FAILED
+            job.error = "Failed to queue import job"
+            job.finished_at = datetime.now(UTC)
+            await self.db.commit()
+            await self.storage.delete(job.storage_key)
+            raise ImportJobError("Import could not be queued, please try again") from exc
+
+        logger.info(
+            "Import job queued",
+            extra={"job_id": str(job.id), "kind": kind.value, "upload_filename": file_name},
+        )
+        return job
+
+    async def get_job(self, job_id: uuid.UUID) -> ImportJob | None:
+        """Load a job by id."""
+        return await self.db.get(ImportJob, job_id)
+
+    async def list_rows(
+        self,
+        job_id: uuid.UUID,
+        offset: int = 0,
+        limit: int = 100,
+        status: str | None = None,
+    ) -> tuple[list[ImportJobRow], int]:
+        """Return a page of a job's row outcomes in row order, and the total."""
+        filters = [ImportJobRow.job_id == job_id]
+        if status:
+            filters.append(ImportJobRow.status == status)
+        total = await self.db.scalar(select(func.count(ImportJobRow.id)).where(*filters))
+        result = await self.db.execute(
+            select(ImportJobRow)
+            .where(*filters)
+            .order_by(ImportJobRow.row_number)
+            .offset(offset)
+            .limit(limit)
+        )
+        return list(result.scalars().all()), int(total or 0)
+
+
+async def _import_registrations(
+    db: AsyncSession, job: ImportJob, file_bytes: bytes, progress: ImportProgress
+) -> BaseModel:
+    assert job.event_id is not None
+    report = await RegistrationImportService(db).commit(
+        job.event_id, file_bytes, job.file_name, job.initiated_by_user_id, progress=progress
+    )
+    await AuditService.log_registration_import(
+        db=db,
+        event_id=job.event_id,
+        initiated_by_user_id=job.initiated_by_user_id,
+        stage="commit",
+        total_rows=report.total_rows,
+        created_count=report.created_count,
+        error_count=report.error_rows,
+    )
+    return report
+
+
+async def _import_users(
+    db: AsyncSession, job: ImportJob, file_bytes: bytes, progress: ImportProgress
+) -> BaseModel:
+    report = await UserImportService(db).commit(
+        npo_id=job.npo_id,
+        preflight_id=str(job.params["preflight_id"]),
+        file_bytes=file_bytes,
+        initiated_by_user_id=job.initiated_by_user_id,
+        progress=progress,
+    )
+    await AuditService.log_user_import(
+        db=db,
+        npo_id=job.npo_id,
+        initiated_by_user_id=job.initiated_by_user_id,
+        stage="commit",
+        total_rows=report.created_rows
+        + report.skipped_rows
+        + report.membership_added_rows
+        + report.failed_rows,
+        created_count=report.created_rows,
+        skipped_count=report.skipped_rows,
+        membership_added_count=report.membership_added_rows,
+        error_count=report.failed_rows,
+    )
+    return report
+
+
+async def _import_ticket_sales(
+    db: AsyncSession, job: ImportJob, file_bytes: bytes, progress: ImportProgress
+) -> BaseModel:
+    assert job.event_id is not None
+    result = await TicketSalesImportService(db).commit_import(
+        event_id=job.event_id,
+        preflight_id=uuid.UUID(str(job.params["preflight_id"])),
+        file_bytes=file_bytes,
+        user_id=job.initiated_by_user_id,
+        progress=progress,
+    )
+    await db.commit()
+    await AuditService.log_ticket_sales_import(
+        db=db,
+        event_id=job.event_id,
+        initiated_by_user_id=job.initiated_by_user_id,
+        stage="commit",
+        total_rows=result.created_rows + result.skipped_rows + result.failed_rows,
+        error_count=result.failed_rows,
+    )
+    return result
+
+
+async def _import_auction_bids(
+    db: AsyncSession, job: ImportJob, file_bytes: bytes, progress: ImportProgress
+) -> BaseModel:
+    assert job.event_id is not None
+    result = await AuctionBidImportService(db).confirm_import(
+        event_id=job.event_id,
+        import_batch_id=uuid.UUID(str(job.params["import_batch_id"])),
+        file_bytes=file_bytes,
+        user_id=job.initiated_by_user_id,
+        progress=progress,
+    )
+    await AuditService.log_auction_bid_import(
+        db=db,
+        event_id=job.event_id,
+        initiated_by_user_id=job.initiated_by_user_id,
+        stage="confirm",
+        total_rows=result.created_bids,
+        error_count=0,
+        commit=False,
+    )
+    await db.commit()
+    await EventSnapshotCache.bump_version(job.event_id)
+    return result
+
+
+async def _import_auction_items(
+    db: AsyncSession, job: ImportJob, file_bytes: bytes, progress: ImportProgress
+) -> BaseModel:
+    assert job.event_id is not None
+    report = await AuctionItemImportService(db).commit(
+        job.event_id, file_bytes, job.initiated_by_user_id, progress=progress
+    )
+    await AuditService.log_auction_item_import(
+        db=db,
+        event_id=job.event_id,
+        initiated_by_user_id=job.initiated_by_user_id,
+        stage="commit",
+        total_rows=report.total_rows,
+        created_count=report.created_count,
+        updated_count=report.updated_count,
+        error_count=report.error_count,
+    )
+    return report
+
+
+IMPORTERS: dict[ImportJobKind, Importer] = {
+    ImportJobKind.REGISTRATIONS: _import_registrations,
+    ImportJobKind.USERS: _import_users,
+    ImportJobKind.TICKET_SALES: _import_ticket_sales,
+    ImportJobKind.AUCTION_BIDS: _import_auction_bids,
+    ImportJobKind.AUCTION_ITEMS: _import_auction_items,
+}
+
+
+async def _refresh_heartbeat(job_id: uuid.UUID, session_factory: SessionFactory) -> None:
+    """Keep a running job's heartbeat fresh until cancelled."""
+    while True:
+        await asyncio.sleep(settings.import_job_heartbeat_seconds)
+        try:
+            async with session_factory() as db:
+                await db.execute(
+                    update(ImportJob)
+                    .where(ImportJob.id == job_id, ImportJob.status == ImportJobStatus.RUNNING)
+                    .values(heartbeat_at=datetime.now(UTC))
+                )
+                await db.commit()
+        except SQLAlchemyError:
+            logger.warning("Failed to refresh import job heartbeat", extra={"job_id": str(job_id)})
+
+
+async def run_import_job(
+    job_id: uuid.UUID, session_factory: SessionFactory = AsyncSessionLocal
+) -> ImportJobStatus | None:
+    """Run a queued import job to completion.
+
+    A job is claimed while it is ``queued``, or while it is ``running`` with
+    an expired heartbeat and attempts left (its worker was killed), so a
+    redelivered task message does not import the same file twice but can
+    pick up an abandoned job. Row outcomes of an abandoned attempt are
+    discarded.
+
+    Args:
+        job_id: Job to run
+        session_factory: Source of database sessions (the worker's session maker)
+
+    Returns:
+        The job's final status, or None if it was not claimed.
+    """
+    async with session_factory() as db:
+        now = datetime.now(UTC)
+        claimed = await db.execute(
+            update(ImportJob)
+            .where(
+                ImportJob.id == job_id,
+                or_(
+                    ImportJob.status == ImportJobStatus.QUEUED,
+                    and_(
+                        _stale_running_job(),
+                        ImportJob.attempts < settings.import_job_max_attempts,
+                    ),
+                ),
+            )
+            .values(
+                status=ImportJobStatus.RUNNING,
+                started_at=now,
+                heartbeat_at=now,
+                attempts=ImportJob.attempts + 1,
+                total_rows=0,
+                processed_rows=0,
+                status_counts={},
+            )
+            .returning(ImportJob.attempts)
+        )
+        attempts = claimed.scalar_one_or_none()
+        if attempts is None:
+            await db.commit()
+            logger.warning("Import job not claimed", extra={"job_id": str(job_id)})
+            return None
+        if attempts > 1:
+            await db.execute(delete(ImportJobRow).where(ImportJobRow.job_id == job_id))
+        await db.commit()
+        job = await db.get(ImportJob, job_id, populate_existing=True)
+        assert job is not None
+
+    storage = ImportUploadStorage()
+    progress = ImportJobProgress(job, session_factory)
+    extra = {"job_id": str(job_id), "kind": job.kind.value, "attempt": attempts}
+    heartbeat = asyncio.create_task(_refresh_heartbeat(job_id, session_factory))
+    values: dict[str, Any]
+    try:
+        file_bytes = await storage.load(str(job.storage_key))
+        async with session_factory() as db:
+            result = await IMPORTERS[job.kind](db, job, file_bytes, progress)
+    except IMPORT_ERRORS as exc:
+        logger.info("Import job rejected", extra={**extra, "error": str(exc)})
+        final_status, values = ImportJobStatus.FAILED, {"error": str(exc)}
+    except Exception as exc:
+        logger.exception("Import job failed", extra=extra)
+        final_status = ImportJobStatus.FAILED
+        values = {"error": f"Unexpected error during import: {exc}"}
+    else:
+        final_status = ImportJobStatus.COMPLETED
+        values = {"result": result.model_dump(mode="json")}
+    finally:
+        heartbeat.cancel()
+        with suppress(asyncio.CancelledError):
+            await heartbeat
+
+    try:
+        await progress.flush(status=final_status, finished_at=datetime.now(UTC), **values)
+    finally:
+        if job.storage_key:
+            await storage.delete(job.storage_key)
+    logger.info(
+        "Import job finished",
+        extra={**extra, "status": final_status.value, "rows": progress.processed_rows},
+    )
+    return final_status
+
+
+async def reap_stale_import_jobs(
+    session_factory: SessionFactory = AsyncSessionLocal,
+) -> tuple[int, int]:
+    """Re-queue or fail running jobs whose worker stopped (killed, OOM, deploy).
+
+    A stale job with attempts left goes back to ``queued`` and is dispatched
+    again; one that has used them all is failed and its upload removed.
+
+    Returns:
+        Numbers of (re-queued, failed) jobs
+    """
+    from app.tasks.import_tasks import run_import_job_task
+
+    async with session_factory() as db:
+        failed_result = await db.execute(
+            update(ImportJob)
+            .where(_stale_running_job(), ImportJob.attempts >= settings.import_job_max_attempts)
+            .values(
+                status=ImportJobStatus.FAILED,
+                error=STALE_JOB_ERROR,
+                finished_at=datetime.now(UTC),
+            )
+            .returning(ImportJob.id)
+        )
+        failed_ids = list(failed_result.scalars().all())
+        requeued_result = await db.execute(
+            update(ImportJob)
+            .where(_stale_running_job())
+            .values(status=ImportJobStatus.QUEUED)
+            .returning(ImportJob.id)
+        )
+        requeued_ids = list(requeued_result.scalars().all())
+        await db.commit()
+
+        undispatched = 0
+        for job_id in requeued_ids:
+            try:
+                run_import_job_task.apply_async(args=[str(job_id)])
+            except Exception:
+                logger.exception("Failed to re-queue import job", extra={"job_id": str(job_id)})
+                await db.execute(
+                    update(ImportJob)
+                    .where(ImportJob.id == job_id, ImportJob.status == ImportJobStatus.QUEUED)
+                    .values(
+                        status=ImportJobStatus.FAILED,
+                        error=STALE_JOB_ERROR,
+                        finished_at=datetime.now(UTC),
+                    )
+                )
+                await db.commit()
+                failed_ids.append(job_id)
+                undispatched += 1
+            else:
+                logger.warning("Re-queued stale import job", extra={"job_id": str(job_id)})
+
+        if not failed_ids:
+            return len(requeued_ids), 0
+        jobs = (
+            (await db.execute(select(ImportJob).where(ImportJob.id.in_(failed_ids))))
+            .scalars()
+            .all()
+        )
+
+    storage = ImportUploadStorage()
+    for job in jobs:
+        logger.warning("Failed stale import job", extra={"job_id": str(job.id)})
+        if job.storage_key:
+            await storage.delete(job.storage_key)
+        await emit_import_job_progress(str(job.id), import_job_progress_payload(job))
+    return len(requeued_ids) - undispatched, len(jobs)
@@ -0,0 +1,37 @@
+"""Row-level progress reporting for bulk importers.
+
+Importers accept an optional ``ImportProgress`` and tell it how many rows the
+file has and what happened to each one. The base class discards everything,
+so an importer called without a job behaves exactly as before; the import
+job runner passes a subclass that saves row results and emits progress.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from enum import Enum
+from typing import Any
+
+
+class ImportProgress:
+    """Receiver for an importer's row outcomes (no-op by default)."""
+
+    def __init__(self) -> None:
+        self._reported = 0
+
+    async def start(self, total_rows: int) -> None:
+        """Called once the file is parsed, before rows are imported."""
+
+    async def row(self, row_number: int, status: str, message: str | None = None) -> None:
+        """Called once per source row with its final status."""
+
+    async def report(self, results: Sequence[Any]) -> None:
+        """Report the entries appended to ``results`` since the last call.
+
+        For importers that collect row result objects (with ``row_number``,
+        ``status`` and ``message``) in one list as they go.
+        """
+        for result in results[self._reported :]:
+            status = result.status.value if isinstance(result.status, Enum) else result.status
+            await self.row(result.row_number, str(status), result.message)
+        self._reported = len(results)
@@ -0,0 +1,221 @@
+"""Streaming readers for uploaded import files.
+
+The import services read uploads one record at a time instead of decoding
+the whole file into a string (or loading a whole JSON document or workbook)
+first: CSV goes through an incremental decoder, XLSX through openpyxl's
+read-only row iterator, and JSON arrays are parsed one element at a time.
+Memory then tracks the rows kept rather than the size of the upload, and a
+row limit or malformed row stops parsing as soon as it is reached.
+
+Services keep the parsed rows (at most their row limit) because preflight
+validates the file as a whole and the rows are cached for the commit;
+``iter_batches`` hands them to the commit a chunk at a time.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import re
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, TypeVar
+
+from openpyxl import load_workbook
+from openpyxl.workbook.workbook import Workbook
+
+JSON_READ_CHUNK_CHARS = 64 * 1024
+
+T = TypeVar("T")
+
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_NUMBER_TAIL = re.compile(r"[0-9eE.+-]*")
+
+
+@dataclass
+class ParsedRow:
+    """One record of an import file, keyed by (normalized) column name."""
+
+    row_number: int
+    data: dict[Any, Any]
+
+
+class JSONArrayExpectedError(ValueError):
+    """The upload is valid JSON, but its top level is not an array."""
+
+
+def iter_batches(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield lists of up to ``size`` items (at least one per list), in order."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, max(size, 1))):
+        yield batch
+
+
+@contextmanager
+def open_text(content: bytes, encoding: str = "utf-8-sig") -> Iterator[io.TextIOWrapper]:
+    """Open an upload as a text stream that decodes as it is read.
+
+    Decoding errors surface as ``UnicodeDecodeError`` while reading, not
+    up front.
+    """
+    stream = io.TextIOWrapper(io.BytesIO(content), encoding=encoding, newline="")
+    try:
+        yield stream
+    finally:
+        stream.detach()
+
+
+def iter_csv_records(content: bytes, encoding: str = "utf-8-sig") -> Iterator[list[str]]:
+    """Yield CSV records (header first) without decoding the whole upload."""
+    with open_text(content, encoding) as stream:
+        yield from csv.reader(stream)
+
+
+def iter_xlsx_records(content: bytes) -> Iterator[tuple[Any, ...]]:
+    """Yield the active sheet's rows (header first) as tuples of cell values.
+
+    The workbook is opened in read-only mode, so rows are streamed from the
+    sheet XML instead of building every cell up front. Opening errors are
+    raised by this call; the workbook is closed once the rows run out.
+    """
+    workbook = load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+    return _iter_active_sheet(workbook)
+
+
+def _iter_active_sheet(workbook: Workbook) -> Iterator[tuple[Any, ...]]:
+    try:
+        sheet = workbook.active
+        if sheet is not None:
+            yield from sheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def iter_json_array(content: bytes, encoding: str = "utf-8") -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array one at a time.
+
+    The opening bracket is checked by this call, so a document that is not
+    an array fails before any element is read.
+
+    Raises:
+        JSONArrayExpectedError: If the document is valid JSON but not an array
+        json.JSONDecodeError: If the document is malformed (possibly only
+            once iteration reaches the bad element)
+        UnicodeDecodeError: If the upload is not valid ``encoding``
+    """
+    reader = _JSONArrayReader(content, encoding)
+    if reader.next_char() != "[":
+        reader.close()
+        document = content.decode(encoding)
+        json.loads(document)  # Raises the same error json.loads would
+        raise JSONArrayExpectedError("JSON document is not an array")
+    reader.pos += 1
+    return reader.elements()
+
+
+class _JSONArrayReader:
+    """Incremental parser for the elements of one top-level JSON array.
+
+    Text is read in chunks and each element is decoded with
+    ``JSONDecoder.raw_decode`` once enough of it is buffered; consumed text
+    is dropped, so the buffer holds roughly one element at a time. Errors
+    report positions in the whole document, as ``json.loads`` would.
+    """
+
+    def __init__(self, content: bytes, encoding: str) -> None:
+        self._text = io.TextIOWrapper(io.BytesIO(content), encoding=encoding, newline="")
+        self._decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self._eof = False
+        self._offset = 0
+        self._lines = 0
+        self._column = 0
+
+    def close(self) -> None:
+        self._text.detach()
+
+    def elements(self) -> Iterator[Any]:
+        try:
+            if self.next_char() == "]":
+                self.pos += 1
+            else:
+                while True:
+                    yield self._decode_value()
+                    separator = self.next_char()
+                    self.pos += 1
+                    if separator == "]":
+                        break
+                    if separator != ",":
+                        raise self._error("Expecting ',' delimiter", self.pos - 1)
+                    if self.next_char() in ("]", ""):
+                        raise self._error("Expecting value", self.pos)
+            if self.next_char() != "":
+                raise self._error("Extra data", self.pos)
+        finally:
+            self.close()
+
+    def next_char(self) -> str:
+        """Skip whitespace and return the next character ("" at the end)."""
+        while True:
+            whitespace = _JSON_WHITESPACE.match(self.buffer, self.pos)
+            if whitespace is not None:
+                self.pos = whitespace.end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def _decode_value(self) -> Any:
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as exc:
+                if self._fill():
+                    continue
+                raise self._error(exc.msg, exc.pos) from None
+            # Only numbers can end early at a chunk boundary ("2.5e" then
+            # "10"); when nothing but number characters follow, decode again
+            # with the next chunk.
+            if (
+                isinstance(value, (int, float))
+                and _JSON_NUMBER_TAIL.fullmatch(self.buffer, end)
+                and self._fill()
+            ):
+                continue
+            self.pos = end
+            return value
+
+    def _fill(self) -> bool:
+        """Drop consumed text and read another chunk; False at end of input."""
+        if self._eof:
+            return False
+        # Read at least as much as is buffered, so one huge element is not
+        # re-decoded once per fixed-size chunk.
+        chunk = self._text.read(max(JSON_READ_CHUNK_CHARS, len(self.buffer)))
+        if not chunk:
+            self._eof = True
+            return False
+        consumed = self.buffer[: self.pos]
+        newlines = consumed.count("\n")
+        if newlines:
+            self._lines += newlines
+            self._column = len(consumed) - consumed.rfind("\n") - 1
+        else:
+            self._column += len(consumed)
+        self._offset += self.pos
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def _error(self, msg: str, pos: int) -> json.JSONDecodeError:
+        error = json.JSONDecodeError(msg, self.buffer, pos)
+        last_newline = self.buffer.rfind("\n", 0, pos)
+        error.pos = self._offset + pos
+        error.lineno = self._lines + self.buffer.count("\n", 0, pos) + 1
+        error.colno = pos - last_newline if last_newline >= 0 else self._column + pos + 1
+        error.args = (f"{msg}: line {error.lineno} column {error.colno} (char {error.pos})",)
+        return error
@@ -0,0 +1,146 @@
+"""Parsed import rows cached between preflight and commit.
+
+An import is parsed at preflight and again at commit, usually minutes apart
+and often in a different process (commits run on the bulk Celery queue). The
+rows parsed at preflight are stored in Redis under a hash of the uploaded
+bytes, so the commit of an unchanged file reuses them instead of parsing the
+upload a second time. A file that fails to parse is never cached, and any
+Redis failure falls back to parsing.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Callable
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any
+
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+from app.core.redis import get_redis
+from app.services.import_reader import ParsedRow
+
+logger = logging.getLogger(__name__)
+
+
+def _encode(value: Any) -> Any:
+    """Encode a cell value as JSON, tagging everything that is not a JSON scalar.
+
+    Every encoded object is a one-key tag, so dicts from JSON uploads cannot be
+    mistaken for tagged values, and dict keys keep their type (CSV rows can
+    carry a ``None`` key for extra columns).
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, dict):
+        return {"d": [[_encode(key), _encode(item)] for key, item in value.items()]}
+    if isinstance(value, (list, tuple)):
+        return {"l": [_encode(item) for item in value]}
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"da": value.isoformat()}
+    if isinstance(value, time):
+        return {"t": value.isoformat()}
+    if isinstance(value, timedelta):
+        return {"td": value.total_seconds()}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    raise TypeError(f"Cannot cache import value of type {type(value).__name__}")
+
+
+def _decode(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    ((tag, payload),) = value.items()
+    if tag == "d":
+        return {_decode(key): _decode(item) for key, item in payload}
+    if tag == "l":
+        return [_decode(item) for item in payload]
+    if tag == "dt":
+        return datetime.fromisoformat(payload)
+    if tag == "da":
+        return date.fromisoformat(payload)
+    if tag == "t":
+        return time.fromisoformat(payload)
+    if tag == "td":
+        return timedelta(seconds=payload)
+    if tag == "n":
+        return Decimal(payload)
+    raise ValueError(f"Unknown cached import value tag {tag!r}")
+
+
+def encode_rows(rows: list[ParsedRow]) -> str:
+    """Serialize parsed rows for the cache."""
+    return json.dumps([[row.row_number, _encode(row.data)] for row in rows], separators=(",", ":"))
+
+
+def decode_rows(payload: str) -> list[ParsedRow]:
+    """Rebuild parsed rows from :func:`encode_rows` output."""
+    return [
+        ParsedRow(row_number=number, data=_decode(data)) for number, data in json.loads(payload)
+    ]
+
+
+class ImportRowCache:
+    """Redis-backed parsed rows of import uploads keyed by content hash."""
+
+    # Bump when a parser changes what it returns, so stale rows are not reused
+    VERSION = 1
+    KEY_PREFIX = "import:rows:"
+
+    @staticmethod
+    def _key(kind: str, content: bytes) -> str:
+        digest = hashlib.sha256(content).hexdigest()
+        return f"{ImportRowCache.KEY_PREFIX}{ImportRowCache.VERSION}:{kind}:{digest}"
+
+    @staticmethod
+    async def get_or_parse(
+        kind: str, content: bytes, parse: Callable[[bytes], list[ParsedRow]]
+    ) -> list[ParsedRow]:
+        """Return the parsed rows of an upload, parsing it only on a cache miss.
+
+        Parsing runs in a worker thread so large files do not block the event
+        loop. Errors raised by ``parse`` propagate unchanged.
+
+        Args:
+            kind: Import type and anything else that changes how the bytes
+                are parsed (such as the file format)
+            content: Uploaded file bytes
+            parse: Parser returning the file's rows
+
+        Returns:
+            Parsed rows
+        """
+        key = ImportRowCache._key(kind, content)
+        try:
+            redis = await get_redis()
+            cached: str | None = await redis.get(key)
+        except (RedisError, OSError):
+            logger.warning("Import row cache lookup failed", extra={"kind": kind})
+            cached = None
+        if cached is not None:
+            try:
+                return decode_rows(cached)
+            except (ValueError, TypeError, KeyError):
+                logger.warning("Discarding unreadable cached import rows", extra={"kind": kind})
+
+        rows = await asyncio.to_thread(parse, content)
+
+        settings = get_settings()
+        try:
+            payload = encode_rows(rows)
+        except TypeError:
+            logger.warning("Import rows are not cacheable", extra={"kind": kind})
+            return rows
+        if len(payload) > settings.import_row_cache_max_bytes:
+            return rows
+        try:
+            redis = await get_redis()
+            await redis.setex(key, settings.import_row_cache_ttl_seconds, payload)
+        except (RedisError, OSError):
+            logger.warning("Import row cache store failed", extra={"kind": kind})
+        return rows
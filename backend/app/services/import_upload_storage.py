@@ -0,0 +1,111 @@
+"""Storage for import files between the upload request and the import job.
+
+Files go to a private Azure Blob container when storage is configured and to
+``import_upload_dir`` otherwise. The local directory only works when the API
+and the bulk workers share a filesystem; docker-compose points every service
+at Azurite instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from azure.storage.blob import ContainerClient
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+class ImportUploadStorageError(Exception):
+    """Raised when an import file cannot be stored or read back."""
+
+
+def _storage_key(job_id: UUID, filename: str) -> str:
+    safe_name = _UNSAFE_FILENAME_CHARS.sub("_", Path(filename).name).strip("._") or "upload"
+    return f"{job_id}/{safe_name}"
+
+
+class ImportUploadStorage:
+    """Save, load and delete uploaded import files by storage key."""
+
+    def __init__(self) -> None:
+        self.connection_string = settings.azure_storage_connection_string
+        self.container_name = settings.import_upload_container
+        self.local_dir = Path(settings.import_upload_dir)
+
+    async def save(self, job_id: UUID, filename: str, content: bytes) -> str:
+        """Store an uploaded file and return its storage key."""
+        key = _storage_key(job_id, filename)
+        try:
+            await asyncio.to_thread(self._save, key, content)
+        except Exception as exc:
+            raise ImportUploadStorageError(f"Failed to store import file: {exc}") from exc
+        return key
+
+    async def load(self, key: str) -> bytes:
+        """Read a stored file back."""
+        try:
+            return await asyncio.to_thread(self._load, key)
+        except Exception as exc:
+            raise ImportUploadStorageError(f"Import file is no longer available: {exc}") from exc
+
+    async def delete(self, key: str) -> None:
+        """Remove a stored file; failures are logged, not raised."""
+        try:
+            await asyncio.to_thread(self._delete, key)
+        except Exception:
+            logger.warning("Failed to delete import file", extra={"storage_key": key})
+
+    def _container(self) -> ContainerClient:
+        from azure.storage.blob import BlobServiceClient
+
+        client = BlobServiceClient.from_connection_string(str(self.connection_string))
+        return client.get_container_client(self.container_name)
+
+    def _save(self, key: str, content: bytes) -> None:
+        if self.connection_string:
+            from azure.core.exceptions import ResourceExistsError
+
+            container = self._container()
+            try:
+                container.create_container()
+            except ResourceExistsError:
+                pass
+            container.upload_blob(key, content, overwrite=True)
+            return
+
+        path = self.local_dir / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+    def _load(self, key: str) -> bytes:
+        if self.connection_string:
+            return bytes(self._container().download_blob(key).readall())
+        return (self.local_dir / key).read_bytes()
+
+    def _delete(self, key: str) -> None:
+        if self.connection_string:
+            from azure.core.exceptions import ResourceNotFoundError
+
+            try:
+                self._container().delete_blob(key)
+            except ResourceNotFoundError:
+                pass
+            return
+
+        path = self.local_dir / key
+        path.unlink(missing_ok=True)
+        try:
+            path.parent.rmdir()
+        except OSError:
+            pass
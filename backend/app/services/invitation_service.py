@@ -9,7 +9,6 @@ Handles invitation lifecycle:
 """
 
 import hmac
-import secrets
 import uuid
 from datetime import UTC, datetime, timedelta
 
@@ -21,7 +20,12 @@ from sqlalchemy.orm import selectinload
 
 from app.api.v1.event_media_urls import resolve_event_logo_url
 from app.core.logging import get_logger
-from app.core.security import create_invitation_token, decode_token, hash_password, verify_password
+from app.core.security import (
+    create_invitation_token,
+    decode_token,
+    unusable_password_hash,
+    verify_password,
+)
 from app.models.base import Base
 from app.models.event import Event
 from app.models.invitation import Invitation, InvitationStatus
@@ -245,7 +249,7 @@ class InvitationService:
                     email=email.lower(),
                     first_name=user_first_name,
                     last_name=user_last_name,
-                    password_hash=hash_password(f"Tmp{secrets.token_urlsafe(10)}1"),
+                    password_hash=unusable_password_hash(),
                     role_id=role_id,
                     must_change_password=True,
                     email_verified=False,
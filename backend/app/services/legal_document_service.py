@@ -22,6 +22,7 @@ from app.schemas.legal_documents import (
     LegalDocumentResponse,
     LegalDocumentUpdateRequest,
 )
+from app.services.consent_cache import ConsentCache
 
 
 class LegalDocumentService:
@@ -152,6 +153,7 @@ class LegalDocumentService:
         document.updated_at = datetime.now(UTC)
 
         await db.commit()
+        await ConsentCache.invalidate_latest()
         await db.refresh(document)
 
         return document
@@ -24,6 +24,7 @@ from app.core.config import get_settings
 from app.core.metrics import EVENT_MEDIA_SCAN_RESULTS_TOTAL, EVENT_MEDIA_UPLOADS_TOTAL
 from app.models.event import EventMedia, EventMediaStatus, EventMediaType, EventMediaUsageTag
 from app.models.user import User
+from app.services.event_snapshot_cache import EventSnapshotCache
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -288,6 +289,7 @@ class MediaService:
 
         db.add(media)
         await db.commit()
+        await EventSnapshotCache.bump_version(event_id)
 
         # Generate SAS URL for upload
         storage_account_name: str | None = blob_client.account_name
@@ -354,6 +356,7 @@ class MediaService:
         media.status = EventMediaStatus.SCANNED  # Will be re-checked after virus scan
 
         await db.commit()
+        await EventSnapshotCache.bump_version(media.event_id)
         await db.refresh(media)
 
         # Increment metrics for successful upload
@@ -567,6 +570,7 @@ class MediaService:
 
         db.add(media)
         await db.commit()
+        await EventSnapshotCache.bump_version(event_id)
         await db.refresh(media)
 
         EVENT_MEDIA_UPLOADS_TOTAL.labels(status="success").inc()
@@ -600,6 +604,7 @@ class MediaService:
             logger.warning(f"Media {media_id} rejected after scan: {scan_details}")
 
         await db.commit()
+        await EventSnapshotCache.bump_version(media.event_id)
         await db.refresh(media)
 
         return media
@@ -639,7 +644,9 @@ class MediaService:
             # Continue with DB deletion even if blob deletion fails
 
         # Delete from database
+        event_id = media.event_id
         await db.delete(media)
         await db.commit()
+        await EventSnapshotCache.bump_version(event_id)
 
         logger.info(f"Media {media_id} deleted by user {current_user.id}")
@@ -1,7 +1,7 @@
 """Notification scheduler for auction lifecycle events.
 
-Schedules and sends auction-related notifications (opened, closing soon, closed)
-using Celery delayed tasks.
+Schedules and sends auction-related notifications (opened, closing soon, closed).
+Delayed sends are timers on the Redis timer wheel, fired by the timer dispatcher.
 """
 
 import uuid
@@ -15,75 +15,70 @@ from app.models.auction_bid import AuctionBid, BidStatus
 from app.models.event import Event
 from app.models.event_registration import EventRegistration
 from app.models.notification import NotificationPriorityEnum, NotificationTypeEnum
-from app.services.notification_service import NotificationService
+from app.services.notification_service import BulkNotification, NotificationService
+from app.services.timer_wheel import AUCTION_CLOSING_SOON, CHECKOUT_REMINDER, TimerWheel
 from app.websocket.notification_ws import sio
 
 logger = get_logger(__name__)
 
-# Task IDs stored for revocation: mapping event_id -> list of celery task IDs
-_scheduled_task_ids: dict[str, list[str]] = {}
+# Minutes before the auction closes at which closing-soon warnings go out
+AUCTION_WARNING_MINUTES = (15, 5, 1)
 
 
-def schedule_auction_warnings(event_id: str, close_time: datetime) -> list[str]:
-    """Schedule Celery tasks for auction closing warnings.
+async def schedule_auction_warnings(event_id: str, close_time: datetime) -> list[str]:
+    """Schedule auction closing warnings on the timer wheel.
 
     Schedules notifications at -15min, -5min, and -1min from close_time.
+    Warnings already scheduled for the event are moved, and warnings whose
+    time has passed are cancelled, so calling this again after a close-time
+    change (on any replica) reschedules rather than duplicates.
 
     Args:
         event_id: Event UUID string
         close_time: When the auction closes (timezone-aware)
 
     Returns:
-        List of Celery task IDs for tracking/revocation.
+        Timer kinds scheduled.
     """
-    from app.tasks.notification_tasks import send_auction_closing_soon_task
-
+    event_uuid = uuid.UUID(event_id)
     now = datetime.now(UTC)
-    task_ids: list[str] = []
+    kinds: list[str] = []
 
-    for minutes_before in [15, 5, 1]:
-        eta = close_time - timedelta(minutes=minutes_before)
-        if eta <= now:
+    for minutes_before in AUCTION_WARNING_MINUTES:
+        kind = f"{AUCTION_CLOSING_SOON}:{minutes_before}"
+        due_at = close_time - timedelta(minutes=minutes_before)
+        if due_at <= now:
+            await TimerWheel.cancel(event_uuid, kind)
             continue
 
-        result = send_auction_closing_soon_task.apply_async(
-            args=[event_id, minutes_before],
-            eta=eta,
-        )
-        task_ids.append(result.id)
-
-    _scheduled_task_ids[event_id] = task_ids
+        await TimerWheel.upsert(event_uuid, kind, due_at, {"minutes": minutes_before})
+        kinds.append(kind)
 
     logger.info(
         "Scheduled auction closing warnings",
-        extra={"event_id": event_id, "task_count": len(task_ids)},
+        extra={"event_id": event_id, "timer_count": len(kinds)},
     )
-    return task_ids
+    return kinds
 
 
-def reschedule_auction_warnings(event_id: str, new_close_time: datetime) -> list[str]:
-    """Revoke existing warning tasks and schedule new ones.
+async def reschedule_auction_warnings(event_id: str, new_close_time: datetime | None) -> list[str]:
+    """Move an event's closing warnings to a new close time.
 
     Args:
         event_id: Event UUID string
-        new_close_time: Updated auction close time
+        new_close_time: Updated auction close time, or None to cancel the warnings
 
     Returns:
-        List of new Celery task IDs.
+        Timer kinds scheduled.
     """
-    from app.celery_app import celery_app
-
-    # Revoke old tasks
-    old_task_ids = _scheduled_task_ids.pop(event_id, [])
-    for task_id in old_task_ids:
-        celery_app.control.revoke(task_id, terminate=False)
-
-    logger.info(
-        "Revoked old auction warning tasks",
-        extra={"event_id": event_id, "revoked_count": len(old_task_ids)},
-    )
-
-    return schedule_auction_warnings(event_id, new_close_time)
+    if new_close_time is None:
+        cancelled = await TimerWheel.cancel_event(uuid.UUID(event_id), AUCTION_CLOSING_SOON)
+        logger.info(
+            "Cancelled auction warning timers",
+            extra={"event_id": event_id, "cancelled_count": cancelled},
+        )
+        return []
+    return await schedule_auction_warnings(event_id, new_close_time)
 
 
 async def send_auction_opened_notification(db: AsyncSession, event_id: str) -> int:
@@ -116,31 +111,29 @@ async def send_auction_opened_notification(db: AsyncSession, event_id: str) -> i
     reg_result = await db.execute(reg_stmt)
     user_ids = [row[0] for row in reg_result.all()]
 
-    sent = 0
-    for user_id in user_ids:
-        try:
-            await NotificationService.create_notification(
-                db=db,
-                event_id=event_uuid,
+    notifications = await NotificationService.create_notifications_bulk(
+        db=db,
+        event_id=event_uuid,
+        notification_type=NotificationTypeEnum.AUCTION_OPENED,
+        recipients=[
+            BulkNotification(
                 user_id=user_id,
-                notification_type=NotificationTypeEnum.AUCTION_OPENED,
-                priority=NotificationPriorityEnum.NORMAL,
                 title="Auction is now open!",
                 body=f"Bidding is live for {event_name}. Browse items and place your bids!",
                 data={
                     "deep_link": f"/events/{event_slug}?tab=auction",
                     "animation_type": "pulse",
                 },
-                sio=sio,
-            )
-            sent += 1
-        except Exception:
-            logger.warning(
-                "Failed to create auction opened notification",
-                extra={"event_id": event_id, "user_id": str(user_id)},
             )
+            for user_id in user_ids
+        ],
+        priority=NotificationPriorityEnum.NORMAL,
+        sio=sio,
+    )
+    sent = len(notifications)
 
     await db.commit()
+    NotificationService.dispatch_delivery_tasks_bulk(notifications)
     logger.info(
         "Sent auction opened notifications",
         extra={"event_id": event_id, "sent_count": sent, "total_registrants": len(user_ids)},
@@ -181,15 +174,13 @@ async def send_auction_closing_soon(db: AsyncSession, event_id: str, minutes_rem
     result = await db.execute(active_bidders_stmt)
     user_ids = [row[0] for row in result.all()]
 
-    sent = 0
-    for user_id in user_ids:
-        try:
-            await NotificationService.create_notification(
-                db=db,
-                event_id=event_uuid,
+    notifications = await NotificationService.create_notifications_bulk(
+        db=db,
+        event_id=event_uuid,
+        notification_type=NotificationTypeEnum.AUCTION_CLOSING_SOON,
+        recipients=[
+            BulkNotification(
                 user_id=user_id,
-                notification_type=NotificationTypeEnum.AUCTION_CLOSING_SOON,
-                priority=NotificationPriorityEnum.HIGH,
                 title=f"Auction closing in {minutes_remaining} min!",
                 body=(
                     f"The auction for {event_name} closes in {minutes_remaining} "
@@ -200,16 +191,16 @@ async def send_auction_closing_soon(db: AsyncSession, event_id: str, minutes_rem
                     "deep_link": f"/events/{event_slug}?tab=auction",
                     "minutes_remaining": minutes_remaining,
                 },
-                sio=sio,
-            )
-            sent += 1
-        except Exception:
-            logger.warning(
-                "Failed to create closing soon notification",
-                extra={"event_id": event_id, "user_id": str(user_id)},
             )
+            for user_id in user_ids
+        ],
+        priority=NotificationPriorityEnum.HIGH,
+        sio=sio,
+    )
+    sent = len(notifications)
 
     await db.commit()
+    NotificationService.dispatch_delivery_tasks_bulk(notifications)
     logger.info(
         "Sent auction closing soon notifications",
         extra={
@@ -226,13 +217,13 @@ async def send_auction_closing_soon(db: AsyncSession, event_id: str, minutes_rem
 # ---------------------------------------------------------------------------
 
 
-def schedule_checkout_reminders(
+async def schedule_checkout_reminders(
     event_id: str,
     initial_delay_minutes: int = 0,
     followup_interval_minutes: int = 30,
     max_reminders: int = 3,
 ) -> list[str]:
-    """Schedule checkout reminder tasks (initial + follow-ups).
+    """Schedule checkout reminder timers (initial + follow-ups).
 
     Args:
         event_id: Event UUID string
@@ -241,30 +232,25 @@ def schedule_checkout_reminders(
         max_reminders: Maximum number of reminders (default 3)
 
     Returns:
-        List of Celery task IDs for tracking.
+        Timer kinds scheduled.
     """
-    from app.tasks.notification_tasks import send_checkout_reminders_task
-
+    event_uuid = uuid.UUID(event_id)
     now = datetime.now(UTC)
-    task_ids: list[str] = []
+    kinds: list[str] = []
 
     for i in range(max_reminders):
         delay = initial_delay_minutes + (i * followup_interval_minutes)
-        eta = now + timedelta(minutes=delay)
-
-        result = send_checkout_reminders_task.apply_async(
-            args=[event_id],
-            eta=eta,
-        )
-        task_ids.append(result.id)
+        kind = f"{CHECKOUT_REMINDER}:{i + 1}"
+        await TimerWheel.upsert(event_uuid, kind, now + timedelta(minutes=delay))
+        kinds.append(kind)
 
     logger.info(
         "Scheduled checkout reminders",
         extra={
             "event_id": event_id,
-            "count": len(task_ids),
+            "count": len(kinds),
             "initial_delay_minutes": initial_delay_minutes,
             "followup_interval_minutes": followup_interval_minutes,
         },
     )
-    return task_ids
+    return kinds
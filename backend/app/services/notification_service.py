@@ -1,10 +1,25 @@
 """Core notification service for creating, querying, and managing notifications."""
 
+import asyncio
 import uuid
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import func, select, update
+from sqlalchemy import (
+    String,
+    Uuid,
+    and_,
+    cast,
+    column,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
@@ -25,10 +40,47 @@ settings = get_settings()
 # Default expiration offset from event date
 NOTIFICATION_EXPIRY_DAYS = 30
 
+# Rows per multi-row INSERT and concurrent Socket.IO emits in bulk creation
+BULK_INSERT_BATCH_SIZE = 500
+BULK_EMIT_BATCH_SIZE = 100
+
+# Notification IDs per batched push/email/SMS delivery task
+DELIVERY_BATCH_SIZE = 200
+
+# (status, failure_reason) for one notification on one delivery channel
+DeliveryOutcome = tuple[DeliveryStatusEnum, str | None]
+
+
+@dataclass
+class BulkNotification:
+    """Per-recipient content for NotificationService.create_notifications_bulk."""
+
+    user_id: uuid.UUID
+    title: str
+    body: str
+    data: dict[str, Any] | None = None
+
 
 class NotificationService:
     """Service for notification lifecycle management."""
 
+    @staticmethod
+    def _default_channels(notification_type: NotificationTypeEnum) -> list[DeliveryChannelEnum]:
+        """Channels used when a user has no stored preferences for a type."""
+        # High-priority types default to all channels; everything else
+        # defaults to in-app only.
+        _MULTI_CHANNEL_DEFAULTS = {
+            NotificationTypeEnum.OUTBID,
+            NotificationTypeEnum.ITEM_WON,
+        }
+        if notification_type in _MULTI_CHANNEL_DEFAULTS:
+            return [
+                DeliveryChannelEnum.INAPP,
+                DeliveryChannelEnum.PUSH,
+                DeliveryChannelEnum.EMAIL,
+            ]
+        return [DeliveryChannelEnum.INAPP]
+
     @staticmethod
     async def _get_enabled_channels(
         db: AsyncSession,
@@ -36,29 +88,37 @@ class NotificationService:
         notification_type: NotificationTypeEnum,
     ) -> list[DeliveryChannelEnum]:
         """Return channels enabled for a user+type, defaulting to all if no prefs."""
+        channels_by_user = await NotificationService._get_enabled_channels_bulk(
+            db, [user_id], notification_type
+        )
+        return channels_by_user[user_id]
+
+    @staticmethod
+    async def _get_enabled_channels_bulk(
+        db: AsyncSession,
+        user_ids: Sequence[uuid.UUID],
+        notification_type: NotificationTypeEnum,
+    ) -> dict[uuid.UUID, list[DeliveryChannelEnum]]:
+        """Return enabled channels for many users of one type in a single query."""
         stmt = select(NotificationPreference).where(
-            NotificationPreference.user_id == user_id,
+            NotificationPreference.user_id.in_(set(user_ids)),
             NotificationPreference.notification_type == notification_type,
         )
         result = await db.execute(stmt)
-        prefs = list(result.scalars().all())
-
-        if not prefs:
-            # No preferences stored → high-priority types default to all
-            # channels; everything else defaults to in-app only.
-            _MULTI_CHANNEL_DEFAULTS = {
-                NotificationTypeEnum.OUTBID,
-                NotificationTypeEnum.ITEM_WON,
-            }
-            if notification_type in _MULTI_CHANNEL_DEFAULTS:
-                return [
-                    DeliveryChannelEnum.INAPP,
-                    DeliveryChannelEnum.PUSH,
-                    DeliveryChannelEnum.EMAIL,
-                ]
-            return [DeliveryChannelEnum.INAPP]
-
-        return [p.channel for p in prefs if p.enabled]
+
+        prefs_by_user: dict[uuid.UUID, list[NotificationPreference]] = {}
+        for pref in result.scalars().all():
+            prefs_by_user.setdefault(pref.user_id, []).append(pref)
+
+        defaults = NotificationService._default_channels(notification_type)
+        return {
+            user_id: (
+                [p.channel for p in prefs_by_user[user_id] if p.enabled]
+                if user_id in prefs_by_user
+                else list(defaults)
+            )
+            for user_id in user_ids
+        }
 
     @staticmethod
     async def create_notification(
@@ -190,16 +250,162 @@ class NotificationService:
 
         return notification
 
+    @staticmethod
+    async def create_notifications_bulk(
+        db: AsyncSession,
+        event_id: uuid.UUID,
+        notification_type: NotificationTypeEnum,
+        recipients: Sequence[BulkNotification],
+        priority: NotificationPriorityEnum = NotificationPriorityEnum.NORMAL,
+        campaign_id: uuid.UUID | None = None,
+        created_by: uuid.UUID | None = None,
+        expires_at: datetime | None = None,
+        sio: Any | None = None,
+        override_channels: list[DeliveryChannelEnum] | None = None,
+    ) -> list[Notification]:
+        """Create notifications of one type for many recipients in a few round-trips.
+
+        Preferences for every recipient are loaded in one query, notifications
+        and delivery status rows are written with multi-row INSERTs, and the
+        Socket.IO emits are sent concurrently in batches. Delivery tasks are
+        never dispatched here: commit first, then call dispatch_delivery_tasks
+        for each notification with its ``_resolved_channels``.
+
+        Args:
+            db: Async database session
+            event_id: Event these notifications belong to
+            notification_type: Type shared by all notifications
+            recipients: One entry per notification to create
+            priority: Priority level
+            campaign_id: Optional link to a campaign
+            created_by: Optional admin user who triggered this
+            expires_at: Optional explicit expiry; defaults to +30 days
+            sio: Optional Socket.IO server for real-time emit
+            override_channels: When provided, use these channels for every
+                recipient instead of their notification preferences.
+
+        Returns:
+            Created Notification instances, in the order of ``recipients``.
+        """
+        if not recipients:
+            return []
+
+        if expires_at is None:
+            expires_at = datetime.now(UTC) + timedelta(days=NOTIFICATION_EXPIRY_DAYS)
+
+        if override_channels is not None:
+            channels_by_user = {r.user_id: override_channels for r in recipients}
+        else:
+            channels_by_user = await NotificationService._get_enabled_channels_bulk(
+                db, [r.user_id for r in recipients], notification_type
+            )
+
+        notifications: list[Notification] = []
+        now = datetime.now(UTC)
+        for start in range(0, len(recipients), BULK_INSERT_BATCH_SIZE):
+            batch = recipients[start : start + BULK_INSERT_BATCH_SIZE]
+            result = await db.scalars(
+                insert(Notification).returning(Notification, sort_by_parameter_order=True),
+                [
+                    {
+                        "event_id": event_id,
+                        "user_id": r.user_id,
+                        "notification_type": notification_type,
+                        "title": r.title,
+                        "body": r.body,
+                        "priority": priority,
+                        "data": r.data,
+                        "campaign_id": campaign_id,
+                        "created_by": created_by,
+                        "expires_at": expires_at,
+                    }
+                    for r in batch
+                ],
+            )
+            created = list(result.all())
+
+            delivery_rows: list[dict[str, Any]] = []
+            for notification in created:
+                channels = channels_by_user[notification.user_id]
+                notification._resolved_channels = channels  # type: ignore[attr-defined]
+                for channel in channels:
+                    # INAPP is "delivered" the moment the row exists in the DB
+                    is_inapp = channel == DeliveryChannelEnum.INAPP
+                    delivery_rows.append(
+                        {
+                            "notification_id": notification.id,
+                            "channel": channel,
+                            "status": DeliveryStatusEnum.SENT
+                            if is_inapp
+                            else DeliveryStatusEnum.PENDING,
+                            "sent_at": now if is_inapp else None,
+                        }
+                    )
+            if delivery_rows:
+                await db.execute(insert(NotificationDeliveryStatus), delivery_rows)
+            notifications.extend(created)
+
+        if sio is not None:
+            await NotificationService._emit_bulk(sio, notifications)
+
+        logger.info(
+            "Notifications created in bulk",
+            extra={
+                "event_id": str(event_id),
+                "type": notification_type.value,
+                "count": len(notifications),
+            },
+        )
+        return notifications
+
+    @staticmethod
+    async def _emit_bulk(sio: Any, notifications: Sequence[Notification]) -> None:
+        """Emit notification:new to each recipient's room, a batch at a time."""
+
+        async def _emit(notification: Notification) -> None:
+            room = f"user:{notification.user_id}:event:{notification.event_id}"
+            try:
+                await sio.emit(
+                    "notification:new",
+                    {
+                        "id": str(notification.id),
+                        "notification_type": notification.notification_type.value,
+                        "title": notification.title,
+                        "body": notification.body,
+                        "priority": notification.priority.value,
+                        "data": notification.data,
+                        "created_at": notification.created_at.isoformat()
+                        if notification.created_at
+                        else None,
+                    },
+                    room=room,
+                )
+            except Exception:
+                logger.warning(
+                    "Failed to emit Socket.IO notification",
+                    extra={"notification_id": str(notification.id), "room": room},
+                )
+
+        for start in range(0, len(notifications), BULK_EMIT_BATCH_SIZE):
+            batch = notifications[start : start + BULK_EMIT_BATCH_SIZE]
+            await asyncio.gather(*(_emit(notification) for notification in batch))
+
     @staticmethod
     def dispatch_delivery_tasks(
         notification_id: str,
         channels: list[DeliveryChannelEnum],
+        queue: str | None = None,
     ) -> None:
         """Dispatch Celery delivery tasks for the given channels.
 
         Call this AFTER the transaction containing the notification has been
         committed so that the Celery workers (or eager-mode inline execution)
         can see the rows.
+
+        Args:
+            notification_id: Notification UUID string
+            channels: Channels to deliver on
+            queue: Override the routed queue (defaults to the realtime queue)
         """
 
         def _dispatch(task: object) -> None:
@@ -208,7 +414,7 @@ class NotificationService:
             # calls that corrupt the asyncpg connection pool, breaking subsequent
             # requests.  In-app delivery is handled synchronously by
             # create_notification itself; push/email/SMS need a Celery worker.
-            task.delay(notification_id)  # type: ignore[attr-defined]
+            task.apply_async((notification_id,), queue=queue)  # type: ignore[attr-defined]
 
         if DeliveryChannelEnum.PUSH in channels:
             try:
@@ -243,6 +449,93 @@ class NotificationService:
                     extra={"notification_id": notification_id},
                 )
 
+    @staticmethod
+    def dispatch_delivery_tasks_bulk(notifications: Sequence[Notification]) -> None:
+        """Dispatch batched Celery delivery tasks for many notifications.
+
+        Notification IDs are grouped by channel and sent in chunks of
+        DELIVERY_BATCH_SIZE, so a campaign to thousands of recipients queues a
+        handful of tasks per channel instead of one per recipient and channel.
+        Reads the channels resolved by create_notifications_bulk. Call this
+        AFTER the transaction has been committed.
+        """
+        from app.tasks.notification_tasks import (
+            send_email_notification_batch_task,
+            send_push_notification_batch_task,
+            send_sms_notification_batch_task,
+        )
+
+        batch_tasks = {
+            DeliveryChannelEnum.PUSH: send_push_notification_batch_task,
+            DeliveryChannelEnum.EMAIL: send_email_notification_batch_task,
+            DeliveryChannelEnum.SMS: send_sms_notification_batch_task,
+        }
+        ids_by_channel: dict[DeliveryChannelEnum, list[str]] = {}
+        for notification in notifications:
+            for channel in getattr(notification, "_resolved_channels", []):
+                if channel in batch_tasks:
+                    ids_by_channel.setdefault(channel, []).append(str(notification.id))
+
+        for channel, ids in ids_by_channel.items():
+            for start in range(0, len(ids), DELIVERY_BATCH_SIZE):
+                chunk = ids[start : start + DELIVERY_BATCH_SIZE]
+                try:
+                    batch_tasks[channel].delay(chunk)
+                except Exception:
+                    logger.warning(
+                        "Failed to dispatch notification batch task",
+                        extra={"channel": channel.value, "notification_count": len(chunk)},
+                    )
+
+    @staticmethod
+    async def record_delivery_outcomes(
+        db: AsyncSession,
+        channel: DeliveryChannelEnum,
+        outcomes: Mapping[uuid.UUID, DeliveryOutcome],
+    ) -> None:
+        """Write delivery results for many notifications in one UPDATE statement.
+
+        Args:
+            db: Async database session (caller commits)
+            channel: Delivery channel the results belong to
+            outcomes: Notification ID -> (status, failure_reason)
+        """
+        if not outcomes:
+            return
+
+        now = datetime.now(UTC)
+        rows = [
+            (
+                notification_id,
+                status.value,
+                now if status == DeliveryStatusEnum.SENT else None,
+                failure_reason,
+            )
+            for notification_id, (status, failure_reason) in outcomes.items()
+        ]
+        sent_at_type = NotificationDeliveryStatus.sent_at.type
+        failure_reason_type = NotificationDeliveryStatus.failure_reason.type
+        results = values(
+            column("notification_id", Uuid),
+            column("status", String),
+            column("sent_at", sent_at_type),
+            column("failure_reason", failure_reason_type),
+            name="outcomes",
+        ).data(rows)
+        await db.execute(
+            update(NotificationDeliveryStatus)
+            .where(
+                NotificationDeliveryStatus.notification_id == results.c.notification_id,
+                NotificationDeliveryStatus.channel == channel,
+            )
+            .values(
+                status=cast(results.c.status, NotificationDeliveryStatus.status.type),
+                sent_at=cast(results.c.sent_at, sent_at_type),
+                failure_reason=cast(results.c.failure_reason, failure_reason_type),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
     @staticmethod
     async def list_notifications(
         db: AsyncSession,
@@ -292,6 +585,56 @@ class NotificationService:
 
         return rows, next_cursor
 
+    @staticmethod
+    async def list_notifications_after(
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        event_id: uuid.UUID,
+        after_created_at: datetime,
+        after_id: uuid.UUID | None = None,
+        limit: int = 50,
+    ) -> tuple[list[Notification], bool]:
+        """List notifications newer than a ``(created_at, id)`` cursor, oldest first.
+
+        Keyset pagination over ix_notifications_user_event: the id breaks ties
+        between notifications created in the same transaction, so a page
+        boundary never skips or repeats one.
+
+        Args:
+            db: Async database session
+            user_id: Owner of the notifications
+            event_id: Event scope
+            after_created_at: created_at of the last notification already seen
+            after_id: id of that notification; None returns everything
+                strictly newer than ``after_created_at``
+            limit: Max results
+
+        Returns:
+            Tuple of (notifications, whether more remain after them).
+        """
+        stmt = select(Notification).where(
+            Notification.user_id == user_id,
+            Notification.event_id == event_id,
+        )
+        if after_id is None:
+            stmt = stmt.where(Notification.created_at > after_created_at)
+        else:
+            stmt = stmt.where(
+                Notification.created_at >= after_created_at,
+                or_(
+                    Notification.created_at > after_created_at,
+                    and_(
+                        Notification.created_at == after_created_at,
+                        Notification.id > after_id,
+                    ),
+                ),
+            )
+        stmt = stmt.order_by(Notification.created_at.asc(), Notification.id.asc()).limit(limit + 1)
+
+        result = await db.execute(stmt)
+        rows = list(result.scalars().all())
+        return rows[:limit], len(rows) > limit
+
     @staticmethod
     async def get_unread_count(
         db: AsyncSession,
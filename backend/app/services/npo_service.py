@@ -20,6 +20,7 @@ from app.models.npo import NPO, NPOStatus
 from app.models.npo_member import MemberRole, MemberStatus, NPOMember
 from app.models.user import User
 from app.schemas.npo import NPOCreateRequest, NPOListRequest, NPOUpdateRequest
+from app.services.event_service import EventService
 from app.services.npo_permission_service import NPOPermissionService
 
 logger = logging.getLogger(__name__)
@@ -323,6 +324,7 @@ class NPOService:
 
         await db.commit()
         await db.refresh(npo)
+        await EventService.bump_npo_event_versions(db, npo_id)
 
         logger.info(f"NPO updated: {npo.name} (ID: {npo.id}) by user {updated_by_user_id}")
 
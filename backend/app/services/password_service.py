@@ -137,7 +137,7 @@ class PasswordService:
             )
 
         # Update password
-        user.set_password(new_password)
+        await user.set_password_async(new_password)
         await db.commit()
         await db.refresh(user)
 
@@ -185,11 +185,11 @@ class PasswordService:
         if user.has_local_password:
             if not current_password:
                 raise ValueError("Current password is required")
-            if not user.verify_password(current_password):
+            if not await user.verify_password_async(current_password):
                 raise ValueError("Current password is incorrect")
 
         # Update password and clear forced-change flag
-        user.set_password(new_password)
+        await user.set_password_async(new_password)
         user.must_change_password = False
         await db.commit()
         await db.refresh(user)
@@ -117,6 +117,9 @@ class PermissionService:
         Args:
             user_id: User ID whose permissions to invalidate
         """
+        from app.services.identity_cache import publish_identity_invalidation
+
+        await publish_identity_invalidation(user_id)
         try:
             redis_client = await get_redis()
             # Delete all keys matching pattern perm:{user_id}:*
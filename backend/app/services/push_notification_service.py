@@ -3,14 +3,17 @@
 Manages push subscriptions and sends push notifications via the Web Push protocol.
 """
 
+import asyncio
 import base64
 import json
 import re
 import uuid
-from datetime import UTC, datetime, timedelta
+import weakref
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from functools import lru_cache
 
 from azure.storage.blob import BlobSasPermissions, generate_blob_sas
-from pywebpush import WebPushException, webpush
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,8 +21,10 @@ from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.models.event import Event
 from app.models.notification import DeliveryChannelEnum, DeliveryStatusEnum, Notification
-from app.models.notification_delivery_status import NotificationDeliveryStatus
 from app.models.push_subscription import PushSubscription
+from app.services.blob_sas_cache import blob_sas_url_cache
+from app.services.notification_service import NotificationService
+from app.services.web_push_sender import PushResult, VapidHeaderCache, WebPushSender
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -39,14 +44,12 @@ def _ensure_blob_sas_url(url: str | None) -> str | None:
     if not url:
         return None
 
-    if (
-        not settings.azure_storage_connection_string
-        or not settings.azure_storage_account_name
-        or not settings.azure_storage_container_name
-    ):
+    account_name = settings.azure_storage_account_name
+    conn_str = settings.azure_storage_connection_string
+    if not conn_str or not account_name or not settings.azure_storage_container_name:
         return url
 
-    account_host = f"{settings.azure_storage_account_name}.blob.core.windows.net"
+    account_host = f"{account_name}.blob.core.windows.net"
     if account_host not in url:
         return url
 
@@ -60,25 +63,27 @@ def _ensure_blob_sas_url(url: str | None) -> str | None:
     blob_name = url.split(container_prefix, 1)[1].split("?", 1)[0]
 
     try:
-        conn_str = settings.azure_storage_connection_string
         account_key = conn_str.split("AccountKey=")[1].split(";")[0]
-        sas_token = generate_blob_sas(
-            account_name=settings.azure_storage_account_name,
-            container_name=settings.azure_storage_container_name,
-            blob_name=blob_name,
-            account_key=account_key,
-            permission=BlobSasPermissions(read=True),
-            expiry=datetime.utcnow() + timedelta(hours=24),
-        )
-        return (
-            f"https://{account_host}/{settings.azure_storage_container_name}"
-            f"/{blob_name}?{sas_token}"
-        )
+        container_name = settings.azure_storage_container_name
+
+        def sign(expires_at: datetime) -> str:
+            sas_token = generate_blob_sas(
+                account_name=account_name,
+                container_name=container_name,
+                blob_name=blob_name,
+                account_key=account_key,
+                permission=BlobSasPermissions(read=True),
+                expiry=expires_at,
+            )
+            return f"https://{account_host}/{container_name}/{blob_name}?{sas_token}"
+
+        return blob_sas_url_cache.get_or_sign(container_name, blob_name, 24, sign)
     except Exception:
         logger.debug("Failed to generate push icon SAS URL", exc_info=True)
         return url
 
 
+@lru_cache(maxsize=1)
 def _get_vapid_private_key_raw() -> str | None:
     """Extract raw base64url-encoded VAPID private key.
 
@@ -110,6 +115,44 @@ def _get_vapid_private_key_raw() -> str | None:
     return key
 
 
+@lru_cache(maxsize=1)
+def _get_vapid_header_cache() -> VapidHeaderCache | None:
+    """Process-wide VAPID signer built from the configured private key."""
+    vapid_key = _get_vapid_private_key_raw()
+    if not vapid_key:
+        return None
+    return VapidHeaderCache(vapid_key, settings.vapid_claims_email)
+
+
+# One sender per event loop (aiohttp sessions are loop-bound), so pooled
+# connections to each push service are kept across batches
+_push_senders: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, WebPushSender] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_push_sender(vapid: VapidHeaderCache) -> WebPushSender:
+    """The running event loop's shared push sender, created on first use."""
+    loop = asyncio.get_running_loop()
+    sender = _push_senders.get(loop)
+    if sender is None:
+        sender = WebPushSender(
+            vapid,
+            max_concurrency=settings.push_max_concurrency,
+            connections_per_origin=settings.push_connections_per_origin,
+            timeout_seconds=settings.push_request_timeout_seconds,
+        )
+        _push_senders[loop] = sender
+    return sender
+
+
+async def close_push_sender() -> None:
+    """Close the running event loop's push sender (API and worker shutdown)."""
+    sender = _push_senders.pop(asyncio.get_running_loop(), None)
+    if sender is not None:
+        await sender.close()
+
+
 class PushNotificationService:
     """Service for Web Push subscription management and delivery."""
 
@@ -219,89 +262,8 @@ class PushNotificationService:
         return deactivated
 
     @staticmethod
-    async def send_push(
-        db: AsyncSession,
-        notification_id: uuid.UUID,
-    ) -> bool:
-        """Send push notification to all active subscriptions for a notification's user.
-
-        Args:
-            db: Async database session
-            notification_id: Notification UUID to send
-
-        Returns:
-            True if at least one push was sent successfully.
-        """
-        if not settings.vapid_private_key or not settings.vapid_public_key:
-            logger.warning("VAPID keys not configured, skipping push notification")
-            return False
-
-        vapid_key = _get_vapid_private_key_raw()
-        if not vapid_key:
-            logger.warning("Could not extract VAPID private key, skipping push notification")
-            return False
-
-        # Load notification
-        notif_stmt = select(Notification).where(Notification.id == notification_id)
-        notif_result = await db.execute(notif_stmt)
-        notification = notif_result.scalar_one_or_none()
-
-        if not notification:
-            logger.warning(
-                "Notification not found for push delivery",
-                extra={"notification_id": str(notification_id)},
-            )
-            return False
-
-        # T067: Skip push delivery if notification was triggered in spoof context
-        if notification.data and notification.data.get("_spoof_context"):
-            logger.info(
-                "Skipping push for spoof context notification",
-                extra={"notification_id": str(notification_id)},
-            )
-            # Mark as skipped
-            delivery_stmt = select(NotificationDeliveryStatus).where(
-                NotificationDeliveryStatus.notification_id == notification_id,
-                NotificationDeliveryStatus.channel == DeliveryChannelEnum.PUSH,
-            )
-            delivery_result = await db.execute(delivery_stmt)
-            delivery = delivery_result.scalar_one_or_none()
-            if delivery:
-                delivery.status = DeliveryStatusEnum.SKIPPED
-                delivery.failure_reason = "spoof_context"
-                await db.commit()
-            return False
-
-        # Get active subscriptions for user
-        sub_stmt = select(PushSubscription).where(
-            PushSubscription.user_id == notification.user_id,
-            PushSubscription.is_active.is_(True),
-        )
-        sub_result = await db.execute(sub_stmt)
-        subscriptions = list(sub_result.scalars().all())
-
-        if not subscriptions:
-            logger.debug(
-                "No active push subscriptions for user",
-                extra={"user_id": str(notification.user_id)},
-            )
-            # Mark delivery as skipped so it doesn't stay pending forever
-            update_delivery_stmt = (
-                update(NotificationDeliveryStatus)
-                .where(
-                    NotificationDeliveryStatus.notification_id == notification_id,
-                    NotificationDeliveryStatus.channel == DeliveryChannelEnum.PUSH,
-                )
-                .values(
-                    status=DeliveryStatusEnum.SKIPPED,
-                    failure_reason="no_active_subscriptions",
-                )
-            )
-            await db.execute(update_delivery_stmt)
-            await db.commit()
-            return False
-
-        # Build push payload
+    def _build_payload(notification: Notification, event_logo_url: str | None) -> str:
+        """Build the Web Push JSON payload for a notification."""
         deep_link = None
         image_url: str | None = None
         if notification.data and isinstance(notification.data, dict):
@@ -311,19 +273,12 @@ class PushNotificationService:
         image_url = _ensure_blob_sas_url(image_url)
 
         # Use event logo when no item image is available.
-        event_icon_url: str | None = None
-        if notification.event_id:
-            event_logo_result = await db.execute(
-                select(Event.logo_url).where(Event.id == notification.event_id)
-            )
-            event_logo = event_logo_result.scalar_one_or_none()
-            if event_logo:
-                event_icon_url = _ensure_blob_sas_url(event_logo)
+        event_icon_url = _ensure_blob_sas_url(event_logo_url)
 
         # Visual priority: item thumbnail -> event icon -> app logo fallback
         visual_url = image_url or event_icon_url or "/images/pwa-192x192.png"
 
-        payload = json.dumps(
+        return json.dumps(
             {
                 "title": notification.title,
                 "body": _sanitize_push_body(notification.body),
@@ -341,104 +296,219 @@ class PushNotificationService:
             }
         )
 
-        any_success = False
-
-        for subscription in subscriptions:
-            try:
-                endpoint_domain = subscription.endpoint.split("/")[2]
-            except IndexError:
-                endpoint_domain = "unknown"
+    @staticmethod
+    async def _send_to_subscription(
+        sender: WebPushSender,
+        subscription: PushSubscription,
+        payload: str,
+        notification_id: uuid.UUID,
+    ) -> PushResult:
+        """Send one payload to one subscription and log the outcome."""
+        try:
+            endpoint_domain = subscription.endpoint.split("/")[2]
+        except IndexError:
+            endpoint_domain = "unknown"
+        result = await sender.send(
+            subscription.endpoint,
+            subscription.p256dh_key,
+            subscription.auth_key,
+            payload,
+        )
+        if result.ok:
             logger.info(
-                "Sending push to subscription",
+                "Push sent successfully",
                 extra={
                     "subscription_id": str(subscription.id),
                     "endpoint_domain": endpoint_domain,
                     "notification_id": str(notification_id),
+                    "status_code": result.status,
+                },
+            )
+        elif not result.gone:
+            logger.warning(
+                "Push notification delivery failed",
+                extra={
+                    "subscription_id": str(subscription.id),
+                    "endpoint_domain": endpoint_domain,
+                    "status_code": result.status,
+                    "error": result.error,
                 },
             )
-            try:
-                # Fresh claims dict per subscription — pywebpush mutates it
-                # (sets 'aud' from the endpoint URL), so reusing a single dict
-                # causes subsequent calls to different push services (e.g.
-                # Apple after FCM) to send a JWT with the wrong audience.
-                vapid_claims = {"sub": settings.vapid_claims_email}
-                resp = webpush(
-                    subscription_info={
-                        "endpoint": subscription.endpoint,
-                        "keys": {
-                            "p256dh": subscription.p256dh_key,
-                            "auth": subscription.auth_key,
-                        },
-                    },
-                    data=payload,
-                    vapid_private_key=vapid_key,
-                    vapid_claims=vapid_claims,
-                    headers={
-                        "TTL": "86400",
-                        "Urgency": "high",
-                    },
+        return result
+
+    @staticmethod
+    async def _deactivate_gone_subscriptions(
+        db: AsyncSession, gone: Sequence[tuple[PushSubscription, int]]
+    ) -> None:
+        """Deactivate subscriptions the push service reported as 404/410, one UPDATE per status."""
+        ids_by_status: dict[int, list[uuid.UUID]] = {}
+        for subscription, status in gone:
+            ids_by_status.setdefault(status, []).append(subscription.id)
+        now = datetime.now(UTC)
+        for status, subscription_ids in ids_by_status.items():
+            await db.execute(
+                update(PushSubscription)
+                .where(PushSubscription.id.in_(subscription_ids))
+                .values(
+                    is_active=False,
+                    deactivated_at=now,
+                    deactivation_reason=f"endpoint_gone_{status}",
                 )
-                resp_status = resp.status_code if resp else "no-response"
+                .execution_options(synchronize_session=False)
+            )
+        logger.info(
+            "Deactivated expired push subscriptions",
+            extra={"count": len(gone)},
+        )
+
+    @staticmethod
+    async def send_push(
+        db: AsyncSession,
+        notification_id: uuid.UUID,
+    ) -> bool:
+        """Send push notification to all active subscriptions for a notification's user.
+
+        Args:
+            db: Async database session
+            notification_id: Notification UUID to send
+
+        Returns:
+            True if at least one push was sent successfully.
+        """
+        results = await PushNotificationService.send_push_batch(db, [notification_id])
+        return results.get(notification_id, False)
+
+    @staticmethod
+    async def send_push_batch(
+        db: AsyncSession,
+        notification_ids: Sequence[uuid.UUID],
+    ) -> dict[uuid.UUID, bool]:
+        """Send push notifications for many notifications at once.
+
+        Notifications, subscriptions and event logos are loaded with one query
+        each. Pushes are sent concurrently over pooled connections, the PUSH
+        delivery status rows are updated in a single statement, and
+        subscriptions the push service reports as gone (404/410) are
+        deactivated in bulk. The caller commits.
+
+        Args:
+            db: Async database session
+            notification_ids: Notification UUIDs to send
+
+        Returns:
+            Mapping of notification ID to whether at least one push succeeded.
+        """
+        if not settings.vapid_private_key or not settings.vapid_public_key:
+            logger.warning("VAPID keys not configured, skipping push notification")
+            return {}
+
+        vapid = _get_vapid_header_cache()
+        if vapid is None:
+            logger.warning("Could not extract VAPID private key, skipping push notification")
+            return {}
+
+        notif_result = await db.execute(
+            select(Notification).where(Notification.id.in_(notification_ids))
+        )
+        notifications = list(notif_result.scalars().all())
+        missing = set(notification_ids) - {n.id for n in notifications}
+        if missing:
+            logger.warning(
+                "Notification not found for push delivery",
+                extra={"notification_ids": [str(n) for n in missing]},
+            )
+
+        outcomes: dict[uuid.UUID, tuple[DeliveryStatusEnum, str | None]] = {}
+        to_send: list[Notification] = []
+        for notification in notifications:
+            # T067: Skip push delivery if notification was triggered in spoof context
+            if notification.data and notification.data.get("_spoof_context"):
                 logger.info(
-                    "Push sent successfully",
-                    extra={
-                        "subscription_id": str(subscription.id),
-                        "endpoint_domain": endpoint_domain,
-                        "status_code": resp_status,
-                    },
+                    "Skipping push for spoof context notification",
+                    extra={"notification_id": str(notification.id)},
                 )
-                any_success = True
-            except WebPushException as e:
-                response = getattr(e, "response", None)
-                status_code = response.status_code if response else None
-
-                if status_code == 410:
-                    # Subscription expired/unsubscribed — deactivate
-                    subscription.is_active = False
-                    subscription.deactivated_at = datetime.now(UTC)
-                    subscription.deactivation_reason = "endpoint_gone_410"
-                    logger.info(
-                        "Deactivated expired push subscription (410 Gone)",
-                        extra={"subscription_id": str(subscription.id)},
-                    )
-                else:
-                    logger.warning(
-                        "Push notification delivery failed",
-                        extra={
-                            "subscription_id": str(subscription.id),
-                            "status_code": status_code,
-                            "error": str(e),
-                        },
-                    )
-            except Exception:
-                logger.exception(
-                    "Unexpected error sending push notification",
-                    extra={"subscription_id": str(subscription.id)},
+                outcomes[notification.id] = (DeliveryStatusEnum.SKIPPED, "spoof_context")
+            else:
+                to_send.append(notification)
+
+        # Active subscriptions for every recipient in one query
+        subscriptions_by_user: dict[uuid.UUID, list[PushSubscription]] = {}
+        if to_send:
+            sub_result = await db.execute(
+                select(PushSubscription).where(
+                    PushSubscription.user_id.in_({n.user_id for n in to_send}),
+                    PushSubscription.is_active.is_(True),
                 )
-
-        # Update delivery status for PUSH channel
-        delivery_status = DeliveryStatusEnum.SENT if any_success else DeliveryStatusEnum.FAILED
-        update_delivery_stmt = (
-            update(NotificationDeliveryStatus)
-            .where(
-                NotificationDeliveryStatus.notification_id == notification_id,
-                NotificationDeliveryStatus.channel == DeliveryChannelEnum.PUSH,
             )
-            .values(
-                status=delivery_status,
-                sent_at=datetime.now(UTC) if any_success else None,
-                failure_reason=None if any_success else "all_subscriptions_failed",
+            for subscription in sub_result.scalars().all():
+                subscriptions_by_user.setdefault(subscription.user_id, []).append(subscription)
+
+        event_ids = {n.event_id for n in to_send if n.event_id}
+        event_logos: dict[uuid.UUID, str | None] = {}
+        if event_ids:
+            logo_result = await db.execute(
+                select(Event.id, Event.logo_url).where(Event.id.in_(event_ids))
+            )
+            event_logos = {row.id: row.logo_url for row in logo_result.all()}
+
+        sends: list[tuple[Notification, PushSubscription, str]] = []
+        for notification in to_send:
+            subscriptions = subscriptions_by_user.get(notification.user_id, [])
+            if not subscriptions:
+                logger.debug(
+                    "No active push subscriptions for user",
+                    extra={"user_id": str(notification.user_id)},
+                )
+                # Mark delivery as skipped so it doesn't stay pending forever
+                outcomes[notification.id] = (
+                    DeliveryStatusEnum.SKIPPED,
+                    "no_active_subscriptions",
+                )
+                continue
+            payload = PushNotificationService._build_payload(
+                notification, event_logos.get(notification.event_id)
+            )
+            sends.extend((notification, subscription, payload) for subscription in subscriptions)
+
+        sender = _get_push_sender(vapid)
+        results = await asyncio.gather(
+            *(
+                PushNotificationService._send_to_subscription(
+                    sender, subscription, payload, notification.id
+                )
+                for notification, subscription, payload in sends
             )
         )
-        await db.execute(update_delivery_stmt)
+
+        succeeded: set[uuid.UUID] = set()
+        gone: list[tuple[PushSubscription, int]] = []
+        for (notification, subscription, _), result in zip(sends, results, strict=True):
+            if result.ok:
+                succeeded.add(notification.id)
+            elif result.gone and result.status is not None:
+                gone.append((subscription, result.status))
+        for notification, _, _ in sends:
+            if notification.id in succeeded:
+                outcomes[notification.id] = (DeliveryStatusEnum.SENT, None)
+            else:
+                outcomes[notification.id] = (
+                    DeliveryStatusEnum.FAILED,
+                    "all_subscriptions_failed",
+                )
+
+        if gone:
+            await PushNotificationService._deactivate_gone_subscriptions(db, gone)
+
+        # Update delivery status for PUSH channel
+        await NotificationService.record_delivery_outcomes(db, DeliveryChannelEnum.PUSH, outcomes)
         await db.flush()
 
         logger.info(
             "Push notification delivery complete",
             extra={
-                "notification_id": str(notification_id),
-                "success": any_success,
-                "subscription_count": len(subscriptions),
+                "notification_count": len(notification_ids),
+                "succeeded": len(succeeded),
+                "subscription_count": len(sends),
             },
         )
-        return any_success
+        return {notification_id: notification_id in succeeded for notification_id in outcomes}
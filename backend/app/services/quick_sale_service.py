@@ -10,7 +10,7 @@ from fastapi import HTTPException, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import hash_password
+from app.core.security import unusable_password_hash
 from app.models.event import Event
 from app.models.event_registration import EventRegistration, RegistrationStatus
 from app.models.registration_guest import RegistrationGuest
@@ -245,9 +245,9 @@ class QuickSaleService:
         first_name = name_parts[0] if len(name_parts) > 0 else "Guest"
         last_name = name_parts[1] if len(name_parts) > 1 else ""
 
-        # Generate a secure placeholder password hash
+        # Placeholder that matches no password
         # User won't be able to login until they reset their password
-        placeholder_hash = hash_password(f"quick-sale-placeholder-{uuid.uuid4()}")
+        placeholder_hash = unusable_password_hash()
 
         user = User(
             email=email,
@@ -6,19 +6,20 @@ import base64
 import csv
 import io
 import json
-import uuid
 from collections import Counter
-from dataclasses import dataclass
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
-from typing import Any
-from uuid import UUID
+from typing import Any, cast
+from uuid import UUID, uuid4
 
-from openpyxl import load_workbook
-from sqlalchemy import func, select
+from sqlalchemy import CursorResult, Insert, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import hash_password
+from app.core.config import get_settings
+from app.core.security import unusable_password_hash
 from app.models.base import Base
 from app.models.event import FoodOption
 from app.models.event_registration import EventRegistration, RegistrationStatus
@@ -36,8 +37,23 @@ from app.schemas.registration_import import (
     ValidationIssue,
     ValidationIssueSeverity,
 )
+from app.services.import_progress import ImportProgress
+from app.services.import_reader import (
+    JSONArrayExpectedError,
+    ParsedRow,
+    iter_batches,
+    iter_csv_records,
+    iter_json_array,
+    iter_xlsx_records,
+)
+from app.services.import_row_cache import ImportRowCache
+
+settings = get_settings()
 
 MAX_IMPORT_ROWS = 5000
+# Rows per multi-row INSERT in bulk commit mode; keeps wide tables under the
+# driver's 32,767 bind parameter limit
+MAX_ROWS_PER_INSERT = 500
 
 REQUIRED_HEADERS = [
     "registrant_name",
@@ -63,9 +79,25 @@ OPTIONAL_HEADERS = [
 
 
 @dataclass
-class ParsedRow:
+class _PlannedInserts:
+    """Rows to insert for one import row in bulk commit mode."""
+
     row_number: int
-    data: dict[str, Any]
+    email: str = ""
+    user: dict[str, Any] | None = None
+    registration: dict[str, Any] | None = None
+    guests: list[dict[str, Any]] = field(default_factory=list)
+    meals: list[dict[str, Any]] = field(default_factory=list)
+    guest_row_numbers: list[int] = field(default_factory=list)
+
+
+@dataclass
+class _TicketPurchaseIndex:
+    """Ticket purchases an import can link to, fetched up front."""
+
+    event_id_by_id: dict[UUID, UUID] = field(default_factory=dict)
+    ids_by_external_id: dict[str, list[UUID]] = field(default_factory=dict)
+    ids_by_email_date: dict[tuple[str, date], list[UUID]] = field(default_factory=dict)
 
 
 class RegistrationImportError(Exception):
@@ -81,7 +113,7 @@ class RegistrationImportService:
     async def preflight(self, event_id: UUID, file_bytes: bytes, filename: str) -> ImportReport:
         """Run preflight validation without creating records."""
         file_type = self._detect_file_type(filename)
-        parsed_rows = self._parse_file(file_bytes, file_type)
+        parsed_rows = await self._load_rows(file_bytes, file_type)
 
         # Fetch existing external IDs
         external_ids = [
@@ -97,12 +129,19 @@ class RegistrationImportService:
         return self._build_report(results, file_type)
 
     async def commit(
-        self, event_id: UUID, file_bytes: bytes, filename: str, user_id: UUID
+        self,
+        event_id: UUID,
+        file_bytes: bytes,
+        filename: str,
+        user_id: UUID,
+        progress: ImportProgress | None = None,
     ) -> ImportReport:
         """Execute import and create registration records."""
+        progress = progress or ImportProgress()
         file_type = self._detect_file_type(filename)
-        parsed_rows = self._parse_file(file_bytes, file_type)
+        parsed_rows = await self._load_rows(file_bytes, file_type)
         row_lookup = {row.row_number: row for row in parsed_rows}
+        await progress.start(len(parsed_rows))
 
         guest_rows_by_parent_email: dict[str, list[ParsedRow]] = {}
         guest_parent_emails: set[str] = set()
@@ -128,11 +167,52 @@ class RegistrationImportService:
         # Validate and then create records
         validation_results = await self._validate_rows(event_id, parsed_rows, existing_ids)
 
-        results = []
+        if settings.registration_import_bulk_commit:
+            results = await self._commit_bulk(
+                event_id,
+                validation_results,
+                row_lookup,
+                guest_rows_by_parent_email,
+                existing_parent_by_email,
+                food_option_name_index,
+                food_option_id_index,
+                progress,
+            )
+        else:
+            results = await self._commit_per_row(
+                event_id,
+                user_id,
+                validation_results,
+                row_lookup,
+                guest_rows_by_parent_email,
+                existing_parent_by_email,
+                food_option_name_index,
+                food_option_id_index,
+                progress,
+            )
+
+        await progress.report(results)
+        return self._build_report(results, file_type)
+
+    async def _commit_per_row(
+        self,
+        event_id: UUID,
+        user_id: UUID,
+        validation_results: list[ImportRowResult],
+        row_lookup: dict[int, ParsedRow],
+        guest_rows_by_parent_email: dict[str, list[ParsedRow]],
+        existing_parent_by_email: dict[str, EventRegistration],
+        food_option_name_index: dict[str, UUID],
+        food_option_id_index: dict[str, UUID],
+        progress: ImportProgress,
+    ) -> list[ImportRowResult]:
+        """Create registrations one row at a time, committing after each."""
+        results: list[ImportRowResult] = []
         created_parent_by_email: dict[str, EventRegistration] = {}
         guest_rows_created: set[int] = set()
 
         for result in validation_results:
+            await progress.report(results)
             row = row_lookup[result.row_number]
             is_guest_row = bool(self._normalize_email(row.data.get("guest_of_email")))
             if is_guest_row:
@@ -189,6 +269,7 @@ class RegistrationImportService:
                 )
 
         for result in validation_results:
+            await progress.report(results)
             row = row_lookup[result.row_number]
             guest_of_email = self._normalize_email(row.data.get("guest_of_email"))
             if not guest_of_email:
@@ -240,7 +321,495 @@ class RegistrationImportService:
                     )
                 )
 
-        return self._build_report(results, file_type)
+        return results
+
+    async def _commit_bulk(
+        self,
+        event_id: UUID,
+        validation_results: list[ImportRowResult],
+        row_lookup: dict[int, ParsedRow],
+        guest_rows_by_parent_email: dict[str, list[ParsedRow]],
+        existing_parent_by_email: dict[str, EventRegistration],
+        food_option_name_index: dict[str, UUID],
+        food_option_id_index: dict[str, UUID],
+        progress: ImportProgress,
+    ) -> list[ImportRowResult]:
+        """Create registrations a chunk at a time.
+
+        Users, existing registrations and ticket purchases for the whole file
+        are looked up in a few queries, then each chunk of rows is written
+        with multi-row INSERTs in one transaction. A chunk that fails is
+        rolled back and retried row by row in savepoints, so a bad row only
+        fails itself. Row results come out in the same order as the
+        per-row path.
+        """
+        existing_parent_ids = {
+            email: registration.id for email, registration in existing_parent_by_email.items()
+        }
+        parent_results: list[ImportRowResult] = []
+        guest_results: list[ImportRowResult] = []
+        for result in validation_results:
+            row = row_lookup[result.row_number]
+            if self._normalize_email(row.data.get("guest_of_email")):
+                guest_results.append(result)
+            else:
+                parent_results.append(result)
+
+        creatable_rows = [
+            row_lookup[result.row_number]
+            for result in parent_results
+            if result.status not in (ImportRowStatus.ERROR, ImportRowStatus.SKIPPED)
+        ]
+        emails = {
+            self._normalize_email(row.data.get("registrant_email")) for row in creatable_rows
+        } - {""}
+        user_ids = await self._fetch_user_ids_by_email(emails)
+        registered_user_ids = await self._fetch_registered_user_ids(
+            event_id, set(user_ids.values())
+        )
+        purchase_index = await self._fetch_ticket_purchase_index(
+            event_id, [row.data for row in creatable_rows]
+        )
+        donor_role_id = await self._fetch_donor_role_id() if emails - user_ids.keys() else None
+
+        chunk_size = settings.registration_import_commit_chunk_size
+        results: list[ImportRowResult] = []
+        created_parent_ids: dict[str, UUID] = {}
+        guest_rows_created: set[int] = set()
+        planned_emails: set[str] = set()
+
+        for chunk in iter_batches(parent_results, chunk_size):
+            outcomes: dict[int, ImportRowResult] = {}
+            plans: list[_PlannedInserts] = []
+            for result in chunk:
+                if result.status in (ImportRowStatus.ERROR, ImportRowStatus.SKIPPED):
+                    continue
+                row = row_lookup[result.row_number]
+                email = self._normalize_email(row.data.get("registrant_email"))
+                if email in planned_emails or user_ids.get(email) in registered_user_ids:
+                    outcomes[result.row_number] = self._with_outcome(
+                        result, ImportRowStatus.SKIPPED, "Skipped: registration already exists"
+                    )
+                    continue
+                try:
+                    plan = self._plan_registration(
+                        event_id,
+                        row,
+                        guest_rows_by_parent_email.get(email, []),
+                        user_ids,
+                        donor_role_id,
+                        purchase_index,
+                        food_option_name_index,
+                        food_option_id_index,
+                    )
+                except RegistrationImportError as exc:
+                    outcomes[result.row_number] = self._with_outcome(
+                        result, ImportRowStatus.ERROR, f"Failed to create registration: {exc}"
+                    )
+                    continue
+                planned_emails.add(email)
+                plans.append(plan)
+
+            skipped, failed = await self._write_planned_chunk(plans)
+            chunk_by_row = {result.row_number: result for result in chunk}
+            for plan in plans:
+                result = chunk_by_row[plan.row_number]
+                if plan.row_number in failed:
+                    outcomes[plan.row_number] = self._with_outcome(
+                        result,
+                        ImportRowStatus.ERROR,
+                        f"Failed to create registration: {failed[plan.row_number]}",
+                    )
+                elif plan.row_number in skipped:
+                    outcomes[plan.row_number] = self._with_outcome(
+                        result, ImportRowStatus.SKIPPED, "Skipped: registration already exists"
+                    )
+                else:
+                    assert plan.registration is not None
+                    created_parent_ids[plan.email] = plan.registration["id"]
+                    guest_rows_created.update(plan.guest_row_numbers)
+            results.extend(outcomes.get(result.row_number, result) for result in chunk)
+            await progress.report(results)
+
+        for chunk in iter_batches(guest_results, chunk_size):
+            outcomes = {}
+            plans = []
+            for result in chunk:
+                if result.status == ImportRowStatus.ERROR:
+                    continue
+                if result.row_number in guest_rows_created:
+                    continue
+                row = row_lookup[result.row_number]
+                parent_email = self._normalize_email(row.data.get("guest_of_email"))
+                registration_id = created_parent_ids.get(parent_email) or existing_parent_ids.get(
+                    parent_email
+                )
+                if not registration_id:
+                    outcomes[result.row_number] = self._with_outcome(
+                        result,
+                        ImportRowStatus.ERROR,
+                        "Failed to create guest: parent registration not found",
+                    )
+                    continue
+                plan = _PlannedInserts(row_number=result.row_number)
+                self._plan_guest(
+                    plan,
+                    registration_id,
+                    row.data,
+                    food_option_name_index,
+                    food_option_id_index,
+                )
+                plans.append(plan)
+
+            _, failed = await self._write_planned_chunk(plans)
+            for result in chunk:
+                if result.row_number in failed:
+                    outcomes[result.row_number] = self._with_outcome(
+                        result,
+                        ImportRowStatus.ERROR,
+                        f"Failed to create guest: {failed[result.row_number]}",
+                    )
+            results.extend(outcomes.get(result.row_number, result) for result in chunk)
+            await progress.report(results)
+
+        return results
+
+    async def _write_planned_chunk(
+        self, plans: list[_PlannedInserts]
+    ) -> tuple[set[int], dict[int, str]]:
+        """Insert a chunk of planned rows and commit it.
+
+        Returns:
+            Row numbers whose registration already existed, and the error
+            message of each row that could not be written.
+        """
+        if not plans:
+            return set(), {}
+
+        try:
+            skipped = await self._insert_planned(plans)
+            await self.db.commit()
+            return skipped, {}
+        except Exception:
+            await self.db.rollback()
+
+        skipped = set()
+        failed: dict[int, str] = {}
+        for plan in plans:
+            try:
+                async with self.db.begin_nested():
+                    skipped |= await self._insert_planned([plan])
+            except Exception as exc:
+                failed[plan.row_number] = str(exc)
+        await self.db.commit()
+        return skipped, failed
+
+    async def _insert_planned(self, plans: list[_PlannedInserts]) -> set[int]:
+        """Write the users, registrations, guests and meal selections of ``plans``.
+
+        Returns the row numbers whose registration already existed (created
+        since the lookups ran); their guests and meal selections are dropped.
+        """
+        new_users = [plan.user for plan in plans if plan.user]
+        if new_users:
+            created_user_ids = await self._insert_rows(
+                pg_insert(User)
+                .on_conflict_do_nothing(index_elements=[User.email])
+                .returning(User.id),
+                new_users,
+            )
+            raced_emails = {
+                user["email"] for user in new_users if user["id"] not in created_user_ids
+            }
+            if raced_emails:
+                current_ids = await self._fetch_user_ids_by_email(raced_emails)
+                for plan in plans:
+                    if plan.user and plan.user["email"] in raced_emails:
+                        self._assign_user(plan, current_ids[plan.user["email"]])
+
+        registrations = [plan.registration for plan in plans if plan.registration]
+        inserted_ids = await self._insert_rows(
+            pg_insert(EventRegistration)
+            .on_conflict_do_nothing(
+                index_elements=[EventRegistration.user_id, EventRegistration.event_id]
+            )
+            .returning(EventRegistration.id),
+            registrations,
+        )
+        skipped = {
+            plan.row_number
+            for plan in plans
+            if plan.registration and plan.registration["id"] not in inserted_ids
+        }
+        written = [plan for plan in plans if plan.row_number not in skipped]
+        await self._insert_rows(
+            insert(RegistrationGuest), [guest for plan in written for guest in plan.guests]
+        )
+        await self._insert_rows(
+            insert(MealSelection), [meal for plan in written for meal in plan.meals]
+        )
+        return skipped
+
+    async def _insert_rows(self, statement: Insert, rows: list[dict[str, Any]]) -> set[Any]:
+        """Run a multi-row INSERT in batches, collecting any RETURNING values."""
+        returned: set[Any] = set()
+        for start in range(0, len(rows), MAX_ROWS_PER_INSERT):
+            # An INSERT always produces a CursorResult
+            result = cast(
+                CursorResult[Any],
+                await self.db.execute(statement.values(rows[start : start + MAX_ROWS_PER_INSERT])),
+            )
+            if result.returns_rows:
+                returned.update(result.scalars())
+        return returned
+
+    def _plan_registration(
+        self,
+        event_id: UUID,
+        row: ParsedRow,
+        guest_rows: list[ParsedRow],
+        user_ids: dict[str, UUID],
+        donor_role_id: UUID | None,
+        purchase_index: _TicketPurchaseIndex,
+        food_option_name_index: dict[str, UUID],
+        food_option_id_index: dict[str, UUID],
+    ) -> _PlannedInserts:
+        """Build the inserts for one registrant row, as ``_create_registration`` would."""
+        data = row.data
+        registrant_name_raw = str(data.get("registrant_name", "")).strip()
+        registrant_email_raw = str(data.get("registrant_email", "")).strip().lower()
+        registrant_phone = str(data.get("registrant_phone", "")).strip() or None
+
+        if not registrant_name_raw or not registrant_email_raw:
+            raise RegistrationImportError("Registrant name and email are required")
+
+        plan = _PlannedInserts(row_number=row.row_number, email=registrant_email_raw)
+        registrant_user_id = user_ids.get(registrant_email_raw)
+        if registrant_user_id is None:
+            first_name, last_name = self._split_name(registrant_name_raw)
+            registrant_user_id = uuid4()
+            plan.user = {
+                "id": registrant_user_id,
+                "email": registrant_email_raw,
+                "first_name": first_name,
+                "last_name": last_name,
+                "phone": registrant_phone,
+                "email_verified": False,
+                "is_active": False,
+                "role_id": donor_role_id,
+                "password_hash": unusable_password_hash(),
+            }
+
+        number_of_guests = self._resolve_guest_count(data)
+        registration_id = uuid4()
+        plan.registration = {
+            "id": registration_id,
+            "user_id": registrant_user_id,
+            "event_id": event_id,
+            "number_of_guests": number_of_guests,
+            "ticket_purchase_id": self._lookup_ticket_purchase_id(event_id, data, purchase_index),
+        }
+
+        self._plan_guest(
+            plan,
+            registration_id,
+            data,
+            food_option_name_index,
+            food_option_id_index,
+            user_id=registrant_user_id,
+            is_primary=True,
+        )
+        for guest_row in guest_rows:
+            self._plan_guest(
+                plan,
+                registration_id,
+                guest_row.data,
+                food_option_name_index,
+                food_option_id_index,
+            )
+            plan.guest_row_numbers.append(guest_row.row_number)
+
+        additional_guest_count = max(number_of_guests - 1 - len(guest_rows), 0)
+        for _ in range(additional_guest_count):
+            self._plan_guest(plan, registration_id, {}, {}, {})
+        return plan
+
+    def _plan_guest(
+        self,
+        plan: _PlannedInserts,
+        registration_id: UUID,
+        data: dict[str, Any],
+        food_option_name_index: dict[str, UUID],
+        food_option_id_index: dict[str, UUID],
+        user_id: UUID | None = None,
+        is_primary: bool = False,
+    ) -> None:
+        """Add a guest (and their meal selection, if any) to ``plan``."""
+        guest_id = uuid4()
+        plan.guests.append(
+            {
+                "id": guest_id,
+                "registration_id": registration_id,
+                "user_id": user_id,
+                "name": str(data.get("registrant_name", "")).strip() or None,
+                "email": str(data.get("registrant_email", "")).strip().lower() or None,
+                "phone": str(data.get("registrant_phone", "")).strip() or None,
+                "bidder_number": self._parse_optional_int(data.get("bidder_number")),
+                "table_number": self._parse_optional_int(data.get("table_number")),
+                "status": RegistrationStatus.CONFIRMED.value,
+                "is_primary": is_primary,
+            }
+        )
+        food_option_id = self._resolve_food_option_from_indexes(
+            str(data.get("food_option", "")).strip(),
+            food_option_name_index,
+            food_option_id_index,
+        )
+        if food_option_id:
+            plan.meals.append(
+                {
+                    "id": uuid4(),
+                    "registration_id": registration_id,
+                    "guest_id": guest_id,
+                    "food_option_id": food_option_id,
+                }
+            )
+
+    def _assign_user(self, plan: _PlannedInserts, user_id: UUID) -> None:
+        """Point a planned registration at a user created since the lookups ran."""
+        plan.user = None
+        assert plan.registration is not None
+        plan.registration["user_id"] = user_id
+        for guest in plan.guests:
+            if guest["is_primary"]:
+                guest["user_id"] = user_id
+
+    def _with_outcome(
+        self, result: ImportRowResult, status: ImportRowStatus, message: str
+    ) -> ImportRowResult:
+        return ImportRowResult(
+            row_number=result.row_number,
+            external_id=result.external_id,
+            registrant_name=result.registrant_name,
+            registrant_email=result.registrant_email,
+            status=status,
+            message=message,
+            issues=result.issues if status == ImportRowStatus.SKIPPED else [],
+        )
+
+    async def _fetch_user_ids_by_email(self, emails: set[str]) -> dict[str, UUID]:
+        if not emails:
+            return {}
+        result = await self.db.execute(select(User.email, User.id).where(User.email.in_(emails)))
+        return dict(result.tuples().all())
+
+    async def _fetch_registered_user_ids(self, event_id: UUID, user_ids: set[UUID]) -> set[UUID]:
+        if not user_ids:
+            return set()
+        result = await self.db.execute(
+            select(EventRegistration.user_id).where(
+                EventRegistration.event_id == event_id,
+                EventRegistration.user_id.in_(user_ids),
+            )
+        )
+        return set(result.scalars().all())
+
+    async def _fetch_donor_role_id(self) -> UUID:
+        roles = Base.metadata.tables["roles"]
+        result = await self.db.execute(select(roles.c.id).where(roles.c.name == "donor"))
+        role_id: UUID = result.scalar_one()
+        return role_id
+
+    async def _fetch_ticket_purchase_index(
+        self, event_id: UUID, rows: list[dict[str, Any]]
+    ) -> _TicketPurchaseIndex:
+        """Fetch every ticket purchase the rows could link to, in up to three queries."""
+        purchase_ids: set[UUID] = set()
+        external_ids: set[str] = set()
+        purchaser_emails: set[str] = set()
+        for data in rows:
+            raw_purchase_id = str(data.get("ticket_purchase_id", "")).strip()
+            if raw_purchase_id:
+                try:
+                    purchase_ids.add(UUID(raw_purchase_id))
+                except (ValueError, TypeError):
+                    external_ids.add(raw_purchase_id)
+            purchaser_email = str(data.get("ticket_purchaser_email", "")).strip().lower()
+            if purchaser_email:
+                purchaser_emails.add(purchaser_email)
+
+        index = _TicketPurchaseIndex()
+        if purchase_ids:
+            owners = await self.db.execute(
+                select(TicketPurchase.id, TicketPurchase.event_id).where(
+                    TicketPurchase.id.in_(purchase_ids)
+                )
+            )
+            index.event_id_by_id = dict(owners.tuples().all())
+        if external_ids:
+            by_external_id = await self.db.execute(
+                select(TicketPurchase.external_sale_id, TicketPurchase.id).where(
+                    TicketPurchase.event_id == event_id,
+                    TicketPurchase.external_sale_id.in_(external_ids),
+                )
+            )
+            for external_id, purchase_id in by_external_id.tuples():
+                if external_id is not None:  # Always set; the column is nullable
+                    index.ids_by_external_id.setdefault(external_id, []).append(purchase_id)
+        if purchaser_emails:
+            lower_email = func.lower(TicketPurchase.purchaser_email)
+            by_email_date = await self.db.execute(
+                select(lower_email, func.date(TicketPurchase.purchased_at), TicketPurchase.id)
+                .where(TicketPurchase.event_id == event_id)
+                .where(lower_email.in_(purchaser_emails))
+            )
+            for purchaser_email, purchased_on, purchase_id in by_email_date.tuples():
+                index.ids_by_email_date.setdefault((purchaser_email, purchased_on), []).append(
+                    purchase_id
+                )
+        return index
+
+    def _lookup_ticket_purchase_id(
+        self, event_id: UUID, row: dict[str, Any], index: _TicketPurchaseIndex
+    ) -> UUID | None:
+        """Resolve a row's ticket purchase like ``_resolve_ticket_purchase_id``, from ``index``."""
+        raw_purchase_id = str(row.get("ticket_purchase_id", "")).strip()
+        purchaser_email = str(row.get("ticket_purchaser_email", "")).strip()
+        purchase_date_raw = row.get("ticket_purchase_date")
+
+        if raw_purchase_id:
+            try:
+                purchase_id = UUID(raw_purchase_id)
+            except (ValueError, TypeError):
+                matches = index.ids_by_external_id.get(raw_purchase_id, [])
+                if not matches:
+                    raise RegistrationImportError("Ticket purchase not found") from None
+                if len(matches) > 1:
+                    raise RegistrationImportError(
+                        "Multiple ticket purchases found for ticket_purchase_id"
+                    ) from None
+                return matches[0]
+            if index.event_id_by_id.get(purchase_id) == event_id:
+                return purchase_id
+
+        if purchaser_email or purchase_date_raw not in (None, ""):
+            if not purchaser_email or purchase_date_raw in (None, ""):
+                raise RegistrationImportError(
+                    "Both ticket_purchaser_email and ticket_purchase_date are required"
+                )
+
+            purchase_date = self._parse_purchase_date(purchase_date_raw)
+            if not purchase_date:
+                raise RegistrationImportError(f"Invalid ticket_purchase_date: {purchase_date_raw}")
+
+            matches = index.ids_by_email_date.get((purchaser_email.lower(), purchase_date), [])
+            if len(matches) == 0:
+                raise RegistrationImportError("No matching ticket purchase found for email/date")
+            if len(matches) > 1:
+                raise RegistrationImportError("Multiple ticket purchases found for email/date")
+            return matches[0]
+
+        return None
 
     def _detect_file_type(self, filename: str) -> str:
         """Detect file type from filename."""
@@ -256,6 +825,14 @@ class RegistrationImportService:
                 f"Unsupported file type. Must be JSON, CSV, or Excel (.xlsx): {filename}"
             )
 
+    async def _load_rows(self, file_bytes: bytes, file_type: str) -> list[ParsedRow]:
+        """Parse a file, reusing the rows parsed at preflight when unchanged."""
+        return await ImportRowCache.get_or_parse(
+            f"registrations:{file_type}",
+            file_bytes,
+            lambda content: self._parse_file(content, file_type),
+        )
+
     def _parse_file(self, file_bytes: bytes, file_type: str) -> list[ParsedRow]:
         """Parse file based on type."""
         if file_type == "json":
@@ -268,91 +845,71 @@ class RegistrationImportService:
             raise RegistrationImportError(f"Unsupported file type: {file_type}")
 
     def _parse_json(self, file_bytes: bytes) -> list[ParsedRow]:
-        """Parse JSON array of registration objects."""
+        """Parse JSON array of registration objects, one element at a time."""
+        parsed_rows: list[ParsedRow] = []
+        found = 0
         try:
-            content = file_bytes.decode("utf-8")
-            data = json.loads(content)
+            for found, obj in enumerate(iter_json_array(file_bytes, "utf-8"), start=1):
+                if found > MAX_IMPORT_ROWS:
+                    continue  # Only counted, for the error message below
+                if not isinstance(obj, dict):
+                    continue
+                row_data = {
+                    self._normalize_header(k): self._normalize_cell(v) for k, v in obj.items()
+                }
+                parsed_rows.append(ParsedRow(row_number=found, data=row_data))
+        except JSONArrayExpectedError as exc:
+            raise RegistrationImportError(
+                "JSON must contain an array of registration objects"
+            ) from exc
         except (UnicodeDecodeError, json.JSONDecodeError) as exc:
             raise RegistrationImportError(f"Invalid JSON file: {exc}") from exc
 
-        if not isinstance(data, list):
-            raise RegistrationImportError("JSON must contain an array of registration objects")
-
-        if len(data) == 0:
+        if found == 0:
             raise RegistrationImportError("JSON file contains no data")
 
-        if len(data) > MAX_IMPORT_ROWS:
+        if found > MAX_IMPORT_ROWS:
             raise RegistrationImportError(
-                f"File exceeds maximum of {MAX_IMPORT_ROWS} rows (found {len(data)})"
+                f"File exceeds maximum of {MAX_IMPORT_ROWS} rows (found {found})"
             )
 
-        parsed_rows: list[ParsedRow] = []
-        for index, obj in enumerate(data, start=1):
-            if not isinstance(obj, dict):
-                continue
-            row_data = {self._normalize_header(k): self._normalize_cell(v) for k, v in obj.items()}
-            parsed_rows.append(ParsedRow(row_number=index, data=row_data))
-
         if not parsed_rows:
             raise RegistrationImportError("JSON file contains no valid data rows")
 
         return parsed_rows
 
     def _parse_csv(self, file_bytes: bytes) -> list[ParsedRow]:
-        """Parse CSV file."""
+        """Parse CSV file, decoding it as rows are read."""
         try:
-            content = file_bytes.decode("utf-8-sig")
+            return self._parse_records(iter_csv_records(file_bytes, "utf-8-sig"), "CSV", "CSV")
         except UnicodeDecodeError as exc:
             raise RegistrationImportError("CSV must be UTF-8 encoded") from exc
 
-        reader = csv.reader(io.StringIO(content))
-        header_row = next(reader, None)
-        if not header_row:
-            raise RegistrationImportError("CSV is empty")
-
-        headers = [self._normalize_header(value) for value in header_row]
-        self._validate_required_headers(headers)
-
-        parsed_rows: list[ParsedRow] = []
-        for index, values in enumerate(reader, start=2):
-            if self._is_empty_row(values):
-                continue
-            if len(parsed_rows) >= MAX_IMPORT_ROWS:
-                raise RegistrationImportError(f"CSV exceeds maximum of {MAX_IMPORT_ROWS} rows")
-
-            row_data = {
-                headers[i]: self._normalize_cell(values[i]) if i < len(values) else None
-                for i in range(len(headers))
-            }
-            parsed_rows.append(ParsedRow(row_number=index, data=row_data))
-
-        if not parsed_rows:
-            raise RegistrationImportError("CSV contains no data rows")
-
-        return parsed_rows
-
     def _parse_excel(self, file_bytes: bytes) -> list[ParsedRow]:
-        """Parse Excel workbook."""
+        """Parse Excel workbook from its read-only row stream."""
         try:
-            workbook = load_workbook(io.BytesIO(file_bytes), read_only=True, data_only=True)
+            records = iter_xlsx_records(file_bytes)
         except Exception as exc:
             raise RegistrationImportError(f"Invalid Excel file: {exc}") from exc
+        return self._parse_records(records, "Excel", "Excel workbook")
 
-        sheet = workbook.active
-        row_iter = sheet.iter_rows(values_only=True)
-        header_row = next(row_iter, None)
+    def _parse_records(
+        self, records: Iterator[Sequence[Any]], label: str, document: str
+    ) -> list[ParsedRow]:
+        """Build rows from a header record followed by data records."""
+        header_row = next(records, None)
         if not header_row:
-            raise RegistrationImportError("Excel workbook is empty")
+            raise RegistrationImportError(f"{document} is empty")
 
         headers = [self._normalize_header(value) for value in header_row]
         self._validate_required_headers(headers)
 
         parsed_rows: list[ParsedRow] = []
-        for index, values in enumerate(row_iter, start=2):
+        for index, values in enumerate(records, start=2):
             if self._is_empty_row(values):
                 continue
             if len(parsed_rows) >= MAX_IMPORT_ROWS:
-                raise RegistrationImportError(f"Excel exceeds maximum of {MAX_IMPORT_ROWS} rows")
+                raise RegistrationImportError(f"{label} exceeds maximum of {MAX_IMPORT_ROWS} rows")
 
             row_data = {
                 headers[i]: self._normalize_cell(values[i]) if i < len(values) else None
@@ -361,7 +918,7 @@ class RegistrationImportService:
             parsed_rows.append(ParsedRow(row_number=index, data=row_data))
 
         if not parsed_rows:
-            raise RegistrationImportError("Excel workbook contains no data rows")
+            raise RegistrationImportError(f"{document} contains no data rows")
 
         return parsed_rows
 
@@ -383,7 +940,7 @@ class RegistrationImportService:
         if missing:
             raise RegistrationImportError(f"Missing required columns: {', '.join(missing)}")
 
-    def _is_empty_row(self, values: tuple[Any, ...] | list[Any]) -> bool:
+    def _is_empty_row(self, values: Sequence[Any]) -> bool:
         """Check if a row is empty."""
         return all(v is None or str(v).strip() == "" for v in values)
 
@@ -447,17 +1004,17 @@ class RegistrationImportService:
             is_guest_row = bool(guest_of_email)
 
             # Validate required fields
-            for field in REQUIRED_HEADERS:
-                if is_guest_row and field == "external_registration_id":
+            for header in REQUIRED_HEADERS:
+                if is_guest_row and header == "external_registration_id":
                     continue
-                value = data.get(field)
+                value = data.get(header)
                 if value is None or str(value).strip() == "":
                     issues.append(
                         ValidationIssue(
                             row_number=row.row_number,
                             severity=ValidationIssueSeverity.ERROR,
-                            field_name=field,
-                            message=f"Required field '{field}' is missing or empty",
+                            field_name=header,
+                            message=f"Required field '{header}' is missing or empty",
                         )
                     )
 
@@ -794,11 +1351,7 @@ class RegistrationImportService:
         if existing:
             return existing
 
-        donor_role_stmt = select(Base.metadata.tables["roles"].c.id).where(
-            Base.metadata.tables["roles"].c.name == "donor"
-        )
-        role_result = await self.db.execute(donor_role_stmt)
-        donor_role_id = role_result.scalar_one()
+        donor_role_id = await self._fetch_donor_role_id()
 
         user = User(
             email=email,
@@ -809,7 +1362,7 @@ class RegistrationImportService:
             is_active=False,
             role_id=donor_role_id,
         )
-        user.password_hash = hash_password(uuid.uuid4().hex)
+        user.password_hash = unusable_password_hash()
         self.db.add(user)
         await self.db.flush()
         return user
@@ -20,7 +20,7 @@ from app.models.silent_auction_extension_policy import (
 @dataclass
 class ExtensionEvaluationResult:
     extension_applied_minutes: int
-    item_effective_close_at: object | None
+    item_effective_close_at: datetime | None
     max_extension_reached: bool
 
 
@@ -332,7 +332,7 @@ class SocialAuthService:
         user = await cls._get_user_by_id(db, confirmation.candidate_user_id)
         if not user:
             raise ValueError("User not found")
-        if not user.verify_password(password):
+        if not await user.verify_password_async(password):
             raise ValueError("Invalid password")
 
         # Create the identity link
@@ -469,7 +469,7 @@ class SocialAuthService:
         user = await cls._get_user_by_id(db, challenge.user_id)
         if not user:
             raise ValueError("User not found")
-        if not user.verify_password(password):
+        if not await user.verify_password_async(password):
             raise ValueError("Invalid password")
 
         challenge.status = "satisfied"
@@ -895,7 +895,7 @@ class SocialAuthService:
             is_active=True,
             role_id=role.id,
         )
-        user.set_password(secrets.token_urlsafe(32))
+        await user.set_password_async(secrets.token_urlsafe(32))
         db.add(user)
         await db.flush()
 
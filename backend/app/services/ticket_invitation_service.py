@@ -8,7 +8,6 @@ import hashlib
 import hmac
 import json
 import os
-import secrets
 import uuid
 from datetime import UTC, datetime, timedelta
 
@@ -19,7 +18,7 @@ from sqlalchemy.orm import selectinload
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
-from app.core.security import hash_password
+from app.core.security import unusable_password_hash
 from app.models.event import Event
 from app.models.event_registration import EventRegistration
 from app.models.npo import NPO
@@ -228,7 +227,7 @@ class TicketInvitationService:
                     email=assignment.guest_email.lower(),
                     first_name=pre_first,
                     last_name=pre_last,
-                    password_hash=hash_password(f"Tmp{secrets.token_urlsafe(10)}1"),
+                    password_hash=unusable_password_hash(),
                     role_id=donor_role.id,
                     must_change_password=True,
                     email_verified=False,
@@ -713,7 +712,7 @@ class TicketInvitationService:
             )
 
         # Activate the account and set the chosen password
-        user.set_password(request.password)
+        await user.set_password_async(request.password)
         user.email_verified = True
         user.is_active = True
         user.must_change_password = False
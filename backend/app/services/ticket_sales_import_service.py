@@ -4,16 +4,14 @@ from __future__ import annotations
 
 import csv
 import hashlib
-import io
 import json
-from dataclasses import dataclass
+from collections.abc import Iterator
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from typing import Any
 from uuid import UUID
 
 import magic
-from openpyxl import load_workbook
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -39,6 +37,15 @@ from app.schemas.ticket_sales_import import (
     PreflightIssue,
     PreflightResult,
 )
+from app.services.import_progress import ImportProgress
+from app.services.import_reader import (
+    JSONArrayExpectedError,
+    ParsedRow,
+    iter_json_array,
+    iter_xlsx_records,
+    open_text,
+)
+from app.services.import_row_cache import ImportRowCache
 
 # Constants
 MAX_IMPORT_ROWS = 5000
@@ -61,14 +68,6 @@ OPTIONAL_CSV_HEADERS = [
 ]
 
 
-@dataclass
-class ParsedRow:
-    """Parsed row from import file."""
-
-    row_number: int
-    data: dict[str, Any]
-
-
 class TicketSalesImportError(Exception):
     """Base exception for ticket sales import errors."""
 
@@ -106,7 +105,7 @@ class TicketSalesImportService:
         detected_format = self._detect_format(file_bytes, filename)
 
         # Parse file
-        parsed_rows = self._parse_file(file_bytes, detected_format)
+        parsed_rows = await self._load_rows(file_bytes, detected_format)
 
         # Check row count limit
         if len(parsed_rows) > MAX_IMPORT_ROWS:
@@ -195,7 +194,12 @@ class TicketSalesImportService:
         )
 
     async def commit_import(
-        self, event_id: UUID, preflight_id: UUID, file_bytes: bytes, user_id: UUID
+        self,
+        event_id: UUID,
+        preflight_id: UUID,
+        file_bytes: bytes,
+        user_id: UUID,
+        progress: ImportProgress | None = None,
     ) -> ImportResult:
         """Execute import using preflight results.
 
@@ -204,6 +208,7 @@ class TicketSalesImportService:
             preflight_id: UUID of the preflight batch
             file_bytes: Raw bytes of the uploaded file (must match preflight checksum)
             user_id: UUID of the user initiating the import
+            progress: Receives the outcome of each row as it is imported
 
         Returns:
             ImportResult with created, skipped, and failed counts
@@ -236,7 +241,9 @@ class TicketSalesImportService:
             )
 
         # Parse file
-        parsed_rows = self._parse_file(file_bytes, batch.source_format)
+        progress = progress or ImportProgress()
+        parsed_rows = await self._load_rows(file_bytes, batch.source_format)
+        await progress.start(len(parsed_rows))
 
         # Fetch existing external_sale_ids
         external_ids = [
@@ -275,6 +282,7 @@ class TicketSalesImportService:
                             raw_value=external_id,
                         )
                     )
+                    await progress.row(parsed_row.row_number, "skipped", warnings[-1].message)
                     continue
 
                 # Get ticket package
@@ -282,6 +290,9 @@ class TicketSalesImportService:
                 package = package_map.get(ticket_type.lower())
                 if not package:
                     failed_count += 1
+                    await progress.row(
+                        parsed_row.row_number, "error", f"Unknown ticket type '{ticket_type}'"
+                    )
                     continue
 
                 # Parse values
@@ -355,6 +366,9 @@ class TicketSalesImportService:
                         message=f"Failed to import: {str(e)}",
                     )
                 )
+                await progress.row(parsed_row.row_number, "error", warnings[-1].message)
+            else:
+                await progress.row(parsed_row.row_number, "created")
 
         # Update batch status
         batch.status = ImportStatus.IMPORTED
@@ -388,6 +402,14 @@ class TicketSalesImportService:
                 f"Unsupported file format. Please upload a CSV, JSON, or Excel file. Detected: {mime_type}"
             )
 
+    async def _load_rows(self, file_bytes: bytes, file_format: ImportFormat) -> list[ParsedRow]:
+        """Parse a file, reusing the rows parsed at preflight when unchanged."""
+        return await ImportRowCache.get_or_parse(
+            f"ticket_sales:{file_format.value}",
+            file_bytes,
+            lambda content: self._parse_file(content, file_format),
+        )
+
     def _parse_file(self, file_bytes: bytes, file_format: ImportFormat) -> list[ParsedRow]:
         """Parse file based on format."""
         if file_format == ImportFormat.CSV:
@@ -400,52 +422,71 @@ class TicketSalesImportService:
             raise TicketSalesImportError(f"Unsupported format: {file_format}")
 
     def _parse_csv(self, file_bytes: bytes) -> list[ParsedRow]:
-        """Parse CSV file."""
+        """Parse CSV file, decoding it as rows are read."""
         try:
-            text = file_bytes.decode("utf-8")
-            reader = csv.DictReader(io.StringIO(text))
-            rows = []
-            for idx, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
-                rows.append(ParsedRow(row_number=idx, data=dict(row)))
-            return rows
+            with open_text(file_bytes, "utf-8") as text:
+                reader = csv.DictReader(text)
+                # Start at 2 (header is row 1)
+                return self._collect_rows(
+                    ParsedRow(row_number=idx, data=dict(row))
+                    for idx, row in enumerate(reader, start=2)
+                )
+        except TicketSalesImportError:
+            raise
         except Exception as e:
             raise TicketSalesImportError(f"Failed to parse CSV: {str(e)}")
 
     def _parse_json(self, file_bytes: bytes) -> list[ParsedRow]:
-        """Parse JSON file."""
+        """Parse JSON file, one array element at a time."""
         try:
-            text = file_bytes.decode("utf-8")
-            data = json.loads(text)
-            if not isinstance(data, list):
-                raise TicketSalesImportError("JSON must contain an array of ticket sales")
-            rows = []
-            for idx, item in enumerate(data, start=1):
-                rows.append(ParsedRow(row_number=idx, data=item))
-            return rows
+            items = iter_json_array(file_bytes, "utf-8")
+            return self._collect_rows(
+                ParsedRow(row_number=idx, data=item) for idx, item in enumerate(items, start=1)
+            )
+        except TicketSalesImportError:
+            raise
+        except JSONArrayExpectedError:
+            raise TicketSalesImportError(
+                "Failed to parse JSON: JSON must contain an array of ticket sales"
+            )
         except json.JSONDecodeError as e:
             raise TicketSalesImportError(f"Invalid JSON: {str(e)}")
         except Exception as e:
             raise TicketSalesImportError(f"Failed to parse JSON: {str(e)}")
 
     def _parse_xlsx(self, file_bytes: bytes) -> list[ParsedRow]:
-        """Parse Excel file."""
+        """Parse Excel file from its read-only row stream."""
         try:
-            workbook = load_workbook(io.BytesIO(file_bytes))
-            sheet = workbook.active
-            if sheet is None:
-                raise TicketSalesImportError("Excel file has no active sheet")
+            records = iter_xlsx_records(file_bytes)
 
             # Get headers from first row
-            headers = [cell.value for cell in sheet[1]]
+            headers = list(next(records, ()))
 
-            rows = []
-            for idx, row in enumerate(sheet.iter_rows(min_row=2, values_only=True), start=2):
-                data = {headers[i]: row[i] for i in range(len(headers)) if i < len(row)}
-                rows.append(ParsedRow(row_number=idx, data=data))
-            return rows
+            return self._collect_rows(
+                ParsedRow(
+                    row_number=idx,
+                    data={headers[i]: row[i] for i in range(len(headers)) if i < len(row)},
+                )
+                for idx, row in enumerate(records, start=2)
+            )
+        except TicketSalesImportError:
+            raise
         except Exception as e:
             raise TicketSalesImportError(f"Failed to parse Excel: {str(e)}")
 
+    def _collect_rows(self, rows: Iterator[ParsedRow]) -> list[ParsedRow]:
+        """Keep up to MAX_IMPORT_ROWS rows; past that, only count them for the error."""
+        collected: list[ParsedRow] = []
+        total = 0
+        for total, row in enumerate(rows, start=1):
+            if total <= MAX_IMPORT_ROWS:
+                collected.append(row)
+        if total > MAX_IMPORT_ROWS:
+            raise TicketSalesImportError(
+                f"File contains {total} rows. Maximum allowed is {MAX_IMPORT_ROWS}."
+            )
+        return collected
+
     def _validate_row(
         self,
         parsed_row: ParsedRow,
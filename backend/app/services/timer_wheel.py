@@ -0,0 +1,166 @@
+"""Durable per-event timers in a Redis sorted set.
+
+Replaces Celery ETA tasks for event-scoped schedules (closing warnings,
+checkout reminders, checkout auto-open, event auto-close) and for the bid
+notification coalescing windows. A timer is
+identified by ``(event_id, kind)``: scheduling the same timer again moves it
+instead of adding a second one, and any API replica can cancel it. A single
+beat-driven dispatcher claims due timers in batches and fires them, and the
+claim is atomic so concurrent dispatchers never fire a timer twice.
+
+Keys:
+    timers:due            sorted set, member "<event_id>|<kind>", score = due epoch seconds
+    timers:payload        hash, member -> JSON payload
+    timers:event:<id>     set of that event's members, for cancelling them all
+"""
+
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Timer kinds; parameterised kinds append ":<value>" (e.g. "auction_closing_soon:15")
+AUCTION_CLOSING_SOON = "auction_closing_soon"
+CHECKOUT_REMINDER = "checkout_reminder"
+CHECKOUT_AUTO_OPEN = "checkout_auto_open"
+EVENT_AUTO_CLOSE = "event_auto_close"
+BID_DIGEST = "bid_digest"
+
+# Pop up to ARGV[2] timers due at or before ARGV[1], returning member, score, payload triples
+_CLAIM_SCRIPT = """
+local members = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+local claimed = {}
+for _, member in ipairs(members) do
+    local score = redis.call('ZSCORE', KEYS[1], member)
+    local payload = redis.call('HGET', KEYS[2], member)
+    redis.call('ZREM', KEYS[1], member)
+    redis.call('HDEL', KEYS[2], member)
+    local sep = string.find(member, '|', 1, true)
+    redis.call('SREM', ARGV[3] .. string.sub(member, 1, sep - 1), member)
+    table.insert(claimed, member)
+    table.insert(claimed, score)
+    table.insert(claimed, payload or '{}')
+end
+return claimed
+"""
+
+
+@dataclass
+class DueTimer:
+    """A timer claimed by the dispatcher."""
+
+    event_id: UUID
+    kind: str
+    due_at: float
+    payload: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def family(self) -> str:
+        """Kind without its parameter (``auction_closing_soon:15`` -> ``auction_closing_soon``)."""
+        return self.kind.split(":", 1)[0]
+
+
+class TimerWheel:
+    """Upsert, cancel and claim event timers.
+
+    Unlike the cache helpers, Redis errors propagate: a schedule that silently
+    fails to persist is worse than a failed request.
+    """
+
+    DUE_KEY = "timers:due"
+    PAYLOAD_KEY = "timers:payload"
+    EVENT_PREFIX = "timers:event:"
+
+    @staticmethod
+    def _member(event_id: UUID, kind: str) -> str:
+        return f"{event_id}|{kind}"
+
+    @staticmethod
+    async def upsert(
+        event_id: UUID,
+        kind: str,
+        due_at: datetime,
+        payload: dict[str, Any] | None = None,
+        keep_due: bool = False,
+    ) -> None:
+        """Schedule a timer, replacing any existing timer with the same event and kind.
+
+        With ``keep_due``, an already scheduled timer keeps its due time and
+        only its payload is replaced.
+        """
+        member = TimerWheel._member(event_id, kind)
+        redis = await get_redis()
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(TimerWheel.DUE_KEY, {member: due_at.timestamp()}, nx=keep_due)
+            pipe.hset(TimerWheel.PAYLOAD_KEY, member, json.dumps(payload or {}))
+            pipe.sadd(f"{TimerWheel.EVENT_PREFIX}{event_id}", member)
+            await pipe.execute()
+
+    @staticmethod
+    async def cancel(event_id: UUID, kind: str) -> None:
+        """Cancel one timer if it is scheduled."""
+        member = TimerWheel._member(event_id, kind)
+        redis = await get_redis()
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.zrem(TimerWheel.DUE_KEY, member)
+            pipe.hdel(TimerWheel.PAYLOAD_KEY, member)
+            pipe.srem(f"{TimerWheel.EVENT_PREFIX}{event_id}", member)
+            await pipe.execute()
+
+    @staticmethod
+    async def cancel_event(event_id: UUID, family: str | None = None) -> int:
+        """Cancel all of an event's timers, or only those of one kind family.
+
+        Returns:
+            Number of timers cancelled
+        """
+        event_key = f"{TimerWheel.EVENT_PREFIX}{event_id}"
+        redis = await get_redis()
+        members = [
+            member
+            for member in await redis.smembers(event_key)
+            if family is None or member.split("|", 1)[1].split(":", 1)[0] == family
+        ]
+        if not members:
+            return 0
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.zrem(TimerWheel.DUE_KEY, *members)
+            pipe.hdel(TimerWheel.PAYLOAD_KEY, *members)
+            pipe.srem(event_key, *members)
+            await pipe.execute()
+        return len(members)
+
+    @staticmethod
+    async def claim_due(limit: int, now: float | None = None) -> list[DueTimer]:
+        """Atomically remove and return up to ``limit`` timers that are due."""
+        redis = await get_redis()
+        # The redis stubs leave eval untyped; the script returns a flat list of strings
+        raw: list[str] = await redis.eval(  # type: ignore[no-untyped-call]
+            _CLAIM_SCRIPT,
+            2,
+            TimerWheel.DUE_KEY,
+            TimerWheel.PAYLOAD_KEY,
+            str(time.time() if now is None else now),
+            str(limit),
+            TimerWheel.EVENT_PREFIX,
+        )
+        timers: list[DueTimer] = []
+        for index in range(0, len(raw), 3):
+            member, score, payload = raw[index : index + 3]
+            event_id, kind = member.split("|", 1)
+            timers.append(
+                DueTimer(
+                    event_id=UUID(event_id),
+                    kind=kind,
+                    due_at=float(score),
+                    payload=json.loads(payload),
+                )
+            )
+        return timers
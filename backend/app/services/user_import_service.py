@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import csv
 import hashlib
 import io
 import json
-import secrets
 from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
@@ -18,7 +18,7 @@ from pydantic import EmailStr, TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import hash_password
+from app.core.security import hash_password_async, unusable_password_hash
 from app.models.base import Base
 from app.models.npo import NPO
 from app.models.npo_member import MemberRole, MemberStatus, NPOMember
@@ -40,7 +40,17 @@ from app.schemas.user_import import (
     PreflightIssue,
     PreflightResult,
 )
+from app.services.email_service import get_email_service
+from app.services.import_progress import ImportProgress
+from app.services.import_reader import (
+    JSONArrayExpectedError,
+    ParsedRow,
+    iter_csv_records,
+    iter_json_array,
+)
+from app.services.import_row_cache import ImportRowCache
 from app.services.password_service import PasswordService
+from app.services.redis_service import RedisService
 
 MAX_IMPORT_ROWS = 5000
 REQUIRED_HEADERS = ["full_name", "email", "role"]
@@ -79,12 +89,6 @@ MEMBER_ROLE_BY_USER_ROLE = {
 }
 
 
-@dataclass
-class ParsedRow:
-    row_number: int
-    data: dict[str, Any]
-
-
 @dataclass
 class ValidatedRow:
     row_number: int
@@ -116,7 +120,7 @@ class UserImportService:
     ) -> PreflightResult:
         """Validate uploaded file and return preflight results."""
         file_type = self._detect_file_type(filename)
-        parsed_rows = self._parse_file(file_bytes, file_type)
+        parsed_rows = await self._load_rows(file_bytes, file_type)
 
         if len(parsed_rows) > MAX_IMPORT_ROWS:
             raise UserImportError(
@@ -198,8 +202,10 @@ class UserImportService:
         preflight_id: str,
         file_bytes: bytes,
         initiated_by_user_id: UUID,
+        progress: ImportProgress | None = None,
     ) -> ImportResult:
         """Execute import after preflight."""
+        progress = progress or ImportProgress()
         try:
             preflight_uuid = UUID(preflight_id)
         except ValueError as exc:
@@ -217,7 +223,8 @@ class UserImportService:
         if batch.error_rows > 0:
             raise UserImportError("Cannot import file with errors. Please fix errors and re-run.")
 
-        parsed_rows = self._parse_file(file_bytes, batch.file_type)
+        parsed_rows = await self._load_rows(file_bytes, batch.file_type)
+        await progress.start(len(parsed_rows))
         npo_name = None
         if npo_id is not None:
             npo = await self._fetch_npo(npo_id)
@@ -239,6 +246,8 @@ class UserImportService:
             role_ids=role_ids,
         )
 
+        password_hashes = await self._hash_supplied_passwords(validated_rows, existing_users)
+
         warnings: list[PreflightIssue] = []
         results: list[ImportRowResult] = []
 
@@ -247,8 +256,10 @@ class UserImportService:
         membership_added_rows = 0
         failed_rows = 0
         reset_emails: list[tuple[int, str]] = []
+        setup_emails: list[tuple[int, User, str]] = []
 
         for row in validated_rows:
+            await progress.report(results)
             warnings.extend(row.warnings)
             if row.errors:
                 failed_rows += 1
@@ -365,9 +376,8 @@ class UserImportService:
                 )
                 continue
 
-            password = str(row.data.get("password") or "").strip()
-            if not password:
-                password = self._generate_temp_password()
+            # Users without a supplied password set one through an account setup link
+            password_hash = password_hashes.get(row.row_number)
 
             social_media_links = row.data.get("social_media_links")
             user = User(
@@ -386,7 +396,8 @@ class UserImportService:
                 social_media_links=social_media_links
                 if isinstance(social_media_links, dict)
                 else None,
-                password_hash=hash_password(password),
+                password_hash=password_hash or unusable_password_hash(),
+                must_change_password=password_hash is None,
                 role_id=role_ids[row.role],
                 email_verified=True,
                 is_active=True,
@@ -407,7 +418,10 @@ class UserImportService:
                 )
 
             created_rows += 1
-            reset_emails.append((row.row_number, user.email))
+            if password_hash is None:
+                setup_emails.append((row.row_number, user, row.role))
+            else:
+                reset_emails.append((row.row_number, user.email))
             results.append(
                 ImportRowResult(
                     row_number=row.row_number,
@@ -418,6 +432,7 @@ class UserImportService:
                 )
             )
 
+        await progress.report(results)
         batch.status = UserImportStatus.COMMITTED
         batch.total_rows = len(parsed_rows)
         batch.valid_rows = len(parsed_rows) - failed_rows
@@ -444,6 +459,20 @@ class UserImportService:
                     )
                 )
 
+        for row_number, user, role in setup_emails:
+            try:
+                await self._send_account_setup_email(user, role)
+            except Exception:
+                warnings.append(
+                    PreflightIssue(
+                        row_number=row_number,
+                        field_name="email",
+                        severity=IssueSeverity.WARNING,
+                        message=f"Account setup email failed to send for {user.email}",
+                        raw_value=user.email,
+                    )
+                )
+
         return ImportResult(
             batch_id=str(batch.id),
             created_rows=created_rows,
@@ -496,6 +525,12 @@ class UserImportService:
             return "csv"
         raise UserImportError("Unsupported file type. Must be JSON or CSV.")
 
+    async def _load_rows(self, file_bytes: bytes, file_type: str) -> list[ParsedRow]:
+        """Parse a file, reusing the rows parsed at preflight when unchanged."""
+        return await ImportRowCache.get_or_parse(
+            f"users:{file_type}", file_bytes, lambda content: self._parse_file(content, file_type)
+        )
+
     def _parse_file(self, file_bytes: bytes, file_type: str) -> list[ParsedRow]:
         if file_type == "json":
             return self._parse_json(file_bytes)
@@ -504,61 +539,60 @@ class UserImportService:
         raise UserImportError(f"Unsupported file type: {file_type}")
 
     def _parse_json(self, file_bytes: bytes) -> list[ParsedRow]:
+        parsed_rows: list[ParsedRow] = []
+        found = 0
+        has_non_object = False
         try:
-            content = file_bytes.decode("utf-8")
-            data = json.loads(content)
+            for found, obj in enumerate(iter_json_array(file_bytes, "utf-8"), start=1):
+                if found > MAX_IMPORT_ROWS or has_non_object:
+                    continue  # Only counted, so the errors below keep their order
+                if not isinstance(obj, dict):
+                    has_non_object = True
+                    continue
+                row_data = {
+                    self._normalize_header(k): self._normalize_cell(v) for k, v in obj.items()
+                }
+                parsed_rows.append(ParsedRow(row_number=found, data=row_data))
+        except JSONArrayExpectedError as exc:
+            raise UserImportError("JSON must contain an array of user objects") from exc
         except (UnicodeDecodeError, json.JSONDecodeError) as exc:
             raise UserImportError(f"Invalid JSON file: {exc}") from exc
 
-        if not isinstance(data, list):
-            raise UserImportError("JSON must contain an array of user objects")
-
-        if not data:
+        if found == 0:
             raise UserImportError("JSON file contains no data")
 
-        if len(data) > MAX_IMPORT_ROWS:
-            raise UserImportError(
-                f"File exceeds maximum of {MAX_IMPORT_ROWS} rows (found {len(data)})"
-            )
+        if found > MAX_IMPORT_ROWS:
+            raise UserImportError(f"File exceeds maximum of {MAX_IMPORT_ROWS} rows (found {found})")
 
-        parsed_rows: list[ParsedRow] = []
-        for index, obj in enumerate(data, start=1):
-            if not isinstance(obj, dict):
-                raise UserImportError("JSON entries must be objects")
-            row_data = {self._normalize_header(k): self._normalize_cell(v) for k, v in obj.items()}
-            parsed_rows.append(ParsedRow(row_number=index, data=row_data))
-
-        if not parsed_rows:
-            raise UserImportError("JSON file contains no valid data rows")
+        if has_non_object:
+            raise UserImportError("JSON entries must be objects")
 
         return parsed_rows
 
     def _parse_csv(self, file_bytes: bytes) -> list[ParsedRow]:
+        records = iter_csv_records(file_bytes, "utf-8-sig")
         try:
-            content = file_bytes.decode("utf-8-sig")
-        except UnicodeDecodeError as exc:
-            raise UserImportError("CSV must be UTF-8 encoded") from exc
+            header_row = next(records, None)
+            if not header_row:
+                raise UserImportError("CSV is empty")
 
-        reader = csv.reader(io.StringIO(content))
-        header_row = next(reader, None)
-        if not header_row:
-            raise UserImportError("CSV is empty")
+            headers = [self._normalize_header(value) for value in header_row]
+            self._validate_required_headers(headers)
 
-        headers = [self._normalize_header(value) for value in header_row]
-        self._validate_required_headers(headers)
-
-        parsed_rows: list[ParsedRow] = []
-        for index, values in enumerate(reader, start=2):
-            if self._is_empty_row(values):
-                continue
-            if len(parsed_rows) >= MAX_IMPORT_ROWS:
-                raise UserImportError(f"CSV exceeds maximum of {MAX_IMPORT_ROWS} rows")
-
-            row_data = {
-                headers[i]: self._normalize_cell(values[i]) if i < len(values) else None
-                for i in range(len(headers))
-            }
-            parsed_rows.append(ParsedRow(row_number=index, data=row_data))
+            parsed_rows: list[ParsedRow] = []
+            for index, values in enumerate(records, start=2):
+                if self._is_empty_row(values):
+                    continue
+                if len(parsed_rows) >= MAX_IMPORT_ROWS:
+                    raise UserImportError(f"CSV exceeds maximum of {MAX_IMPORT_ROWS} rows")
+
+                row_data = {
+                    headers[i]: self._normalize_cell(values[i]) if i < len(values) else None
+                    for i in range(len(headers))
+                }
+                parsed_rows.append(ParsedRow(row_number=index, data=row_data))
+        except UnicodeDecodeError as exc:
+            raise UserImportError("CSV must be UTF-8 encoded") from exc
 
         if not parsed_rows:
             raise UserImportError("CSV contains no data rows")
@@ -667,8 +701,31 @@ class UserImportService:
             return False
         return True
 
-    def _generate_temp_password(self) -> str:
-        return f"Tmp{secrets.token_urlsafe(10)}1"
+    async def _hash_supplied_passwords(
+        self, rows: list[ValidatedRow], existing_users: dict[str, User]
+    ) -> dict[int, str]:
+        """Hash the passwords supplied for new users, in parallel and off the event loop."""
+        passwords: dict[int, str] = {}
+        for row in rows:
+            if row.errors or not row.email or row.email in existing_users:
+                continue
+            password = str(row.data.get("password") or "").strip()
+            if password:
+                passwords[row.row_number] = password
+        hashes = await asyncio.gather(*(hash_password_async(p) for p in passwords.values()))
+        return dict(zip(passwords, hashes, strict=True))
+
+    async def _send_account_setup_email(self, user: User, role: str) -> None:
+        setup_token = PasswordService.generate_reset_token()
+        await RedisService.store_account_setup_token(
+            PasswordService.hash_token(setup_token), user.id
+        )
+        await get_email_service().send_account_setup_email(
+            to_email=user.email,
+            setup_token=setup_token,
+            user_name=user.first_name,
+            role=role,
+        )
 
     async def _fetch_npo(self, npo_id: UUID) -> NPO:
         result = await self.db.execute(select(NPO).where(NPO.id == npo_id))
@@ -853,7 +910,7 @@ class UserImportService:
                         row_number=row.row_number,
                         field_name="password",
                         severity=IssueSeverity.WARNING,
-                        message="Temporary password will be generated and reset email sent",
+                        message="Account setup email will be sent so the user can set a password",
                     )
                 )
 
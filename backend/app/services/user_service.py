@@ -12,7 +12,7 @@ from math import ceil
 from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import hash_password
+from app.core.security import hash_password_async
 from app.models.npo_member import MemberRole, MemberStatus, NPOMember
 from app.models.user import User
 from app.schemas.users import (
@@ -281,7 +281,7 @@ class UserService:
             state=user_data.state,
             postal_code=user_data.postal_code,
             country=user_data.country,
-            password_hash=hash_password(password),
+            password_hash=await hash_password_async(password),
             role_id=role_id,
             must_change_password=True,  # Admin-created users must change on first login
             email_verified=False,  # Will need email verification
@@ -409,7 +409,7 @@ class UserService:
         if user_data.social_media_links is not None:
             user.social_media_links = user_data.social_media_links
         if user_data.password is not None:
-            user.password_hash = hash_password(user_data.password)
+            user.password_hash = await hash_password_async(user_data.password)
 
         await db.commit()
         await db.refresh(user)
@@ -0,0 +1,157 @@
+"""Async Web Push transport.
+
+Push services (FCM, Mozilla autopush, Apple) are a handful of HTTPS origins,
+so a batch of pushes is mostly many requests to the same few hosts. The sender
+keeps one pooled aiohttp session per origin, bounds concurrency across every
+send made through it, and reuses signed VAPID headers per audience until
+shortly before they expire instead of signing a new JWT for each request.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from types import TracebackType
+from urllib.parse import urlparse
+
+import aiohttp
+from py_vapid import Vapid02 as Vapid
+from pywebpush import WebPusher
+
+logger = logging.getLogger(__name__)
+
+# pywebpush's default VAPID token lifetime
+VAPID_TOKEN_LIFETIME_SECONDS = 12 * 60 * 60
+# Re-sign this long before a cached token expires
+VAPID_REFRESH_MARGIN_SECONDS = 10 * 60
+
+# Push service responses meaning the subscription no longer exists
+GONE_STATUSES = frozenset({404, 410})
+
+
+class VapidHeaderCache:
+    """Signed VAPID Authorization headers cached per push-service audience."""
+
+    def __init__(self, private_key: str, subject: str) -> None:
+        self._vapid = Vapid.from_string(private_key=private_key)
+        self._subject = subject
+        self._headers: dict[str, tuple[dict[str, str], float]] = {}
+        self._lock = threading.Lock()
+
+    def headers_for(self, audience: str) -> dict[str, str]:
+        """Get VAPID headers for an audience (``scheme://host`` of the endpoint)."""
+        now = time.time()
+        with self._lock:
+            cached = self._headers.get(audience)
+            if cached is not None and cached[1] - VAPID_REFRESH_MARGIN_SECONDS > now:
+                return dict(cached[0])
+
+            expires_at = int(now) + VAPID_TOKEN_LIFETIME_SECONDS
+            headers = self._vapid.sign({"sub": self._subject, "aud": audience, "exp": expires_at})
+            self._headers[audience] = (headers, expires_at)
+            return dict(headers)
+
+
+@dataclass
+class PushResult:
+    """Outcome of one push request."""
+
+    status: int | None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status is not None and 200 <= self.status < 300
+
+    @property
+    def gone(self) -> bool:
+        """The push service no longer knows this subscription."""
+        return self.status in GONE_STATUSES
+
+
+class WebPushSender:
+    """Concurrent Web Push client with one connection pool per push-service origin.
+
+    Sessions are bound to the event loop they were created on, so use one
+    sender per loop and close it when the loop shuts down (or scope it with
+    ``async with WebPushSender(...) as sender``).
+    """
+
+    def __init__(
+        self,
+        vapid: VapidHeaderCache,
+        max_concurrency: int = 50,
+        connections_per_origin: int = 20,
+        timeout_seconds: float = 10.0,
+    ) -> None:
+        self._vapid = vapid
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._connections_per_origin = connections_per_origin
+        self._timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+        self._sessions: dict[str, aiohttp.ClientSession] = {}
+
+    async def __aenter__(self) -> "WebPushSender":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close every pooled session."""
+        sessions, self._sessions = self._sessions, {}
+        await asyncio.gather(*(session.close() for session in sessions.values()))
+
+    def _session_for(self, origin: str) -> aiohttp.ClientSession:
+        session = self._sessions.get(origin)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._connections_per_origin),
+                timeout=self._timeout,
+            )
+            self._sessions[origin] = session
+        return session
+
+    async def send(
+        self,
+        endpoint: str,
+        p256dh_key: str,
+        auth_key: str,
+        payload: str,
+        ttl: int = 86400,
+        urgency: str = "high",
+    ) -> PushResult:
+        """Encrypt and send one payload to one subscription.
+
+        Never raises for delivery failures; inspect the returned PushResult.
+        """
+        url = urlparse(endpoint)
+        origin = f"{url.scheme}://{url.netloc}"
+        headers = {"Urgency": urgency, **self._vapid.headers_for(origin)}
+        try:
+            pusher = WebPusher(
+                {"endpoint": endpoint, "keys": {"p256dh": p256dh_key, "auth": auth_key}},
+                aiohttp_session=self._session_for(origin),
+            )
+            async with self._semaphore:
+                response = await pusher.send_async(
+                    payload,
+                    headers,
+                    ttl=ttl,
+                    content_encoding="aes128gcm",
+                    timeout=self._timeout,
+                )
+        except (aiohttp.ClientError, TimeoutError) as exc:
+            return PushResult(status=None, error=str(exc) or type(exc).__name__)
+        except Exception as exc:
+            logger.exception("Unexpected error sending push", extra={"origin": origin})
+            return PushResult(status=None, error=str(exc) or type(exc).__name__)
+        status: int = response.status
+        if status > 202:
+            return PushResult(status=status, error=response.reason)
+        return PushResult(status=status)
@@ -4,26 +4,11 @@ from typing import Any
 
 from app.celery_app import celery_app
 from app.core.logging import get_logger
+from app.core.worker_runtime import run_async
 
 logger = get_logger(__name__)
 
 
-def _run_async(coro: Any) -> Any:
-    """Run an async coroutine from a sync Celery task."""
-    import asyncio
-
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                return pool.submit(asyncio.run, coro).result()
-        return loop.run_until_complete(coro)
-    except RuntimeError:
-        return asyncio.run(coro)
-
-
 @celery_app.task(  # type: ignore[misc]
     bind=True,
     name="app.tasks.checkout_tasks.auto_open_checkout_task",
@@ -37,7 +22,7 @@ def auto_open_checkout_task(self: Any, event_id_str: str) -> None:
         extra={"event_id": event_id_str},
     )
     try:
-        _run_async(_auto_open_checkout_async(event_id_str))
+        run_async(_auto_open_checkout_async(event_id_str))
     except Exception as exc:
         logger.exception(
             f"auto_open_checkout_task failed for event {event_id_str}, will retry",
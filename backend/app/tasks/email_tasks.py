@@ -0,0 +1,56 @@
+"""Celery task that retries transactional emails the provider failed transiently.
+
+EmailService sends on the caller's path; when the provider throttles or is
+briefly unavailable the rendered message is queued here with a backoff
+countdown instead of being retried with a sleep inside the request or task.
+"""
+
+from typing import Any
+
+from app.celery_app import celery_app
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.metrics import EMAIL_FAILURES_TOTAL
+from app.core.worker_runtime import run_async
+from app.services.email_service import EmailService
+from app.services.email_transport import (
+    EmailSendError,
+    OutboundEmail,
+    TransientEmailError,
+    get_email_transport,
+)
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+@celery_app.task(  # type: ignore[misc]
+    name="app.tasks.email_tasks.send_email_task",
+)
+def send_email_task(payload: dict[str, Any], attempt: int = 1) -> bool:
+    """Send a requeued email, queueing another attempt on transient failure.
+
+    Args:
+        payload: OutboundEmail.to_payload() of the rendered email
+        attempt: Retry number (1 for the first retry)
+
+    Returns:
+        True if the email was sent.
+    """
+    message = OutboundEmail.from_payload(payload)
+    extra = {"email_type": message.email_type, "to_email": message.to_email, "attempt": attempt}
+    try:
+        run_async(get_email_transport().send(message))
+    except TransientEmailError as exc:
+        EMAIL_FAILURES_TOTAL.inc()
+        if attempt >= settings.email_max_retries:
+            logger.error("Email sending failed after all retries", extra=extra)
+            return False
+        EmailService.requeue(message, attempt + 1, exc.retry_after)
+        return False
+    except EmailSendError:
+        EMAIL_FAILURES_TOTAL.inc()
+        logger.exception("Email sending failed", extra=extra)
+        return False
+    logger.info("Requeued email sent", extra=extra)
+    return True
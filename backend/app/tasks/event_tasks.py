@@ -1,13 +1,8 @@
 """Event-related background tasks.
 
-NOTE: Celery is not yet configured in this project. These are placeholder
-functions that should be converted to Celery tasks when Celery is set up.
-
-To set up Celery:
-1. Add celery to pyproject.toml dependencies
-2. Create app/celery_app.py with Celery configuration
-3. Add @celery_app.task decorator to these functions
-4. Configure celery beat for periodic tasks
+``close_expired_events`` is a Celery task fired by the timer dispatcher when
+an event's auto-close timer comes due. The remaining functions are
+placeholders that should be converted to Celery tasks when they are needed.
 """
 
 import logging
@@ -17,12 +12,28 @@ import pytz
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.celery_app import celery_app
 from app.core.metrics import EVENTS_CLOSED_TOTAL
+from app.core.worker_runtime import run_async
 from app.models.event import Event, EventStatus
 
 logger = logging.getLogger(__name__)
 
 
+@celery_app.task(name="app.tasks.event_tasks.close_expired_events")  # type: ignore[misc]
+def close_expired_events() -> int:
+    """Close every active event more than 24 hours past its event_datetime."""
+    return run_async(_close_expired_events_async())
+
+
+async def _close_expired_events_async() -> int:
+    from app.core.database import AsyncSessionLocal
+    from app.services.event_service import close_expired_events as close_expired
+
+    async with AsyncSessionLocal() as db:
+        return await close_expired(db)
+
+
 async def close_expired_events_task(db: AsyncSession) -> int:
     """
     Background task: Close events 24 hours after event_datetime.
@@ -93,28 +104,9 @@ async def scan_uploaded_file_task(media_id: str) -> dict[str, bool | str]:
     return {"passed": True, "details": "Scan not implemented - auto-approved"}
 
 
-# Celery configuration example (when Celery is set up):
-#
-# from app.celery_app import celery_app
+# Celery configuration example (when virus scanning is implemented):
 #
-# @celery_app.task(name="event_tasks.close_expired_events")
-# def close_expired_events():
-#     """Celery task wrapper for close_expired_events_task."""
-#     from app.core.database import get_async_session
-#     async with get_async_session() as db:
-#         return await close_expired_events_task(db)
-#
-# @celery_app.task(name="event_tasks.scan_uploaded_file")
+# @celery_app.task(name="app.tasks.event_tasks.scan_uploaded_file")
 # def scan_uploaded_file(media_id: str):
 #     """Celery task wrapper for scan_uploaded_file_task."""
-#     from app.core.database import get_async_session
-#     async with get_async_session() as db:
-#         return await scan_uploaded_file_task(media_id)
-#
-# Celery Beat schedule:
-# celery_app.conf.beat_schedule = {
-#     "close-expired-events-every-15-minutes": {
-#         "task": "event_tasks.close_expired_events",
-#         "schedule": 900.0,  # 15 minutes in seconds
-#     },
-# }
+#     return run_async(scan_uploaded_file_task(media_id))
@@ -0,0 +1,46 @@
+"""Celery tasks that run committed bulk imports off the request path."""
+
+from __future__ import annotations
+
+import uuid
+
+from app.celery_app import celery_app
+from app.core.logging import get_logger
+from app.core.worker_runtime import run_async
+from app.services.import_job_service import reap_stale_import_jobs, run_import_job
+
+logger = get_logger(__name__)
+
+
+@celery_app.task(  # type: ignore[misc]
+    name="app.tasks.import_tasks.run_import_job_task",
+)
+def run_import_job_task(job_id: str) -> str | None:
+    """Run one queued import job.
+
+    Failures are recorded on the job rather than retried: most importers are
+    not safe to run twice over a partly imported file.
+
+    Args:
+        job_id: ImportJob UUID string
+
+    Returns:
+        The job's final status, or None if another delivery already ran it.
+    """
+    status = run_async(run_import_job(uuid.UUID(job_id)))
+    return status.value if status else None
+
+
+@celery_app.task(  # type: ignore[misc]
+    name="app.tasks.import_tasks.reap_stale_import_jobs_task",
+)
+def reap_stale_import_jobs_task() -> dict[str, int]:
+    """Re-queue or fail import jobs left running by a worker that stopped.
+
+    Returns:
+        Counts of re-queued and failed jobs
+    """
+    requeued, failed = run_async(reap_stale_import_jobs())
+    if requeued or failed:
+        logger.warning("Reaped stale import jobs", extra={"requeued": requeued, "failed": failed})
+    return {"requeued": requeued, "failed": failed}
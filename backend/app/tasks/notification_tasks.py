@@ -1,6 +1,8 @@
 """Celery tasks for notification delivery and lifecycle.
 
-All tasks run in the 'notifications' queue (configured in celery_app.py).
+Tasks are routed by urgency in celery_app.py: single-notification delivery
+and bid digests go to the 'realtime' queue, batched delivery and auction-wide
+fan-outs to 'bulk', and the expired-notification purge to 'maintenance'.
 """
 
 import asyncio
@@ -15,6 +17,7 @@ from sqlalchemy import delete, select
 from app.celery_app import celery_app
 from app.core.database import AsyncSessionLocal
 from app.core.logging import get_logger
+from app.core.worker_runtime import run_async
 from app.models.auction_bid import AuctionBid, BidStatus
 from app.models.event import Event
 from app.models.notification import (
@@ -29,13 +32,16 @@ from app.services.notification_scheduler import (
     send_auction_closing_soon,
     send_auction_opened_notification,
 )
-from app.services.notification_service import NotificationService
+from app.services.notification_service import BulkNotification, NotificationService
 from app.websocket.notification_ws import sio
 
 logger = get_logger(__name__)
 
 _URL_PATTERN = re.compile(r"https?://[^\s)]+")
 
+# Concurrent sends per batched SMS delivery task (email uses email_send_concurrency)
+SMS_SEND_CONCURRENCY = 5
+
 
 def _extract_first_url(text: str) -> str | None:
     match = _URL_PATTERN.search(text)
@@ -72,20 +78,6 @@ def _extract_item_id_from_url(raw_url: str) -> uuid.UUID | None:
         return None
 
 
-def _run_async(coro: Any) -> Any:
-    """Run an async coroutine from a sync Celery task."""
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                return pool.submit(asyncio.run, coro).result()
-        return loop.run_until_complete(coro)
-    except RuntimeError:
-        return asyncio.run(coro)
-
-
 @celery_app.task(name="app.tasks.notification_tasks.send_auction_opened_task")  # type: ignore[misc]
 def send_auction_opened_task(event_id: str) -> int:
     """Send auction-opened notifications to all registered donors.
@@ -97,7 +89,7 @@ def send_auction_opened_task(event_id: str) -> int:
         Number of notifications sent.
     """
     logger.info("Running send_auction_opened_task", extra={"event_id": event_id})
-    count: int = _run_async(_send_auction_opened_async(event_id))
+    count: int = run_async(_send_auction_opened_async(event_id))
     return count
 
 
@@ -130,7 +122,7 @@ def send_auction_closing_soon_task(event_id: str, minutes: int) -> int:
         "Running send_auction_closing_soon_task",
         extra={"event_id": event_id, "minutes": minutes},
     )
-    count: int = _run_async(_send_auction_closing_soon_async(event_id, minutes))
+    count: int = run_async(_send_auction_closing_soon_async(event_id, minutes))
     return count
 
 
@@ -162,7 +154,7 @@ def send_auction_closed_task(event_id: str) -> int:
         Total notifications sent.
     """
     logger.info("Running send_auction_closed_task", extra={"event_id": event_id})
-    count: int = _run_async(_send_auction_closed_async(event_id))
+    count: int = run_async(_send_auction_closed_async(event_id))
     return count
 
 
@@ -190,58 +182,31 @@ async def _send_auction_closed_async(event_id: str) -> int:
             winning_result = await db.execute(winning_bids_stmt)
             winning_bids = list(winning_result.scalars().all())
 
-            winner_user_ids: set[uuid.UUID] = set()
-            sent = 0
-            created_notifications: list[tuple[str, list[DeliveryChannelEnum]]] = []
+            winner_user_ids = {bid.user_id for bid in winning_bids}
 
-            # Notify winners
-            for bid in winning_bids:
-                winner_user_ids.add(bid.user_id)
-                try:
-                    # Fetch primary image for thumbnail
-                    from app.models.auction_item import AuctionItemMedia
+            # Primary images for every won item in one query
+            from app.core.config import get_settings
+            from app.services.auction_item_media_service import AuctionItemMediaService
 
-                    media_result = await db.execute(
-                        select(AuctionItemMedia.file_path)
-                        .where(
-                            AuctionItemMedia.auction_item_id == bid.auction_item_id,
-                            AuctionItemMedia.media_type == "image",
-                        )
-                        .order_by(AuctionItemMedia.display_order)
-                        .limit(1)
-                    )
-                    item_image_url: str | None = None
-                    raw_image_url = media_result.scalar_one_or_none()
-                    if raw_image_url:
-                        if raw_image_url.startswith("https://"):
-                            try:
-                                from app.core.config import get_settings
-                                from app.services.auction_item_media_service import (
-                                    AuctionItemMediaService,
-                                )
-
-                                _settings = get_settings()
-                                _media_svc = AuctionItemMediaService(_settings, db)
-                                container_path = f"{_settings.azure_storage_container_name}/"
-                                if container_path in raw_image_url:
-                                    blob_path = raw_image_url.split(container_path, 1)[1]
-                                    blob_path = blob_path.split("?", 1)[0]
-                                    item_image_url = _media_svc._generate_blob_sas_url(
-                                        blob_path, expiry_hours=24
-                                    )
-                                else:
-                                    item_image_url = raw_image_url
-                            except Exception:
-                                item_image_url = raw_image_url
-                        else:
-                            item_image_url = raw_image_url
+            media_service = AuctionItemMediaService(get_settings(), db)
+            image_paths = await media_service.get_primary_image_paths(
+                list({bid.auction_item_id for bid in winning_bids})
+            )
+            image_urls: dict[uuid.UUID, str] = {}
+            for item_id, path in image_paths.items():
+                try:
+                    image_urls[item_id] = media_service.get_read_url(path) or path
+                except Exception:
+                    image_urls[item_id] = path
 
-                    notification = await NotificationService.create_notification(
-                        db=db,
-                        event_id=event_uuid,
+            # Notify winners
+            won_notifications = await NotificationService.create_notifications_bulk(
+                db=db,
+                event_id=event_uuid,
+                notification_type=NotificationTypeEnum.ITEM_WON,
+                recipients=[
+                    BulkNotification(
                         user_id=bid.user_id,
-                        notification_type=NotificationTypeEnum.ITEM_WON,
-                        priority=NotificationPriorityEnum.HIGH,
                         title="Congratulations! You won! 🎉",
                         body=(
                             f"You won an auction item at {event_name} "
@@ -252,19 +217,18 @@ async def _send_auction_closed_async(event_id: str) -> int:
                             "deep_link": f"/events/{event_slug}?item={bid.auction_item_id}",
                             "animation_type": "confetti",
                             "bid_amount": str(bid.bid_amount),
-                            **({"image_url": item_image_url} if item_image_url else {}),
+                            **(
+                                {"image_url": image_urls[bid.auction_item_id]}
+                                if bid.auction_item_id in image_urls
+                                else {}
+                            ),
                         },
-                        sio=sio,
-                        dispatch_tasks=False,
-                    )
-                    channels = getattr(notification, "_resolved_channels", [])
-                    created_notifications.append((str(notification.id), channels))
-                    sent += 1
-                except Exception:
-                    logger.warning(
-                        "Failed to create item won notification",
-                        extra={"user_id": str(bid.user_id), "bid_id": str(bid.id)},
                     )
+                    for bid in winning_bids
+                ],
+                priority=NotificationPriorityEnum.HIGH,
+                sio=sio,
+            )
 
             # Find all participants who didn't win
             all_bidders_stmt = (
@@ -275,39 +239,33 @@ async def _send_auction_closed_async(event_id: str) -> int:
             non_winners = all_bidder_ids - winner_user_ids
 
             # Notify non-winners
-            for user_id in non_winners:
-                try:
-                    notification = await NotificationService.create_notification(
-                        db=db,
-                        event_id=event_uuid,
+            thanks_notifications = await NotificationService.create_notifications_bulk(
+                db=db,
+                event_id=event_uuid,
+                notification_type=NotificationTypeEnum.AUCTION_CLOSED,
+                recipients=[
+                    BulkNotification(
                         user_id=user_id,
-                        notification_type=NotificationTypeEnum.AUCTION_CLOSED,
-                        priority=NotificationPriorityEnum.NORMAL,
                         title="Auction has ended",
                         body=(
                             f"Thank you for participating in the {event_name} auction! "
                             "Your support makes a difference."
                         ),
-                        data={
-                            "deep_link": f"/events/{event_slug}?tab=auction",
-                        },
-                        sio=sio,
-                        dispatch_tasks=False,
-                    )
-                    channels = getattr(notification, "_resolved_channels", [])
-                    created_notifications.append((str(notification.id), channels))
-                    sent += 1
-                except Exception:
-                    logger.warning(
-                        "Failed to create auction closed notification",
-                        extra={"user_id": str(user_id)},
+                        data={"deep_link": f"/events/{event_slug}?tab=auction"},
                     )
+                    for user_id in non_winners
+                ],
+                priority=NotificationPriorityEnum.NORMAL,
+                sio=sio,
+            )
+            sent = len(won_notifications) + len(thanks_notifications)
 
             await db.commit()
 
             # Dispatch delivery tasks after commit
-            for notif_id, channels in created_notifications:
-                NotificationService.dispatch_delivery_tasks(notif_id, channels)
+            NotificationService.dispatch_delivery_tasks_bulk(
+                [*won_notifications, *thanks_notifications]
+            )
             logger.info(
                 "Sent auction closed notifications",
                 extra={
@@ -335,7 +293,7 @@ def purge_expired_notifications() -> int:
         Number of notifications purged.
     """
     logger.info("Running purge_expired_notifications")
-    count: int = _run_async(_purge_expired_async())
+    count: int = run_async(_purge_expired_async())
     return count
 
 
@@ -377,7 +335,7 @@ def send_push_notification_task(self: Any, notification_id: str) -> bool:
         extra={"notification_id": notification_id},
     )
     try:
-        success: bool = _run_async(_send_push_async(notification_id))
+        success: bool = run_async(_send_push_async(notification_id))
         return success
     except Exception as exc:
         logger.exception(
@@ -404,6 +362,129 @@ async def _send_push_async(notification_id: str) -> bool:
             return False
 
 
+@celery_app.task(  # type: ignore[misc]
+    name="app.tasks.notification_tasks.send_push_notification_batch_task",
+    bind=True,
+    max_retries=1,
+)
+def send_push_notification_batch_task(self: Any, notification_ids: list[str]) -> int:
+    """Send push notifications for a chunk of notifications.
+
+    Args:
+        notification_ids: Notification UUID strings
+
+    Returns:
+        Number of notifications with at least one successful push.
+    """
+    logger.info(
+        "Running send_push_notification_batch_task",
+        extra={"notification_count": len(notification_ids)},
+    )
+    try:
+        sent: int = run_async(_send_push_batch_async(notification_ids))
+        return sent
+    except Exception as exc:
+        logger.exception(
+            "send_push_notification_batch_task failed",
+            extra={"notification_count": len(notification_ids)},
+        )
+        raise self.retry(exc=exc) from exc
+
+
+async def _send_push_batch_async(notification_ids: list[str]) -> int:
+    from app.services.push_notification_service import PushNotificationService
+
+    async with AsyncSessionLocal() as db:
+        try:
+            results = await PushNotificationService.send_push_batch(
+                db, [uuid.UUID(notification_id) for notification_id in notification_ids]
+            )
+            await db.commit()
+            return sum(results.values())
+        except Exception:
+            await db.rollback()
+            logger.exception(
+                "Failed to send push notification batch",
+                extra={"notification_count": len(notification_ids)},
+            )
+            return 0
+
+
+# ---------------------------------------------------------------------------
+# Coalesced bid notification delivery
+# ---------------------------------------------------------------------------
+@celery_app.task(  # type: ignore[misc]
+    name="app.tasks.notification_tasks.send_bid_digest_task",
+    bind=True,
+    max_retries=1,
+)
+def send_bid_digest_task(
+    self: Any,
+    event_id: str,
+    user_id: str,
+    item_id: str,
+    notification_id: str,
+    channels: list[str],
+) -> bool:
+    """Deliver the latest bid notification of a closed coalescing window.
+
+    Args:
+        event_id: Event UUID string
+        user_id: Recipient user UUID string
+        item_id: Auction item UUID string
+        notification_id: Latest notification in the window
+        channels: External channels resolved for it
+
+    Returns:
+        True if delivery tasks were dispatched.
+    """
+    logger.info(
+        "Running send_bid_digest_task",
+        extra={"notification_id": notification_id, "item_id": item_id},
+    )
+    try:
+        dispatched: bool = run_async(
+            _send_bid_digest_async(event_id, user_id, item_id, notification_id, channels)
+        )
+        return dispatched
+    except Exception as exc:
+        logger.exception(
+            "send_bid_digest_task failed",
+            extra={"notification_id": notification_id, "item_id": item_id},
+        )
+        raise self.retry(exc=exc) from exc
+
+
+async def _send_bid_digest_async(
+    event_id: str,
+    user_id: str,
+    item_id: str,
+    notification_id: str,
+    channels: list[str],
+) -> bool:
+    from app.services.bid_notification_coalescer import BidNotificationCoalescer
+
+    async with AsyncSessionLocal() as db:
+        try:
+            deliver = await BidNotificationCoalescer.release(
+                db,
+                uuid.UUID(event_id),
+                uuid.UUID(user_id),
+                uuid.UUID(item_id),
+                uuid.UUID(notification_id),
+            )
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+    if deliver:
+        NotificationService.dispatch_delivery_tasks(
+            notification_id, [DeliveryChannelEnum(channel) for channel in channels]
+        )
+    return deliver
+
+
 # ---------------------------------------------------------------------------
 # T050: Checkout reminder task
 # ---------------------------------------------------------------------------
@@ -423,7 +504,7 @@ def send_checkout_reminders_task(self: Any, event_id: str) -> int:
     """
     logger.info("Running send_checkout_reminders_task", extra={"event_id": event_id})
     try:
-        count: int = _run_async(_send_checkout_reminders_async(event_id))
+        count: int = run_async(_send_checkout_reminders_async(event_id))
         return count
     except Exception as exc:
         logger.exception("send_checkout_reminders_task failed", extra={"event_id": event_id})
@@ -470,42 +551,32 @@ async def _send_checkout_reminders_async(event_id: str) -> int:
             reg_ids = {row[0] for row in reg_result.all()}
 
             all_recipients = set(donor_ids) | reg_ids
-            sent = 0
-            created_notifications: list[tuple[str, list[DeliveryChannelEnum]]] = []
 
-            for user_id in all_recipients:
-                try:
-                    notification = await NotificationService.create_notification(
-                        db=db,
-                        event_id=event_uuid,
+            notifications = await NotificationService.create_notifications_bulk(
+                db=db,
+                event_id=event_uuid,
+                notification_type=NotificationTypeEnum.CHECKOUT_REMINDER,
+                recipients=[
+                    BulkNotification(
                         user_id=user_id,
-                        notification_type=NotificationTypeEnum.CHECKOUT_REMINDER,
-                        priority=NotificationPriorityEnum.URGENT,
                         title="Time to check out!",
                         body=(
                             f"Please visit the checkout area at {event_name} "
                             "to complete your purchases."
                         ),
-                        data={
-                            "deep_link": f"/events/{event_slug}",
-                        },
-                        sio=sio,
-                        dispatch_tasks=False,
-                    )
-                    channels = getattr(notification, "_resolved_channels", [])
-                    created_notifications.append((str(notification.id), channels))
-                    sent += 1
-                except Exception:
-                    logger.warning(
-                        "Failed to create checkout reminder",
-                        extra={"user_id": str(user_id), "event_id": event_id},
+                        data={"deep_link": f"/events/{event_slug}"},
                     )
+                    for user_id in all_recipients
+                ],
+                priority=NotificationPriorityEnum.URGENT,
+                sio=sio,
+            )
+            sent = len(notifications)
 
             await db.commit()
 
             # Dispatch delivery tasks after commit
-            for notif_id, channels in created_notifications:
-                NotificationService.dispatch_delivery_tasks(notif_id, channels)
+            NotificationService.dispatch_delivery_tasks_bulk(notifications)
             logger.info(
                 "Sent checkout reminders",
                 extra={"event_id": event_id, "sent_count": sent},
@@ -539,7 +610,7 @@ def deliver_campaign_task(self: Any, campaign_id: str) -> int:
     """
     logger.info("Running deliver_campaign_task", extra={"campaign_id": campaign_id})
     try:
-        count: int = _run_async(_deliver_campaign_async(campaign_id))
+        count: int = run_async(_deliver_campaign_async(campaign_id))
         return count
     except Exception as exc:
         logger.exception("deliver_campaign_task failed", extra={"campaign_id": campaign_id})
@@ -547,9 +618,12 @@ def deliver_campaign_task(self: Any, campaign_id: str) -> int:
 
 
 async def _deliver_campaign_async(campaign_id: str) -> int:
+    from app.core.config import get_settings
     from app.models.event_registration import EventRegistration
+    from app.services.auction_item_media_service import AuctionItemMediaService
 
     async with AsyncSessionLocal() as db:
+        media_service = AuctionItemMediaService(get_settings(), db)
         try:
             campaign_uuid = uuid.UUID(campaign_id)
 
@@ -730,7 +804,7 @@ async def _deliver_campaign_async(campaign_id: str) -> int:
                     notification_data["item_id"] = str(message_item_uuid)
                     notification_data["link_label"] = "View item"
 
-                    from app.models.auction_item import AuctionItem, AuctionItemMedia
+                    from app.models.auction_item import AuctionItem
 
                     linked_item_result = await db.execute(
                         select(AuctionItem.title, AuctionItem.id).where(
@@ -748,47 +822,19 @@ async def _deliver_campaign_async(campaign_id: str) -> int:
                                 f"/events/{event_slug}?item={linked_item_row.id}"
                             )
 
-                        linked_media_result = await db.execute(
-                            select(AuctionItemMedia.file_path)
-                            .where(
-                                AuctionItemMedia.auction_item_id == message_item_uuid,
-                                AuctionItemMedia.media_type == "image",
-                            )
-                            .order_by(AuctionItemMedia.display_order)
-                            .limit(1)
+                        linked_image_paths = await media_service.get_primary_image_paths(
+                            [message_item_uuid]
                         )
-                        linked_media_row = linked_media_result.scalar_one_or_none()
-                        if linked_media_row:
-                            # Generate SAS URL for blob storage images
-                            if linked_media_row.startswith("https://"):
-                                try:
-                                    from app.core.config import get_settings
-                                    from app.services.auction_item_media_service import (
-                                        AuctionItemMediaService,
-                                    )
-
-                                    _settings = get_settings()
-                                    _media_svc = AuctionItemMediaService(_settings, db)
-                                    container_path = f"{_settings.azure_storage_container_name}/"
-                                    if container_path in linked_media_row:
-                                        blob_path = linked_media_row.split(container_path, 1)[1]
-                                        blob_path = blob_path.split("?", 1)[0]
-                                        notification_data["image_url"] = (
-                                            _media_svc._generate_blob_sas_url(
-                                                blob_path, expiry_hours=24
-                                            )
-                                        )
-                                    else:
-                                        notification_data["image_url"] = linked_media_row
-                                except Exception:
-                                    notification_data["image_url"] = linked_media_row
-                            else:
-                                notification_data["image_url"] = linked_media_row
+                        linked_image_url = media_service.get_read_url(
+                            linked_image_paths.get(message_item_uuid)
+                        )
+                        if linked_image_url:
+                            notification_data["image_url"] = linked_image_url
 
             if recipient_type in {"item", "item_watchers", "item_bidders"} and criteria.get(
                 "item_id"
             ):
-                from app.models.auction_item import AuctionItem, AuctionItemMedia
+                from app.models.auction_item import AuctionItem
 
                 item_uuid = uuid.UUID(criteria["item_id"])
                 item_result = await db.execute(
@@ -813,76 +859,32 @@ async def _deliver_campaign_async(campaign_id: str) -> int:
                     if event_slug:
                         notification_data["deep_link"] = f"/events/{event_slug}?item={item_row.id}"
                     # Get first image for thumbnail
-                    media_result = await db.execute(
-                        select(AuctionItemMedia.file_path)
-                        .where(
-                            AuctionItemMedia.auction_item_id == item_uuid,
-                            AuctionItemMedia.media_type == "image",
-                        )
-                        .order_by(AuctionItemMedia.display_order)
-                        .limit(1)
-                    )
-                    media_row = media_result.scalar_one_or_none()
-                    if media_row:
-                        # Generate SAS URL for blob storage images
-                        if media_row.startswith("https://"):
-                            try:
-                                from app.core.config import get_settings
-                                from app.services.auction_item_media_service import (
-                                    AuctionItemMediaService,
-                                )
-
-                                _settings = get_settings()
-                                _media_svc = AuctionItemMediaService(_settings, db)
-                                container_path = f"{_settings.azure_storage_container_name}/"
-                                if container_path in media_row:
-                                    blob_path = media_row.split(container_path, 1)[1]
-                                    blob_path = blob_path.split("?", 1)[0]
-                                    notification_data["image_url"] = (
-                                        _media_svc._generate_blob_sas_url(
-                                            blob_path, expiry_hours=24
-                                        )
-                                    )
-                                else:
-                                    notification_data["image_url"] = media_row
-                            except Exception:
-                                notification_data["image_url"] = media_row
-                        else:
-                            notification_data["image_url"] = media_row
-
-            sent = 0
-            failed = 0
-            # Collect created notifications so we can dispatch delivery tasks
-            # AFTER the transaction commits (avoids transaction-isolation issues
-            # when Celery runs in eager / synchronous mode).
-            created_notifications: list[tuple[str, list[DeliveryChannelEnum]]] = []
-
-            for user_id in unique_user_ids:
-                try:
-                    notification = await NotificationService.create_notification(
-                        db=db,
-                        event_id=event_id,
+                    image_paths = await media_service.get_primary_image_paths([item_uuid])
+                    image_url = media_service.get_read_url(image_paths.get(item_uuid))
+                    if image_url:
+                        notification_data["image_url"] = image_url
+
+            notifications = await NotificationService.create_notifications_bulk(
+                db=db,
+                event_id=event_id,
+                notification_type=NotificationTypeEnum.CUSTOM,
+                recipients=[
+                    BulkNotification(
                         user_id=user_id,
-                        notification_type=NotificationTypeEnum.CUSTOM,
-                        priority=NotificationPriorityEnum.NORMAL,
                         title=notification_title,
                         body=campaign.message,
-                        campaign_id=campaign.id,
-                        created_by=campaign.sender_id,
                         data=notification_data,
-                        sio=sio,
-                        override_channels=override_channels,
-                        dispatch_tasks=False,
-                    )
-                    channels = getattr(notification, "_resolved_channels", override_channels)
-                    created_notifications.append((str(notification.id), channels))
-                    sent += 1
-                except Exception:
-                    failed += 1
-                    logger.warning(
-                        "Failed to create campaign notification",
-                        extra={"user_id": str(user_id), "campaign_id": campaign_id},
                     )
+                    for user_id in unique_user_ids
+                ],
+                priority=NotificationPriorityEnum.NORMAL,
+                campaign_id=campaign.id,
+                created_by=campaign.sender_id,
+                sio=sio,
+                override_channels=override_channels,
+            )
+            sent = len(notifications)
+            failed = len(unique_user_ids) - sent
 
             campaign.delivered_count = sent
             campaign.failed_count = failed
@@ -893,8 +895,7 @@ async def _deliver_campaign_async(campaign_id: str) -> int:
             # Now that the transaction is committed, dispatch delivery tasks
             # so the Celery workers (or eager inline execution) can read the
             # notification rows from the database.
-            for notif_id, channels in created_notifications:
-                NotificationService.dispatch_delivery_tasks(notif_id, channels)
+            NotificationService.dispatch_delivery_tasks_bulk(notifications)
 
             logger.info(
                 "Campaign delivered",
@@ -933,123 +934,213 @@ async def _deliver_campaign_async(campaign_id: str) -> int:
     bind=True,
     max_retries=1,
 )
-def send_email_notification_task(self: Any, notification_id: str) -> bool:
+def send_email_notification_task(self: Any, notification_id: str, attempt: int = 0) -> bool:
     """Send email notification for a given notification.
 
     Args:
         notification_id: Notification UUID string
+        attempt: Times the email was requeued after a transient provider failure
 
     Returns:
         True if email was sent successfully.
     """
     logger.info(
         "Running send_email_notification_task",
-        extra={"notification_id": notification_id},
+        extra={"notification_id": notification_id, "attempt": attempt},
     )
     try:
-        success: bool = _run_async(_send_email_notification_async(notification_id))
-        return success
+        sent, retry_ids, retry_after = run_async(
+            _send_email_notification_batch_async([notification_id], attempt)
+        )
     except Exception as exc:
         logger.exception(
             "send_email_notification_task failed",
             extra={"notification_id": notification_id},
         )
         raise self.retry(exc=exc) from exc
+    if retry_ids:
+        _requeue_email(send_email_notification_task, notification_id, attempt, retry_after)
+    return sent == 1
 
 
-async def _send_email_notification_async(notification_id: str) -> bool:
-    from app.models.notification_delivery_status import NotificationDeliveryStatus
+@celery_app.task(  # type: ignore[misc]
+    name="app.tasks.notification_tasks.send_email_notification_batch_task",
+    bind=True,
+    max_retries=1,
+)
+def send_email_notification_batch_task(
+    self: Any, notification_ids: list[str], attempt: int = 0
+) -> int:
+    """Send email notifications for a chunk of notifications.
+
+    Emails the provider failed transiently stay pending and are requeued
+    together as a smaller batch with exponential backoff.
+
+    Args:
+        notification_ids: Notification UUID strings
+        attempt: Times this chunk was requeued after transient provider failures
+
+    Returns:
+        Number of emails sent successfully.
+    """
+    logger.info(
+        "Running send_email_notification_batch_task",
+        extra={"notification_count": len(notification_ids), "attempt": attempt},
+    )
+    try:
+        sent, retry_ids, retry_after = run_async(
+            _send_email_notification_batch_async(notification_ids, attempt)
+        )
+    except Exception as exc:
+        logger.exception(
+            "send_email_notification_batch_task failed",
+            extra={"notification_count": len(notification_ids)},
+        )
+        raise self.retry(exc=exc) from exc
+    if retry_ids:
+        _requeue_email(send_email_notification_batch_task, retry_ids, attempt, retry_after)
+    return sent
+
+
+def _requeue_email(task: Any, target: Any, attempt: int, retry_after: float | None) -> None:
+    """Queue the transiently failed part of an email delivery task again."""
+    from app.services.email_transport import retry_delay_seconds
+
+    countdown = retry_delay_seconds(attempt + 1, retry_after)
+    try:
+        task.apply_async(args=[target], kwargs={"attempt": attempt + 1}, countdown=countdown)
+    except Exception:
+        logger.warning(
+            "Failed to requeue email notifications",
+            extra={"task": task.name, "attempt": attempt + 1},
+        )
+
+
+async def _send_email_notification_batch_async(
+    notification_ids: list[str], attempt: int = 0
+) -> tuple[int, list[str], float | None]:
+    """Render and send notification emails over one pooled transport batch.
+
+    Returns:
+        Emails sent, IDs to retry after a transient provider failure (their
+        deliveries stay pending) and the largest Retry-After hint among them.
+        On the last allowed attempt transient failures are recorded as failed.
+    """
+    from sqlalchemy.orm import selectinload
+
+    from app.api.v1.event_media_urls import resolve_event_logo_url
+    from app.core.config import get_settings
+    from app.models.notification import DeliveryStatusEnum
+    from app.models.npo import NPO
     from app.models.user import User
     from app.services.email_service import get_email_service
+    from app.services.email_transport import OutboundEmail
+    from app.services.notification_service import DeliveryOutcome
 
     async with AsyncSessionLocal() as db:
         try:
-            notif_uuid = uuid.UUID(notification_id)
-            stmt = select(Notification).where(Notification.id == notif_uuid)
-            result = await db.execute(stmt)
-            notification = result.scalar_one_or_none()
-            if not notification:
-                return False
+            notif_result = await db.execute(
+                select(Notification).where(
+                    Notification.id.in_([uuid.UUID(n) for n in notification_ids])
+                )
+            )
+            notifications = list(notif_result.scalars().all())
+            if not notifications:
+                return 0, [], None
 
-            # Get user email
+            # Recipients, events (with media for the logo) and NPOs, one query each
             user_result = await db.execute(
-                select(User.email, User.first_name).where(User.id == notification.user_id)
+                select(User.id, User.email, User.first_name).where(
+                    User.id.in_({n.user_id for n in notifications})
+                )
             )
-            user_row = user_result.one_or_none()
-            if not user_row:
-                return False
-
-            email, first_name = user_row
-
-            # Resolve event logo and NPO slug for branded email
-            event_logo_url: str | None = None
-            npo_slug: str | None = None
-            npo_name: str | None = None
-            primary_color: str | None = None
-            if notification.event_id:
-                from sqlalchemy.orm import selectinload
+            users = {row.id: row for row in user_result.all()}
 
-                from app.api.v1.event_media_urls import resolve_event_logo_url
-                from app.models.npo import NPO
+            event_ids = {n.event_id for n in notifications if n.event_id}
+            events: dict[uuid.UUID, Event] = {}
+            if event_ids:
+                event_result = await db.execute(
+                    select(Event).options(selectinload(Event.media)).where(Event.id.in_(event_ids))
+                )
+                events = {event.id: event for event in event_result.scalars().all()}
 
-                event_with_media_result = await db.execute(
-                    select(Event)
-                    .options(selectinload(Event.media))
-                    .where(Event.id == notification.event_id)
+            npo_ids = {event.npo_id for event in events.values() if event.npo_id}
+            npos: dict[uuid.UUID, Any] = {}
+            if npo_ids:
+                npo_result = await db.execute(
+                    select(NPO.id, NPO.slug, NPO.name).where(NPO.id.in_(npo_ids))
                 )
-                event_row_full = event_with_media_result.scalar_one_or_none()
-                if event_row_full:
-                    event_logo_url = resolve_event_logo_url(event_row_full)
-                    primary_color = event_row_full.primary_color
-                if event_row_full and event_row_full.npo_id:
-                    npo_result = await db.execute(
-                        select(NPO.slug, NPO.name).where(NPO.id == event_row_full.npo_id)
-                    )
-                    npo_row = npo_result.one_or_none()
-                    if npo_row:
-                        npo_slug = npo_row.slug
-                        npo_name = npo_row.name
+                npos = {row.id: row for row in npo_result.all()}
 
-            # Send branded notification email via EmailService (T072)
             email_service = get_email_service()
-            notification_data: dict[str, object] | None = (
-                dict(notification.data) if notification.data else None
-            )
-            await email_service.send_notification_email(
-                to_email=email,
-                notification_type=notification.notification_type.value,
-                title=notification.title,
-                body=notification.body,
-                donor_name=first_name,
-                data=notification_data,
-                event_logo_url=event_logo_url,
-                npo_slug=npo_slug,
-                primary_color=primary_color,
-                npo_name=npo_name,
-            )
-
-            # Update delivery status
-            from app.models.notification import DeliveryChannelEnum, DeliveryStatusEnum
+            outcomes: dict[uuid.UUID, DeliveryOutcome] = {}
+            messages: list[OutboundEmail] = []
+            message_owners: list[uuid.UUID] = []
+            for notification in notifications:
+                user_row = users.get(notification.user_id)
+                if not user_row:
+                    outcomes[notification.id] = (DeliveryStatusEnum.SKIPPED, "user_not_found")
+                    continue
+                event = events.get(notification.event_id) if notification.event_id else None
+                npo_row = npos.get(event.npo_id) if event and event.npo_id else None
+                try:
+                    message = email_service.build_notification_email(
+                        to_email=user_row.email,
+                        notification_type=notification.notification_type.value,
+                        title=notification.title,
+                        body=notification.body,
+                        donor_name=user_row.first_name,
+                        data=dict(notification.data) if notification.data else None,
+                        event_logo_url=resolve_event_logo_url(event) if event else None,
+                        npo_slug=npo_row.slug if npo_row else None,
+                        primary_color=event.primary_color if event else None,
+                        npo_name=npo_row.name if npo_row else None,
+                    )
+                except Exception:
+                    logger.exception(
+                        "Failed to render email notification",
+                        extra={"notification_id": str(notification.id)},
+                    )
+                    outcomes[notification.id] = (DeliveryStatusEnum.FAILED, "send_failed")
+                    continue
+                messages.append(message)
+                message_owners.append(notification.id)
+
+            final_attempt = attempt >= get_settings().email_max_retries
+            retry_ids: list[str] = []
+            retry_after: float | None = None
+            results = await email_service.send_batch(messages) if messages else []
+            for notification_id, send_result in zip(message_owners, results, strict=True):
+                if send_result.ok:
+                    outcomes[notification_id] = (DeliveryStatusEnum.SENT, None)
+                elif send_result.transient and not final_attempt:
+                    retry_ids.append(str(notification_id))
+                    hint = getattr(send_result.error, "retry_after", None)
+                    if hint is not None:
+                        retry_after = max(retry_after or 0.0, hint)
+                else:
+                    logger.warning(
+                        "Failed to send email notification",
+                        extra={
+                            "notification_id": str(notification_id),
+                            "error": str(send_result.error),
+                        },
+                    )
+                    outcomes[notification_id] = (DeliveryStatusEnum.FAILED, "send_failed")
 
-            delivery_stmt = select(NotificationDeliveryStatus).where(
-                NotificationDeliveryStatus.notification_id == notif_uuid,
-                NotificationDeliveryStatus.channel == DeliveryChannelEnum.EMAIL,
+            await NotificationService.record_delivery_outcomes(
+                db, DeliveryChannelEnum.EMAIL, outcomes
             )
-            delivery_result = await db.execute(delivery_stmt)
-            delivery = delivery_result.scalar_one_or_none()
-            if delivery:
-                delivery.status = DeliveryStatusEnum.SENT
-                delivery.sent_at = datetime.now(UTC)
-
             await db.commit()
-            return True
+            sent = sum(1 for status, _ in outcomes.values() if status == DeliveryStatusEnum.SENT)
+            return sent, retry_ids, retry_after
         except Exception:
             await db.rollback()
             logger.exception(
-                "Failed to send email notification",
-                extra={"notification_id": notification_id},
+                "Failed to send email notification batch",
+                extra={"notification_count": len(notification_ids)},
             )
-            return False
+            return 0, [], None
 
 
 # ---------------------------------------------------------------------------
@@ -1074,7 +1165,7 @@ def send_sms_notification_task(self: Any, notification_id: str) -> bool:
         extra={"notification_id": notification_id},
     )
     try:
-        success: bool = _run_async(_send_sms_notification_async(notification_id))
+        success: bool = run_async(_send_sms_notification_async(notification_id))
         return success
     except Exception as exc:
         logger.exception(
@@ -1147,3 +1238,100 @@ async def _send_sms_notification_async(notification_id: str) -> bool:
                 extra={"notification_id": notification_id},
             )
             return False
+
+
+@celery_app.task(  # type: ignore[misc]
+    name="app.tasks.notification_tasks.send_sms_notification_batch_task",
+    bind=True,
+    max_retries=1,
+)
+def send_sms_notification_batch_task(self: Any, notification_ids: list[str]) -> int:
+    """Send SMS notifications for a chunk of notifications.
+
+    Args:
+        notification_ids: Notification UUID strings
+
+    Returns:
+        Number of SMS messages sent successfully.
+    """
+    logger.info(
+        "Running send_sms_notification_batch_task",
+        extra={"notification_count": len(notification_ids)},
+    )
+    try:
+        sent: int = run_async(_send_sms_notification_batch_async(notification_ids))
+        return sent
+    except Exception as exc:
+        logger.exception(
+            "send_sms_notification_batch_task failed",
+            extra={"notification_count": len(notification_ids)},
+        )
+        raise self.retry(exc=exc) from exc
+
+
+async def _send_sms_notification_batch_async(notification_ids: list[str]) -> int:
+    from app.models.notification import DeliveryStatusEnum
+    from app.models.user import User
+    from app.services.notification_service import DeliveryOutcome
+    from app.services.sms_service import send_sms
+
+    async with AsyncSessionLocal() as db:
+        try:
+            notif_result = await db.execute(
+                select(Notification).where(
+                    Notification.id.in_([uuid.UUID(n) for n in notification_ids])
+                )
+            )
+            notifications = list(notif_result.scalars().all())
+            if not notifications:
+                return 0
+
+            phone_result = await db.execute(
+                select(User.id, User.phone).where(User.id.in_({n.user_id for n in notifications}))
+            )
+            phones = {row.id: row.phone for row in phone_result.all()}
+
+            semaphore = asyncio.Semaphore(SMS_SEND_CONCURRENCY)
+            outcomes: dict[uuid.UUID, DeliveryOutcome] = {}
+
+            async def _send(notification: Notification) -> None:
+                phone = phones.get(notification.user_id)
+                if not phone:
+                    logger.info(
+                        "No phone number for SMS notification",
+                        extra={"notification_id": str(notification.id)},
+                    )
+                    outcomes[notification.id] = (DeliveryStatusEnum.SKIPPED, "no_phone_number")
+                    return
+
+                # Compose <=160 char message
+                body = notification.body or notification.title or ""
+                if len(body) > 157:
+                    body = body[:157] + "..."
+
+                try:
+                    async with semaphore:
+                        await send_sms(phone, body)
+                except Exception:
+                    logger.exception(
+                        "Failed to send SMS notification",
+                        extra={"notification_id": str(notification.id)},
+                    )
+                    outcomes[notification.id] = (DeliveryStatusEnum.FAILED, "send_failed")
+                    return
+                outcomes[notification.id] = (DeliveryStatusEnum.SENT, None)
+
+            await asyncio.gather(*(_send(notification) for notification in notifications))
+
+            await NotificationService.record_delivery_outcomes(
+                db, DeliveryChannelEnum.SMS, outcomes
+            )
+            await db.commit()
+            return sum(1 for status, _ in outcomes.values() if status == DeliveryStatusEnum.SENT)
+        except Exception:
+            await db.rollback()
+            logger.exception(
+                "Failed to send SMS notification batch",
+                extra={"notification_count": len(notification_ids)},
+            )
+            return 0
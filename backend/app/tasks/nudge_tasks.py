@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import uuid
 from datetime import UTC, datetime
 from typing import Any
@@ -10,9 +9,10 @@ from typing import Any
 from sqlalchemy import delete, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from app.celery_app import celery_app
+from app.celery_app import BULK_QUEUE, celery_app
 from app.core.database import AsyncSessionLocal
 from app.core.logging import get_logger
+from app.core.worker_runtime import run_async
 from app.models.event import Event, EventStatus
 from app.models.event_nudge_notification_log import EventNudgeNotificationLog
 from app.models.notification import NotificationPriorityEnum, NotificationTypeEnum
@@ -27,7 +27,7 @@ logger = get_logger(__name__)
 def nudge_scan_task(self: Any, event_id: str) -> dict[str, Any]:
     """Compute nudges for one active event and dispatch notifications for new rank 1/2 nudges."""
     try:
-        return asyncio.run(_scan_event(event_id))
+        return run_async(_scan_event(event_id))
     except Exception as exc:
         logger.error("nudge_scan_task failed for event %s: %s", event_id, exc, exc_info=True)
         raise self.retry(exc=exc, countdown=60) from exc
@@ -38,7 +38,7 @@ def nudge_scan_task(self: Any, event_id: str) -> dict[str, Any]:
 )
 def fan_out_nudge_scans_task() -> dict[str, Any]:
     """Query all ACTIVE events and dispatch a nudge_scan_task for each."""
-    return asyncio.run(_fan_out())
+    return run_async(_fan_out())
 
 
 async def _fan_out() -> dict[str, Any]:
@@ -124,7 +124,9 @@ async def _scan_event(event_id_str: str) -> dict[str, Any]:
 
         for notification_id, channels in pending_dispatches:
             try:
-                NotificationService.dispatch_delivery_tasks(notification_id, channels)
+                NotificationService.dispatch_delivery_tasks(
+                    notification_id, channels, queue=BULK_QUEUE
+                )
             except Exception as exc:
                 logger.warning(
                     "Failed to dispatch delivery tasks for nudge notification %s: %s",
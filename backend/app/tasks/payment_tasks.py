@@ -7,7 +7,6 @@ T058: retry_failed_receipts — full implementation.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import uuid
 from datetime import UTC
@@ -19,8 +18,9 @@ if TYPE_CHECKING:
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
-from app.core.celery_app import celery_app
+from app.celery_app import celery_app
 from app.core.database import AsyncSessionLocal
+from app.core.worker_runtime import run_async
 from app.models.payment_receipt import PaymentReceipt
 from app.models.payment_transaction import PaymentTransaction, TransactionStatus
 from app.services.receipt_service import ReceiptService
@@ -74,7 +74,7 @@ def generate_and_send_receipt(self: celery.Task, transaction_id: str) -> None:
             await service.generate_and_deliver(txn)
 
     try:
-        asyncio.run(_run())
+        run_async(_run())
     except Exception as exc:
         logger.error(
             "generate_and_send_receipt failed",
@@ -128,7 +128,7 @@ def expire_pending_transactions() -> None:
             await db.commit()
             logger.info("expire_pending_transactions complete: %d expired", len(pending))
 
-    asyncio.run(_run())
+    run_async(_run())
 
 
 # ── T058 ───────────────────────────────────────────────────────────────────────
@@ -180,4 +180,4 @@ def retry_failed_receipts() -> None:
                     receipt,
                 )
 
-    asyncio.run(_run())
+    run_async(_run())
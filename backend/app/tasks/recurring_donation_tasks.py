@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 
 from app.celery_app import celery_app
+from app.core.worker_runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +13,7 @@ logger = logging.getLogger(__name__)
 @celery_app.task(name="app.tasks.recurring_donation_tasks.process_monthly_donations")  # type: ignore[misc]
 def process_monthly_donations() -> dict[str, int]:
     """Daily task: charge all active recurring donations due today."""
-    return asyncio.get_event_loop().run_until_complete(_async_process_monthly())
+    return run_async(_async_process_monthly())
 
 
 async def _async_process_monthly() -> dict[str, int]:
@@ -1,30 +1,16 @@
 """Celery tasks for Run-of-Show notification delivery."""
 
-import asyncio
 import uuid
 from typing import Any
 
 from app.celery_app import celery_app
 from app.core.database import AsyncSessionLocal
 from app.core.logging import get_logger
+from app.core.worker_runtime import run_async
 
 logger = get_logger(__name__)
 
 
-def _run_async(coro: Any) -> Any:
-    """Run an async coroutine from a sync Celery task."""
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                return pool.submit(asyncio.run, coro).result()
-        return loop.run_until_complete(coro)
-    except RuntimeError:
-        return asyncio.run(coro)
-
-
 @celery_app.task(  # type: ignore[misc]
     bind=True,
     name="app.tasks.run_of_show_tasks.send_ros_notification_task",
@@ -38,7 +24,7 @@ def send_ros_notification_task(self: Any, notification_id: str) -> None:
         extra={"notification_id": notification_id},
     )
     try:
-        _run_async(_send_ros_notification_async(notification_id))
+        run_async(_send_ros_notification_async(notification_id))
     except Exception as exc:
         logger.exception(
             f"send_ros_notification_task failed for {notification_id}, will retry",
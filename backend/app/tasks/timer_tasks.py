@@ -0,0 +1,126 @@
+"""Celery beat task that fires due timer wheel timers.
+
+Each due timer is handed to the task that does the actual work, on that
+task's own queue, so the dispatcher itself stays fast. A timer whose task
+cannot be enqueued is put back on the wheel to be retried shortly after.
+"""
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from app.celery_app import celery_app
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.worker_runtime import run_async
+from app.services.timer_wheel import (
+    AUCTION_CLOSING_SOON,
+    BID_DIGEST,
+    CHECKOUT_AUTO_OPEN,
+    CHECKOUT_REMINDER,
+    EVENT_AUTO_CLOSE,
+    DueTimer,
+    TimerWheel,
+)
+
+logger = get_logger(__name__)
+
+# Upper bound on batches per run so one backlog cannot pin the dispatcher
+MAX_BATCHES_PER_RUN = 10
+
+
+def _fire_auction_closing_soon(timer: DueTimer) -> None:
+    from app.tasks.notification_tasks import send_auction_closing_soon_task
+
+    send_auction_closing_soon_task.delay(str(timer.event_id), int(timer.payload["minutes"]))
+
+
+def _fire_checkout_reminder(timer: DueTimer) -> None:
+    from app.tasks.notification_tasks import send_checkout_reminders_task
+
+    send_checkout_reminders_task.delay(str(timer.event_id))
+
+
+def _fire_checkout_auto_open(timer: DueTimer) -> None:
+    from app.tasks.checkout_tasks import auto_open_checkout_task
+
+    auto_open_checkout_task.delay(str(timer.event_id))
+
+
+def _fire_event_auto_close(timer: DueTimer) -> None:
+    from app.tasks.event_tasks import close_expired_events
+
+    close_expired_events.delay()
+
+
+def _fire_bid_digest(timer: DueTimer) -> None:
+    from app.services.bid_notification_coalescer import BidNotificationCoalescer
+    from app.tasks.notification_tasks import send_bid_digest_task
+
+    user_id, item_id = BidNotificationCoalescer.parse_timer_kind(timer.kind)
+    send_bid_digest_task.delay(
+        str(timer.event_id),
+        str(user_id),
+        str(item_id),
+        timer.payload["notification_id"],
+        timer.payload["channels"],
+    )
+
+
+TIMER_HANDLERS: dict[str, Callable[[DueTimer], None]] = {
+    AUCTION_CLOSING_SOON: _fire_auction_closing_soon,
+    CHECKOUT_REMINDER: _fire_checkout_reminder,
+    CHECKOUT_AUTO_OPEN: _fire_checkout_auto_open,
+    EVENT_AUTO_CLOSE: _fire_event_auto_close,
+    BID_DIGEST: _fire_bid_digest,
+}
+
+
+@celery_app.task(name="app.tasks.timer_tasks.dispatch_due_timers_task")  # type: ignore[misc]
+def dispatch_due_timers_task() -> int:
+    """Fire every due timer (scheduled by beat).
+
+    Returns:
+        Number of timers fired.
+    """
+    return run_async(_dispatch_due_timers_async())
+
+
+async def _dispatch_due_timers_async() -> int:
+    settings = get_settings()
+    batch_size = settings.timer_dispatch_batch_size
+    fired = 0
+
+    for _ in range(MAX_BATCHES_PER_RUN):
+        timers = await TimerWheel.claim_due(batch_size)
+        for timer in timers:
+            if await _fire(timer, settings.timer_retry_delay_seconds):
+                fired += 1
+        if len(timers) < batch_size:
+            break
+
+    if fired:
+        logger.info("Fired due timers", extra={"count": fired})
+    return fired
+
+
+async def _fire(timer: DueTimer, retry_delay_seconds: int) -> bool:
+    """Run a timer's handler, putting the timer back on the wheel if it fails."""
+    handler = TIMER_HANDLERS.get(timer.family)
+    if handler is None:
+        logger.error(
+            "Dropping timer of unknown kind",
+            extra={"event_id": str(timer.event_id), "kind": timer.kind},
+        )
+        return False
+
+    try:
+        handler(timer)
+    except Exception:
+        logger.exception(
+            "Timer handler failed, retrying later",
+            extra={"event_id": str(timer.event_id), "kind": timer.kind},
+        )
+        retry_at = datetime.now(UTC) + timedelta(seconds=retry_delay_seconds)
+        await TimerWheel.upsert(timer.event_id, timer.kind, retry_at, timer.payload)
+        return False
+    return True
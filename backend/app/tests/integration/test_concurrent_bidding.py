@@ -0,0 +1,256 @@
+"""Integration tests for per-item bid serialization under concurrent load."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.security import hash_password
+from app.models.auction_bid import AuctionBid, BidStatus, BidType
+from app.models.auction_item import AuctionItem, AuctionType, ItemStatus
+from app.models.event import Event, EventStatus
+from app.models.event_registration import EventRegistration
+from app.models.npo import NPO, NPOStatus
+from app.models.registration_guest import RegistrationGuest
+from app.models.user import User
+from app.services.auction_bid_service import AuctionBidService, BidConflictError
+
+pytestmark = pytest.mark.asyncio
+
+BIDDER_COUNT = 8
+
+
+@dataclass
+class CommittedAuction:
+    """Auction fixtures committed outside the per-test rollback transaction."""
+
+    event_id: uuid.UUID
+    user_ids: list[uuid.UUID]
+
+
+async def _create_item(
+    engine: AsyncEngine,
+    event_id: uuid.UUID,
+    created_by: uuid.UUID,
+    **overrides: Any,
+) -> uuid.UUID:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        item = AuctionItem(
+            event_id=event_id,
+            created_by=created_by,
+            bid_number=100,
+            title="Closing Rush Item",
+            description="Hot item during the final minutes",
+            auction_type=AuctionType.SILENT.value,
+            starting_bid=Decimal("100.00"),
+            bid_increment=Decimal("10.00"),
+            min_next_bid_amount=Decimal("100.00"),
+            quantity_available=1,
+            status=ItemStatus.PUBLISHED.value,
+            **overrides,
+        )
+        session.add(item)
+        await session.commit()
+        return item.id
+
+
+@pytest_asyncio.fixture
+async def committed_auction(test_engine: AsyncEngine) -> AsyncGenerator[CommittedAuction, None]:
+    """Commit an event with several registered bidders so parallel sessions can see it."""
+    suffix = uuid.uuid4().hex[:8]
+    async with AsyncSession(test_engine, expire_on_commit=False) as session:
+        donor_role_id: uuid.UUID = (
+            await session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
+        ).scalar_one()
+        users = [
+            User(
+                email=f"rush-{suffix}-{index}@test.com",
+                first_name="Rush",
+                last_name=f"Bidder {index}",
+                password_hash=hash_password("TestPass123"),
+                email_verified=True,
+                is_active=True,
+                role_id=donor_role_id,
+            )
+            for index in range(BIDDER_COUNT)
+        ]
+        session.add_all(users)
+        await session.flush()
+
+        npo = NPO(
+            name=f"Rush NPO {suffix}",
+            slug=f"rush-npo-{suffix}",
+            email=f"rush-{suffix}@testnpo.org",
+            status=NPOStatus.APPROVED,
+            created_by_user_id=users[0].id,
+        )
+        session.add(npo)
+        await session.flush()
+
+        event = Event(
+            npo_id=npo.id,
+            name="Closing Rush Gala",
+            slug=f"closing-rush-{suffix}",
+            status=EventStatus.ACTIVE,
+            event_datetime=datetime.now(UTC) + timedelta(days=1),
+            timezone="America/New_York",
+            venue_name="FundrBolt Hall",
+            version=1,
+            created_by=users[0].id,
+            updated_by=users[0].id,
+        )
+        session.add(event)
+        await session.flush()
+
+        for index, user in enumerate(users):
+            registration = EventRegistration(event_id=event.id, user_id=user.id, number_of_guests=1)
+            session.add(registration)
+            await session.flush()
+            session.add(
+                RegistrationGuest(
+                    registration_id=registration.id,
+                    user_id=user.id,
+                    name=f"{user.first_name} {user.last_name}",
+                    email=user.email,
+                    is_primary=True,
+                    bidder_number=500 + index,
+                )
+            )
+        await session.commit()
+
+        auction = CommittedAuction(event_id=event.id, user_ids=[user.id for user in users])
+        npo_id = npo.id
+
+    try:
+        yield auction
+    finally:
+        async with AsyncSession(test_engine) as session:
+            await session.execute(delete(Event).where(Event.id == auction.event_id))
+            await session.execute(delete(NPO).where(NPO.id == npo_id))
+            await session.execute(delete(User).where(User.id.in_(auction.user_ids)))
+            await session.commit()
+
+
+async def _place_bid_in_own_session(
+    engine: AsyncEngine,
+    user_id: uuid.UUID,
+    event_id: uuid.UUID,
+    item_id: uuid.UUID,
+    bid_amount: Decimal,
+    bid_type: BidType,
+) -> AuctionBid | Exception:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        try:
+            return await AuctionBidService(session).place_bid(
+                user_id=user_id,
+                event_id=event_id,
+                auction_item_id=item_id,
+                bid_amount=bid_amount,
+                bid_type=bid_type,
+            )
+        except (BidConflictError, ValueError) as exc:
+            return exc
+
+
+async def _latest_bid_records(engine: AsyncEngine, item_id: uuid.UUID) -> list[AuctionBid]:
+    async with AsyncSession(engine) as session:
+        superseded = select(AuctionBid.source_bid_id).where(AuctionBid.source_bid_id.isnot(None))
+        result = await session.execute(
+            select(AuctionBid).where(
+                AuctionBid.auction_item_id == item_id,
+                AuctionBid.id.not_in(superseded),
+            )
+        )
+        return list(result.scalars().all())
+
+
+async def test_parallel_regular_bids_accept_only_one_at_same_amount(
+    test_engine: AsyncEngine, committed_auction: CommittedAuction
+) -> None:
+    item_id = await _create_item(
+        test_engine, committed_auction.event_id, committed_auction.user_ids[0]
+    )
+
+    results = await asyncio.gather(
+        *[
+            _place_bid_in_own_session(
+                test_engine,
+                user_id,
+                committed_auction.event_id,
+                item_id,
+                Decimal("100.00"),
+                BidType.REGULAR,
+            )
+            for user_id in committed_auction.user_ids
+        ]
+    )
+
+    accepted = [result for result in results if isinstance(result, AuctionBid)]
+    rejected = [result for result in results if isinstance(result, Exception)]
+    assert len(accepted) == 1
+    assert len(rejected) == BIDDER_COUNT - 1
+
+    latest = await _latest_bid_records(test_engine, item_id)
+    leaders = [
+        bid for bid in latest if bid.bid_status in {BidStatus.ACTIVE.value, BidStatus.WINNING.value}
+    ]
+    assert len(leaders) == 1
+    assert leaders[0].id == accepted[0].id
+
+    async with AsyncSession(test_engine) as session:
+        item = await session.get(AuctionItem, item_id)
+        assert item is not None
+        assert item.current_high_bid_id == accepted[0].id
+        assert item.bid_count == 1
+
+
+async def test_parallel_buy_now_does_not_oversell(
+    test_engine: AsyncEngine, committed_auction: CommittedAuction
+) -> None:
+    item_id = await _create_item(
+        test_engine,
+        committed_auction.event_id,
+        committed_auction.user_ids[0],
+        buy_now_enabled=True,
+        buy_now_price=Decimal("250.00"),
+        quantity_available=1,
+    )
+
+    results = await asyncio.gather(
+        *[
+            _place_bid_in_own_session(
+                test_engine,
+                user_id,
+                committed_auction.event_id,
+                item_id,
+                Decimal("250.00"),
+                BidType.BUY_NOW,
+            )
+            for user_id in committed_auction.user_ids
+        ]
+    )
+
+    accepted = [result for result in results if isinstance(result, AuctionBid)]
+    assert len(accepted) == 1
+
+    async with AsyncSession(test_engine) as session:
+        winners = (
+            await session.execute(
+                select(AuctionBid).where(
+                    AuctionBid.auction_item_id == item_id,
+                    AuctionBid.bid_type == BidType.BUY_NOW.value,
+                    AuctionBid.bid_status == BidStatus.WINNING.value,
+                )
+            )
+        ).scalars()
+        assert len(list(winners)) == 1
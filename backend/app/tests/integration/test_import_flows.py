@@ -2,19 +2,42 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import Any
+from uuid import UUID
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.import_job import ImportJobStatus
+from app.services.import_job_service import run_import_job
 
 pytestmark = pytest.mark.asyncio
 
 
 async def test_user_import_preflight_commit_and_error_report(
     async_client: AsyncClient,
+    db_session: AsyncSession,
     test_super_admin_token: str,
     test_approved_npo: Any,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
 ) -> None:
+    from app.services import import_upload_storage
+    from app.tasks import import_tasks
+
+    queued: list[str] = []
+    monkeypatch.setattr(import_upload_storage.settings, "azure_storage_connection_string", None)
+    monkeypatch.setattr(import_upload_storage.settings, "import_upload_dir", str(tmp_path))
+    monkeypatch.setattr(
+        import_tasks.run_import_job_task,
+        "apply_async",
+        lambda args: queued.append(args[0]),
+    )
+
     headers = {"Authorization": f"Bearer {test_super_admin_token}"}
     file_bytes = (
         b'[{"email":"imported-user@example.com","full_name":"Imported User","role":"donor"}]'
@@ -36,8 +59,33 @@ async def test_user_import_preflight_commit_and_error_report(
         files={"file": ("users.json", file_bytes, "application/json")},
         headers=headers,
     )
-    assert commit_response.status_code == 200, commit_response.json()
-    assert commit_response.json()["created_rows"] == 1
+    assert commit_response.status_code == 202, commit_response.json()
+    job = commit_response.json()
+    assert job["kind"] == "users"
+    assert job["status"] == "queued"
+    assert queued == [job["id"]]
+
+    @asynccontextmanager
+    async def shared_session() -> AsyncIterator[AsyncSession]:
+        yield db_session
+
+    status = await run_import_job(UUID(job["id"]), session_factory=shared_session)
+    assert status == ImportJobStatus.COMPLETED
+
+    job_response = await async_client.get(f"/api/v1/admin/import-jobs/{job['id']}", headers=headers)
+    assert job_response.status_code == 200, job_response.json()
+    job = job_response.json()
+    assert job["status"] == "completed"
+    assert job["processed_rows"] == 1
+    assert job["result"]["created_rows"] == 1
+
+    rows_response = await async_client.get(
+        f"/api/v1/admin/import-jobs/{job['id']}/rows", headers=headers
+    )
+    assert rows_response.status_code == 200
+    assert rows_response.json()["rows"] == [
+        {"row_number": 1, "status": "created", "message": "User created"}
+    ]
 
     error_report_response = await async_client.post(
         "/api/v1/admin/users/import/error-report",
@@ -0,0 +1,48 @@
+"""Shared fixtures for unit tests."""
+
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+
+from app.services.import_reader import ParsedRow
+
+
+class FakeSession:
+    """Counts transaction calls; statements are never executed."""
+
+    def __init__(self) -> None:
+        self.commits = 0
+        self.rollbacks = 0
+        self.savepoints = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+    @asynccontextmanager
+    async def _savepoint(self) -> AsyncIterator[None]:
+        self.savepoints += 1
+        yield
+
+    def begin_nested(self) -> Any:
+        return self._savepoint()
+
+
+@pytest.fixture
+def fake_session() -> FakeSession:
+    """Session double for import services whose statements are patched out."""
+    return FakeSession()
+
+
+@pytest.fixture
+def make_row() -> Callable[..., ParsedRow]:
+    """Factory for parsed import rows: ``make_row(row_number, **data)``."""
+
+    def factory(row_number: int, **data: Any) -> ParsedRow:
+        return ParsedRow(row_number=row_number, data=data)
+
+    return factory
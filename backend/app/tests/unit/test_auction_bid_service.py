@@ -1,7 +1,9 @@
 """Unit tests for AuctionBidService."""
 
 from decimal import Decimal
+from typing import Any
 from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
 
 import pytest
 from sqlalchemy import select
@@ -17,8 +19,8 @@ from app.services.notification_service import NotificationService
 
 async def _create_auction_item(
     db_session: AsyncSession,
-    event_id,
-    created_by,
+    event_id: UUID,
+    created_by: UUID,
     *,
     auction_type: AuctionType = AuctionType.SILENT,
     category: str | None = None,
@@ -55,8 +57,8 @@ async def _create_auction_item(
 
 async def _create_registration_for_user(
     db_session: AsyncSession,
-    event_id,
-    user_id,
+    event_id: UUID,
+    user_id: UUID,
 ) -> EventRegistration:
     registration = EventRegistration(
         event_id=event_id,
@@ -72,8 +74,8 @@ async def _create_registration_for_user(
 
 async def _create_bidder_number(
     db_session: AsyncSession,
-    registration_id,
-    user_id,
+    registration_id: UUID,
+    user_id: UUID,
     bidder_number: int,
 ) -> RegistrationGuest:
     stmt = select(RegistrationGuest).where(
@@ -106,8 +108,8 @@ class TestAuctionBidService:
     async def test_place_bid_requires_bidder_number(
         self,
         db_session: AsyncSession,
-        test_event,
-        test_donor_user,
+        test_event: Any,
+        test_donor_user: Any,
     ) -> None:
         service = AuctionBidService(db_session)
         item = await _create_auction_item(
@@ -128,9 +130,9 @@ class TestAuctionBidService:
     async def test_place_bid_validates_minimum_bid(
         self,
         db_session: AsyncSession,
-        test_event,
-        test_donor_user,
-        test_registration,
+        test_event: Any,
+        test_donor_user: Any,
+        test_registration: Any,
     ) -> None:
         service = AuctionBidService(db_session)
         item = await _create_auction_item(
@@ -160,9 +162,9 @@ class TestAuctionBidService:
     async def test_buy_now_bid_sets_winning_status(
         self,
         db_session: AsyncSession,
-        test_event,
-        test_donor_user,
-        test_registration,
+        test_event: Any,
+        test_donor_user: Any,
+        test_registration: Any,
     ) -> None:
         service = AuctionBidService(db_session)
         item = await _create_auction_item(
@@ -193,10 +195,10 @@ class TestAuctionBidService:
     async def test_buy_now_with_zero_quantity_is_unlimited(
         self,
         db_session: AsyncSession,
-        test_event,
-        test_donor_user,
-        test_registration,
-        test_user_2,
+        test_event: Any,
+        test_donor_user: Any,
+        test_registration: Any,
+        test_user_2: Any,
     ) -> None:
         service = AuctionBidService(db_session)
         item = await _create_auction_item(
@@ -249,9 +251,9 @@ class TestAuctionBidService:
     async def test_buy_now_ignores_confirmation_notification_failures(
         self,
         db_session: AsyncSession,
-        test_event,
-        test_donor_user,
-        test_registration,
+        test_event: Any,
+        test_donor_user: Any,
+        test_registration: Any,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         service = AuctionBidService(db_session)
@@ -297,9 +299,9 @@ class TestAuctionBidService:
     async def test_impact_item_rejects_regular_bids(
         self,
         db_session: AsyncSession,
-        test_event,
-        test_donor_user,
-        test_registration,
+        test_event: Any,
+        test_donor_user: Any,
+        test_registration: Any,
     ) -> None:
         service = AuctionBidService(db_session)
         item = await _create_auction_item(
@@ -327,7 +329,11 @@ class TestAuctionBidService:
             )
 
     async def test_proxy_auto_bidding_outbids_previous(
-        self, db_session: AsyncSession, test_event, test_donor_user, test_user_2
+        self,
+        db_session: AsyncSession,
+        test_event: Any,
+        test_donor_user: Any,
+        test_user_2: Any,
     ) -> None:
         service = AuctionBidService(db_session)
         item = await _create_auction_item(
@@ -381,16 +387,142 @@ class TestAuctionBidService:
             max_bid=Decimal("160.00"),
         )
 
+        # The higher maximum wins one increment above the losing maximum.
         current_high = await service._current_high_bid(item.id)
         assert current_high is not None
         assert current_high.user_id == test_user_2.id
-        assert current_high.bid_amount == Decimal("110.00")
+        assert current_high.bid_amount == Decimal("140.00")
+
+    async def test_proxy_max_defends_against_lower_bid(
+        self,
+        db_session: AsyncSession,
+        test_event: Any,
+        test_donor_user: Any,
+        test_user_2: Any,
+    ) -> None:
+        service = AuctionBidService(db_session)
+        item = await _create_auction_item(
+            db_session,
+            event_id=test_event.id,
+            created_by=test_donor_user.id,
+            auction_type=AuctionType.SILENT,
+            starting_bid=Decimal("100.00"),
+            bid_increment=Decimal("10.00"),
+        )
+        registration_one = await _create_registration_for_user(
+            db_session, event_id=test_event.id, user_id=test_donor_user.id
+        )
+        registration_two = await _create_registration_for_user(
+            db_session, event_id=test_event.id, user_id=test_user_2.id
+        )
+        await _create_bidder_number(
+            db_session,
+            registration_id=registration_one.id,
+            user_id=test_donor_user.id,
+            bidder_number=111,
+        )
+        await _create_bidder_number(
+            db_session,
+            registration_id=registration_two.id,
+            user_id=test_user_2.id,
+            bidder_number=222,
+        )
+
+        await service.place_bid(
+            user_id=test_donor_user.id,
+            event_id=test_event.id,
+            auction_item_id=item.id,
+            bid_amount=Decimal("100.00"),
+            bid_type=BidType.PROXY_AUTO,
+            max_bid=Decimal("200.00"),
+        )
+        challenger = await service.place_bid(
+            user_id=test_user_2.id,
+            event_id=test_event.id,
+            auction_item_id=item.id,
+            bid_amount=Decimal("150.00"),
+            bid_type=BidType.REGULAR,
+        )
+
+        assert challenger.bid_status == BidStatus.OUTBID.value
+        current_high = await service._current_high_bid(item.id)
+        assert current_high is not None
+        assert current_high.user_id == test_donor_user.id
+        assert current_high.bid_type == BidType.PROXY_AUTO.value
+        assert current_high.bid_amount == Decimal("160.00")
+
+        await db_session.refresh(item)
+        assert item.min_next_bid_amount == Decimal("170.00")
+        assert item.bid_count == 3
+
+    async def test_place_bid_maintains_materialized_high_bid_state(
+        self,
+        db_session: AsyncSession,
+        test_event: Any,
+        test_donor_user: Any,
+        test_user_2: Any,
+    ) -> None:
+        service = AuctionBidService(db_session)
+        item = await _create_auction_item(
+            db_session,
+            event_id=test_event.id,
+            created_by=test_donor_user.id,
+            starting_bid=Decimal("100.00"),
+            bid_increment=Decimal("10.00"),
+        )
+        registration_one = await _create_registration_for_user(
+            db_session, event_id=test_event.id, user_id=test_donor_user.id
+        )
+        registration_two = await _create_registration_for_user(
+            db_session, event_id=test_event.id, user_id=test_user_2.id
+        )
+        await _create_bidder_number(
+            db_session,
+            registration_id=registration_one.id,
+            user_id=test_donor_user.id,
+            bidder_number=111,
+        )
+        await _create_bidder_number(
+            db_session,
+            registration_id=registration_two.id,
+            user_id=test_user_2.id,
+            bidder_number=222,
+        )
+
+        await service.place_bid(
+            user_id=test_donor_user.id,
+            event_id=test_event.id,
+            auction_item_id=item.id,
+            bid_amount=Decimal("100.00"),
+            bid_type=BidType.REGULAR,
+        )
+        second = await service.place_bid(
+            user_id=test_user_2.id,
+            event_id=test_event.id,
+            auction_item_id=item.id,
+            bid_amount=Decimal("110.00"),
+            bid_type=BidType.REGULAR,
+        )
+
+        await db_session.refresh(item)
+        assert item.current_high_bid_id == second.id
+        assert item.current_bid_amount == Decimal("110.00")
+        assert item.min_next_bid_amount == Decimal("120.00")
+        assert item.bid_count == 2
+
+        await service.cancel_bid(second.id, actor_user_id=test_user_2.id, reason="Mistake")
+
+        await db_session.refresh(item)
+        assert item.current_high_bid_id is None
+        assert item.current_bid_amount is None
+        assert item.min_next_bid_amount == Decimal("100.00")
+        assert item.bid_count == 1
 
     async def test_get_bidder_number_with_duplicate_primary_rows(
         self,
         db_session: AsyncSession,
-        test_event,
-        test_donor_user,
+        test_event: Any,
+        test_donor_user: Any,
     ) -> None:
         service = AuctionBidService(db_session)
         registration = await _create_registration_for_user(
@@ -423,3 +555,80 @@ class TestAuctionBidService:
         bidder_number = await service._get_bidder_number(test_event.id, test_donor_user.id)
 
         assert bidder_number in {123, 456}
+
+
+@pytest.mark.asyncio
+class TestAuctionBidReports:
+    """Unit tests for event-scoped auction bid reports."""
+
+    async def test_reports_aggregate_event_bids(
+        self,
+        db_session: AsyncSession,
+        test_event: Any,
+        test_donor_user: Any,
+        test_user_2: Any,
+    ) -> None:
+        service = AuctionBidService(db_session)
+        item = await _create_auction_item(
+            db_session,
+            event_id=test_event.id,
+            created_by=test_donor_user.id,
+            starting_bid=Decimal("100.00"),
+            bid_increment=Decimal("10.00"),
+        )
+        idle_item = await _create_auction_item(
+            db_session, event_id=test_event.id, created_by=test_donor_user.id
+        )
+        for user, bidder_number in ((test_donor_user, 111), (test_user_2, 222)):
+            registration = await _create_registration_for_user(
+                db_session, event_id=test_event.id, user_id=user.id
+            )
+            await _create_bidder_number(
+                db_session,
+                registration_id=registration.id,
+                user_id=user.id,
+                bidder_number=bidder_number,
+            )
+
+        await service.place_bid(
+            user_id=test_donor_user.id,
+            event_id=test_event.id,
+            auction_item_id=item.id,
+            bid_amount=Decimal("100.00"),
+            bid_type=BidType.REGULAR,
+        )
+        await service.place_bid(
+            user_id=test_user_2.id,
+            event_id=test_event.id,
+            auction_item_id=item.id,
+            bid_amount=Decimal("125.00"),
+            bid_type=BidType.REGULAR,
+        )
+
+        performance = {
+            row["auction_item_id"]: row
+            for row in await service.report_item_performance(test_event.id)
+        }
+        assert performance[item.id]["total_bids"] == 2
+        assert performance[item.id]["unique_bidders"] == 2
+        assert performance[item.id]["final_price"] == Decimal("125.00")
+        assert performance[item.id]["proxy_used"] is False
+        assert performance[idle_item.id]["total_bids"] == 0
+        assert performance[idle_item.id]["final_price"] == Decimal("0.00")
+
+        wars = await service.report_bidding_wars(test_event.id)
+        assert len(wars) == 1
+        assert wars[0]["auction_item_id"] == item.id
+        assert wars[0]["participant_count"] == 2
+        assert wars[0]["escalation_amount"] == Decimal("25.00")
+        assert wars[0]["manual_vs_proxy_ratio"] == Decimal("2")
+
+        analytics = {
+            row["bidder_number"]: row
+            for row in await service.report_bidder_analytics(test_event.id)
+        }
+        assert analytics[111]["total_lost"] == Decimal("100.00")
+        assert analytics[222]["total_lost"] == Decimal("0.00")
+        assert analytics[222]["silent_total"] == Decimal("125.00")
+
+        assert await service.report_item_performance(uuid4()) == []
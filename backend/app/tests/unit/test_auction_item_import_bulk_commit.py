@@ -0,0 +1,176 @@
+"""Unit tests for the bulk commit path of AuctionItemImportService."""
+
+import threading
+import time
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.schemas.auction_item_import import (
+    AuctionItemImportRow,
+    ImportImageStatus,
+    ImportRowResult,
+    ImportRowStatus,
+)
+from app.services.auction_item_import_service import AuctionItemImportService, _PlannedItem
+from app.services.auction_item_service import AuctionItemService
+from app.services.import_reader import ParsedRow
+from app.tests.unit.conftest import FakeSession
+
+PNG_BYTES = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082"
+)
+
+
+def _service(session: FakeSession, **overrides: Any) -> AuctionItemImportService:
+    settings = get_settings().model_copy(
+        update={"azure_storage_connection_string": None, **overrides}
+    )
+    return AuctionItemImportService(cast(AsyncSession, session), settings)
+
+
+def _row(row_number: int, external_id: str, images: str) -> ParsedRow:
+    return ParsedRow(
+        row_number=row_number,
+        data={
+            "external_id": external_id,
+            "title": f"Item {external_id}",
+            "description": "A lovely thing",
+            "auction_type": "silent",
+            "category": "Experiences",
+            "starting_bid": "100",
+            "fair_market_value": "250",
+            "image_filenames": images,
+        },
+    )
+
+
+def _result(row: ParsedRow, status: ImportRowStatus = ImportRowStatus.CREATED) -> ImportRowResult:
+    return ImportRowResult(
+        row_number=row.row_number,
+        external_id=row.data["external_id"],
+        title=row.data["title"],
+        status=status,
+        message="Ready",
+        image_status=ImportImageStatus.OK,
+        image_count=1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_store_images_runs_in_bounded_pool(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, fake_session: FakeSession
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    service = _service(fake_session, auction_item_import_image_concurrency=2)
+    lock = threading.Lock()
+    running = {"now": 0, "max": 0}
+    process_image = service._process_image
+
+    def tracked(*args: Any) -> dict[str, Any]:
+        with lock:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+        try:
+            time.sleep(0.02)
+            if args[1] == "broken.png":
+                raise OSError("disk full")
+            return process_image(*args)
+        finally:
+            with lock:
+                running["now"] -= 1
+
+    monkeypatch.setattr(service, "_process_image", tracked)
+    rows = [_row(2, "A-1", "a.png, b.png, c.png"), _row(3, "A-2", "broken.png; d.png")]
+    image_files = dict.fromkeys(("a.png", "b.png", "c.png", "d.png", "broken.png"), PNG_BYTES)
+    plans = [
+        _PlannedItem(
+            result=_result(row),
+            row=AuctionItemImportRow(**service._coerce_row(row.data)),
+            item_id=uuid.uuid4(),
+        )
+        for row in rows
+    ]
+
+    errors = await service._store_images(
+        plans,
+        image_files,
+        SimpleNamespace(blob_service_client=None),  # type: ignore[arg-type]
+    )
+
+    assert running["max"] == 2
+    assert errors == {3: "Failed to store image broken.png: disk full"}
+    media = plans[0].media
+    assert [values["file_name"] for values in media] == ["a.png", "b.png", "c.png"]
+    assert [values["display_order"] for values in media] == [0, 1, 2]
+    assert media[0]["mime_type"] == "image/png"
+    assert Path(media[0]["file_path"]).read_bytes() == PNG_BYTES
+    assert str(plans[0].item_id) in media[0]["file_path"]
+
+
+@pytest.mark.asyncio
+async def test_commit_chunk_allocates_bid_numbers_and_isolates_failures(
+    monkeypatch: pytest.MonkeyPatch, fake_session: FakeSession
+) -> None:
+    service = _service(fake_session)
+    event_id = uuid.uuid4()
+    existing_id = uuid.uuid4()
+    rows = [
+        _row(2, "NEW-1", "a.png"),
+        _row(3, "OLD-1", "a.png"),
+        _row(4, "BAD-1", "a.png"),
+        _row(5, "NEW-2", "a.png"),
+    ]
+    chunk = [
+        _result(rows[0]),
+        _result(rows[1], ImportRowStatus.UPDATED),
+        _result(rows[2]),
+        _result(rows[3]),
+    ]
+    requested: list[int] = []
+    written: list[list[tuple[str, int | None]]] = []
+
+    async def store_images(plans: list[_PlannedItem], *args: Any) -> dict[int, str]:
+        return {}
+
+    async def bid_numbers(self: AuctionItemService, event: uuid.UUID, count: int) -> list[int]:
+        requested.append(count)
+        return [998, 999]
+
+    async def write_items(event: uuid.UUID, user: uuid.UUID, plans: list[_PlannedItem]) -> None:
+        written.append([(plan.row.external_id, plan.bid_number) for plan in plans])
+        if any(plan.row.external_id == "BAD-1" for plan in plans):
+            raise ValueError("value too long")
+
+    monkeypatch.setattr(service, "_store_images", store_images)
+    monkeypatch.setattr(AuctionItemService, "_get_next_bid_numbers", bid_numbers)
+    monkeypatch.setattr(service, "_write_items", write_items)
+
+    outcomes = await service._commit_chunk(
+        event_id,
+        uuid.uuid4(),
+        chunk,
+        {row.row_number: row for row in rows},
+        {"a.png": PNG_BYTES},
+        {"OLD-1": (existing_id, 101)},
+        SimpleNamespace(blob_service_client=None),  # type: ignore[arg-type]
+    )
+
+    assert requested == [3]
+    assert outcomes[5].status == ImportRowStatus.ERROR
+    assert outcomes[5].message == "Event has reached maximum auction items (900 items limit)"
+    assert outcomes[4].message == "value too long"
+    assert set(outcomes) == {4, 5}
+    assert written == [
+        [("NEW-1", 998), ("OLD-1", 101), ("BAD-1", 999)],
+        [("NEW-1", 998)],
+        [("OLD-1", 101)],
+        [("BAD-1", 999)],
+    ]
+    assert (fake_session.commits, fake_session.rollbacks, fake_session.savepoints) == (2, 1, 3)
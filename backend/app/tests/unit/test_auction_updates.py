@@ -0,0 +1,104 @@
+"""Unit tests for coalesced auction update fan-out."""
+
+import asyncio
+import uuid
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from app.models.auction_item import AuctionItem
+from app.websocket import auction_updates
+from app.websocket.auction_updates import AuctionUpdatePublisher, build_item_delta
+
+
+def _item(amount: str) -> AuctionItem:
+    return AuctionItem(
+        id=uuid.uuid4(),
+        event_id=uuid.uuid4(),
+        current_bid_amount=Decimal(amount),
+        min_next_bid_amount=Decimal(amount) + Decimal("10.00"),
+        bid_count=1,
+        bid_state_version=1,
+    )
+
+
+@pytest.fixture
+def emitted(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str, dict[str, Any]]]:
+    calls: list[tuple[str, str, dict[str, Any]]] = []
+
+    async def bid_placed(event_id: str, data: dict[str, Any]) -> None:
+        calls.append(("auction:bid_placed", event_id, data))
+
+    async def item_changed(event_id: str, data: dict[str, Any]) -> None:
+        calls.append(("auction:item_changed", event_id, data))
+
+    monkeypatch.setattr(auction_updates, "emit_auction_bid_placed", bid_placed)
+    monkeypatch.setattr(auction_updates, "emit_auction_item_changed", item_changed)
+    return calls
+
+
+@pytest.mark.asyncio
+class TestAuctionUpdatePublisher:
+    async def test_burst_on_one_item_is_coalesced(
+        self, emitted: list[tuple[str, str, dict[str, Any]]]
+    ) -> None:
+        publisher = AuctionUpdatePublisher(window_seconds=0.05)
+        item = _item("100.00")
+
+        for amount in ("100.00", "110.00", "120.00", "130.00"):
+            item.current_bid_amount = Decimal(amount)
+            item.bid_state_version += 1
+            await publisher.publish_bid_placed(item, build_item_delta(item))
+
+        assert [call[2]["current_bid_amount"] for call in emitted] == ["100.00"]
+        await asyncio.sleep(0.1)
+
+        assert [call[2]["current_bid_amount"] for call in emitted] == ["100.00", "130.00"]
+        assert all(call[1] == str(item.event_id) for call in emitted)
+
+    async def test_items_are_not_coalesced_together(
+        self, emitted: list[tuple[str, str, dict[str, Any]]]
+    ) -> None:
+        publisher = AuctionUpdatePublisher(window_seconds=0.05)
+        first, second = _item("100.00"), _item("200.00")
+
+        await publisher.publish_bid_placed(first, build_item_delta(first))
+        await publisher.publish_item_changed(second, build_item_delta(second))
+
+        assert [(call[0], call[2]["item_id"]) for call in emitted] == [
+            ("auction:bid_placed", str(first.id)),
+            ("auction:item_changed", str(second.id)),
+        ]
+
+    async def test_trailing_emit_keeps_known_close_time(
+        self, emitted: list[tuple[str, str, dict[str, Any]]]
+    ) -> None:
+        publisher = AuctionUpdatePublisher(window_seconds=0.05)
+        item = _item("100.00")
+        close_at = datetime(2026, 10, 16, 21, 0, tzinfo=UTC)
+
+        await publisher.publish_bid_placed(item, build_item_delta(item, close_at))
+        await publisher.publish_bid_placed(item, build_item_delta(item, close_at))
+        await publisher.publish_item_changed(item, build_item_delta(item))
+        await asyncio.sleep(0.1)
+
+        assert emitted[-1][0] == "auction:item_changed"
+        assert emitted[-1][2]["effective_close_at"] == close_at.isoformat()
+
+    async def test_older_state_is_dropped(
+        self, emitted: list[tuple[str, str, dict[str, Any]]]
+    ) -> None:
+        publisher = AuctionUpdatePublisher(window_seconds=0.05)
+        item = _item("100.00")
+        older = build_item_delta(item)
+        item.current_bid_amount = Decimal("110.00")
+        item.bid_state_version += 1
+        newer = build_item_delta(item)
+
+        await publisher.publish_bid_placed(item, newer)
+        await publisher.publish_bid_placed(item, older)
+        await asyncio.sleep(0.1)
+
+        assert [call[2]["bid_state_version"] for call in emitted] == [2]
@@ -0,0 +1,140 @@
+"""Unit tests for bid notification coalescing."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.config import get_settings
+from app.models.notification import DeliveryChannelEnum
+from app.services.bid_notification_coalescer import BidNotificationCoalescer
+from app.services.notification_service import NotificationService
+from app.services.timer_wheel import BID_DIGEST, TimerWheel
+
+
+def _notification(*channels: DeliveryChannelEnum) -> Any:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        event_id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        _resolved_channels=list(channels),
+    )
+
+
+def test_timer_kind_round_trips() -> None:
+    user_id, item_id = uuid.uuid4(), uuid.uuid4()
+    kind = BidNotificationCoalescer.timer_kind(user_id, item_id)
+
+    assert kind.startswith(f"{BID_DIGEST}:")
+    assert BidNotificationCoalescer.parse_timer_kind(kind) == (user_id, item_id)
+
+
+def _window(deadline: datetime | None) -> Any:
+    async def open_window(
+        event_id: uuid.UUID, user_id: uuid.UUID, item_id: uuid.UUID, window: int
+    ) -> datetime | None:
+        return deadline
+
+    return staticmethod(open_window)
+
+
+async def _within_quota(event_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+    return True
+
+
+@pytest.mark.asyncio
+class TestHold:
+    async def test_holds_followers_until_the_open_window_closes(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[tuple[uuid.UUID, str, datetime, dict[str, Any], bool]] = []
+        deadline = datetime.now(UTC) + timedelta(seconds=12)
+
+        async def upsert(
+            event_id: uuid.UUID,
+            kind: str,
+            due_at: datetime,
+            payload: dict[str, Any] | None = None,
+            keep_due: bool = False,
+        ) -> None:
+            calls.append((event_id, kind, due_at, payload or {}, keep_due))
+
+        def dispatch(notification_id: str, channels: list[DeliveryChannelEnum]) -> None:
+            raise AssertionError("delivery dispatched before the window closed")
+
+        monkeypatch.setattr(get_settings(), "bid_notification_coalesce_seconds", 15)
+        monkeypatch.setattr(BidNotificationCoalescer, "_open_window", _window(deadline))
+        monkeypatch.setattr(TimerWheel, "upsert", staticmethod(upsert))
+        monkeypatch.setattr(NotificationService, "dispatch_delivery_tasks", dispatch)
+        notification = _notification(
+            DeliveryChannelEnum.INAPP, DeliveryChannelEnum.PUSH, DeliveryChannelEnum.EMAIL
+        )
+        item_id = uuid.uuid4()
+
+        await BidNotificationCoalescer.hold(notification, item_id)
+
+        assert calls == [
+            (
+                notification.event_id,
+                BidNotificationCoalescer.timer_kind(notification.user_id, item_id),
+                deadline,
+                {"notification_id": str(notification.id), "channels": ["push", "email"]},
+                True,
+            )
+        ]
+
+    async def test_first_notification_in_window_is_sent_immediately(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        dispatched: list[tuple[str, list[DeliveryChannelEnum]]] = []
+
+        async def upsert(*args: Any, **kwargs: Any) -> None:
+            raise AssertionError("leading notification was held")
+
+        def dispatch(notification_id: str, channels: list[DeliveryChannelEnum]) -> None:
+            dispatched.append((notification_id, channels))
+
+        monkeypatch.setattr(get_settings(), "bid_notification_coalesce_seconds", 15)
+        monkeypatch.setattr(BidNotificationCoalescer, "_open_window", _window(None))
+        monkeypatch.setattr(BidNotificationCoalescer, "_consume_quota", staticmethod(_within_quota))
+        monkeypatch.setattr(TimerWheel, "upsert", staticmethod(upsert))
+        monkeypatch.setattr(NotificationService, "dispatch_delivery_tasks", dispatch)
+        notification = _notification(DeliveryChannelEnum.INAPP, DeliveryChannelEnum.PUSH)
+
+        await BidNotificationCoalescer.hold(notification, uuid.uuid4())
+
+        assert dispatched == [(str(notification.id), [DeliveryChannelEnum.PUSH])]
+
+    async def test_inapp_only_is_not_held(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        async def upsert(*args: Any, **kwargs: Any) -> None:
+            raise AssertionError("in-app notification was held")
+
+        monkeypatch.setattr(TimerWheel, "upsert", staticmethod(upsert))
+
+        await BidNotificationCoalescer.hold(_notification(DeliveryChannelEnum.INAPP), uuid.uuid4())
+
+    @pytest.mark.parametrize("window, redis_up", [(0, True), (60, False)])
+    async def test_dispatches_immediately_without_coalescing(
+        self, monkeypatch: pytest.MonkeyPatch, window: int, redis_up: bool
+    ) -> None:
+        dispatched: list[tuple[str, list[DeliveryChannelEnum]]] = []
+
+        async def open_window(*args: Any) -> datetime | None:
+            if not redis_up:
+                raise RedisConnectionError("redis down")
+            return datetime.now(UTC)
+
+        def dispatch(notification_id: str, channels: list[DeliveryChannelEnum]) -> None:
+            dispatched.append((notification_id, channels))
+
+        monkeypatch.setattr(get_settings(), "bid_notification_coalesce_seconds", window)
+        monkeypatch.setattr(BidNotificationCoalescer, "_open_window", staticmethod(open_window))
+        monkeypatch.setattr(NotificationService, "dispatch_delivery_tasks", dispatch)
+        notification = _notification(DeliveryChannelEnum.INAPP, DeliveryChannelEnum.PUSH)
+
+        await BidNotificationCoalescer.hold(notification, uuid.uuid4())
+
+        assert dispatched == [(str(notification.id), [DeliveryChannelEnum.PUSH])]
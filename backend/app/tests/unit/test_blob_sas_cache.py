@@ -0,0 +1,62 @@
+"""Unit tests for the signed blob URL cache."""
+
+from datetime import UTC, datetime, timedelta
+
+from app.services.blob_sas_cache import BlobSasUrlCache
+
+
+class _Signer:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, expires_at: datetime) -> str:
+        self.calls += 1
+        return f"https://blob/{self.calls}?se={expires_at.isoformat()}"
+
+
+class TestBlobSasUrlCache:
+    def test_reuses_signed_url_for_same_blob(self) -> None:
+        cache = BlobSasUrlCache()
+        sign = _Signer()
+
+        first = cache.get_or_sign("media", "items/a.jpg", 24, sign)
+        second = cache.get_or_sign("media", "items/a.jpg", 24, sign)
+
+        assert first == second
+        assert sign.calls == 1
+
+    def test_signs_separately_per_blob_and_lifetime(self) -> None:
+        cache = BlobSasUrlCache()
+        sign = _Signer()
+
+        cache.get_or_sign("media", "items/a.jpg", 24, sign)
+        cache.get_or_sign("media", "items/b.jpg", 24, sign)
+        cache.get_or_sign("media", "items/a.jpg", 1, sign)
+
+        assert sign.calls == 3
+
+    def test_resigns_once_half_the_lifetime_has_passed(self) -> None:
+        cache = BlobSasUrlCache()
+        sign = _Signer()
+        cache.get_or_sign("media", "items/a.jpg", 24, sign)
+
+        key = ("media", "items/a.jpg", 24)
+        url, _ = cache._entries[key]
+        cache._entries[key] = (url, datetime.now(UTC) + timedelta(hours=11))
+
+        refreshed = cache.get_or_sign("media", "items/a.jpg", 24, sign)
+
+        assert refreshed != url
+        assert sign.calls == 2
+
+    def test_evicts_least_recently_used_entries(self) -> None:
+        cache = BlobSasUrlCache(max_entries=2)
+        sign = _Signer()
+
+        cache.get_or_sign("media", "a", 24, sign)
+        cache.get_or_sign("media", "b", 24, sign)
+        cache.get_or_sign("media", "a", 24, sign)
+        cache.get_or_sign("media", "c", 24, sign)
+
+        assert ("media", "a", 24) in cache._entries
+        assert ("media", "b", 24) not in cache._entries
@@ -0,0 +1,66 @@
+"""Unit tests for Celery queue routing, worker concurrency and queue metrics."""
+
+import json
+
+import pytest
+
+from app.celery_app import (
+    BULK_QUEUE,
+    MAINTENANCE_QUEUE,
+    PUBLISHED_AT_HEADER,
+    REALTIME_QUEUE,
+    REPORTS_QUEUE,
+    celery_app,
+    queue_concurrency,
+)
+from app.core.config import get_settings
+from app.core.queue_metrics import message_age_seconds
+
+
+def _queue_for(task_name: str, **options: object) -> str:
+    route = celery_app.amqp.router.route(dict(options), task_name, (), {})
+    return str(route["queue"].name)
+
+
+@pytest.mark.parametrize(
+    ("task_name", "queue"),
+    [
+        ("app.tasks.notification_tasks.send_push_notification_task", REALTIME_QUEUE),
+        ("app.tasks.run_of_show_tasks.send_ros_notification_task", REALTIME_QUEUE),
+        ("app.tasks.notification_tasks.deliver_campaign_task", BULK_QUEUE),
+        ("app.tasks.notification_tasks.send_push_notification_batch_task", BULK_QUEUE),
+        ("app.tasks.payment_tasks.generate_and_send_receipt", REPORTS_QUEUE),
+        ("app.tasks.notification_tasks.purge_expired_notifications", MAINTENANCE_QUEUE),
+        ("app.tasks.payment_tasks.expire_pending_transactions", MAINTENANCE_QUEUE),
+    ],
+)
+def test_tasks_are_routed_by_urgency(task_name: str, queue: str) -> None:
+    assert _queue_for(task_name) == queue
+
+
+def test_explicit_queue_overrides_route() -> None:
+    task_name = "app.tasks.notification_tasks.send_push_notification_task"
+    assert _queue_for(task_name, queue=BULK_QUEUE) == BULK_QUEUE
+
+
+def test_payment_beat_jobs_share_the_single_app() -> None:
+    tasks = {entry["task"] for entry in celery_app.conf.beat_schedule.values()}
+    assert "app.tasks.payment_tasks.expire_pending_transactions" in tasks
+    assert "app.tasks.notification_tasks.purge_expired_notifications" in tasks
+
+
+def test_queue_concurrency_sums_consumed_queues() -> None:
+    settings = get_settings()
+    assert queue_concurrency([REALTIME_QUEUE]) == settings.celery_realtime_concurrency
+    assert (
+        queue_concurrency([BULK_QUEUE, REPORTS_QUEUE, "default"])
+        == settings.celery_bulk_concurrency + settings.celery_reports_concurrency
+    )
+    assert queue_concurrency(["default"]) is None
+
+
+def test_message_age_reads_publish_stamp() -> None:
+    raw = json.dumps({"body": "", "headers": {PUBLISHED_AT_HEADER: 100.0}})
+    assert message_age_seconds(raw, now=112.5) == 12.5
+    assert message_age_seconds(json.dumps({"headers": {}}), now=112.5) == 0.0
+    assert message_age_seconds(None, now=112.5) == 0.0
@@ -0,0 +1,61 @@
+"""Unit tests for the cached consent check."""
+
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.core import database
+from app.services.consent_cache import ConsentCache
+from app.services.consent_service import ConsentService
+
+
+def _fail_session() -> None:
+    raise AssertionError("consent check opened a database session")
+
+
+@pytest.mark.asyncio
+class TestCachedConsentStatus:
+    async def test_cache_hit_skips_database(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        async def cached(user_id: UUID) -> Any:
+            return ("2.0", "1.1"), ("2.0", "1.1")
+
+        monkeypatch.setattr(ConsentCache, "get", staticmethod(cached))
+        monkeypatch.setattr(database, "AsyncSessionLocal", _fail_session)
+
+        status = await ConsentService().get_cached_consent_status(uuid4())
+
+        assert status is not None
+        assert status.has_active_consent
+        assert not status.consent_required
+
+    async def test_outdated_accepted_version_requires_consent(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def cached(user_id: UUID) -> Any:
+            return ("2.0", "1.1"), ("1.0", "1.1")
+
+        monkeypatch.setattr(ConsentCache, "get", staticmethod(cached))
+        monkeypatch.setattr(database, "AsyncSessionLocal", _fail_session)
+
+        status = await ConsentService().get_cached_consent_status(uuid4())
+
+        assert status is not None
+        assert status.consent_required
+        assert status.current_tos_version == "1.0"
+        assert status.latest_tos_version == "2.0"
+
+    async def test_no_active_consent_requires_consent(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def cached(user_id: UUID) -> Any:
+            return ("2.0", "1.1"), (None, None)
+
+        monkeypatch.setattr(ConsentCache, "get", staticmethod(cached))
+        monkeypatch.setattr(database, "AsyncSessionLocal", _fail_session)
+
+        status = await ConsentService().get_cached_consent_status(uuid4())
+
+        assert status is not None
+        assert not status.has_active_consent
+        assert status.consent_required
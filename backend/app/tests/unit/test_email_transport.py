@@ -0,0 +1,144 @@
+"""Unit tests for the pooled email transport and requeued retries."""
+
+import asyncio
+import smtplib
+from typing import Any
+
+import pytest
+
+from app.services import email_transport
+from app.services.email_service import EmailService
+from app.services.email_transport import (
+    EmailAttachment,
+    EmailSendError,
+    EmailTransport,
+    OutboundEmail,
+    SmtpEmailTransport,
+    TransientEmailError,
+)
+
+
+def _message(to_email: str = "donor@example.com") -> OutboundEmail:
+    return OutboundEmail(to_email=to_email, subject="Outbid", body="You were outbid.")
+
+
+class FakeTransport(EmailTransport):
+    name = "fake"
+
+    def __init__(self, errors: dict[str, Exception] | None = None) -> None:
+        super().__init__()
+        self.rate_limiter.per_second = 0
+        self.errors = errors or {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _send(self, message: OutboundEmail) -> str | None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if message.to_email in self.errors:
+            raise self.errors[message.to_email]
+        return f"id-{message.to_email}"
+
+
+class FakeSMTP:
+    opened: list["FakeSMTP"] = []
+
+    def __init__(self, host: str, port: int, timeout: float) -> None:
+        self.sent: list[str] = []
+        self.disconnect_next = False
+        FakeSMTP.opened.append(self)
+
+    def send_message(self, message: Any) -> None:
+        if self.disconnect_next:
+            self.disconnect_next = False
+            raise smtplib.SMTPServerDisconnected("idle timeout")
+        self.sent.append(message["To"])
+
+    def quit(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def test_payload_round_trips_with_attachments() -> None:
+    message = OutboundEmail(
+        to_email="donor@example.com",
+        subject="Your receipt",
+        body="Thanks",
+        html_body="<p>Thanks</p>",
+        from_address="gala@fundrbolt.com",
+        email_type="receipt",
+        attachments=(EmailAttachment("receipt.pdf", "application/pdf", b"%PDF-1.7"),),
+    )
+
+    assert OutboundEmail.from_payload(message.to_payload()) == message
+
+
+@pytest.mark.asyncio
+async def test_send_batch_bounds_concurrency_and_reports_each_failure() -> None:
+    transport = FakeTransport(
+        errors={
+            "busy@example.com": TransientEmailError("throttled", retry_after=30),
+            "bad@example.com": EmailSendError("rejected"),
+        }
+    )
+    messages = [_message(f"d{i}@example.com") for i in range(20)]
+    messages[3] = _message("busy@example.com")
+    messages[7] = _message("bad@example.com")
+
+    results = await transport.send_batch(messages, concurrency=4)
+
+    assert [result.message for result in results] == messages
+    assert transport.max_in_flight == 4
+    assert results[3].transient and not results[3].ok
+    assert not results[7].transient and not results[7].ok
+    assert sum(result.ok for result in results) == 18
+    assert results[0].message_id == "id-d0@example.com"
+
+
+@pytest.mark.asyncio
+async def test_smtp_transport_reuses_connections_and_reconnects(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    FakeSMTP.opened = []
+    monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+    transport = SmtpEmailTransport("localhost", 1025, pool_size=1)
+    transport.rate_limiter.per_second = 0
+
+    await transport.send(_message("a@example.com"))
+    await transport.send(_message("b@example.com"))
+    assert len(FakeSMTP.opened) == 1
+    assert FakeSMTP.opened[0].sent == ["a@example.com", "b@example.com"]
+
+    FakeSMTP.opened[0].disconnect_next = True
+    await transport.send(_message("c@example.com"))
+    assert len(FakeSMTP.opened) == 2
+    assert FakeSMTP.opened[1].sent == ["c@example.com"]
+
+
+@pytest.mark.asyncio
+async def test_transient_failure_is_requeued_not_slept(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.tasks import email_tasks
+
+    queued: list[dict[str, Any]] = []
+    transport = FakeTransport(errors={"donor@example.com": TransientEmailError("429", 45)})
+
+    def apply_async(args: list[Any], kwargs: dict[str, Any], countdown: int) -> None:
+        queued.append({"payload": args[0], **kwargs, "countdown": countdown})
+
+    monkeypatch.setattr(email_transport, "get_email_transport", lambda: transport)
+    monkeypatch.setattr("app.services.email_service.get_email_transport", lambda: transport)
+    monkeypatch.setattr(email_tasks.send_email_task, "apply_async", apply_async)
+
+    sent = await EmailService()._send_email_with_retry(
+        "donor@example.com", "Outbid", "You were outbid.", "notification_outbid"
+    )
+
+    assert sent is True
+    assert len(queued) == 1
+    assert queued[0]["attempt"] == 1
+    assert queued[0]["countdown"] == 46
+    assert queued[0]["payload"]["email_type"] == "notification_outbid"
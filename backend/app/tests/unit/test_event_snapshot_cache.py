@@ -0,0 +1,44 @@
+"""Unit tests for versioned event snapshot ETags."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.services.event_service import EventService
+from app.services.event_snapshot_cache import EventSnapshotCache
+
+
+class TestEventSnapshotCacheEtag:
+    def test_etag_changes_with_version_and_variant(self) -> None:
+        event_id = uuid4()
+
+        base = EventSnapshotCache.etag(event_id, 3, "items|page=1")
+
+        assert base == EventSnapshotCache.etag(event_id, 3, "items|page=1")
+        assert base != EventSnapshotCache.etag(event_id, 4, "items|page=1")
+        assert base != EventSnapshotCache.etag(event_id, 3, "items|page=2")
+        assert base.startswith('W/"')
+
+    def test_matches_any_listed_etag(self) -> None:
+        etag = EventSnapshotCache.etag(uuid4(), 1, "public")
+
+        assert EventSnapshotCache.matches(f'W/"other", {etag}', etag)
+        assert EventSnapshotCache.matches("*", etag)
+        assert not EventSnapshotCache.matches('W/"other"', etag)
+        assert not EventSnapshotCache.matches(None, etag)
+
+
+class TestBumpNpoEventVersions:
+    @pytest.mark.asyncio
+    async def test_bumps_every_event_of_the_npo(self) -> None:
+        event_ids = [uuid4(), uuid4()]
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = event_ids
+        db = AsyncMock()
+        db.execute.return_value = result
+
+        with patch.object(EventSnapshotCache, "bump_version", new=AsyncMock()) as bump:
+            await EventService.bump_npo_event_versions(db, uuid4())
+
+        assert [call.args[0] for call in bump.await_args_list] == event_ids
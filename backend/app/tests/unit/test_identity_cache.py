@@ -0,0 +1,75 @@
+"""Unit tests for the in-process authenticated user cache."""
+
+import uuid
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.models.user import User
+from app.services import identity_cache as identity_cache_module
+from app.services.identity_cache import IdentityCache
+
+
+def _user(**overrides: Any) -> User:
+    values = {
+        "id": uuid.uuid4(),
+        "email": "donor@example.com",
+        "password_hash": "hash",
+        "first_name": "Dana",
+        "last_name": "Donor",
+        "role_id": uuid.uuid4(),
+        "is_active": True,
+        "email_verified": True,
+        "social_media_links": {"site": "https://example.com"},
+    }
+    values.update(overrides)
+    return User(**values)
+
+
+class TestIdentityCache:
+    def test_snapshot_round_trip_is_isolated(self) -> None:
+        cache = IdentityCache()
+        user = _user()
+        cache.put(user, "donor")
+
+        snapshot = cache.get(user.id)
+        assert snapshot is not None
+        values, role_name = snapshot
+        assert role_name == "donor"
+        assert values["email"] == "donor@example.com"
+
+        values["social_media_links"]["site"] = "changed"
+        again = cache.get(user.id)
+        assert again is not None
+        assert again[0]["social_media_links"]["site"] == "https://example.com"
+
+    def test_entries_expire(self) -> None:
+        cache = IdentityCache(ttl_seconds=0)
+        user = _user()
+        cache.put(user, "donor")
+
+        assert cache.get(user.id) is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = IdentityCache(max_entries=2)
+        first, second, third = _user(), _user(), _user()
+        cache.put(first, "donor")
+        cache.put(second, "donor")
+        cache.get(first.id)
+        cache.put(third, "donor")
+
+        assert cache.get(first.id) is not None
+        assert cache.get(second.id) is None
+
+    def test_flushed_user_changes_evict_snapshot(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        cache = IdentityCache()
+        monkeypatch.setattr(identity_cache_module, "identity_cache", cache)
+        user = _user()
+        cache.put(user, "donor")
+        session = SimpleNamespace(dirty={user}, deleted=set(), info={})
+
+        identity_cache_module._evict_flushed_users(session, None)
+
+        assert cache.get(user.id) is None
+        assert session.info["identity_changed"] == {user.id}
@@ -0,0 +1,298 @@
+"""Unit tests for background import jobs."""
+
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy.sql.dml import Delete
+
+from app.models.import_job import ImportJob, ImportJobKind, ImportJobStatus
+from app.services import import_job_service, import_upload_storage
+from app.services.import_job_service import (
+    STALE_JOB_ERROR,
+    ImportJobProgress,
+    SessionFactory,
+    reap_stale_import_jobs,
+    run_import_job,
+)
+from app.services.import_progress import ImportProgress
+from app.services.import_upload_storage import ImportUploadStorage
+from app.services.registration_import_service import RegistrationImportError
+
+
+class FakeResult:
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def scalar_one_or_none(self) -> Any:
+        return self.value
+
+    def scalars(self) -> "FakeResult":
+        return self
+
+    def all(self) -> Any:
+        return self.value
+
+
+class FakeDatabase:
+    """Records the statements run through every session it hands out."""
+
+    def __init__(self, job: ImportJob) -> None:
+        self.job = job
+        self.claimable = True
+        self.attempts = 0
+        self.rows_deleted = False
+        self.inserted_rows: list[dict[str, Any]] = []
+        self.job_updates: list[dict[str, Any]] = []
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator["FakeDatabase"]:
+        yield self
+
+    @property
+    def session_factory(self) -> SessionFactory:
+        return cast(SessionFactory, self.session)
+
+    async def execute(self, statement: Any, params: Any = None) -> FakeResult:
+        if params is not None:
+            self.inserted_rows.extend(params)
+            return FakeResult(None)
+        if isinstance(statement, Delete):
+            self.rows_deleted = True
+            return FakeResult(None)
+        values = {
+            column.key: getattr(value, "value", value)
+            for column, value in statement._values.items()
+        }
+        if values.get("status") == ImportJobStatus.RUNNING:
+            claimed = self.claimable
+            self.claimable = False
+            if not claimed:
+                return FakeResult(None)
+            self.attempts += 1
+            return FakeResult(self.attempts)
+        self.job_updates.append(values)
+        return FakeResult(None)
+
+    async def get(self, model: Any, ident: Any, **kwargs: Any) -> ImportJob:
+        return self.job
+
+    async def commit(self) -> None:
+        pass
+
+
+class FakeReport(BaseModel):
+    created_count: int
+
+
+def _job(kind: ImportJobKind = ImportJobKind.REGISTRATIONS) -> ImportJob:
+    return ImportJob(
+        id=uuid.uuid4(),
+        kind=kind,
+        status=ImportJobStatus.QUEUED,
+        event_id=uuid.uuid4(),
+        initiated_by_user_id=uuid.uuid4(),
+        file_name="registrations.csv",
+        storage_key=None,
+        params={},
+        total_rows=0,
+        processed_rows=0,
+        status_counts={},
+    )
+
+
+@pytest.fixture
+def emitted(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, Any]]:
+    payloads: list[dict[str, Any]] = []
+
+    async def emit(job_id: str, payload: dict[str, Any]) -> None:
+        payloads.append(payload)
+
+    monkeypatch.setattr(import_job_service, "emit_import_job_progress", emit)
+    return payloads
+
+
+@pytest.fixture
+def local_storage(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> ImportUploadStorage:
+    monkeypatch.setattr(import_upload_storage.settings, "azure_storage_connection_string", None)
+    monkeypatch.setattr(import_upload_storage.settings, "import_upload_dir", str(tmp_path))
+    return ImportUploadStorage()
+
+
+@pytest.mark.asyncio
+async def test_report_forwards_only_new_results() -> None:
+    seen: list[tuple[int, str, str | None]] = []
+
+    class Recorder(ImportProgress):
+        async def row(self, row_number: int, status: str, message: str | None = None) -> None:
+            seen.append((row_number, status, message))
+
+    progress = Recorder()
+    results = [SimpleNamespace(row_number=2, status=ImportJobStatus.FAILED, message="bad")]
+    await progress.report(results)
+    await progress.report(results)
+    results.append(SimpleNamespace(row_number=3, status="created", message="ok"))
+    await progress.report(results)
+
+    assert seen == [(2, "failed", "bad"), (3, "created", "ok")]
+
+
+@pytest.mark.asyncio
+async def test_progress_writes_rows_in_batches(
+    monkeypatch: pytest.MonkeyPatch, emitted: list[dict[str, Any]]
+) -> None:
+    monkeypatch.setattr(import_job_service.settings, "import_job_progress_rows", 2)
+    monkeypatch.setattr(import_job_service.settings, "import_job_progress_interval_seconds", 60)
+    job = _job()
+    database = FakeDatabase(job)
+    progress = ImportJobProgress(job, database.session_factory)
+
+    await progress.start(3)
+    await progress.row(2, "created")
+    assert database.inserted_rows == []
+
+    await progress.row(3, "error", "Missing email")
+    assert [row["row_number"] for row in database.inserted_rows] == [2, 3]
+    assert database.job_updates[-1]["processed_rows"] == 2
+    assert emitted[-1]["status_counts"] == {"created": 1, "error": 1}
+    assert emitted[-1]["total_rows"] == 3
+
+    await progress.row(4, "created")
+    assert len(database.inserted_rows) == 2
+
+
+@pytest.mark.asyncio
+async def test_run_import_job_records_result_and_removes_upload(
+    monkeypatch: pytest.MonkeyPatch,
+    emitted: list[dict[str, Any]],
+    local_storage: ImportUploadStorage,
+) -> None:
+    job = _job()
+    job.storage_key = await local_storage.save(job.id, "../../registrations.csv", b"a,b\n1,2\n")
+    assert job.storage_key == f"{job.id}/registrations.csv"
+    database = FakeDatabase(job)
+
+    async def importer(
+        db: Any, job: ImportJob, file_bytes: bytes, progress: ImportProgress
+    ) -> BaseModel:
+        assert file_bytes == b"a,b\n1,2\n"
+        await progress.start(1)
+        await progress.row(2, "created")
+        return FakeReport(created_count=1)
+
+    monkeypatch.setitem(import_job_service.IMPORTERS, ImportJobKind.REGISTRATIONS, importer)
+
+    assert await run_import_job(job.id, database.session_factory) == ImportJobStatus.COMPLETED
+    assert await run_import_job(job.id, database.session_factory) is None
+
+    final = database.job_updates[-1]
+    assert final["status"] == ImportJobStatus.COMPLETED
+    assert final["result"] == {"created_count": 1}
+    assert final["processed_rows"] == 1
+    assert emitted[-1]["status"] == "completed"
+    assert not (Path(local_storage.local_dir) / job.storage_key).exists()
+
+
+@pytest.mark.asyncio
+async def test_run_import_job_marks_rejected_file_failed(
+    monkeypatch: pytest.MonkeyPatch,
+    emitted: list[dict[str, Any]],
+    local_storage: ImportUploadStorage,
+) -> None:
+    job = _job()
+    job.storage_key = await local_storage.save(job.id, "registrations.csv", b"")
+    database = FakeDatabase(job)
+
+    async def importer(*args: Any) -> BaseModel:
+        raise RegistrationImportError("File contains no data rows")
+
+    monkeypatch.setitem(import_job_service.IMPORTERS, ImportJobKind.REGISTRATIONS, importer)
+
+    assert await run_import_job(job.id, database.session_factory) == ImportJobStatus.FAILED
+    assert database.job_updates[-1]["error"] == "File contains no data rows"
+    assert emitted[-1]["error"] == "File contains no data rows"
+
+
+@pytest.mark.asyncio
+async def test_run_import_job_reclaims_abandoned_job(
+    monkeypatch: pytest.MonkeyPatch,
+    emitted: list[dict[str, Any]],
+    local_storage: ImportUploadStorage,
+) -> None:
+    job = _job()
+    job.storage_key = await local_storage.save(job.id, "registrations.csv", b"a\n1\n")
+    database = FakeDatabase(job)
+    database.attempts = 1  # A worker claimed it and was killed
+
+    async def importer(*args: Any) -> BaseModel:
+        return FakeReport(created_count=1)
+
+    monkeypatch.setitem(import_job_service.IMPORTERS, ImportJobKind.REGISTRATIONS, importer)
+
+    assert await run_import_job(job.id, database.session_factory) == ImportJobStatus.COMPLETED
+    assert database.rows_deleted
+    assert database.job_updates[-1]["status"] == ImportJobStatus.COMPLETED
+
+
+class ReapDatabase:
+    """Answers the reaper's statements in order: failed ids, re-queued ids, jobs."""
+
+    def __init__(self, *results: Any) -> None:
+        self.results = list(results)
+        self.updates: list[dict[str, Any]] = []
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator["ReapDatabase"]:
+        yield self
+
+    async def execute(self, statement: Any) -> FakeResult:
+        if statement.is_dml:
+            self.updates.append(
+                {
+                    column.key: getattr(value, "value", value)
+                    for column, value in statement._values.items()
+                }
+            )
+        return FakeResult(self.results.pop(0) if self.results else None)
+
+    async def commit(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_reap_requeues_or_fails_stale_jobs(
+    monkeypatch: pytest.MonkeyPatch,
+    emitted: list[dict[str, Any]],
+    local_storage: ImportUploadStorage,
+) -> None:
+    from app.tasks import import_tasks
+
+    exhausted, retried, undeliverable = _job(), _job(), _job()
+    exhausted.status = undeliverable.status = ImportJobStatus.FAILED
+    exhausted.storage_key = await local_storage.save(exhausted.id, "a.csv", b"a")
+    undeliverable.storage_key = await local_storage.save(undeliverable.id, "b.csv", b"b")
+    database = ReapDatabase(
+        [exhausted.id], [retried.id, undeliverable.id], None, [exhausted, undeliverable]
+    )
+    dispatched: list[str] = []
+
+    def apply_async(args: list[str]) -> None:
+        if args[0] == str(undeliverable.id):
+            raise ConnectionError("broker down")
+        dispatched.append(args[0])
+
+    monkeypatch.setattr(import_tasks.run_import_job_task, "apply_async", apply_async)
+
+    assert await reap_stale_import_jobs(cast(SessionFactory, database.session)) == (1, 2)
+
+    assert dispatched == [str(retried.id)]
+    assert database.updates[0]["error"] == STALE_JOB_ERROR
+    assert database.updates[1]["status"] == ImportJobStatus.QUEUED
+    assert database.updates[2]["status"] == ImportJobStatus.FAILED
+    assert {payload["status"] for payload in emitted} == {"failed"}
+    assert not list(Path(local_storage.local_dir).rglob("*.csv"))
@@ -0,0 +1,205 @@
+"""Unit tests for the streaming import readers and the parsed row cache."""
+
+import io
+import json
+import zipfile
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from openpyxl import Workbook
+from redis.exceptions import RedisError
+
+from app.services import import_reader, import_row_cache
+from app.services.import_reader import (
+    JSONArrayExpectedError,
+    ParsedRow,
+    iter_batches,
+    iter_csv_records,
+    iter_json_array,
+    iter_xlsx_records,
+)
+from app.services.import_row_cache import ImportRowCache, decode_rows, encode_rows
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+
+@pytest.mark.parametrize("chunk_chars", [1, 3, 7, 64 * 1024])
+@pytest.mark.parametrize(
+    "document",
+    [
+        "[]",
+        ' [1, -2.5e10, "caf\\u00e9", {"a": [true, null]}, "x,]"] ',
+        '[\n  {"name": "Ada"},\n  {"name": "Grace"}\n]',
+        "[12345.678e-9, 0, -0.5, 1E+2]",
+        '["line\\nbreak", "quote \\" inside", "\\ud83d\\ude00"]',
+        "[1,]",
+        "[1 2]",
+        "[1,,2]",
+        "[,1]",
+        "[1] []",
+        "[",
+        "[1",
+        "[1,",
+        '["unterminated',
+        '[{"a": 1,}]',
+        '[{"a" 1}]',
+        '[{"a": [1, 2}]',
+        '["bad \\x escape"]',
+        '["raw\ttab"]',
+        "[tru]",
+        "[1.]",
+        "[1e]",
+        "[-]",
+        "[01]",
+        "[NaN, Infinity]",
+        "[\n  1,\n  2,\n  oops\n]",
+        '[\n  {"a": 1},\n\n  {"b": }\n]',
+        "\ufeff[1]",
+        "",
+        "   ",
+    ],
+)
+def test_json_array_matches_json_loads_across_chunks(
+    monkeypatch: pytest.MonkeyPatch, document: str, chunk_chars: int
+) -> None:
+    # Values, and error messages with their line/column/char positions, must
+    # not depend on where chunk boundaries fall.
+    monkeypatch.setattr(import_reader, "JSON_READ_CHUNK_CHARS", chunk_chars)
+    try:
+        expected: Any = json.loads(document)
+    except json.JSONDecodeError as exc:
+        expected = str(exc)
+
+    try:
+        actual: Any = list(iter_json_array(document.encode()))
+    except json.JSONDecodeError as exc:
+        actual = str(exc)
+
+    assert actual == expected
+
+
+def test_json_array_rejects_other_documents_up_front() -> None:
+    with pytest.raises(JSONArrayExpectedError):
+        iter_json_array(b'{"rows": []}')
+    with pytest.raises(json.JSONDecodeError):
+        iter_json_array(b'{"rows": ')
+
+
+def test_json_array_stops_at_first_bad_element() -> None:
+    elements = iter_json_array(b'[{"a": 1}, {"a": 2}, nope, {"a": 4}]')
+
+    assert next(elements) == {"a": 1}
+    assert next(elements) == {"a": 2}
+    with pytest.raises(json.JSONDecodeError, match="char 21"):
+        next(elements)
+
+
+def test_iter_batches_keeps_order_and_remainder() -> None:
+    assert list(iter_batches(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(iter_batches([], 2)) == []
+    assert list(iter_batches("ab", 0)) == [["a"], ["b"]]
+
+
+def test_csv_records_decode_incrementally() -> None:
+    content = '﻿name,note\nAda,"multi\nline"\n'.encode()
+    assert list(iter_csv_records(content)) == [["name", "note"], ["Ada", "multi\nline"]]
+
+    records = iter_csv_records(b"name\nAda\n" + b"x" * 100_000 + b"\xff\n")
+    assert next(records) == ["name"]
+    with pytest.raises(UnicodeDecodeError):
+        list(records)
+
+
+def test_xlsx_records_stream_active_sheet() -> None:
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["name", "amount", "when"])
+    sheet.append(["Ada", 10, datetime(2026, 3, 1, 18, 30)])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+
+    assert list(iter_xlsx_records(buffer.getvalue())) == [
+        ("name", "amount", "when"),
+        ("Ada", 10, datetime(2026, 3, 1, 18, 30)),
+    ]
+    with pytest.raises(zipfile.BadZipFile):
+        iter_xlsx_records(b"not a workbook")
+
+
+def test_row_codec_round_trips_cell_types() -> None:
+    rows = [
+        ParsedRow(
+            row_number=2,
+            data={
+                "name": "Ada",
+                "amount": Decimal("10.50"),
+                "count": 3,
+                "ratio": 0.5,
+                "paid": True,
+                "when": datetime(2026, 3, 1, 18, 30),
+                "day": date(2026, 3, 1),
+                "duration": timedelta(minutes=90),
+                "nested": {"d": [1, "two"]},
+                None: ["extra"],
+                "empty": None,
+            },
+        )
+    ]
+
+    assert decode_rows(encode_rows(rows)) == rows
+
+
+@pytest.mark.asyncio
+async def test_get_or_parse_reuses_cached_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    redis = FakeRedis()
+
+    async def get_redis() -> FakeRedis:
+        return redis
+
+    monkeypatch.setattr(import_row_cache, "get_redis", get_redis)
+    calls: list[bytes] = []
+
+    def parse(content: bytes) -> list[ParsedRow]:
+        calls.append(content)
+        return [ParsedRow(row_number=2, data={"when": date(2026, 3, 1)})]
+
+    first = await ImportRowCache.get_or_parse("users:csv", b"file", parse)
+    second = await ImportRowCache.get_or_parse("users:csv", b"file", parse)
+    other_kind = await ImportRowCache.get_or_parse("users:json", b"file", parse)
+
+    assert first == second == other_kind
+    assert second is not first
+    assert calls == [b"file", b"file"]
+    assert set(redis.ttls.values()) == {3600}
+
+
+@pytest.mark.asyncio
+async def test_get_or_parse_falls_back_when_redis_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def get_redis() -> FakeRedis:
+        raise RedisError("connection refused")
+
+    monkeypatch.setattr(import_row_cache, "get_redis", get_redis)
+    rows = [ParsedRow(row_number=1, data={"a": 1})]
+
+    assert await ImportRowCache.get_or_parse("users:json", b"file", lambda _: rows) == rows
+
+    def broken(content: bytes) -> list[ParsedRow]:
+        raise ValueError("CSV is empty")
+
+    with pytest.raises(ValueError, match="CSV is empty"):
+        await ImportRowCache.get_or_parse("users:csv", b"", broken)
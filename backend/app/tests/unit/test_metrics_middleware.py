@@ -0,0 +1,68 @@
+"""Unit tests for the HTTP metrics middleware."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+
+from app.middleware.metrics import MetricsMiddleware, instrument_engine
+
+
+def _sample(name: str, **labels: str) -> float:
+    value = REGISTRY.get_sample_value(name, labels)
+    return value or 0.0
+
+
+def _build_app() -> FastAPI:
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics-test/items/{item_id}")
+    def get_item(item_id: str) -> dict[str, str]:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        return {"item_id": item_id}
+
+    return app
+
+
+class TestMetricsMiddleware:
+    def test_labels_requests_by_route_template(self) -> None:
+        client = TestClient(_build_app())
+        labels = {"method": "GET", "path": "/metrics-test/items/{item_id}"}
+        before = _sample("fundrbolt_http_requests_total", status="200", **labels)
+
+        first = client.get("/metrics-test/items/6f1c2a4e")
+        client.get("/metrics-test/items/9b3d7e10")
+
+        assert first.status_code == 200
+        assert "X-Process-Time" in first.headers
+        assert _sample("fundrbolt_http_requests_total", status="200", **labels) == before + 2
+        assert _sample("fundrbolt_http_request_duration_seconds_count", **labels) >= 2
+        assert _sample("fundrbolt_http_response_size_bytes_sum", **labels) > 0
+
+    def test_records_sql_statements_per_request(self) -> None:
+        client = TestClient(_build_app())
+        labels = {"method": "GET", "path": "/metrics-test/items/{item_id}"}
+        count_before = _sample("fundrbolt_http_request_db_queries_count", **labels)
+        sum_before = _sample("fundrbolt_http_request_db_queries_sum", **labels)
+
+        client.get("/metrics-test/items/abc")
+
+        assert _sample("fundrbolt_http_request_db_queries_count", **labels) == count_before + 1
+        assert _sample("fundrbolt_http_request_db_queries_sum", **labels) == sum_before + 2
+
+    def test_unmatched_paths_share_one_series(self) -> None:
+        client = TestClient(_build_app())
+        labels = {"method": "GET", "path": "<unmatched>", "status": "404"}
+        before = _sample("fundrbolt_http_requests_total", **labels)
+
+        client.get("/no-such-route/1")
+        client.get("/no-such-route/2")
+
+        assert _sample("fundrbolt_http_requests_total", **labels) == before + 2
+        assert _sample("fundrbolt_http_requests_in_progress", method="GET") == 0
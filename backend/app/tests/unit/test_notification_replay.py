@@ -0,0 +1,87 @@
+"""Unit tests for cursor-based missed-notification replay over Socket.IO."""
+
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from app.websocket import notification_ws
+from app.websocket.notification_ws import decode_replay_cursor, encode_replay_cursor
+
+
+def test_replay_cursor_round_trips() -> None:
+    created_at = datetime(2026, 10, 16, 21, 9, 49, 123456, tzinfo=UTC)
+    notification_id = uuid.uuid4()
+
+    cursor = encode_replay_cursor(created_at, notification_id)
+
+    assert decode_replay_cursor(cursor) == (created_at, notification_id)
+
+
+def test_bare_timestamp_cursor_has_no_id() -> None:
+    assert decode_replay_cursor("2026-10-16T21:09:49+00:00") == (
+        datetime(2026, 10, 16, 21, 9, 49, tzinfo=UTC),
+        None,
+    )
+
+
+@pytest.mark.asyncio
+class TestEmitMissedNotifications:
+    async def test_throttled_join_asks_client_to_retry(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        emitted: list[tuple[str, dict[str, Any], str]] = []
+
+        async def slot_taken(user_id: str, event_id: str) -> bool:
+            return False
+
+        async def load_page(*args: Any) -> dict[str, Any]:
+            raise AssertionError("throttled replay queried the database")
+
+        async def emit(event: str, data: dict[str, Any], to: str) -> None:
+            emitted.append((event, data, to))
+
+        monkeypatch.setattr(notification_ws, "_acquire_replay_slot", slot_taken)
+        monkeypatch.setattr(notification_ws, "_load_missed_page", load_page)
+        monkeypatch.setattr(notification_ws.sio, "emit", emit)
+
+        await notification_ws._emit_missed_notifications(
+            "sid-1", str(uuid.uuid4()), str(uuid.uuid4()), {"cursor": "2026-10-16T21:09:49+00:00"}
+        )
+
+        assert len(emitted) == 1
+        event, page, to = emitted[0]
+        assert (event, to) == ("notification:missed", "sid-1")
+        assert page["notifications"] == []
+        assert page["has_more"] is True
+        interval = notification_ws.settings.notification_replay_min_interval_seconds
+        assert page["retry_after"] == interval
+
+    async def test_replay_is_one_batched_emit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        emitted: list[tuple[str, dict[str, Any], str]] = []
+        page = {
+            "notifications": [{"id": str(uuid.uuid4())}, {"id": str(uuid.uuid4())}],
+            "cursor": "next",
+            "has_more": True,
+            "retry_after": None,
+        }
+
+        async def slot_free(user_id: str, event_id: str) -> bool:
+            return True
+
+        async def load_page(*args: Any) -> dict[str, Any]:
+            return page
+
+        async def emit(event: str, data: dict[str, Any], to: str) -> None:
+            emitted.append((event, data, to))
+
+        monkeypatch.setattr(notification_ws, "_acquire_replay_slot", slot_free)
+        monkeypatch.setattr(notification_ws, "_load_missed_page", load_page)
+        monkeypatch.setattr(notification_ws.sio, "emit", emit)
+
+        await notification_ws._emit_missed_notifications(
+            "sid-1", str(uuid.uuid4()), str(uuid.uuid4()), {"last_seen_id": str(uuid.uuid4())}
+        )
+
+        assert emitted == [("notification:missed", page, "sid-1")]
@@ -0,0 +1,154 @@
+"""Unit tests for NotificationService bulk creation and batched delivery."""
+
+import uuid
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.notification import (
+    DeliveryChannelEnum,
+    DeliveryStatusEnum,
+    NotificationTypeEnum,
+)
+from app.models.notification_delivery_status import NotificationDeliveryStatus
+from app.models.notification_preference import NotificationPreference
+from app.services import notification_service
+from app.services.notification_service import BulkNotification, NotificationService
+from app.tasks import notification_tasks
+
+
+@pytest.mark.asyncio
+class TestCreateNotificationsBulk:
+    async def test_creates_notifications_and_delivery_rows(
+        self, db_session: AsyncSession, test_event: Any, test_donor_user: Any, test_user: Any
+    ) -> None:
+        db_session.add(
+            NotificationPreference(
+                user_id=test_user.id,
+                notification_type=NotificationTypeEnum.ITEM_WON,
+                channel=DeliveryChannelEnum.INAPP,
+                enabled=True,
+            )
+        )
+        await db_session.flush()
+        sio = AsyncMock()
+
+        notifications = await NotificationService.create_notifications_bulk(
+            db=db_session,
+            event_id=test_event.id,
+            notification_type=NotificationTypeEnum.ITEM_WON,
+            recipients=[
+                BulkNotification(user_id=test_donor_user.id, title="Won", body="Item A"),
+                BulkNotification(user_id=test_user.id, title="Won", body="Item B"),
+            ],
+            sio=sio,
+        )
+
+        assert [n.user_id for n in notifications] == [test_donor_user.id, test_user.id]
+        assert all(n.id is not None and n.created_at is not None for n in notifications)
+        # No stored preferences -> ITEM_WON defaults to every channel
+        assert notifications[0]._resolved_channels == [  # type: ignore[attr-defined]
+            DeliveryChannelEnum.INAPP,
+            DeliveryChannelEnum.PUSH,
+            DeliveryChannelEnum.EMAIL,
+        ]
+        assert notifications[1]._resolved_channels == [  # type: ignore[attr-defined]
+            DeliveryChannelEnum.INAPP
+        ]
+
+        rows = (
+            await db_session.execute(
+                select(NotificationDeliveryStatus).where(
+                    NotificationDeliveryStatus.notification_id.in_([n.id for n in notifications])
+                )
+            )
+        ).scalars()
+        statuses = {(row.notification_id, row.channel): row.status for row in rows}
+        assert len(statuses) == 4
+        assert statuses[(notifications[0].id, DeliveryChannelEnum.INAPP)] == DeliveryStatusEnum.SENT
+        assert (
+            statuses[(notifications[0].id, DeliveryChannelEnum.PUSH)] == DeliveryStatusEnum.PENDING
+        )
+        assert sio.emit.await_count == 2
+
+    async def test_empty_recipient_list_is_a_no_op(
+        self, db_session: AsyncSession, test_event: Any
+    ) -> None:
+        notifications = await NotificationService.create_notifications_bulk(
+            db=db_session,
+            event_id=test_event.id,
+            notification_type=NotificationTypeEnum.CUSTOM,
+            recipients=[],
+        )
+
+        assert notifications == []
+
+
+@pytest.mark.asyncio
+class TestRecordDeliveryOutcomes:
+    async def test_updates_only_the_given_channel(
+        self, db_session: AsyncSession, test_event: Any, test_donor_user: Any
+    ) -> None:
+        notifications = await NotificationService.create_notifications_bulk(
+            db=db_session,
+            event_id=test_event.id,
+            notification_type=NotificationTypeEnum.CUSTOM,
+            recipients=[BulkNotification(user_id=test_donor_user.id, title="A", body="B")],
+            override_channels=[DeliveryChannelEnum.PUSH, DeliveryChannelEnum.EMAIL],
+        )
+        notification_id = notifications[0].id
+
+        await NotificationService.record_delivery_outcomes(
+            db_session,
+            DeliveryChannelEnum.PUSH,
+            {notification_id: (DeliveryStatusEnum.FAILED, "all_subscriptions_failed")},
+        )
+
+        rows = (
+            await db_session.execute(
+                select(NotificationDeliveryStatus).where(
+                    NotificationDeliveryStatus.notification_id == notification_id
+                )
+            )
+        ).scalars()
+        by_channel = {row.channel: row for row in rows}
+        assert by_channel[DeliveryChannelEnum.PUSH].status == DeliveryStatusEnum.FAILED
+        assert by_channel[DeliveryChannelEnum.PUSH].failure_reason == "all_subscriptions_failed"
+        assert by_channel[DeliveryChannelEnum.EMAIL].status == DeliveryStatusEnum.PENDING
+
+
+class TestDispatchDeliveryTasksBulk:
+    def test_groups_by_channel_and_chunks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(notification_service, "DELIVERY_BATCH_SIZE", 2)
+        push_delay = MagicMock()
+        email_delay = MagicMock()
+        sms_delay = MagicMock()
+        monkeypatch.setattr(
+            notification_tasks.send_push_notification_batch_task, "delay", push_delay
+        )
+        monkeypatch.setattr(
+            notification_tasks.send_email_notification_batch_task, "delay", email_delay
+        )
+        monkeypatch.setattr(notification_tasks.send_sms_notification_batch_task, "delay", sms_delay)
+
+        notifications = [
+            SimpleNamespace(
+                id=uuid.uuid4(),
+                _resolved_channels=[DeliveryChannelEnum.INAPP, DeliveryChannelEnum.PUSH],
+            )
+            for _ in range(3)
+        ]
+        notifications[0]._resolved_channels.append(DeliveryChannelEnum.EMAIL)
+
+        NotificationService.dispatch_delivery_tasks_bulk(notifications)  # type: ignore[arg-type]
+
+        assert [call.args[0] for call in push_delay.call_args_list] == [
+            [str(notifications[0].id), str(notifications[1].id)],
+            [str(notifications[2].id)],
+        ]
+        email_delay.assert_called_once_with([str(notifications[0].id)])
+        sms_delay.assert_not_called()
@@ -5,11 +5,24 @@ Tests the password hashing utilities:
 - Password verification
 - Hash strength (12+ rounds)
 - Invalid password handling
+- Off-loop hashing in the process pool and placeholder hashes
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
 import pytest
 
-from app.core.security import hash_password, verify_password
+from app.core import security
+from app.core.security import (
+    UNUSABLE_PASSWORD_PREFIX,
+    hash_password,
+    hash_password_async,
+    unusable_password_hash,
+    verify_password,
+    verify_password_async,
+)
 
 
 class TestPasswordHashing:
@@ -207,3 +220,53 @@ class TestPasswordHashing:
         # This is a rough check; bcrypt is designed for constant-time comparison
         ratio = max(correct_time, incorrect_time) / min(correct_time, incorrect_time)
         assert ratio < 1.5  # Should be similar timing
+
+
+class TestOffLoopPasswordHashing:
+    """Unit tests for process-pool hashing and placeholder hashes."""
+
+    def test_unusable_password_hash_never_verifies(self) -> None:
+        placeholder = unusable_password_hash()
+
+        assert placeholder.startswith(UNUSABLE_PASSWORD_PREFIX)
+        assert placeholder != unusable_password_hash()
+        assert verify_password(placeholder, placeholder) is False
+
+    @pytest.mark.asyncio
+    async def test_async_hash_round_trips_through_executor(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        executor = ThreadPoolExecutor(max_workers=2)
+        monkeypatch.setattr(security, "_get_password_executor", lambda: executor)
+
+        hashed = await hash_password_async("SecurePass123")
+
+        assert await verify_password_async("SecurePass123", hashed) is True
+        assert await verify_password_async("WrongPass456", hashed) is False
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_unusable_hash_skips_the_executor(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def no_executor() -> None:
+            raise AssertionError("placeholder hash was sent to the hashing pool")
+
+        monkeypatch.setattr(security, "_get_password_executor", no_executor)
+
+        assert await verify_password_async("anything", unusable_password_hash()) is False
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_falls_back_and_is_recreated(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        class BrokenExecutor(ThreadPoolExecutor):
+            def submit(self, *args: Any, **kwargs: Any) -> Any:
+                raise BrokenProcessPool("worker died")
+
+        broken = BrokenExecutor(max_workers=1)
+        monkeypatch.setattr(security, "_password_executor", broken)
+
+        hashed = await hash_password_async("SecurePass123")
+
+        assert verify_password("SecurePass123", hashed) is True
+        assert security._password_executor is None
+        broken.shutdown()
@@ -0,0 +1,214 @@
+"""Unit tests for the bulk commit path of RegistrationImportService."""
+
+import uuid
+from collections.abc import Callable
+from datetime import date
+from typing import Any, cast
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.registration_import import ImportRowResult, ImportRowStatus
+from app.services import registration_import_service
+from app.services.import_progress import ImportProgress
+from app.services.import_reader import ParsedRow
+from app.services.registration_import_service import (
+    RegistrationImportError,
+    RegistrationImportService,
+    _PlannedInserts,
+    _TicketPurchaseIndex,
+)
+from app.tests.unit.conftest import FakeSession
+
+RowFactory = Callable[..., ParsedRow]
+
+
+def _result(row_number: int, email: str) -> ImportRowResult:
+    return ImportRowResult(
+        row_number=row_number,
+        registrant_email=email,
+        status=ImportRowStatus.CREATED,
+        message="Ready",
+    )
+
+
+def test_plan_registration_builds_user_guests_and_meals(
+    fake_session: FakeSession, make_row: RowFactory
+) -> None:
+    service = RegistrationImportService(cast(AsyncSession, fake_session))
+    event_id = uuid.uuid4()
+    donor_role_id = uuid.uuid4()
+    purchase_id = uuid.uuid4()
+    chicken_id = uuid.uuid4()
+    index = _TicketPurchaseIndex(ids_by_external_id={"SALE-1": [purchase_id]})
+
+    plan = service._plan_registration(
+        event_id,
+        make_row(
+            2,
+            registrant_name="Ada Lovelace",
+            registrant_email="Ada@Example.com",
+            guest_count=4,
+            food_option="Chicken",
+            ticket_purchase_id="SALE-1",
+        ),
+        [make_row(3, registrant_name="Guest One", guest_of_email="ada@example.com")],
+        {},
+        donor_role_id,
+        index,
+        {"chicken": chicken_id},
+        {},
+    )
+
+    assert plan.user is not None
+    assert plan.user["email"] == "ada@example.com"
+    assert (plan.user["first_name"], plan.user["last_name"]) == ("Ada", "Lovelace")
+    assert plan.user["role_id"] == donor_role_id
+    assert plan.registration is not None
+    assert plan.registration["user_id"] == plan.user["id"]
+    assert plan.registration["ticket_purchase_id"] == purchase_id
+    assert plan.registration["number_of_guests"] == 4
+    assert [guest["name"] for guest in plan.guests] == ["Ada Lovelace", "Guest One", None, None]
+    assert [guest["is_primary"] for guest in plan.guests] == [True, False, False, False]
+    assert plan.guests[0]["user_id"] == plan.user["id"]
+    assert plan.meals == [
+        {
+            "id": plan.meals[0]["id"],
+            "registration_id": plan.registration["id"],
+            "guest_id": plan.guests[0]["id"],
+            "food_option_id": chicken_id,
+        }
+    ]
+    assert plan.guest_row_numbers == [3]
+
+
+def test_plan_registration_reuses_existing_user_and_checks_purchase(
+    fake_session: FakeSession, make_row: RowFactory
+) -> None:
+    service = RegistrationImportService(cast(AsyncSession, fake_session))
+    event_id = uuid.uuid4()
+    user_id = uuid.uuid4()
+    purchase_id = uuid.uuid4()
+    index = _TicketPurchaseIndex(
+        ids_by_email_date={("buyer@example.com", date(2026, 3, 1)): [purchase_id]}
+    )
+    row = make_row(
+        2,
+        registrant_name="Grace Hopper",
+        registrant_email="grace@example.com",
+        ticket_purchaser_email="Buyer@Example.com",
+        ticket_purchase_date="2026-03-01",
+    )
+
+    plan = service._plan_registration(
+        event_id, row, [], {"grace@example.com": user_id}, None, index, {}, {}
+    )
+    assert plan.user is None
+    assert plan.registration is not None
+    assert plan.registration["user_id"] == user_id
+    assert plan.registration["ticket_purchase_id"] == purchase_id
+
+    row.data["ticket_purchase_date"] = "2026-03-02"
+    with pytest.raises(RegistrationImportError, match="No matching ticket purchase"):
+        service._plan_registration(
+            event_id, row, [], {"grace@example.com": user_id}, None, index, {}, {}
+        )
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_is_retried_row_by_row(
+    monkeypatch: pytest.MonkeyPatch, fake_session: FakeSession
+) -> None:
+    service = RegistrationImportService(cast(AsyncSession, fake_session))
+    attempts: list[list[int]] = []
+
+    async def insert_planned(plans: list[_PlannedInserts]) -> set[int]:
+        attempts.append([plan.row_number for plan in plans])
+        if any(plan.row_number == 3 for plan in plans):
+            raise ValueError("value too long for type character varying(20)")
+        return {4} if len(plans) == 1 and plans[0].row_number == 4 else set()
+
+    monkeypatch.setattr(service, "_insert_planned", insert_planned)
+    plans = [_PlannedInserts(row_number=number) for number in (2, 3, 4)]
+
+    assert await service._write_planned_chunk(plans[:1]) == (set(), {})
+    assert (fake_session.commits, fake_session.savepoints) == (1, 0)
+
+    skipped, failed = await service._write_planned_chunk(plans)
+
+    assert attempts[1:] == [[2, 3, 4], [2], [3], [4]]
+    assert skipped == {4}
+    assert failed == {3: "value too long for type character varying(20)"}
+    assert (fake_session.commits, fake_session.rollbacks, fake_session.savepoints) == (2, 1, 3)
+
+
+@pytest.mark.asyncio
+async def test_commit_bulk_keeps_row_order_and_reports_per_chunk(
+    monkeypatch: pytest.MonkeyPatch, fake_session: FakeSession, make_row: RowFactory
+) -> None:
+    monkeypatch.setattr(
+        registration_import_service.settings, "registration_import_commit_chunk_size", 2
+    )
+    service = RegistrationImportService(cast(AsyncSession, fake_session))
+    existing_user_id = uuid.uuid4()
+    reported: list[int] = []
+
+    class Recorder(ImportProgress):
+        async def row(self, row_number: int, status: str, message: str | None = None) -> None:
+            reported.append(row_number)
+
+    async def user_ids(emails: set[str]) -> dict[str, uuid.UUID]:
+        return {"old@example.com": existing_user_id} if "old@example.com" in emails else {}
+
+    async def registered(event_id: uuid.UUID, ids: set[uuid.UUID]) -> set[uuid.UUID]:
+        return {existing_user_id}
+
+    async def purchases(event_id: uuid.UUID, rows: list[dict[str, Any]]) -> Any:
+        return _TicketPurchaseIndex()
+
+    async def donor_role() -> uuid.UUID:
+        return uuid.uuid4()
+
+    async def write(plans: list[_PlannedInserts]) -> tuple[set[int], dict[int, str]]:
+        return set(), {}
+
+    monkeypatch.setattr(service, "_fetch_user_ids_by_email", user_ids)
+    monkeypatch.setattr(service, "_fetch_registered_user_ids", registered)
+    monkeypatch.setattr(service, "_fetch_ticket_purchase_index", purchases)
+    monkeypatch.setattr(service, "_fetch_donor_role_id", donor_role)
+    monkeypatch.setattr(service, "_write_planned_chunk", write)
+
+    rows = [
+        make_row(2, registrant_name="New Donor", registrant_email="new@example.com"),
+        make_row(3, registrant_name="Guest", guest_of_email="new@example.com"),
+        make_row(4, registrant_name="Old Donor", registrant_email="old@example.com"),
+        make_row(5, registrant_name="Orphan", guest_of_email="nobody@example.com"),
+        make_row(6, registrant_name="", registrant_email="blank@example.com"),
+    ]
+    guests_by_parent = {"new@example.com": [rows[1]], "nobody@example.com": [rows[3]]}
+    validation = [
+        _result(row.row_number, str(row.data.get("registrant_email", ""))) for row in rows
+    ]
+
+    results = await service._commit_bulk(
+        uuid.uuid4(),
+        validation,
+        {row.row_number: row for row in rows},
+        guests_by_parent,
+        {},
+        {},
+        {},
+        Recorder(),
+    )
+
+    assert [(result.row_number, result.status) for result in results] == [
+        (2, ImportRowStatus.CREATED),
+        (4, ImportRowStatus.SKIPPED),
+        (6, ImportRowStatus.ERROR),
+        (3, ImportRowStatus.CREATED),
+        (5, ImportRowStatus.ERROR),
+    ]
+    assert results[1].message == "Skipped: registration already exists"
+    assert "name and email are required" in results[2].message
+    assert results[4].message == "Failed to create guest: parent registration not found"
+    assert reported == [2, 4, 6, 3, 5]
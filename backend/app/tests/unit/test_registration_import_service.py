@@ -276,7 +276,7 @@ class TestValidation:
         test_event: Event,
     ):
         """Test validation passes with all required fields."""
-        from app.services.registration_import_service import ParsedRow
+        from app.services.import_reader import ParsedRow
 
         rows = [
             ParsedRow(
@@ -305,7 +305,7 @@ class TestValidation:
         test_event: Event,
     ):
         """Test validation fails with missing required field."""
-        from app.services.registration_import_service import ParsedRow
+        from app.services.import_reader import ParsedRow
 
         rows = [
             ParsedRow(
@@ -333,7 +333,7 @@ class TestValidation:
         test_event: Event,
     ):
         """Test validation detects duplicate external IDs in file."""
-        from app.services.registration_import_service import ParsedRow
+        from app.services.import_reader import ParsedRow
 
         rows = [
             ParsedRow(
@@ -371,7 +371,7 @@ class TestValidation:
         test_event: Event,
     ):
         """Test validation warns about existing external IDs."""
-        from app.services.registration_import_service import ParsedRow
+        from app.services.import_reader import ParsedRow
 
         existing_ids = {"REG-EXISTS"}
         rows = [
@@ -402,7 +402,7 @@ class TestValidation:
         """Test validation fails with non-existent ticket purchase."""
         from uuid import uuid4
 
-        from app.services.registration_import_service import ParsedRow
+        from app.services.import_reader import ParsedRow
 
         rows = [
             ParsedRow(
@@ -430,7 +430,7 @@ class TestValidation:
         test_event: Event,
     ):
         """Test validation fails with invalid quantity."""
-        from app.services.registration_import_service import ParsedRow
+        from app.services.import_reader import ParsedRow
 
         rows = [
             ParsedRow(
@@ -457,7 +457,7 @@ class TestValidation:
         test_event: Event,
     ):
         """Test validation fails with invalid date format."""
-        from app.services.registration_import_service import ParsedRow
+        from app.services.import_reader import ParsedRow
 
         rows = [
             ParsedRow(
@@ -484,7 +484,7 @@ class TestValidation:
         test_event: Event,
     ):
         """Test validation warns about event_id mismatch."""
-        from app.services.registration_import_service import ParsedRow
+        from app.services.import_reader import ParsedRow
 
         rows = [
             ParsedRow(
@@ -511,7 +511,7 @@ class TestValidation:
         test_event: Event,
     ):
         """Test guest row fails when parent registration is missing."""
-        from app.services.registration_import_service import ParsedRow
+        from app.services.import_reader import ParsedRow
 
         rows = [
             ParsedRow(
@@ -539,7 +539,7 @@ class TestValidation:
         test_event: Event,
     ):
         """Test duplicate guest email per parent fails preflight."""
-        from app.services.registration_import_service import ParsedRow
+        from app.services.import_reader import ParsedRow
 
         rows = [
             ParsedRow(
@@ -589,7 +589,7 @@ class TestValidation:
         test_event: Event,
     ):
         """Test guest rows exceeding guest_count fail preflight."""
-        from app.services.registration_import_service import ParsedRow
+        from app.services.import_reader import ParsedRow
 
         rows = [
             ParsedRow(
@@ -639,7 +639,7 @@ class TestValidation:
         test_event: Event,
     ):
         """Test invalid food option fails preflight."""
-        from app.services.registration_import_service import ParsedRow
+        from app.services.import_reader import ParsedRow
 
         rows = [
             ParsedRow(
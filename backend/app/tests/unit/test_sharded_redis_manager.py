@@ -0,0 +1,53 @@
+"""Unit tests for per-event Socket.IO pub/sub channel routing."""
+
+from typing import Any
+
+import pytest
+
+from app.websocket.sharded_redis_manager import ShardedRedisManager, event_shard
+
+
+def test_event_shard_of_event_scoped_rooms() -> None:
+    assert event_shard("event:e1") == "e1"
+    assert event_shard("user:u1:event:e1") == "e1"
+    assert event_shard("user:u1") is None
+    assert event_shard("some-sid") is None
+    assert event_shard(None) is None
+
+
+def test_only_event_room_emits_leave_the_base_channel() -> None:
+    manager = ShardedRedisManager("redis://localhost:6379/0")
+
+    assert manager._channel_for({"method": "emit", "room": "event:e1"}) == "socketio:event:e1"
+    assert (
+        manager._channel_for({"method": "emit", "room": "user:u1:event:e1"}) == "socketio:event:e1"
+    )
+    assert manager._channel_for({"method": "emit", "room": None}) == "socketio"
+    assert manager._channel_for({"method": "enter_room", "room": "event:e1"}) == "socketio"
+
+
+@pytest.mark.asyncio
+async def test_subscribes_while_an_event_room_is_joined_locally() -> None:
+    manager = ShardedRedisManager("redis://localhost:6379/0")
+    changes: list[tuple[str, bool]] = []
+
+    async def set_subscription(shard: str, subscribe: bool) -> None:
+        changes.append((shard, subscribe))
+
+    manager._set_subscription = set_subscription  # type: ignore[method-assign]
+    manager.rooms = {"/": {None: {"s1": "eio1"}}}
+
+    rooms: dict[Any, Any] = manager.rooms["/"]
+    rooms["event:e1"] = {"s1": "eio1"}
+    rooms["user:u1:event:e1"] = {"s1": "eio1"}
+    await manager._refresh_rooms("/", ["event:e1", "user:u1:event:e1"])
+    assert manager.subscribed_shards == {"e1"}
+
+    del rooms["event:e1"]
+    await manager._refresh_rooms("/", ["event:e1"])
+    assert manager.subscribed_shards == {"e1"}
+
+    del rooms["user:u1:event:e1"]
+    await manager._refresh_rooms("/", ["user:u1:event:e1"])
+    assert manager.subscribed_shards == set()
+    assert changes == [("e1", True), ("e1", False)]
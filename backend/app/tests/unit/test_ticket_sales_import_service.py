@@ -91,7 +91,7 @@ General,Jane Smith,jane@example.com,1,50.00,2026-02-02,EXT-002"""
     async def test_validate_row_missing_required_field(self, db_session: AsyncSession) -> None:
         """Test validation catches missing required fields."""
         service = TicketSalesImportService(db_session)
-        from app.services.ticket_sales_import_service import ParsedRow
+        from app.services.import_reader import ParsedRow
 
         row = ParsedRow(
             row_number=1,
@@ -116,7 +116,7 @@ General,Jane Smith,jane@example.com,1,50.00,2026-02-02,EXT-002"""
     async def test_validate_row_invalid_quantity(self, db_session: AsyncSession) -> None:
         """Test validation catches invalid quantity."""
         service = TicketSalesImportService(db_session)
-        from app.services.ticket_sales_import_service import ParsedRow
+        from app.services.import_reader import ParsedRow
 
         row = ParsedRow(
             row_number=1,
@@ -140,7 +140,7 @@ General,Jane Smith,jane@example.com,1,50.00,2026-02-02,EXT-002"""
     async def test_validate_row_ticket_type_not_found(self, db_session: AsyncSession) -> None:
         """Test validation catches non-existent ticket type."""
         service = TicketSalesImportService(db_session)
-        from app.services.ticket_sales_import_service import ParsedRow
+        from app.services.import_reader import ParsedRow
 
         row = ParsedRow(
             row_number=1,
@@ -164,7 +164,7 @@ General,Jane Smith,jane@example.com,1,50.00,2026-02-02,EXT-002"""
     async def test_validate_row_duplicate_in_file(self, db_session: AsyncSession) -> None:
         """Test validation catches duplicate external_sale_id in file."""
         service = TicketSalesImportService(db_session)
-        from app.services.ticket_sales_import_service import ParsedRow
+        from app.services.import_reader import ParsedRow
 
         row = ParsedRow(
             row_number=2,
@@ -189,7 +189,7 @@ General,Jane Smith,jane@example.com,1,50.00,2026-02-02,EXT-002"""
     async def test_validate_row_existing_external_id(self, db_session: AsyncSession) -> None:
         """Test validation warns about existing external_sale_id."""
         service = TicketSalesImportService(db_session)
-        from app.services.ticket_sales_import_service import ParsedRow
+        from app.services.import_reader import ParsedRow
 
         row = ParsedRow(
             row_number=1,
@@ -214,7 +214,7 @@ General,Jane Smith,jane@example.com,1,50.00,2026-02-02,EXT-002"""
     async def test_validate_row_negative_amount(self, db_session: AsyncSession) -> None:
         """Test validation catches negative total_amount."""
         service = TicketSalesImportService(db_session)
-        from app.services.ticket_sales_import_service import ParsedRow
+        from app.services.import_reader import ParsedRow
 
         row = ParsedRow(
             row_number=1,
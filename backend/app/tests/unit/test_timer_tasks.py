@@ -0,0 +1,55 @@
+"""Unit tests for the timer wheel dispatcher."""
+
+import asyncio
+import uuid
+from datetime import datetime
+from typing import Any
+
+import pytest
+
+from app.services.timer_wheel import (
+    AUCTION_CLOSING_SOON,
+    CHECKOUT_AUTO_OPEN,
+    DueTimer,
+    TimerWheel,
+)
+from app.tasks import timer_tasks
+
+
+def test_timer_family_strips_parameter() -> None:
+    timer = DueTimer(uuid.uuid4(), f"{AUCTION_CLOSING_SOON}:15", 0.0, {"minutes": 15})
+
+    assert timer.family == AUCTION_CLOSING_SOON
+
+
+def test_dispatch_fires_handlers_and_requeues_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    ok = DueTimer(uuid.uuid4(), f"{AUCTION_CLOSING_SOON}:5", 0.0, {"minutes": 5})
+    failing = DueTimer(uuid.uuid4(), CHECKOUT_AUTO_OPEN, 0.0)
+    unknown = DueTimer(uuid.uuid4(), "no_such_kind", 0.0)
+    batches = [[ok, failing, unknown]]
+    fired: list[DueTimer] = []
+    requeued: list[tuple[uuid.UUID, str, datetime]] = []
+
+    async def claim_due(limit: int, now: float | None = None) -> list[DueTimer]:
+        return batches.pop(0) if batches else []
+
+    async def upsert(
+        event_id: uuid.UUID, kind: str, due_at: datetime, payload: dict[str, Any] | None = None
+    ) -> None:
+        requeued.append((event_id, kind, due_at))
+
+    def broken(timer: DueTimer) -> None:
+        raise ConnectionError("broker unavailable")
+
+    monkeypatch.setattr(TimerWheel, "claim_due", claim_due)
+    monkeypatch.setattr(TimerWheel, "upsert", upsert)
+    monkeypatch.setitem(timer_tasks.TIMER_HANDLERS, AUCTION_CLOSING_SOON, fired.append)
+    monkeypatch.setitem(timer_tasks.TIMER_HANDLERS, CHECKOUT_AUTO_OPEN, broken)
+
+    count = asyncio.run(timer_tasks._dispatch_due_timers_async())
+
+    assert count == 1
+    assert fired == [ok]
+    assert [(event_id, kind) for event_id, kind, _ in requeued] == [
+        (failing.event_id, CHECKOUT_AUTO_OPEN)
+    ]
@@ -0,0 +1,117 @@
+"""Unit tests for the async Web Push sender and VAPID header cache."""
+
+import asyncio
+import base64
+import os
+import time
+
+import pytest
+from aiohttp import web
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from py_vapid import Vapid02
+
+from app.services import push_notification_service, web_push_sender
+from app.services.web_push_sender import VapidHeaderCache, WebPushSender
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+@pytest.fixture
+def vapid() -> VapidHeaderCache:
+    key = Vapid02()
+    key.generate_keys()
+    raw = key.private_key.private_numbers().private_value.to_bytes(32, "big")
+    return VapidHeaderCache(_b64url(raw), "mailto:test@example.com")
+
+
+@pytest.fixture
+def subscription_keys() -> tuple[str, str]:
+    public_key = ec.generate_private_key(ec.SECP256R1()).public_key()
+    p256dh = public_key.public_bytes(
+        serialization.Encoding.X962, serialization.PublicFormat.UncompressedPoint
+    )
+    return _b64url(p256dh), _b64url(os.urandom(16))
+
+
+class TestVapidHeaderCache:
+    def test_reuses_headers_per_audience(self, vapid: VapidHeaderCache) -> None:
+        first = vapid.headers_for("https://fcm.googleapis.com")
+        assert first["Authorization"].startswith("vapid t=")
+        assert vapid.headers_for("https://fcm.googleapis.com") == first
+        assert vapid.headers_for("https://web.push.apple.com") != first
+
+    def test_resigns_near_expiry(
+        self, vapid: VapidHeaderCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        first = vapid.headers_for("https://fcm.googleapis.com")
+        now = time.time()
+        monkeypatch.setattr(
+            time, "time", lambda: now + web_push_sender.VAPID_TOKEN_LIFETIME_SECONDS
+        )
+        assert vapid.headers_for("https://fcm.googleapis.com") != first
+
+
+@pytest.mark.asyncio
+class TestWebPushSender:
+    async def test_reports_status_and_gone_subscriptions(
+        self, vapid: VapidHeaderCache, subscription_keys: tuple[str, str]
+    ) -> None:
+        seen_headers: list[dict[str, str]] = []
+
+        async def handler(request: web.Request) -> web.Response:
+            seen_headers.append(dict(request.headers))
+            await request.read()
+            return web.Response(status=int(request.match_info["status"]))
+
+        app = web.Application()
+        app.router.add_post("/push/{status}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        p256dh, auth = subscription_keys
+
+        try:
+            async with WebPushSender(vapid, max_concurrency=2) as sender:
+                created, gone, error = await asyncio.gather(
+                    *(
+                        sender.send(
+                            f"http://127.0.0.1:{port}/push/{status}", p256dh, auth, '{"t": 1}'
+                        )
+                        for status in (201, 410, 500)
+                    )
+                )
+        finally:
+            await runner.cleanup()
+
+        assert created.ok and not created.gone
+        assert gone.gone and not gone.ok
+        assert error.status == 500 and not error.ok and not error.gone
+        assert all(h["Authorization"].startswith("vapid t=") for h in seen_headers)
+        assert all(h["Content-Encoding"] == "aes128gcm" for h in seen_headers)
+
+    async def test_transport_errors_do_not_raise(
+        self, vapid: VapidHeaderCache, subscription_keys: tuple[str, str]
+    ) -> None:
+        p256dh, auth = subscription_keys
+        async with WebPushSender(vapid, timeout_seconds=1.0) as sender:
+            result = await sender.send("http://127.0.0.1:9/push", p256dh, auth, "{}")
+
+        assert result.status is None
+        assert result.error
+
+    async def test_push_sender_is_shared_per_event_loop(self, vapid: VapidHeaderCache) -> None:
+        sender = push_notification_service._get_push_sender(vapid)
+        assert push_notification_service._get_push_sender(vapid) is sender
+        session = sender._session_for("https://fcm.googleapis.com")
+
+        await push_notification_service.close_push_sender()
+
+        assert session.closed
+        replacement = push_notification_service._get_push_sender(vapid)
+        assert replacement is not sender
+        await push_notification_service.close_push_sender()
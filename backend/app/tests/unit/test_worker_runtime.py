@@ -0,0 +1,50 @@
+"""Unit tests for the Celery worker asyncio runtime."""
+
+import asyncio
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from app.core import worker_runtime
+from app.core.worker_runtime import run_async
+
+
+async def _current_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+@pytest.fixture
+def worker_loop(monkeypatch: pytest.MonkeyPatch) -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    monkeypatch.setattr(worker_runtime, "_loop", loop)
+    monkeypatch.setattr(worker_runtime, "_loop_thread_id", threading.get_ident())
+    yield loop
+    loop.close()
+
+
+def test_tasks_share_the_worker_loop(worker_loop: asyncio.AbstractEventLoop) -> None:
+    assert run_async(_current_loop()) is worker_loop
+    assert run_async(_current_loop()) is worker_loop
+
+
+def test_other_threads_get_a_private_loop(worker_loop: asyncio.AbstractEventLoop) -> None:
+    result: list[asyncio.AbstractEventLoop] = []
+    thread = threading.Thread(target=lambda: result.append(run_async(_current_loop())))
+    thread.start()
+    thread.join()
+
+    assert result and result[0] is not worker_loop
+
+
+def test_runs_from_inside_a_running_loop() -> None:
+    async def caller() -> asyncio.AbstractEventLoop:
+        return run_async(_current_loop())
+
+    outer = asyncio.new_event_loop()
+    try:
+        inner = outer.run_until_complete(caller())
+    finally:
+        outer.close()
+
+    assert inner is not outer
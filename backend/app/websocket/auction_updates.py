@@ -0,0 +1,117 @@
+"""Coalesced real-time fan-out of auction item state to event rooms.
+
+Bid state is broadcast to the ``event:{event_id}`` room through the Socket.IO
+``AsyncRedisManager``, so every API worker's connected bidders receive it.
+The first update for an item is emitted immediately; further updates inside
+the coalescing window are folded into a single trailing emit carrying the
+latest state, so a burst of bids on one item produces one message.
+
+Every API replica runs its own publisher, so a replica's trailing emit can
+reach clients after a newer state sent by another replica. Each delta carries
+the item's ``bid_state_version``, which increases with every committed bid
+state change; clients keep the highest version they have seen for an item
+(starting from the REST payload) and drop deltas with a lower one.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from app.core.config import get_settings
+from app.models.auction_item import AuctionItem
+from app.websocket.notification_ws import emit_auction_bid_placed, emit_auction_item_changed
+
+Emitter = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+# Drop last-emit timestamps once the map grows past this many items
+_MAX_TRACKED_ITEMS = 1024
+
+
+def build_item_delta(
+    item: AuctionItem, effective_close_at: datetime | None = None
+) -> dict[str, Any]:
+    """Build the compact bid-state payload for an auction item."""
+    return {
+        "item_id": str(item.id),
+        "current_bid_amount": (
+            str(item.current_bid_amount) if item.current_bid_amount is not None else None
+        ),
+        "min_next_bid_amount": (
+            str(item.min_next_bid_amount) if item.min_next_bid_amount is not None else None
+        ),
+        "bid_count": item.bid_count,
+        "bid_state_version": item.bid_state_version,
+        "effective_close_at": effective_close_at.isoformat() if effective_close_at else None,
+    }
+
+
+class AuctionUpdatePublisher:
+    """Per-item coalescing publisher for auction bid deltas."""
+
+    def __init__(self, window_seconds: float) -> None:
+        self.window_seconds = window_seconds
+        self._last_emit_at: dict[UUID, float] = {}
+        self._versions: dict[UUID, int] = {}
+        self._pending: dict[UUID, tuple[Emitter, str, dict[str, Any]]] = {}
+        self._trailing: dict[UUID, asyncio.Task[None]] = {}
+
+    async def publish_bid_placed(self, item: AuctionItem, delta: dict[str, Any]) -> None:
+        """Broadcast a new bid on an item."""
+        await self._publish(item.id, emit_auction_bid_placed, str(item.event_id), delta)
+
+    async def publish_item_changed(self, item: AuctionItem, delta: dict[str, Any]) -> None:
+        """Broadcast a bid-state change that did not come from a new bid."""
+        await self._publish(item.id, emit_auction_item_changed, str(item.event_id), delta)
+
+    async def _publish(
+        self, item_id: UUID, emit: Emitter, event_id: str, delta: dict[str, Any]
+    ) -> None:
+        # Publishes from concurrent requests can arrive out of order
+        version = delta["bid_state_version"]
+        if version < self._versions.get(item_id, version):
+            return
+        self._versions[item_id] = version
+
+        now = time.monotonic()
+        last = self._last_emit_at.get(item_id)
+        if self.window_seconds <= 0 or last is None or now - last >= self.window_seconds:
+            self._last_emit_at[item_id] = now
+            self._prune(now)
+            await emit(event_id, delta)
+            return
+
+        pending = self._pending.get(item_id)
+        if pending and pending[2].get("effective_close_at") and not delta["effective_close_at"]:
+            delta = {**delta, "effective_close_at": pending[2]["effective_close_at"]}
+        self._pending[item_id] = (emit, event_id, delta)
+        if item_id not in self._trailing:
+            delay = self.window_seconds - (now - last)
+            self._trailing[item_id] = asyncio.create_task(self._emit_trailing(item_id, delay))
+
+    async def _emit_trailing(self, item_id: UUID, delay: float) -> None:
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self._trailing.pop(item_id, None)
+        pending = self._pending.pop(item_id, None)
+        if pending is None:
+            return
+        emit, event_id, delta = pending
+        self._last_emit_at[item_id] = time.monotonic()
+        await emit(event_id, delta)
+
+    def _prune(self, now: float) -> None:
+        if len(self._last_emit_at) <= _MAX_TRACKED_ITEMS:
+            return
+        for item_id, emitted_at in list(self._last_emit_at.items()):
+            if now - emitted_at >= self.window_seconds and item_id not in self._pending:
+                del self._last_emit_at[item_id]
+                self._versions.pop(item_id, None)
+
+
+auction_update_publisher = AuctionUpdatePublisher(
+    window_seconds=get_settings().auction_update_coalesce_ms / 1000
+)
@@ -1,15 +1,35 @@
-"""Socket.IO server for real-time notification delivery."""
-
-from datetime import datetime
+"""Socket.IO server for real-time notification delivery.
+
+Missed-notification replay: ``notification:join_event`` may carry the client's
+resume position as an opaque ``cursor`` from a previous replay, a
+``last_seen_id`` or a ``last_seen_at`` timestamp. The server answers with one
+``notification:missed`` payload::
+
+    {"notifications": [...], "cursor": "...", "has_more": bool, "retry_after": int | None}
+
+and the client pages through the rest with ``notification:sync``
+(``{"event_id", "cursor"}``), which returns the same payload as its ack.
+Replays on join are limited to one per user and event per
+``notification_replay_min_interval_seconds``; a throttled join gets an empty
+page with ``retry_after`` and no cursor, and the client retries with
+``notification:sync`` from its own position after that delay. Reconnect
+storms therefore do not become backlog storms.
+"""
+
+import uuid
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import jwt
 import socketio
+from redis.exceptions import RedisError
 from sqlalchemy import select
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.core.redis import get_redis
 from app.models.notification import Notification
+from app.websocket.sharded_redis_manager import ShardedRedisManager
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -18,7 +38,11 @@ settings = get_settings()
 sio = socketio.AsyncServer(
     async_mode="asgi",
     cors_allowed_origins=settings.get_cors_origins_list(),
-    client_manager=socketio.AsyncRedisManager(str(settings.redis_url)),
+    client_manager=(
+        ShardedRedisManager(str(settings.redis_url))
+        if settings.socketio_sharded_channels
+        else socketio.AsyncRedisManager(str(settings.redis_url))
+    ),
     logger=False,
     engineio_logger=False,
 )
@@ -88,8 +112,9 @@ async def disconnect(sid: str) -> None:
 async def join_event(sid: str, data: dict[str, Any]) -> None:
     """Join a user-scoped notification room for an event.
 
-    If `last_seen_at` is provided, emit any notifications created after that
-    timestamp (max 50) so the client can catch up on missed notifications.
+    If the client sends a resume position (``cursor``, ``last_seen_id`` or
+    ``last_seen_at``), emit the first page of notifications it missed as a
+    single ``notification:missed`` payload.
     """
     session = await sio.get_session(sid)
     user_id = session.get("user_id")
@@ -105,11 +130,9 @@ async def join_event(sid: str, data: dict[str, Any]) -> None:
         extra={"sid": sid, "user_id": user_id, "room": room},
     )
 
-    # Sync missed notifications if client provides last_seen_at
-    last_seen_at = data.get("last_seen_at")
-    if last_seen_at:
+    if data.get("cursor") or data.get("last_seen_id") or data.get("last_seen_at"):
         try:
-            await _emit_missed_notifications(sid, user_id, event_id, last_seen_at)
+            await _emit_missed_notifications(sid, user_id, event_id, data)
         except Exception:
             logger.warning(
                 "Failed to emit missed notifications",
@@ -179,56 +202,149 @@ async def emit_unread_count(
         )
 
 
-async def _emit_missed_notifications(
-    sid: str,
+def _serialize_notification(notification: Notification) -> dict[str, Any]:
+    return {
+        "id": str(notification.id),
+        "notification_type": notification.notification_type.value
+        if hasattr(notification.notification_type, "value")
+        else str(notification.notification_type),
+        "title": notification.title,
+        "body": notification.body,
+        "priority": notification.priority.value
+        if hasattr(notification.priority, "value")
+        else str(notification.priority),
+        "data": notification.data,
+        "created_at": notification.created_at.isoformat() if notification.created_at else None,
+    }
+
+
+def encode_replay_cursor(created_at: datetime, notification_id: uuid.UUID) -> str:
+    """Encode a resume position as an opaque cursor string."""
+    return f"{created_at.isoformat()}|{notification_id}"
+
+
+def decode_replay_cursor(cursor: str) -> tuple[datetime, uuid.UUID | None]:
+    """Decode a cursor from encode_replay_cursor (or a bare ISO timestamp)."""
+    created_at, _, notification_id = cursor.partition("|")
+    return (
+        datetime.fromisoformat(created_at),
+        uuid.UUID(notification_id) if notification_id else None,
+    )
+
+
+async def _acquire_replay_slot(user_id: str, event_id: str) -> bool:
+    """Claim this user's replay slot for the event; False if one was used recently."""
+    interval = settings.notification_replay_min_interval_seconds
+    if interval <= 0:
+        return True
+    try:
+        redis = await get_redis()
+        acquired = await redis.set(f"notify:replay:{user_id}:{event_id}", "1", nx=True, ex=interval)
+    except (RedisError, OSError):
+        logger.warning(
+            "Notification replay throttle unavailable",
+            extra={"user_id": user_id, "event_id": event_id},
+        )
+        return True
+    return bool(acquired)
+
+
+async def _load_missed_page(
     user_id: str,
     event_id: str,
-    last_seen_at: str,
-) -> None:
-    """Emit notifications created after last_seen_at to a specific client.
+    position: dict[str, Any],
+) -> dict[str, Any]:
+    """Load one page of notifications after the client's resume position.
 
     Args:
-        sid: Socket.IO session ID (for targeted emit)
         user_id: User UUID string
         event_id: Event UUID string
-        last_seen_at: ISO-format timestamp of last seen notification
+        position: Client payload with ``cursor``, ``last_seen_id`` or ``last_seen_at``
+
+    Returns:
+        The ``notification:missed`` payload.
     """
     from app.core.database import AsyncSessionLocal
+    from app.services.notification_service import NotificationService
 
-    cutoff = datetime.fromisoformat(last_seen_at)
+    user_uuid = uuid.UUID(user_id)
+    event_uuid = uuid.UUID(event_id)
+    oldest = datetime.now(UTC) - timedelta(seconds=settings.notification_replay_max_age_seconds)
 
     async with AsyncSessionLocal() as db:
-        stmt = (
-            select(Notification)
-            .where(
-                Notification.user_id == user_id,
-                Notification.event_id == event_id,
-                Notification.created_at > cutoff,
+        after_id: uuid.UUID | None = None
+        if position.get("cursor"):
+            after_at, after_id = decode_replay_cursor(str(position["cursor"]))
+        elif position.get("last_seen_id"):
+            after_id = uuid.UUID(str(position["last_seen_id"]))
+            seen_at = await db.scalar(
+                select(Notification.created_at).where(
+                    Notification.id == after_id,
+                    Notification.user_id == user_uuid,
+                )
             )
-            .order_by(Notification.created_at.asc())
-            .limit(50)
+            # An unknown id (e.g. purged) replays only the recent window
+            after_at = seen_at or oldest
+            after_id = after_id if seen_at else None
+        else:
+            after_at = datetime.fromisoformat(str(position["last_seen_at"]))
+
+        if after_at.tzinfo is None:
+            after_at = after_at.replace(tzinfo=UTC)
+        if after_at < oldest:
+            after_at, after_id = oldest, None
+
+        missed, has_more = await NotificationService.list_notifications_after(
+            db,
+            user_uuid,
+            event_uuid,
+            after_at,
+            after_id,
+            limit=settings.notification_replay_page_size,
         )
-        result = await db.execute(stmt)
-        missed = list(result.scalars().all())
 
-    if not missed:
+    if missed:
+        last = missed[-1]
+        cursor = encode_replay_cursor(last.created_at, last.id)
+    else:
+        cursor = encode_replay_cursor(after_at, after_id) if after_id else after_at.isoformat()
+    return {
+        "notifications": [_serialize_notification(n) for n in missed],
+        "cursor": cursor,
+        "has_more": has_more,
+        "retry_after": None,
+    }
+
+
+async def _emit_missed_notifications(
+    sid: str,
+    user_id: str,
+    event_id: str,
+    position: dict[str, Any],
+) -> None:
+    """Emit the first page of missed notifications to a joining client.
+
+    Args:
+        sid: Socket.IO session ID (for targeted emit)
+        user_id: User UUID string
+        event_id: Event UUID string
+        position: Client payload with ``cursor``, ``last_seen_id`` or ``last_seen_at``
+    """
+    if not await _acquire_replay_slot(user_id, event_id):
+        await sio.emit(
+            "notification:missed",
+            {
+                "notifications": [],
+                "cursor": None,
+                "has_more": True,
+                "retry_after": settings.notification_replay_min_interval_seconds,
+            },
+            to=sid,
+        )
         return
 
-    for notification in missed:
-        payload = {
-            "id": str(notification.id),
-            "notification_type": notification.notification_type.value
-            if hasattr(notification.notification_type, "value")
-            else str(notification.notification_type),
-            "title": notification.title,
-            "body": notification.body,
-            "priority": notification.priority.value
-            if hasattr(notification.priority, "value")
-            else str(notification.priority),
-            "data": notification.data,
-            "created_at": notification.created_at.isoformat() if notification.created_at else None,
-        }
-        await sio.emit("notification:new", payload, to=sid)
+    page = await _load_missed_page(user_id, event_id, position)
+    await sio.emit("notification:missed", page, to=sid)
 
     logger.info(
         "Emitted missed notifications",
@@ -236,11 +352,37 @@ async def _emit_missed_notifications(
             "sid": sid,
             "user_id": user_id,
             "event_id": event_id,
-            "count": len(missed),
+            "count": len(page["notifications"]),
+            "has_more": page["has_more"],
         },
     )
 
 
+@sio.on("notification:sync")  # type: ignore[misc]
+async def sync_notifications(sid: str, data: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the next page of missed notifications as the ack.
+
+    Accepts the same resume position keys as ``notification:join_event``.
+    """
+    session = await sio.get_session(sid)
+    user_id = session.get("user_id")
+    event_id = data.get("event_id")
+
+    if not user_id or not event_id:
+        return None
+    if not (data.get("cursor") or data.get("last_seen_id") or data.get("last_seen_at")):
+        return None
+
+    try:
+        return await _load_missed_page(user_id, event_id, data)
+    except Exception:
+        logger.warning(
+            "Failed to sync missed notifications",
+            extra={"sid": sid, "user_id": user_id, "event_id": event_id},
+        )
+        return None
+
+
 async def emit_auction_bid_placed(
     event_id: str,
     bid_data: dict[str, Any],
@@ -294,3 +436,57 @@ async def auction_leave_event(sid: str, data: dict[str, Any]) -> None:
         return
     room = f"event:{event_id}"
     await sio.leave_room(sid, room)
+
+
+async def emit_import_job_progress(job_id: str, progress_data: dict[str, Any]) -> None:
+    """Emit import:progress to the room of clients watching an import job."""
+    room = f"import_job:{job_id}"
+    try:
+        await sio.emit("import:progress", progress_data, room=room)
+    except Exception:
+        logger.warning(
+            "Failed to emit import:progress",
+            extra={"job_id": job_id, "room": room},
+        )
+
+
+@sio.on("import:join_job")  # type: ignore[misc]
+async def import_join_job(sid: str, data: dict[str, Any]) -> dict[str, Any] | None:
+    """Watch an import job started by this user.
+
+    Acks with the job's current progress so a client that joins after the
+    job started (or finished) does not wait for the next ``import:progress``.
+    """
+    from app.core.database import AsyncSessionLocal
+    from app.models.import_job import ImportJob
+    from app.services.import_job_service import import_job_progress_payload
+
+    session_data = await sio.get_session(sid)
+    user_id = session_data.get("user_id") if session_data else None
+    try:
+        job_id = uuid.UUID(str(data.get("job_id")))
+    except ValueError:
+        return None
+    if not user_id:
+        return None
+
+    async with AsyncSessionLocal() as db:
+        job = await db.get(ImportJob, job_id)
+    if job is None or str(job.initiated_by_user_id) != user_id:
+        logger.warning(
+            "Rejected import:join_job",
+            extra={"sid": sid, "user_id": user_id, "job_id": str(job_id)},
+        )
+        return None
+
+    await sio.enter_room(sid, f"import_job:{job_id}")
+    return import_job_progress_payload(job)
+
+
+@sio.on("import:leave_job")  # type: ignore[misc]
+async def import_leave_job(sid: str, data: dict[str, Any]) -> None:
+    """Stop watching an import job."""
+    job_id = data.get("job_id")
+    if not job_id:
+        return
+    await sio.leave_room(sid, f"import_job:{job_id}")
@@ -0,0 +1,189 @@
+"""Socket.IO Redis client manager with one pub/sub channel per event.
+
+``AsyncRedisManager`` publishes every emit on a single channel that every
+replica subscribes to, so each replica decodes every bid update for every
+event. This manager routes emits addressed to an event's rooms
+(``event:{id}`` and ``user:{uid}:event:{id}``) to ``<channel>:event:{id}`` and
+each replica subscribes only to the event channels of rooms its own clients
+have joined. Broadcasts, sid-targeted emits and control messages (disconnect,
+remote room changes, ack callbacks) stay on the base channel.
+
+Every API replica and every process that emits (Celery workers) must use the
+same manager class; enable it with ``SOCKETIO_SHARDED_CHANNELS=true``.
+"""
+
+import asyncio
+from collections import Counter
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
+
+import socketio
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def event_shard(room: Any) -> str | None:
+    """Event ID a room belongs to, or None for rooms that are not event-scoped."""
+    if not isinstance(room, str):
+        return None
+    parts = room.split(":")
+    if len(parts) == 2 and parts[0] == "event":
+        return parts[1]
+    if len(parts) == 4 and parts[0] == "user" and parts[2] == "event":
+        return parts[3]
+    return None
+
+
+class ShardedRedisManager(socketio.AsyncRedisManager):  # type: ignore[misc]
+    """AsyncRedisManager that only receives traffic for locally joined events."""
+
+    name = "sharded-aioredis"
+    # Set by AsyncRedisManager; declared here because the base class is untyped
+    connected: bool
+
+    def __init__(self, url: str = "redis://localhost:6379/0", **kwargs: Any) -> None:
+        super().__init__(url, **kwargs)
+        self._shard_prefix = f"{self.channel}:event:"
+        # Event-scoped rooms that exist on this replica, and how many per event
+        self._live_rooms: set[tuple[str, str]] = set()
+        self._rooms_per_shard: Counter[str] = Counter()
+        self._listen_pubsub: Any = None
+
+    def shard_channel(self, shard: str) -> str:
+        return f"{self._shard_prefix}{shard}"
+
+    def _channel_for(self, message: dict[str, Any]) -> str:
+        if message.get("method") == "emit":
+            shard = event_shard(message.get("room"))
+            if shard is not None:
+                return self.shard_channel(shard)
+        return str(self.channel)
+
+    @property
+    def subscribed_shards(self) -> set[str]:
+        """Events whose channel this replica currently listens on."""
+        return set(self._rooms_per_shard)
+
+    async def _publish(self, data: dict[str, Any]) -> Any:
+        channel = self._channel_for(data)
+        _, error = self._get_redis_module_and_error()
+        for retries_left in (1, 0):
+            try:
+                if not self.connected:
+                    self._redis_connect()
+                return await self.redis.publish(channel, self.json.dumps(data))
+            except error as exc:
+                self.connected = False
+                logger.error(
+                    "Cannot publish to redis",
+                    extra={"channel": channel, "retrying": retries_left > 0, "error": str(exc)},
+                )
+        return None
+
+    async def _redis_listen_with_retries(self) -> AsyncIterator[dict[str, Any]]:
+        _, error = self._get_redis_module_and_error()
+        retry_sleep = 1
+        subscribed = False
+        while True:
+            try:
+                if not subscribed:
+                    self._redis_connect()
+                    self._listen_pubsub = self.pubsub
+                    channels = [self.channel, *map(self.shard_channel, self._rooms_per_shard)]
+                    await self._listen_pubsub.subscribe(*channels)
+                    subscribed = True
+                    retry_sleep = 1
+                async for message in self._listen_pubsub.listen():
+                    yield message
+            except error as exc:
+                logger.error(
+                    "Cannot receive from redis, retrying",
+                    extra={"retry_in_seconds": retry_sleep, "error": str(exc)},
+                )
+                subscribed = False
+                self._listen_pubsub = None
+                await asyncio.sleep(retry_sleep)
+                retry_sleep = min(retry_sleep * 2, 60)
+
+    async def _listen(self) -> AsyncIterator[bytes]:
+        base = self.channel.encode("utf-8")
+        prefix = self._shard_prefix.encode("utf-8")
+        async for message in self._redis_listen_with_retries():
+            channel = message.get("channel") or b""
+            if (
+                message.get("type") == "message"
+                and "data" in message
+                and (channel == base or channel.startswith(prefix))
+            ):
+                yield message["data"]
+
+    async def _set_subscription(self, shard: str, subscribe: bool) -> None:
+        pubsub = self._listen_pubsub
+        if pubsub is None:
+            # Not listening yet (or reconnecting): the listener subscribes on connect
+            return
+        channel = self.shard_channel(shard)
+        try:
+            if subscribe:
+                await pubsub.subscribe(channel)
+            else:
+                await pubsub.unsubscribe(channel)
+        except Exception:
+            logger.warning(
+                "Failed to update event channel subscription",
+                extra={"channel": channel, "subscribe": subscribe},
+            )
+
+    async def _refresh_rooms(self, namespace: str | None, rooms: Iterable[Any]) -> None:
+        """Reconcile event channel subscriptions after rooms were entered or left."""
+        namespace = namespace or "/"
+        present = self.rooms.get(namespace, {})
+        for room in rooms:
+            shard = event_shard(room)
+            if shard is None:
+                continue
+            key = (namespace, room)
+            if room in present and key not in self._live_rooms:
+                self._live_rooms.add(key)
+                self._rooms_per_shard[shard] += 1
+                if self._rooms_per_shard[shard] == 1:
+                    await self._set_subscription(shard, True)
+            elif room not in present and key in self._live_rooms:
+                self._live_rooms.discard(key)
+                self._rooms_per_shard[shard] -= 1
+                if self._rooms_per_shard[shard] == 0:
+                    del self._rooms_per_shard[shard]
+                    await self._set_subscription(shard, False)
+
+    async def enter_room(
+        self, sid: str, namespace: str, room: str, eio_sid: str | None = None
+    ) -> None:
+        await super().enter_room(sid, namespace, room, eio_sid=eio_sid)
+        await self._refresh_rooms(namespace, [room])
+
+    async def leave_room(self, sid: str, namespace: str, room: str) -> None:
+        await super().leave_room(sid, namespace, room)
+        await self._refresh_rooms(namespace, [room])
+
+    async def close_room(self, room: str, namespace: str | None = None) -> None:
+        await super().close_room(room, namespace=namespace)
+        await self._refresh_rooms(namespace, [room])
+
+    async def disconnect(self, sid: str, namespace: str, **kwargs: Any) -> None:
+        rooms = self.get_rooms(sid, namespace)
+        await super().disconnect(sid, namespace, **kwargs)
+        await self._refresh_rooms(namespace, rooms)
+
+    async def _handle_enter_room(self, message: dict[str, Any]) -> None:
+        await super()._handle_enter_room(message)
+        await self._refresh_rooms(message.get("namespace"), [message.get("room")])
+
+    async def _handle_leave_room(self, message: dict[str, Any]) -> None:
+        await super()._handle_leave_room(message)
+        await self._refresh_rooms(message.get("namespace"), [message.get("room")])
+
+    async def _handle_close_room(self, message: dict[str, Any]) -> None:
+        await super()._handle_close_room(message)
+        await self._refresh_rooms(message.get("namespace"), [message.get("room")])
@@ -0,0 +1,113 @@
+"""Event-loop responsiveness while hashing an import's worth of passwords.
+
+Simulates the password work of a user import three ways and, for each, runs a
+heartbeat task that asks to wake every ``--tick-ms`` milliseconds. How late
+the heartbeat wakes is how long every other request on the same API worker
+would have waited:
+
+  - inline:  hash_password() on the event loop (the old import behaviour)
+  - pool:    hash_password_async() in the hashing process pool
+  - setup:   unusable_password_hash() for rows that get an account-setup link
+
+    poetry run python scripts/password_hash_benchmark.py --rows 200
+    PASSWORD_HASH_WORKERS=4 poetry run python scripts/password_hash_benchmark.py --rows 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import secrets
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.security import (  # noqa: E402
+    hash_password,
+    hash_password_async,
+    shutdown_password_executor,
+    unusable_password_hash,
+)
+
+
+async def _heartbeat(tick: float, lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        expected = time.perf_counter() + tick
+        await asyncio.sleep(tick)
+        lags.append(max(0.0, time.perf_counter() - expected) * 1000)
+
+
+async def _measure(
+    work: Callable[[list[str]], Awaitable[Any]], passwords: list[str], tick: float
+) -> dict[str, Any]:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    heartbeat = asyncio.create_task(_heartbeat(tick, lags, stop))
+    await asyncio.sleep(tick * 2)
+    started = time.perf_counter()
+    await work(passwords)
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await heartbeat
+
+    ordered = sorted(lags) or [0.0]
+    return {
+        "seconds": round(elapsed, 2),
+        "rows_per_second": round(len(passwords) / elapsed, 1) if elapsed else None,
+        "loop_lag_ms": {
+            "p50": round(ordered[len(ordered) // 2], 1),
+            "p99": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 1),
+            "max": round(ordered[-1], 1),
+        },
+    }
+
+
+async def _inline(passwords: list[str]) -> None:
+    for password in passwords:
+        hash_password(password)
+
+
+async def _pool(passwords: list[str]) -> None:
+    await asyncio.gather(*(hash_password_async(password) for password in passwords))
+
+
+async def _setup(passwords: list[str]) -> None:
+    for _ in passwords:
+        unusable_password_hash()
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    passwords = [f"Import{secrets.token_urlsafe(8)}1" for _ in range(args.rows)]
+    tick = args.tick_ms / 1000
+    # Start the worker processes outside the measured window
+    await hash_password_async("warm-up-1")
+
+    report: dict[str, Any] = {"rows": args.rows}
+    modes = {"inline": _inline, "pool": _pool, "setup": _setup}
+    for mode in args.modes:
+        report[mode] = await _measure(modes[mode], passwords, tick)
+    shutdown_password_executor()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Password hashing loop-lag benchmark")
+    parser.add_argument("--rows", type=int, default=100, help="Passwords to hash")
+    parser.add_argument("--tick-ms", type=float, default=10.0, help="Heartbeat interval")
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=["inline", "pool", "setup"],
+        default=["inline", "pool", "setup"],
+    )
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+"""Socket.IO fan-out load harness.
+
+Starts N Socket.IO replicas sharing one Redis, connects simulated donors that
+join the same rooms production clients join (``event:{id}`` and
+``user:{uid}:event:{id}``), then publishes bid updates and personal
+notifications from a write-only manager, the way API workers and Celery tasks
+do. Reports emit-to-receive latency percentiles, delivery counts and how many
+pub/sub messages each replica had to process.
+
+Run against a throwaway local Redis (the harness only publishes; it does not
+write keys):
+
+    docker run --rm -p 6379:6379 redis:7
+    poetry run python scripts/socketio_load_test.py --replicas 2 --clients 500 --events 5
+    poetry run python scripts/socketio_load_test.py --mode sharded --replicas 4 --clients 2000
+
+Replicas run in their own processes by default so each one's pub/sub load is
+measured in isolation; ``--in-process`` runs everything in one event loop.
+Runs are reproducible for a given ``--seed``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import resource
+import statistics
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import socketio
+import uvicorn
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.websocket.sharded_redis_manager import ShardedRedisManager  # noqa: E402
+
+MANAGERS: dict[str, type[socketio.AsyncRedisManager]] = {
+    "broadcast": socketio.AsyncRedisManager,
+    "sharded": ShardedRedisManager,
+}
+
+# Channel name isolated from a running app that shares the same Redis
+CHANNEL = "socketio-loadtest"
+
+
+@dataclass
+class Plan:
+    """Deterministic assignment of simulated donors to replicas and events."""
+
+    event_ids: list[str]
+    clients: list[tuple[str, str, int]]  # (user_id, event_id, replica index)
+
+    @classmethod
+    def build(
+        cls, seed: int, events: int, clients: int, replicas: int, replicas_per_event: int
+    ) -> Plan:
+        """Spread donors round-robin over events, and each event's donors over
+        ``replicas_per_event`` consecutive replicas (fewer models sticky routing)."""
+        rng = random.Random(seed)
+        event_ids = [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(events)]
+        spread = max(1, min(replicas_per_event, replicas))
+        assignments = []
+        for index in range(clients):
+            event_index, position = index % events, index // events
+            assignments.append(
+                (
+                    str(uuid.UUID(int=rng.getrandbits(128))),
+                    event_ids[event_index],
+                    (event_index + position % spread) % replicas,
+                )
+            )
+        return cls(event_ids=event_ids, clients=assignments)
+
+
+@dataclass
+class Results:
+    latencies_ms: list[float] = field(default_factory=list)
+    expected: int = 0
+
+    def summary(self) -> dict[str, Any]:
+        ordered = sorted(self.latencies_ms)
+
+        def pct(p: float) -> float | None:
+            if not ordered:
+                return None
+            return round(ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))], 2)
+
+        return {
+            "expected_deliveries": self.expected,
+            "received_deliveries": len(ordered),
+            "delivery_ratio": round(len(ordered) / self.expected, 4) if self.expected else None,
+            "latency_ms": {
+                "p50": pct(50),
+                "p90": pct(90),
+                "p99": pct(99),
+                "max": round(ordered[-1], 2) if ordered else None,
+                "mean": round(statistics.fmean(ordered), 2) if ordered else None,
+            },
+        }
+
+
+def _counting_manager(mode: str, redis_url: str) -> socketio.AsyncRedisManager:
+    """Client manager that counts the emits it receives over pub/sub."""
+    base = MANAGERS[mode]
+
+    class CountingManager(base):  # type: ignore[misc, valid-type]
+        received = 0
+
+        async def _handle_emit(self, message: dict[str, Any]) -> None:
+            CountingManager.received += 1
+            await super()._handle_emit(message)
+
+    return CountingManager(redis_url, channel=CHANNEL)
+
+
+def _build_replica(mode: str, redis_url: str) -> tuple[socketio.AsyncServer, Any]:
+    manager = _counting_manager(mode, redis_url)
+    sio = socketio.AsyncServer(async_mode="asgi", client_manager=manager, logger=False)
+
+    @sio.event  # type: ignore[misc]
+    async def connect(sid: str, environ: dict[str, Any], auth: dict[str, Any] | None) -> None:
+        await sio.save_session(sid, {"user_id": (auth or {}).get("user_id")})
+
+    @sio.on("join")  # type: ignore[misc]
+    async def join(sid: str, data: dict[str, Any]) -> bool:
+        session = await sio.get_session(sid)
+        event_id = data["event_id"]
+        await sio.enter_room(sid, f"event:{event_id}")
+        await sio.enter_room(sid, f"user:{session['user_id']}:event:{event_id}")
+        return True
+
+    return sio, manager
+
+
+async def _serve_replica(mode: str, redis_url: str, port: int, stop: asyncio.Event) -> int:
+    sio, manager = _build_replica(mode, redis_url)
+    config = uvicorn.Config(
+        socketio.ASGIApp(sio), host="127.0.0.1", port=port, log_level="warning", lifespan="off"
+    )
+    server = uvicorn.Server(config)
+    task = asyncio.create_task(server.serve())
+    await stop.wait()
+    server.should_exit = True
+    await task
+    return int(type(manager).received)
+
+
+def _replica_process(mode: str, redis_url: str, port: int, conn: Any) -> None:
+    async def run() -> int:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        loop.add_reader(conn.fileno(), stop.set)
+        return await _serve_replica(mode, redis_url, port, stop)
+
+    received = asyncio.run(run())
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    conn.send({"pubsub_emits": received, "cpu_seconds": round(usage.ru_utime + usage.ru_stime, 2)})
+
+
+async def _wait_for_port(port: int, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            await writer.wait_closed()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+async def _connect_clients(
+    plan: Plan, base_port: int, results: Results, concurrency: int
+) -> list[socketio.AsyncClient]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    def on_message(data: dict[str, Any]) -> None:
+        results.latencies_ms.append((time.time() - data["sent_at"]) * 1000)
+
+    async def connect(user_id: str, event_id: str, replica: int) -> socketio.AsyncClient:
+        client = socketio.AsyncClient(reconnection=False)
+        client.on("auction:bid_placed", on_message)
+        client.on("notification:new", on_message)
+        async with semaphore:
+            await client.connect(
+                f"http://127.0.0.1:{base_port + replica}",
+                transports=["websocket"],
+                auth={"user_id": user_id},
+            )
+            await client.call("join", {"event_id": event_id}, timeout=30)
+        return client
+
+    return await asyncio.gather(*(connect(*assignment) for assignment in plan.clients))
+
+
+async def _publish(plan: Plan, args: argparse.Namespace, results: Results) -> None:
+    """Emit bid updates to every event room and notifications to random donors."""
+    publisher = MANAGERS[args.mode](args.redis_url, channel=CHANNEL, write_only=True)
+    rng = random.Random(args.seed)
+    members_per_event: dict[str, int] = {}
+    for _, event_id, _ in plan.clients:
+        members_per_event[event_id] = members_per_event.get(event_id, 0) + 1
+
+    interval = 1.0 / args.rate
+    deadline = time.monotonic() + args.duration
+    while time.monotonic() < deadline:
+        started = time.monotonic()
+        for event_id in plan.event_ids:
+            await publisher.emit(
+                "auction:bid_placed",
+                {"sent_at": time.time(), "event_id": event_id},
+                room=f"event:{event_id}",
+            )
+            results.expected += members_per_event.get(event_id, 0)
+        user_id, event_id, _ = rng.choice(plan.clients)
+        await publisher.emit(
+            "notification:new",
+            {"sent_at": time.time()},
+            room=f"user:{user_id}:event:{event_id}",
+        )
+        results.expected += 1
+        await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    plan = Plan.build(
+        args.seed,
+        args.events,
+        args.clients,
+        args.replicas,
+        args.replicas_per_event or args.replicas,
+    )
+    results = Results()
+    stop = asyncio.Event()
+    in_process: list[asyncio.Task[int]] = []
+    pipes: list[Any] = []
+    processes: list[multiprocessing.Process] = []
+
+    ctx = multiprocessing.get_context("spawn")
+    for index in range(args.replicas):
+        port = args.base_port + index
+        if args.in_process:
+            in_process.append(
+                asyncio.create_task(_serve_replica(args.mode, args.redis_url, port, stop))
+            )
+        else:
+            parent, child = ctx.Pipe()
+            process = ctx.Process(
+                target=_replica_process, args=(args.mode, args.redis_url, port, child)
+            )
+            process.start()
+            pipes.append(parent)
+            processes.append(process)
+        await _wait_for_port(port)
+
+    clients = await _connect_clients(plan, args.base_port, results, args.connect_concurrency)
+    # Let every replica finish subscribing before publishing
+    await asyncio.sleep(1.0)
+    await _publish(plan, args, results)
+    await asyncio.sleep(args.drain)
+
+    await asyncio.gather(*(client.disconnect() for client in clients))
+    replicas: list[dict[str, Any]] = []
+    if args.in_process:
+        stop.set()
+        replicas = [{"pubsub_emits": count} for count in await asyncio.gather(*in_process)]
+    else:
+        for pipe in pipes:
+            pipe.send("stop")
+        for pipe, process in zip(pipes, processes, strict=True):
+            replicas.append(pipe.recv())
+            process.join()
+
+    return {
+        "mode": args.mode,
+        "replicas": args.replicas,
+        "clients": args.clients,
+        "events": args.events,
+        "replicas_per_event": args.replicas_per_event or args.replicas,
+        "duration_seconds": args.duration,
+        "emits_per_event_per_second": args.rate,
+        **results.summary(),
+        "replica_stats": replicas,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Socket.IO room fan-out load harness")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--mode", choices=sorted(MANAGERS), default="broadcast")
+    parser.add_argument("--replicas", type=int, default=2)
+    parser.add_argument("--clients", type=int, default=200, help="Simulated donors")
+    parser.add_argument("--events", type=int, default=4, help="Events donors are spread over")
+    parser.add_argument(
+        "--replicas-per-event",
+        type=int,
+        default=0,
+        help="Replicas each event's donors connect to (default: all)",
+    )
+    parser.add_argument("--duration", type=float, default=20.0, help="Publishing seconds")
+    parser.add_argument("--rate", type=float, default=10.0, help="Bid emits per event per second")
+    parser.add_argument("--drain", type=float, default=2.0, help="Seconds to wait for stragglers")
+    parser.add_argument("--base-port", type=int, default=8765)
+    parser.add_argument("--connect-concurrency", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--in-process", action="store_true", help="Run replicas in this process")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
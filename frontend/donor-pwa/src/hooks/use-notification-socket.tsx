@@ -3,6 +3,10 @@
  *
  * Connects to the backend Socket.IO server and listens for new notifications.
  * Manages room joining, reconnection, and store/query cache syncing.
+ *
+ * On (re)connect the client sends its per-event replay cursor and the server
+ * answers with one `notification:missed` page; further pages are pulled with
+ * `notification:sync`.
  */
 import { triggerNotificationToast } from '@/components/notifications/NotificationToastOverlay'
 import type { NotificationData } from '@/services/notification-service'
@@ -29,22 +33,34 @@ function getSocketUrl(): string {
 
 const LAST_SEEN_KEY = 'fundrbolt_notification_last_seen'
 
-function loadLastSeen(): string | null {
+function loadCursor(eventId: string): string | null {
   try {
-    return localStorage.getItem(LAST_SEEN_KEY)
+    return localStorage.getItem(`${LAST_SEEN_KEY}:${eventId}`)
   } catch {
     return null
   }
 }
 
-function saveLastSeen(ts: string): void {
+function saveCursor(eventId: string, cursor: string): void {
   try {
-    localStorage.setItem(LAST_SEEN_KEY, ts)
+    localStorage.setItem(`${LAST_SEEN_KEY}:${eventId}`, cursor)
   } catch {
     // Ignore storage failures.
   }
 }
 
+/** Cursor for a notification, in the server's `<created_at>|<id>` format. */
+function cursorFor(notification: NotificationData): string {
+  return `${notification.created_at}|${notification.id}`
+}
+
+interface MissedNotificationsPage {
+  notifications: NotificationData[]
+  cursor: string | null
+  has_more: boolean
+  retry_after: number | null
+}
+
 export type SocketStatus =
   | 'connecting'
   | 'connected'
@@ -63,7 +79,6 @@ export function useNotificationSocket(
   const [status, setStatus] = useState<SocketStatus>('disconnected')
   const socketRef = useRef<Socket | null>(null)
   const queryClient = useQueryClient()
-  const lastSeenRef = useRef<string | null>(loadLastSeen())
 
   const addNotification = useNotificationStore((s) => s.addNotification)
   const incrementUnreadCount = useNotificationStore(
@@ -89,6 +104,60 @@ export function useNotificationSocket(
     // conflicts with React's commit-phase bookkeeping, causing
     // "Maximum update depth exceeded".
     let isCurrent = true
+    let cursor = loadCursor(eventId)
+    let retryTimer: ReturnType<typeof setTimeout> | undefined
+    // While a replay is paging, live notifications must not move the cursor
+    // past pages that have not been fetched yet.
+    let replaying = false
+    let liveCursor: string | null = null
+
+    const advanceCursor = (next: string | null) => {
+      // Cursors start with an ISO timestamp, so they order as strings
+      if (!next || (cursor && next <= cursor)) return
+      cursor = next
+      saveCursor(eventId, next)
+    }
+
+    const requestNextPage = () => {
+      if (!isCurrent || !cursor) return
+      socket.emit(
+        'notification:sync',
+        { event_id: eventId, cursor },
+        (page: MissedNotificationsPage | null) => {
+          if (page) handleMissedPage(page)
+        }
+      )
+    }
+
+    const handleMissedPage = (page: MissedNotificationsPage) => {
+      if (!isCurrent) return
+      clearTimeout(retryTimer)
+      if (page.retry_after) {
+        // Replay throttled by the server; retry from our own cursor later
+        retryTimer = setTimeout(requestNextPage, page.retry_after * 1000)
+        return
+      }
+      const known = new Set(
+        useNotificationStore.getState().notifications.map((n) => n.id)
+      )
+      const missed = page.notifications.filter((n) => !known.has(n.id))
+      for (const notification of missed) {
+        addNotification(notification)
+      }
+      advanceCursor(page.cursor)
+      if (missed.length > 0) {
+        void queryClient.invalidateQueries({ queryKey: ['notifications'] })
+        if (!useNotificationStore.getState().isOpen) {
+          triggerNotificationToast(missed[missed.length - 1])
+        }
+      }
+      if (page.has_more) {
+        requestNextPage()
+        return
+      }
+      replaying = false
+      advanceCursor(liveCursor)
+    }
 
     const socketUrl = getSocketUrl()
 
@@ -112,10 +181,12 @@ export function useNotificationSocket(
       if (!isCurrent) return
       setStatus('connected')
       setConnectionStatus('connected')
-      // Join the event notification room with last_seen_at for catch-up
+      // Join the event notification room with the replay cursor for catch-up
+      replaying = cursor !== null
+      liveCursor = null
       socket.emit('notification:join_event', {
         event_id: eventId,
-        last_seen_at: lastSeenRef.current ?? undefined,
+        cursor: cursor ?? undefined,
       })
       // Invalidate React Query caches on reconnect
       void queryClient.invalidateQueries({ queryKey: ['notifications'] })
@@ -132,13 +203,18 @@ export function useNotificationSocket(
       setStatus('reconnecting')
       setConnectionStatus('reconnecting')
     })
+    socket.on('notification:missed', handleMissedPage)
+
     socket.on('notification:new', (data: NotificationData) => {
       addNotification(data)
       incrementUnreadCount()
-      // Track latest notification timestamp for catch-up on reconnect
+      // Track latest notification for catch-up on reconnect
       if (data.created_at) {
-        lastSeenRef.current = data.created_at
-        saveLastSeen(data.created_at)
+        if (replaying) {
+          liveCursor = cursorFor(data)
+        } else {
+          advanceCursor(cursorFor(data))
+        }
       }
       // Invalidate React Query caches so lists refetch
       void queryClient.invalidateQueries({
@@ -173,6 +249,7 @@ export function useNotificationSocket(
 
     return () => {
       isCurrent = false
+      clearTimeout(retryTimer)
       socket.disconnect()
       socketRef.current = null
     }
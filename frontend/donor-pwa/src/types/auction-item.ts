@@ -46,6 +46,7 @@ export interface AuctionItem extends AuctionItemBase {
   current_bid_amount?: number | null
   min_next_bid_amount?: number | null
   bid_count?: number
+  bid_state_version?: number // Orders real-time bid deltas; drop deltas with a lower version
   bidding_open?: boolean
   watcher_count?: number
   promotion_badge?: string | null
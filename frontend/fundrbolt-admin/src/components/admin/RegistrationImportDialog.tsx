@@ -1,4 +1,4 @@
-import { useState } from 'react'
+import { useRef, useState } from 'react'
 import { registrationImportService } from '@/services/registration-import-service'
 import type {
   ImportRowResult,
@@ -161,6 +161,7 @@ export function RegistrationImportDialog({
   const [report, setReport] = useState<RegistrationImportReport | null>(null)
   const [isPreflight, setIsPreflight] = useState(false)
   const [isCommitting, setIsCommitting] = useState(false)
+  const activeCommit = useRef<AbortController | null>(null)
 
   const handleFileChange = (e: React.ChangeEvent<HTMLInputElement>) => {
     const selectedFile = e.target.files?.[0]
@@ -208,9 +209,17 @@ export function RegistrationImportDialog({
       return
     }
 
+    activeCommit.current?.abort()
+    const controller = new AbortController()
+    activeCommit.current = controller
+
     try {
       setIsCommitting(true)
-      const result = await registrationImportService.commitImport(eventId, file)
+      const result = await registrationImportService.commitImport(
+        eventId,
+        file,
+        controller.signal
+      )
       setReport(result)
       if (result.error_rows > 0) {
         toast.error(`Import completed with ${result.error_rows} error(s)`)
@@ -221,13 +230,17 @@ export function RegistrationImportDialog({
         onImportComplete?.()
       }
     } catch (err) {
+      // Closing the dialog stops waiting; the import keeps running on the server
+      if (controller.signal.aborted) return
       toast.error(getErrorMessage(err, 'Import failed'))
     } finally {
+      activeCommit.current = null
       setIsCommitting(false)
     }
   }
 
   const handleClose = () => {
+    activeCommit.current?.abort()
     setFile(null)
     setReport(null)
     onOpenChange(false)
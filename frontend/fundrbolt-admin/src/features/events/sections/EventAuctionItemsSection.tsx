@@ -1,4 +1,4 @@
-import { useEffect, useState } from 'react'
+import { useEffect, useRef, useState } from 'react'
 import { useNavigate } from '@tanstack/react-router'
 import { auctionItemService } from '@/services/auctionItemService'
 import type { ImportReport } from '@/types/auctionItemImport'
@@ -49,6 +49,7 @@ export function EventAuctionItemsSection({
   const eventId = currentEvent.slug || currentEvent.id // Use slug for navigation
   const [importOpen, setImportOpen] = useState(false)
   const [importFile, setImportFile] = useState<File | null>(null)
+  const activeCommit = useRef<AbortController | null>(null)
   const [importReport, setImportReport] = useState<ImportReport | null>(null)
   const [isPreflighting, setIsPreflighting] = useState(false)
   const [isCommitting, setIsCommitting] = useState(false)
@@ -95,12 +96,15 @@ export function EventAuctionItemsSection({
       toast.error('Please select a ZIP file to import')
       return
     }
+    activeCommit.current?.abort()
+    const controller = new AbortController()
+    activeCommit.current = controller
+    let progressTimer: ReturnType<typeof setInterval> | null = null
     try {
       setIsCommitting(true)
       if (importReport?.total_rows) {
         setCommitProgress({ current: 0, total: importReport.total_rows })
       }
-      let progressTimer: ReturnType<typeof setInterval> | null = null
       if (importReport?.total_rows) {
         progressTimer = setInterval(() => {
           setCommitProgress((prev) => {
@@ -112,11 +116,9 @@ export function EventAuctionItemsSection({
       }
       const report = await auctionItemService.commitImport(
         currentEvent.id,
-        importFile
+        importFile,
+        controller.signal
       )
-      if (progressTimer) {
-        clearInterval(progressTimer)
-      }
       if (report.total_rows > 0) {
         setCommitProgress({
           current: report.total_rows,
@@ -127,13 +129,20 @@ export function EventAuctionItemsSection({
       await fetchAuctionItems(currentEvent.id)
       toast.success('Import completed')
     } catch (err) {
+      // Closing the dialog stops waiting; the import keeps running on the server
+      if (controller.signal.aborted) return
       toast.error(getErrorMessage(err, 'Import failed'))
     } finally {
+      if (progressTimer) {
+        clearInterval(progressTimer)
+      }
+      activeCommit.current = null
       setIsCommitting(false)
     }
   }
 
   const closeImport = () => {
+    activeCommit.current?.abort()
     setImportOpen(false)
     setImportFile(null)
     setImportReport(null)
@@ -1,4 +1,6 @@
+import type { ImportJob } from '@/types/importJob'
 import apiClient from '@/lib/axios'
+import { waitForImportJob } from '@/services/importJobs'
 
 export type IssueSeverity = 'error' | 'warning'
 export type ImportRowStatus =
@@ -78,7 +80,7 @@ export async function preflightUserImport(
     }
   )
 
-  return response.data
+  return waitForImportJob(response.data, { signal })
 }
 
 export async function commitUserImport(
@@ -92,7 +94,7 @@ export async function commitUserImport(
   formData.append('preflight_id', preflightId)
   formData.append('confirm', 'true')
 
-  const response = await apiClient.post<ImportResult>(
+  const response = await apiClient.post<ImportJob<ImportResult>>(
     '/admin/users/import/commit',
     formData,
     {
@@ -4,7 +4,9 @@ import type {
   AuctionBidImportSummary,
   AuctionBidPreflightResult,
 } from '@/types/auctionBidImport'
+import type { ImportJob } from '@/types/importJob'
 import apiClient from '@/lib/axios'
+import { waitForImportJob } from '@/services/importJobs'
 
 /**
  * Auction Bid Import Service
@@ -69,19 +71,19 @@ class AuctionBidService {
         fileSize: file.size,
         fileType: file.type,
       })
-      const response = await apiClient.post<AuctionBidImportSummary>(
+      const response = await apiClient.post<ImportJob<AuctionBidImportSummary>>(
         `/admin/events/${eventId}/auction-bids/import/confirm`,
         formData,
         {
           signal,
         }
       )
-      logDebug('[auction-bids-import] confirm response', {
+      logDebug('[auction-bids-import] confirm queued', {
         eventId,
         importBatchId: payload.import_batch_id,
-        status: response.status,
+        importJobId: response.data.id,
       })
-      return response.data
+      return await waitForImportJob(response.data, { signal })
     } catch (error) {
       logError('[auction-bids-import] confirm request failed', {
         eventId,
@@ -10,7 +10,9 @@ import type {
   SilentAuctionExtensionPolicyUpdate,
 } from '@/types/auction-item'
 import type { ImportReport } from '@/types/auctionItemImport'
+import type { ImportJob } from '@/types/importJob'
 import apiClient from '@/lib/axios'
+import { waitForImportJob } from '@/services/importJobs'
 
 /**
  * Auction Item Service
@@ -107,17 +109,22 @@ class AuctionItemService {
   /**
    * Commit a bulk import ZIP package for auction items
    */
-  async commitImport(eventId: string, zipFile: File): Promise<ImportReport> {
+  async commitImport(
+    eventId: string,
+    zipFile: File,
+    signal?: AbortSignal
+  ): Promise<ImportReport> {
     const formData = new FormData()
     formData.append('zip_file', zipFile)
-    const response = await apiClient.post<ImportReport>(
+    const response = await apiClient.post<ImportJob<ImportReport>>(
       `/admin/events/${eventId}/auction-items/import/commit`,
       formData,
       {
         headers: { 'Content-Type': 'multipart/form-data' },
+        signal,
       }
     )
-    return response.data
+    return waitForImportJob(response.data, { signal })
   }
 
   async getSilentAuctionExtensionPolicy(
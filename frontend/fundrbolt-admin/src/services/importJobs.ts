@@ -0,0 +1,86 @@
+/**
+ * Service for following background import jobs
+ *
+ * Import commit endpoints queue the import and answer 202 with the job;
+ * waitForImportJob polls it until the worker finishes and resolves with the
+ * importer's report (the body the commit endpoints used to return).
+ */
+import type { ImportJob } from '@/types/importJob'
+import apiClient from '@/lib/axios'
+
+const POLL_INTERVAL_MS = 1000
+// Stop waiting after this long; the job itself keeps running on the server
+const DEFAULT_TIMEOUT_MS = 30 * 60 * 1000
+
+/**
+ * Thrown when waitForImportJob gives up before the job finished
+ */
+export class ImportJobTimeoutError extends Error {
+  readonly job: ImportJob<unknown>
+
+  constructor(job: ImportJob<unknown>) {
+    super(
+      'The import is taking longer than expected and is still running. Check back later for its results.'
+    )
+    this.name = 'ImportJobTimeoutError'
+    this.job = job
+  }
+}
+
+export async function getImportJob<TResult>(
+  jobId: string,
+  signal?: AbortSignal
+): Promise<ImportJob<TResult>> {
+  const response = await apiClient.get<ImportJob<TResult>>(
+    `/admin/import-jobs/${jobId}`,
+    { signal }
+  )
+  return response.data
+}
+
+function delay(ms: number, signal?: AbortSignal): Promise<void> {
+  return new Promise((resolve, reject) => {
+    const timer = setTimeout(resolve, ms)
+    signal?.addEventListener(
+      'abort',
+      () => {
+        clearTimeout(timer)
+        reject(signal.reason)
+      },
+      { once: true }
+    )
+  })
+}
+
+/**
+ * Poll an import job until it completes and return its result
+ *
+ * Throws with the job's error message if the import failed, and
+ * ImportJobTimeoutError once `timeoutMs` passes. Abort `signal` to stop
+ * waiting earlier.
+ */
+export async function waitForImportJob<TResult>(
+  job: ImportJob<TResult>,
+  options: {
+    signal?: AbortSignal
+    timeoutMs?: number
+    onProgress?: (job: ImportJob<TResult>) => void
+  } = {}
+): Promise<TResult> {
+  const deadline = Date.now() + (options.timeoutMs ?? DEFAULT_TIMEOUT_MS)
+  let current = job
+  while (current.status === 'queued' || current.status === 'running') {
+    options.onProgress?.(current)
+    if (Date.now() >= deadline) {
+      throw new ImportJobTimeoutError(current)
+    }
+    await delay(POLL_INTERVAL_MS, options.signal)
+    current = await getImportJob<TResult>(current.id, options.signal)
+  }
+  options.onProgress?.(current)
+
+  if (current.status === 'failed' || current.result === null) {
+    throw new Error(current.error ?? 'Import failed')
+  }
+  return current.result
+}
@@ -1,5 +1,7 @@
+import type { ImportJob } from '@/types/importJob'
 import type { RegistrationImportReport } from '@/types/registrationImport'
 import apiClient from '@/lib/axios'
+import { waitForImportJob } from '@/services/importJobs'
 
 /**
  * Registration Import Service
@@ -28,22 +30,24 @@ class RegistrationImportService {
 
   /**
    * Commit a bulk import file for registrations
-   * Creates registration records for valid rows
+   * Queues the import and waits for the background job to create records
    */
   async commitImport(
     eventId: string,
-    file: File
+    file: File,
+    signal?: AbortSignal
   ): Promise<RegistrationImportReport> {
     const formData = new FormData()
     formData.append('file', file)
-    const response = await apiClient.post<RegistrationImportReport>(
+    const response = await apiClient.post<ImportJob<RegistrationImportReport>>(
       `/admin/events/${eventId}/registrations/import/commit`,
       formData,
       {
         headers: { 'Content-Type': 'multipart/form-data' },
+        signal,
       }
     )
-    return response.data
+    return waitForImportJob(response.data, { signal })
   }
 }
 
@@ -1,8 +1,10 @@
 /**
  * Service for ticket sales import API calls
  */
+import type { ImportJob } from '@/types/importJob'
 import type { ImportResult, PreflightResult } from '@/types/ticketSalesImport'
 import apiClient from '@/lib/axios'
+import { waitForImportJob } from '@/services/importJobs'
 
 export interface ImportConfirmRequest {
   preflight_id: string
@@ -47,7 +49,7 @@ export async function commitTicketSalesImport(
   formData.append('file', file)
 
   // Send request with preflight_id and confirm in request body
-  const response = await apiClient.post<ImportResult>(
+  const response = await apiClient.post<ImportJob<ImportResult>>(
     `/admin/events/${eventId}/ticket-sales/import`,
     formData,
     {
@@ -62,7 +64,7 @@ export async function commitTicketSalesImport(
     }
   )
 
-  return response.data
+  return waitForImportJob(response.data, { signal })
 }
 
 /**
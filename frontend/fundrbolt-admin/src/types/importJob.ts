@@ -0,0 +1,29 @@
+/**
+ * Types for background import jobs
+ */
+
+export type ImportJobKind =
+  | 'registrations'
+  | 'users'
+  | 'ticket_sales'
+  | 'auction_bids'
+  | 'auction_items'
+
+export type ImportJobStatus = 'queued' | 'running' | 'completed' | 'failed'
+
+export interface ImportJob<TResult = unknown> {
+  id: string
+  kind: ImportJobKind
+  status: ImportJobStatus
+  event_id: string | null
+  npo_id: string | null
+  file_name: string
+  total_rows: number
+  processed_rows: number
+  status_counts: Record<string, number>
+  result: TResult | null
+  error: string | null
+  created_at: string
+  started_at: string | null
+  finished_at: string | null
+}